@@ -10,6 +10,22 @@ extern "C"
 #include "stm32l4xx_hal.h"
 #include "def.h"
 
+// 화면 전송 포맷 (SET_SCREEN_FORMAT)
+#define UART_SCREEN_FORMAT_TEXT 0   // <<SCREEN_START>> 텍스트 프레이밍 (기본)
+#define UART_SCREEN_FORMAT_BINARY 1 // GET_SCREEN_BIN 바이너리 프레임 허용
+
+// 바이너리 화면 프레임: magic(2) type(1) seq(2) base(2) length(2) payload CRC32(4), 리틀엔디안
+#define UART_BIN_MAGIC0 0xA5
+#define UART_BIN_MAGIC1 0x5A
+#define UART_BIN_TYPE_KEY 0x01   // 전체 화면
+#define UART_BIN_TYPE_DELTA 0x02 // 기준 프레임과 XOR한 변경 페이지만
+#define UART_BIN_PAGE_RAW 0x00
+#define UART_BIN_PAGE_RLE 0x01   // (count, value) 쌍
+#define UART_BIN_NO_BASE 0xFFFF
+#define UART_BIN_PAGE_SIZE 128   // 8행 x 16바이트
+#define UART_BIN_PAGE_COUNT 8
+#define UART_BIN_HEADER_SIZE 9
+
     // UART 태스크용 전역 변수
     typedef struct
     {
@@ -20,11 +36,13 @@ extern "C"
         uint16_t cmd_index;         // 명령어 인덱스
         uint8_t command_ready;      // 명령어 준비 플래그
         uint8_t monitoring_enabled; // 모니터링 활성화 플래그 (요청-응답 모드용)
+        uint8_t screen_format;      // 화면 전송 포맷 (UART_SCREEN_FORMAT_*)
     } UART_State_t;
 
     // UART 태스크 관련 함수 프로토타입
     void UART_ProcessCommand(void);
     void UART_SendScreenData(void);
+    void UART_SendScreenBinary(uint16_t ack_seq);
     void UART_SendStatusData(void);
     void UART_SendResponse(const char *response);
     void UART_ProcessTimerSet(const char *time_str);
@@ -32,6 +50,7 @@ extern "C"
     void UART_ProcessTimerStop(void);
     void UART_ProcessReset(void);
     void UART_ProcessUpdateMode(const char *mode_str);
+    void UART_ProcessScreenFormat(const char *format_str);
 
 #ifdef __cplusplus
 }
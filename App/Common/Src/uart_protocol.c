@@ -10,6 +10,18 @@ extern Battery_Monitor_t Battery_Monitor;
 extern UART_HandleTypeDef huart1;
 extern osMutexId_t UartMutexHandle;
 
+// 바이너리 화면 전송 기준 프레임 (마지막으로 보낸 화면)
+static uint8_t screen_last_frame[UART_BIN_PAGE_SIZE * UART_BIN_PAGE_COUNT];
+// 인코딩 중 UI 태스크가 Paint.Image를 다시 그려도 전송 내용과 기준 프레임이 일치하도록 복사본 사용
+static uint8_t screen_snapshot[UART_BIN_PAGE_SIZE * UART_BIN_PAGE_COUNT];
+static uint16_t screen_last_seq = UART_BIN_NO_BASE;
+static uint16_t screen_next_seq = 0;
+
+static uint32_t UART_Crc32(const uint8_t *data, uint16_t length);
+static uint16_t UART_RlePage(const uint8_t *src, uint8_t *dst, uint16_t limit);
+static uint16_t UART_EncodeScreenFrame(const uint8_t *image, const uint8_t *base,
+                                       uint16_t seq, uint16_t base_seq, uint8_t *out);
+
 /**
  * @brief UART 명령어 처리 함수
  */
@@ -54,6 +66,28 @@ void UART_ProcessCommand(void)
   {
     UART_SendScreenData();
   }
+  else if (memcmp(cmd_str, "GET_SCREEN_BIN", 14) == 0 &&
+           (UART_State.cmd_index == 14 || cmd_str[14] == ':'))
+  {
+    // GET_SCREEN_BIN:<ack_seq> - 호스트가 마지막으로 받은 시퀀스 (없으면 키 프레임)
+    uint16_t ack_seq = UART_BIN_NO_BASE;
+    if (UART_State.cmd_index > 15)
+    {
+      ack_seq = (uint16_t)strtoul(cmd_str + 15, NULL, 10);
+    }
+    if (UART_State.screen_format == UART_SCREEN_FORMAT_BINARY)
+    {
+      UART_SendScreenBinary(ack_seq);
+    }
+    else
+    {
+      UART_SendResponse("ERROR:Binary screen format not enabled\n");
+    }
+  }
+  else if (memcmp(cmd_str, "SET_SCREEN_FORMAT:", 18) == 0 && UART_State.cmd_index > 18)
+  {
+    UART_ProcessScreenFormat(cmd_str + 18);
+  }
   else if (memcmp(cmd_str, "GET_STATUS", 10) == 0 && UART_State.cmd_index == 10)
   {
     UART_SendStatusData();
@@ -189,6 +223,188 @@ void UART_SendScreenData(void)
   UART_SendStatusData();
 }
 
+/**
+ * @brief 바이너리 화면 데이터 전송 (키/델타 프레임)
+ * @param ack_seq 호스트가 마지막으로 복원한 프레임 시퀀스
+ *
+ * ack_seq가 마지막으로 보낸 프레임과 같으면 변경된 페이지만 XOR 델타로 보내고,
+ * 그렇지 않으면 (유실, 재연결 등) 전체 키 프레임을 보낸다.
+ */
+void UART_SendScreenBinary(uint16_t ack_seq)
+{
+  if (Paint.Image == NULL)
+  {
+    UART_SendResponse("ERROR:No screen data available\n");
+    return;
+  }
+
+  // 뮤텍스 획득 (최대 100ms 대기)
+  if (osMutexAcquire(UartMutexHandle, 100) != osOK)
+  {
+    return;
+  }
+
+  uint16_t image_size = (OLED_1in3_C_WIDTH * OLED_1in3_C_HEIGHT) / 8; // 1024 bytes
+  uint16_t seq = screen_next_seq++;
+  if (screen_next_seq == UART_BIN_NO_BASE)
+  {
+    screen_next_seq = 0;
+  }
+
+  const uint8_t *base = NULL;
+  if (ack_seq != UART_BIN_NO_BASE && ack_seq == screen_last_seq)
+  {
+    base = screen_last_frame;
+  }
+
+  // 화면 스냅샷 - 전송할 프레임과 다음 델타의 기준 프레임을 같은 내용으로 고정
+  memcpy(screen_snapshot, Paint.Image, image_size);
+
+  // 프레임 생성 (최대 9 + 1 + 8 * 129 + 4 = 1046 bytes)
+  uint16_t length = UART_EncodeScreenFrame(screen_snapshot, base, seq,
+                                           base ? ack_seq : UART_BIN_NO_BASE, UART_State.tx_buffer);
+  memcpy(screen_last_frame, screen_snapshot, image_size);
+  screen_last_seq = seq;
+
+  HAL_StatusTypeDef status = HAL_UART_Transmit(&huart1, UART_State.tx_buffer, length, 3000);
+  if (status != HAL_OK)
+  {
+    // 호스트는 CRC 오류로 프레임을 버림 - 다음 요청은 키 프레임
+    screen_last_seq = UART_BIN_NO_BASE;
+    osMutexRelease(UartMutexHandle);
+    return;
+  }
+
+  // 뮤텍스 해제
+  osMutexRelease(UartMutexHandle);
+
+  osDelay(1);
+  UART_SendStatusData();
+}
+
+/**
+ * @brief 바이너리 화면 프레임 생성
+ * @param base 기준 프레임 (NULL이면 키 프레임)
+ * @retval 프레임 전체 길이 (CRC 포함)
+ */
+static uint16_t UART_EncodeScreenFrame(const uint8_t *image, const uint8_t *base,
+                                       uint16_t seq, uint16_t base_seq, uint8_t *out)
+{
+  uint8_t page_buf[UART_BIN_PAGE_SIZE];
+  uint16_t pos = UART_BIN_HEADER_SIZE + 1; // 헤더 + 페이지 비트맵
+  uint8_t bitmap = 0;
+
+  for (uint8_t page = 0; page < UART_BIN_PAGE_COUNT; page++)
+  {
+    const uint8_t *src = image + page * UART_BIN_PAGE_SIZE;
+
+    if (base != NULL)
+    {
+      // 기준 프레임과 XOR - 변경 없는 페이지는 생략
+      const uint8_t *ref = base + page * UART_BIN_PAGE_SIZE;
+      uint8_t changed = 0;
+      for (uint16_t i = 0; i < UART_BIN_PAGE_SIZE; i++)
+      {
+        page_buf[i] = src[i] ^ ref[i];
+        changed |= page_buf[i];
+      }
+      if (!changed)
+      {
+        continue;
+      }
+      src = page_buf;
+    }
+
+    bitmap |= (uint8_t)(1 << page);
+
+    // RLE가 원본보다 짧을 때만 사용
+    uint16_t rle_length = UART_RlePage(src, &out[pos + 1], UART_BIN_PAGE_SIZE - 1);
+    if (rle_length > 0)
+    {
+      out[pos] = UART_BIN_PAGE_RLE;
+      pos += 1 + rle_length;
+    }
+    else
+    {
+      out[pos] = UART_BIN_PAGE_RAW;
+      memcpy(&out[pos + 1], src, UART_BIN_PAGE_SIZE);
+      pos += 1 + UART_BIN_PAGE_SIZE;
+    }
+  }
+
+  uint16_t payload_length = pos - UART_BIN_HEADER_SIZE;
+  out[0] = UART_BIN_MAGIC0;
+  out[1] = UART_BIN_MAGIC1;
+  out[2] = base ? UART_BIN_TYPE_DELTA : UART_BIN_TYPE_KEY;
+  out[3] = (uint8_t)(seq & 0xFF);
+  out[4] = (uint8_t)(seq >> 8);
+  out[5] = (uint8_t)(base_seq & 0xFF);
+  out[6] = (uint8_t)(base_seq >> 8);
+  out[7] = (uint8_t)(payload_length & 0xFF);
+  out[8] = (uint8_t)(payload_length >> 8);
+  out[UART_BIN_HEADER_SIZE] = bitmap;
+
+  // CRC32는 type부터 payload 끝까지
+  uint32_t crc = UART_Crc32(&out[2], pos - 2);
+  out[pos++] = (uint8_t)(crc & 0xFF);
+  out[pos++] = (uint8_t)((crc >> 8) & 0xFF);
+  out[pos++] = (uint8_t)((crc >> 16) & 0xFF);
+  out[pos++] = (uint8_t)((crc >> 24) & 0xFF);
+
+  return pos;
+}
+
+/**
+ * @brief 페이지 RLE 인코딩 ((count, value) 쌍)
+ * @retval 인코딩 길이, limit 초과시 0 (원본 전송)
+ */
+static uint16_t UART_RlePage(const uint8_t *src, uint8_t *dst, uint16_t limit)
+{
+  uint16_t out = 0;
+  uint16_t i = 0;
+
+  while (i < UART_BIN_PAGE_SIZE)
+  {
+    uint8_t value = src[i];
+    uint16_t run = 1;
+    while (i + run < UART_BIN_PAGE_SIZE && src[i + run] == value && run < 255)
+    {
+      run++;
+    }
+    if (out + 2 > limit)
+    {
+      return 0;
+    }
+    dst[out++] = (uint8_t)run;
+    dst[out++] = value;
+    i += run;
+  }
+
+  return out;
+}
+
+/**
+ * @brief CRC32 (IEEE 802.3, 니블 테이블 - 플래시 64바이트)
+ */
+static uint32_t UART_Crc32(const uint8_t *data, uint16_t length)
+{
+  static const uint32_t crc_table[16] = {
+      0x00000000, 0x1DB71064, 0x3B6E20C8, 0x26D930AC,
+      0x76DC4190, 0x6B6B51F4, 0x4DB26158, 0x5005713C,
+      0xEDB88320, 0xF00F9344, 0xD6D6A3E8, 0xCB61B38C,
+      0x9B64C2B0, 0x86D3D2D4, 0xA00AE278, 0xBDBDF21C};
+  uint32_t crc = 0xFFFFFFFF;
+
+  for (uint16_t i = 0; i < length; i++)
+  {
+    crc ^= data[i];
+    crc = (crc >> 4) ^ crc_table[crc & 0x0F];
+    crc = (crc >> 4) ^ crc_table[crc & 0x0F];
+  }
+
+  return ~crc;
+}
+
 /**
  * @brief 상태 정보 전송
  */
@@ -426,3 +642,26 @@ void UART_ProcessUpdateMode(const char *mode_str)
     UART_SendResponse("ERROR:Invalid update mode format\n");
   }
 }
+
+/**
+ * @brief 화면 전송 포맷 처리
+ */
+void UART_ProcessScreenFormat(const char *format_str)
+{
+  if (strcmp(format_str, "BINARY") == 0)
+  {
+    UART_State.screen_format = UART_SCREEN_FORMAT_BINARY;
+    screen_last_seq = UART_BIN_NO_BASE; // 첫 프레임은 키 프레임
+    UART_SendResponse("OK:Screen format BINARY\n");
+  }
+  else if (strcmp(format_str, "TEXT") == 0)
+  {
+    UART_State.screen_format = UART_SCREEN_FORMAT_TEXT;
+    screen_last_seq = UART_BIN_NO_BASE;
+    UART_SendResponse("OK:Screen format TEXT\n");
+  }
+  else
+  {
+    UART_SendResponse("ERROR:Unknown screen format\n");
+  }
+}
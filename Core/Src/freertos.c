@@ -146,7 +146,8 @@ UART_State_t UART_State = {
     .rx_index = 0,
     .cmd_index = 0,
     .command_ready = 0,
-    .monitoring_enabled = 0};
+    .monitoring_enabled = 0,
+    .screen_format = UART_SCREEN_FORMAT_TEXT};
 
 // UI 상태 초기화
 UI_Status_t current_status = {
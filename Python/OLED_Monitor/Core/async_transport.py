@@ -0,0 +1,386 @@
+"""
+asyncio 기반 시리얼 전송 계층
+
+요청/응답 프로토콜, 타임아웃, 손상 프레임 재요청을 하나의 이벤트 루프
+스레드에서 코루틴으로 처리한다. POSIX에서는 포트 파일 디스크립터를 루프의
+셀렉터에 등록해 읽고 (스레드 없음), fileno를 쓸 수 없는 포트(Windows COM 등)는
+블로킹 read 스레드 하나가 루프로 데이터를 넘긴다.
+
+Tk 쪽으로는 TkCallbackBridge가 결과를 모아 한 번의 root.after wakeup으로 전달한다.
+"""
+
+import asyncio
+import collections
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from serial_parser import ScreenFrameDecoder
+
+
+class AsyncSerialTransport:
+    """
+    asyncio 시리얼 전송 계층
+
+    펌웨어는 명령 버퍼가 하나뿐이라 전송 중 도착한 명령을 잃으므로, 요청은
+    _request_lock으로 직렬화해 전송선 위의 미응답 요청을 항상 하나로 유지한다.
+
+    코루틴 API (루프 스레드에서 실행):
+        request_screen(command_factory, timeout, retries) - 화면+STATUS 응답
+        command(command, timeout) - 응답 줄 하나
+        send(command) - 응답 대기 없음
+
+    다른 스레드에서는 submit()/call()로 코루틴을 실행한다.
+    """
+
+    def __init__(self, serial_port, decoder: Optional[ScreenFrameDecoder] = None,
+                 status_grace: float = 0.05, read_timeout: float = 0.05,
+                 max_replies: int = 32, write_lock: Optional[threading.Lock] = None):
+        self.serial_port = serial_port
+        self.decoder = decoder if decoder is not None else ScreenFrameDecoder()
+        self.status_grace = status_grace
+        self.read_timeout = read_timeout
+        self.max_replies = max_replies
+        self.write_lock = write_lock if write_lock is not None else threading.Lock()
+
+        self.loop = None
+        self.reader_mode = None     # 'selector' 또는 'thread'
+        self.stats = {
+            'bytes_read': 0,
+            'frames': 0,
+            'replies': 0,
+            'rejected_frames': 0,
+            'frame_errors': 0,
+            'timeouts': 0,
+            'retries': 0,
+            'dropped_replies': 0,
+            'unsolicited_frames': 0,
+            'read_errors': 0
+        }
+
+        self._thread = None
+        self._reader_thread = None
+        self._reader_fd = None
+        self._running = False
+        self._ready = threading.Event()
+
+        # 루프 스레드 전용 상태
+        self._request_lock = None
+        self._replies = None
+        self._screen_waiter = None
+        self._status_waiter = None
+        self._burst_start = None      # 진행 중인 응답의 첫 바이트 수신 시각 (perf_counter)
+        self._chunk_at = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return self._running and self._thread is not None and self._thread.is_alive()
+
+    def start(self, timeout: float = 1.0):
+        """이벤트 루프 스레드 시작 및 수신 등록 완료 대기"""
+        if self.is_running:
+            return
+        self._running = True
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run_loop, name="AsyncSerialTransport", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout)
+
+    def stop(self, timeout: float = 1.0):
+        """진행 중인 코루틴 취소 후 루프 종료"""
+        if not self._running:
+            return
+        self._running = False
+        loop = self.loop
+        if loop is not None and loop.is_running():
+            loop.call_soon_threadsafe(self._shutdown)
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        if self._reader_thread is not None:
+            self._reader_thread.join(timeout)
+        self._thread = None
+        self._reader_thread = None
+
+    def submit(self, coro):
+        """다른 스레드에서 코루틴 실행 예약 (concurrent.futures.Future 반환)"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def call(self, coro, timeout: Optional[float] = None):
+        """다른 스레드에서 코루틴 실행 후 결과 대기"""
+        return self.submit(coro).result(timeout)
+
+    # ------------------------------------------------------------------
+    # 코루틴 API
+    # ------------------------------------------------------------------
+    async def send(self, command) -> bool:
+        """명령 전송 (응답 대기 없음)"""
+        async with self._request_lock:
+            return self._write(command)
+
+    async def command(self, command, timeout: float = 2.0) -> Optional[bytes]:
+        """명령 전송 후 응답 줄 하나 대기 (타임아웃시 None)"""
+        async with self._request_lock:
+            self._drain_replies()
+            if not self._write(command):
+                return None
+            try:
+                return await asyncio.wait_for(self._replies.get(), timeout)
+            except asyncio.TimeoutError:
+                self.stats['timeouts'] += 1
+                return None
+
+    async def request_screen(self, command_factory: Callable[[], str], timeout: float = 2.0,
+                             retries: int = 1) -> Dict:
+        """
+        화면 요청 및 응답 수신 - 손상 프레임만 재요청
+
+        Args:
+            command_factory: 요청 명령 생성 함수 (바이너리 전송의 확인 시퀀스가 재요청마다 바뀜)
+            timeout: 프레임 대기 시간 (초)
+            retries: 손상 프레임 재요청 횟수
+
+        Returns:
+            Dict: {'screen', 'status', 'error'} (SerialFrameReader 기반 경로와 동일)
+        """
+        result = {'screen': None, 'status': None, 'error': None}
+        async with self._request_lock:
+            for attempt in range(retries + 1):
+                if attempt:
+                    self.stats['retries'] += 1
+
+                loop = asyncio.get_running_loop()
+                self._screen_waiter = loop.create_future()
+                self._status_waiter = None
+                sent_at = time.perf_counter()
+                if not self._write(command_factory()):
+                    self._screen_waiter = None
+                    return result
+                written_at = time.perf_counter()
+
+                try:
+                    frame = await asyncio.wait_for(self._screen_waiter, timeout)
+                except asyncio.TimeoutError:
+                    self.stats['timeouts'] += 1
+                    return result
+                finally:
+                    self._screen_waiter = None
+
+                # STATUS 줄 대기 = 펌웨어 전송 종료 확인 (STATUS 없는 기존 펌웨어는 유예 후 진행)
+                status = None
+                if self._status_waiter is not None:
+                    try:
+                        status = await asyncio.wait_for(self._status_waiter, self.status_grace)
+                    except asyncio.TimeoutError:
+                        pass
+                    finally:
+                        self._status_waiter = None
+
+                if frame.get('error') is None:
+                    frame['status'] = status
+                    frame['request_sent_at'] = sent_at
+                    frame['request_written_at'] = written_at
+                    self.stats['frames'] += 1
+                    return {'screen': frame, 'status': status, 'error': None}
+
+                self.stats['rejected_frames'] += 1
+                result = {'screen': None, 'status': status, 'error': frame['error']}
+
+        return result
+
+    # ------------------------------------------------------------------
+    # 루프 스레드 내부
+    # ------------------------------------------------------------------
+    def _run_loop(self):
+        loop = asyncio.new_event_loop()
+        self.loop = loop
+        asyncio.set_event_loop(loop)
+        self._request_lock = asyncio.Lock()
+        self._replies = asyncio.Queue(maxsize=self.max_replies)
+        try:
+            self._attach_reader()
+            self._ready.set()
+            loop.run_forever()
+        finally:
+            self._detach_reader()
+            pending = [task for task in asyncio.all_tasks(loop) if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.close()
+            self._running = False
+            self._ready.set()
+
+    def _shutdown(self):
+        for task in asyncio.all_tasks(self.loop):
+            task.cancel()
+        self.loop.stop()
+
+    def _attach_reader(self):
+        """POSIX는 셀렉터에 fd 등록, 그 외는 블로킹 read 스레드 사용"""
+        fd = None
+        if os.name == 'posix':
+            try:
+                fd = self.serial_port.fileno()
+            except Exception:
+                fd = None
+
+        if fd is not None:
+            self.serial_port.timeout = 0   # 준비 통지 후 읽으므로 논블로킹
+            self.loop.add_reader(fd, self._on_readable)
+            self._reader_fd = fd
+            self.reader_mode = 'selector'
+        else:
+            self.serial_port.timeout = self.read_timeout
+            self._reader_thread = threading.Thread(target=self._blocking_reader,
+                                                   name="AsyncSerialReader", daemon=True)
+            self._reader_thread.start()
+            self.reader_mode = 'thread'
+
+    def _detach_reader(self):
+        if self._reader_fd is not None:
+            try:
+                self.loop.remove_reader(self._reader_fd)
+            except Exception:
+                pass
+            self._reader_fd = None
+
+    def _on_readable(self):
+        try:
+            chunk = self.serial_port.read(self.serial_port.in_waiting or 1)
+        except Exception:
+            self.stats['read_errors'] += 1
+            return
+        if chunk:
+            self._on_data(chunk)
+
+    def _blocking_reader(self):
+        port = self.serial_port
+        while self._running:
+            try:
+                chunk = port.read(port.in_waiting or 1)
+            except Exception:
+                self.stats['read_errors'] += 1
+                time.sleep(self.read_timeout)
+                continue
+            if chunk:
+                try:
+                    self.loop.call_soon_threadsafe(self._on_data, chunk)
+                except RuntimeError:
+                    break   # 루프 종료됨
+
+    def _on_data(self, chunk: bytes):
+        self._chunk_at = time.perf_counter()
+        if self._burst_start is None:
+            self._burst_start = self._chunk_at
+        self.stats['bytes_read'] += len(chunk)
+        for event_type, event in self.decoder.feed(chunk):
+            self._dispatch(event_type, event)
+
+    def _dispatch(self, event_type: str, event: Dict):
+        first_byte_at = self._burst_start or self._chunk_at
+        self._burst_start = None
+        if event_type == 'screen':
+            event['error'] = None
+            event['received_at'] = time.time()
+            event['first_byte_at'] = first_byte_at
+            event['last_byte_at'] = self._chunk_at
+            self._resolve_screen(event)
+        elif event_type == 'status':
+            if self._status_waiter is not None and not self._status_waiter.done():
+                self._status_waiter.set_result(event['raw'])
+            else:
+                self._put_reply(event['raw'])
+        elif event_type == 'line':
+            self._put_reply(event['raw'])
+        elif event_type == 'error':
+            self.stats['frame_errors'] += 1
+            if event['reason'] in ScreenFrameDecoder.FRAME_LOSS_ERRORS:
+                self._resolve_screen({'data': None, 'error': event['reason']})
+
+    def _resolve_screen(self, frame: Dict):
+        waiter = self._screen_waiter
+        if waiter is None or waiter.done():
+            self.stats['unsolicited_frames'] += 1
+            return
+        # 화면(또는 손상 표시) 뒤에 오는 STATUS 줄을 같은 응답으로 묶기 위한 대기자
+        self._status_waiter = self.loop.create_future()
+        waiter.set_result(frame)
+
+    def _put_reply(self, line: bytes):
+        """응답 큐에 추가 - 가득 차면 가장 오래된 항목 폐기"""
+        if self._replies.full():
+            self._replies.get_nowait()
+            self.stats['dropped_replies'] += 1
+        self._replies.put_nowait(line)
+        self.stats['replies'] += 1
+
+    def _drain_replies(self):
+        while not self._replies.empty():
+            self._replies.get_nowait()
+
+    def _write(self, command) -> bool:
+        if isinstance(command, str):
+            command = command.encode()
+        if not command.endswith(b'\n'):
+            command += b'\n'
+        try:
+            with self.write_lock:
+                self.serial_port.write(command)
+            return True
+        except Exception:
+            return False
+
+
+class TkCallbackBridge:
+    """
+    다른 스레드 → Tk 메인 스레드 콜백 전달
+
+    예약된 wakeup이 없을 때만 root.after(0)를 한 번 호출하고, 그 사이에 쌓인
+    콜백은 모두 같은 wakeup에서 실행한다. key를 지정한 콜백은 마지막 것만
+    남기므로 (예: 화면 갱신) 느린 GUI가 오래된 프레임을 쌓지 않는다.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._lock = threading.Lock()
+        self._pending = collections.deque()
+        self._latest = {}
+        self._scheduled = False
+        self.stats = {'posted': 0, 'coalesced': 0, 'wakeups': 0}
+
+    def post(self, callback: Callable, *args, key: Optional[str] = None):
+        """콜백 예약 (key가 같은 이전 콜백은 대체)"""
+        with self._lock:
+            self.stats['posted'] += 1
+            if key is None:
+                self._pending.append((callback, args))
+            else:
+                if key in self._latest:
+                    self.stats['coalesced'] += 1
+                self._latest[key] = (callback, args)
+            schedule = not self._scheduled
+            self._scheduled = True
+
+        if schedule:
+            try:
+                self.root.after(0, self._drain)
+            except Exception:
+                with self._lock:
+                    self._scheduled = False
+
+    def _drain(self):
+        with self._lock:
+            items = list(self._pending)
+            items.extend(self._latest.values())
+            self._pending.clear()
+            self._latest.clear()
+            self._scheduled = False
+            self.stats['wakeups'] += 1
+
+        for callback, args in items:
+            try:
+                callback(*args)
+            except Exception:
+                pass
@@ -0,0 +1,311 @@
+"""
+펌웨어 UART 프로토콜 시뮬레이터
+
+App/Common/Src/uart_protocol.c의 명령 처리와 응답 형식을 그대로 재현한다.
+하드웨어 없이 파서/프레이머/바이너리 전송을 검증하거나 가상 디바이스의
+응답 생성기로 사용한다.
+"""
+
+import time
+from typing import Dict, Optional
+
+from serial_parser import BinaryScreenEncoder, BIN_NO_BASE
+
+
+class FirmwareSimulator:
+    """
+    펌웨어 명령 처리 시뮬레이터
+
+    feed()로 받은 바이트를 개행 단위 명령으로 모아 처리하고, 펌웨어가
+    UART로 보낼 응답 바이트를 반환한다. 알 수 없는 명령은 펌웨어와
+    동일하게 무시한다 (응답 없음).
+    """
+
+    IMAGE_SIZE = 1024
+    SCREEN_FORMAT_TEXT = 0
+    SCREEN_FORMAT_BINARY = 1
+
+    def __init__(self, image_size: int = IMAGE_SIZE):
+        self.image_size = image_size
+        self.image = bytearray(image_size)
+        self.cmd_buffer = bytearray()
+        self.monitoring_enabled = False
+        self.screen_format = self.SCREEN_FORMAT_TEXT
+        self.binary_encoder = BinaryScreenEncoder(image_size)
+
+        # 상태 정보 (UART_SendStatusData 출력 항목)
+        self.battery_voltage = 4.05
+        self.battery_adc = 2512
+        self.timer_value = 5
+        self.minute_count = 0
+        self.second_count = 0
+        self.cooling_second = 0
+        self.run_sec_count = 0
+        self.timer_running = False
+        self.cooling = False
+        self.setting = False
+        self.l1_connected = 1
+        self.l2_connected = 0
+
+        self.stats = {
+            'commands': 0,
+            'ignored': 0,
+            'screen_bytes': 0,
+            'tx_bytes': 0
+        }
+
+    def set_image(self, image: bytes):
+        """화면 버퍼 교체 (Paint.Image)"""
+        if len(image) != self.image_size:
+            raise ValueError(f"화면 크기 불일치: {len(image)} != {self.image_size}")
+        self.image[:] = image
+
+    def draw_test_pattern(self, frame_no: int = 0):
+        """타이머 숫자가 바뀌는 것처럼 일부 영역만 변하는 테스트 화면 생성"""
+        image = bytearray(self.image_size)
+        # 상단 테두리와 고정 아이콘 영역
+        image[0:16] = b'\xff' * 16
+        image[16 * 63:16 * 64] = b'\xff' * 16
+        for row in range(8, 20):
+            image[row * 16 + 1] = 0x3C
+            image[row * 16 + 14] = 0x3C
+        # 프레임 번호에 따라 바뀌는 숫자 영역 (행 24~39, 열 바이트 5~10)
+        for row in range(24, 40):
+            for col in range(5, 11):
+                image[row * 16 + col] = ((frame_no * 37 + row * 7 + col * 13) & 0xFF) \
+                    if (row + frame_no) % 3 else 0x00
+        self.image[:] = image
+
+    def feed(self, data: bytes) -> bytes:
+        """
+        수신 바이트 처리
+
+        Args:
+            data: 호스트가 보낸 바이트 (부분 명령 가능)
+
+        Returns:
+            bytes: 완성된 명령들에 대한 응답
+        """
+        responses = []
+        for value in data:
+            if value in (0x0A, 0x0D):
+                if self.cmd_buffer:
+                    command = bytes(self.cmd_buffer)
+                    self.cmd_buffer.clear()
+                    responses.append(self.process_command(command))
+            elif len(self.cmd_buffer) < 127:
+                self.cmd_buffer.append(value)
+        return b''.join(responses)
+
+    def process_command(self, command: bytes) -> bytes:
+        """
+        단일 명령 처리 (UART_ProcessCommand와 동일한 분기)
+
+        Args:
+            command: 개행을 제외한 명령 바이트
+
+        Returns:
+            bytes: 응답 바이트 (무시된 명령은 b'')
+        """
+        cmd = command.decode('ascii', errors='ignore').rstrip('\r\n ')
+        self.stats['commands'] += 1
+
+        if cmd == 'GET_SCREEN':
+            response = self.screen_response()
+        elif cmd == 'GET_SCREEN_BIN' or cmd.startswith('GET_SCREEN_BIN:'):
+            response = self.binary_screen_response(cmd[15:])
+        elif cmd.startswith('SET_SCREEN_FORMAT:') and len(cmd) > 18:
+            response = self.set_screen_format(cmd[18:])
+        elif cmd == 'GET_STATUS':
+            response = self.status_line()
+        elif cmd == 'PING':
+            response = b'PONG\n'
+        elif cmd == 'TEST':
+            response = b'TEST:OK\n'
+        elif cmd == 'START_MONITOR':
+            self.monitoring_enabled = True
+            response = b'OK:Monitoring started\n'
+        elif cmd == 'STOP_MONITOR':
+            self.monitoring_enabled = False
+            response = b'OK:Monitoring stopped\n'
+        elif cmd.startswith('SET_UPDATE_MODE:') and len(cmd) > 16:
+            response = self.set_update_mode(cmd[16:])
+        elif cmd.startswith('SET_TIMER:') and len(cmd) > 10:
+            response = self.set_timer(cmd[10:])
+        elif cmd == 'START_TIMER':
+            response = self.start_timer()
+        elif cmd == 'STOP_TIMER':
+            response = self.stop_timer()
+        elif cmd == 'RESET':
+            self.timer_running = False
+            self.cooling = False
+            self.setting = False
+            self.monitoring_enabled = False
+            response = b'OK:System reset\n'
+        elif cmd == 'GET_SIMPLE':
+            response = b'SIMPLE:Test pattern sent\n'
+        else:
+            self.stats['ignored'] += 1
+            response = b''
+
+        self.stats['tx_bytes'] += len(response)
+        return response
+
+    def screen_response(self) -> bytes:
+        """GET_SCREEN 텍스트 프레이밍 응답 (UART_SendScreenData)"""
+        checksum = sum(self.image) & 0xFFFFFFFF
+        response = (b'\n<<SCREEN_START>>\nSIZE:128x64\nFORMAT:PAINT_IMAGE\n' +
+                    f'CHECKSUM:{checksum:08X}\n'.encode('ascii') +
+                    b'<<DATA_START>>\n' + bytes(self.image) +
+                    b'\n<<DATA_END>>\n<<SCREEN_END>>\n\n')
+        self.stats['screen_bytes'] += len(response)
+        return response + self.status_line()
+
+    def binary_screen_response(self, ack_str: str) -> bytes:
+        """GET_SCREEN_BIN 응답 (UART_SendScreenBinary)"""
+        if self.screen_format != self.SCREEN_FORMAT_BINARY:
+            return b'ERROR:Binary screen format not enabled\n'
+        try:
+            ack_seq = int(ack_str) & 0xFFFF if ack_str else BIN_NO_BASE
+        except ValueError:
+            ack_seq = 0  # strtoul과 동일하게 숫자가 아니면 0
+        frame = self.binary_encoder.encode(self.image, ack_seq)
+        self.stats['screen_bytes'] += len(frame)
+        return frame + self.status_line()
+
+    def set_screen_format(self, format_str: str) -> bytes:
+        """SET_SCREEN_FORMAT 처리 (UART_ProcessScreenFormat)"""
+        if format_str == 'BINARY':
+            self.screen_format = self.SCREEN_FORMAT_BINARY
+            self.binary_encoder.last_seq = BIN_NO_BASE
+            return b'OK:Screen format BINARY\n'
+        if format_str == 'TEXT':
+            self.screen_format = self.SCREEN_FORMAT_TEXT
+            self.binary_encoder.last_seq = BIN_NO_BASE
+            return b'OK:Screen format TEXT\n'
+        return b'ERROR:Unknown screen format\n'
+
+    def set_update_mode(self, mode_str: str) -> bytes:
+        """SET_UPDATE_MODE 처리 (UART_ProcessUpdateMode)"""
+        mode = mode_str.split(',', 1)[0]
+        if mode in ('REQUEST_RESPONSE', 'AUTO'):
+            self.monitoring_enabled = True
+            return b'OK:Request-Response mode set\n'
+        if mode == 'MANUAL':
+            self.monitoring_enabled = False
+            return b'OK:Manual mode set\n'
+        return b'ERROR:Unknown update mode\n'
+
+    def set_timer(self, time_str: str) -> bytes:
+        """SET_TIMER:MM:SS 처리"""
+        try:
+            minutes, seconds = (int(part) for part in time_str.split(':', 1))
+        except ValueError:
+            return b'ERROR:Invalid time format\n'
+        if not (0 <= minutes <= 99 and 0 <= seconds <= 59):
+            return b'ERROR:Invalid time range\n'
+        self.timer_value = minutes
+        return b'OK:Timer set\n'
+
+    def start_timer(self) -> bytes:
+        """START_TIMER 처리"""
+        if self.timer_running or self.cooling:
+            return b'ERROR:Timer already running\n'
+        self.timer_running = True
+        self.minute_count = self.timer_value
+        self.second_count = 0
+        self.run_sec_count = 0
+        return b'OK:Timer started\n'
+
+    def stop_timer(self) -> bytes:
+        """STOP_TIMER 처리"""
+        if not self.timer_running:
+            return b'ERROR:Timer not running\n'
+        self.timer_running = False
+        if self.timer_value - self.minute_count != 0 and self.second_count <= 50:
+            self.cooling = True
+            self.cooling_second = min(90, (self.timer_value - self.minute_count) * 10)
+            return b'OK:Timer stopped, cooling started\n'
+        return b'OK:Timer stopped\n'
+
+    def tick_second(self):
+        """1초 경과 처리 (freertos.c MainTimer 콜백의 카운트다운/쿨링 로직)"""
+        if self.timer_running:
+            self.run_sec_count += 1
+            if self.second_count > 0:
+                self.second_count -= 1
+            elif self.minute_count > 0:
+                self.minute_count -= 1
+                self.second_count = 59
+            else:
+                # 타이머 완료: 실행 시간에 따라 쿨링 30/60/90초
+                self.timer_running = False
+                self.cooling = True
+                if 10 < self.run_sec_count <= 60:
+                    self.cooling_second = 30
+                elif 60 < self.run_sec_count <= 240:
+                    self.cooling_second = 60
+                elif self.run_sec_count > 240:
+                    self.cooling_second = 90
+                else:
+                    self.cooling_second = 0
+                self.run_sec_count = 0
+        elif self.cooling:
+            self.cooling_second -= 1
+            if self.cooling_second <= 0:
+                self.cooling_second = 0
+                self.cooling = False
+
+    def status_line(self) -> bytes:
+        """STATUS 줄 생성 (UART_SendStatusData와 동일한 형식)"""
+        if self.setting:
+            status_str, minutes, seconds = 'SETTING', self.timer_value, 0
+        elif self.cooling:
+            status_str = 'COOLING'
+            minutes, seconds = divmod(self.cooling_second, 60)
+        elif self.timer_running:
+            status_str, minutes, seconds = 'RUNNING', self.minute_count, self.second_count
+        else:
+            status_str, minutes, seconds = 'STANDBY', self.minute_count, self.second_count
+
+        return (f"STATUS:BAT:{int(self.battery_voltage * 100)}V,TIMER:{minutes:02d}:{seconds:02d},"
+                f"STATUS:{status_str},L1:{self.l1_connected},L2:{self.l2_connected},"
+                f"BAT_ADC:{self.battery_adc},BAT_VOLT:{self.battery_voltage:0.2f}\n").encode('ascii')
+
+    def get_stats(self) -> Dict:
+        """전송 통계 반환"""
+        return dict(self.stats)
+
+
+if __name__ == "__main__":
+    # 텍스트/바이너리 전송량 비교
+    from serial_parser import ScreenFrameDecoder
+
+    simulator = FirmwareSimulator()
+    decoder = ScreenFrameDecoder()
+    frame_count = 100
+
+    simulator.draw_test_pattern(0)
+    text_bytes = len(simulator.process_command(b'GET_SCREEN'))
+    print(f"텍스트 GET_SCREEN 응답: {text_bytes} bytes")
+
+    print(simulator.process_command(b'SET_SCREEN_FORMAT:BINARY'))
+    total_bytes = 0
+    ack_seq: Optional[int] = None
+    start_time = time.perf_counter()
+    for frame_no in range(frame_count):
+        if frame_no % 4 == 0:
+            simulator.draw_test_pattern(frame_no)
+        command = f"GET_SCREEN_BIN:{decoder.binary.ack_seq}\n".encode('ascii')
+        response = simulator.feed(command)
+        total_bytes += len(response)
+        for event_type, event in decoder.feed(response):
+            if event_type == 'screen':
+                assert event['data'] == bytes(simulator.image)
+                ack_seq = event['seq']
+    elapsed = time.perf_counter() - start_time
+
+    print(f"바이너리 {frame_count}프레임: 평균 {total_bytes / frame_count:.0f} bytes "
+          f"(텍스트 대비 {total_bytes / (text_bytes * frame_count) * 100:.1f}%), "
+          f"마지막 시퀀스 {ack_seq}, {elapsed / frame_count * 1e6:.0f}us/frame")
+    print(f"디코더 통계: {decoder.binary.stats}")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+OLED 모니터 헤드리스 실행 (GUI 없음)
+
+상태 로그와 세션 녹화를 최대 속도(또는 지정 주기)로 수집한다.
+SIGINT/SIGTERM을 받으면 현재 요청을 마친 뒤 녹화 색인과 로그를 기록하고 종료한다.
+
+사용 예:
+    python headless_monitor.py /dev/ttyUSB0 --record LOG/session.oses
+    python headless_monitor.py COM3 --interval 0.1 --duration 3600
+    python headless_monitor.py replay:LOG/session.oses --no-log
+"""
+
+import argparse
+import os
+import signal
+import sys
+from datetime import datetime
+
+from monitor_core import MonitorCore
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="OLED 모니터 헤드리스 수집")
+    parser.add_argument("port", help="시리얼 포트 (replay:<파일>이면 세션 재생)")
+    parser.add_argument("--baud", type=int, default=921600, help="보드레이트")
+    parser.add_argument("--interval", type=float, default=0.0, help="요청 간격 (초, 0 = 최대 속도)")
+    parser.add_argument("--duration", type=float, default=None, help="실행 시간 (초)")
+    parser.add_argument("--frames", type=int, default=None, help="수신 프레임 수 한도")
+    parser.add_argument("--text", action="store_true", help="텍스트 화면 전송 사용 (바이너리 협상 안 함)")
+    parser.add_argument("--log-dir", default="LOG", help="상태 로그 디렉토리")
+    parser.add_argument("--no-log", action="store_true", help="상태 로그 기록 안 함")
+    parser.add_argument("--raw-log", action="store_true", help="RAW 데이터 로그도 기록")
+    parser.add_argument("--record", nargs="?", const="auto", default=None,
+                        help="세션 녹화 파일 (경로 생략시 로그 디렉토리에 자동 이름)")
+    parser.add_argument("--timeout", type=float, default=1.0, help="응답 대기 시간 (초)")
+    parser.add_argument("--replay-speed", type=float, default=0.0, help="재생 배속 (0 = 최대 속도)")
+    parser.add_argument("--report", type=float, default=10.0, help="통계 출력 주기 (초, 0 = 안 함)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    record_path = args.record
+    if record_path == "auto":
+        record_path = os.path.join(args.log_dir, f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.oses")
+
+    core = MonitorCore(
+        args.port,
+        baudrate=args.baud,
+        interval=args.interval,
+        binary=not args.text,
+        log_dir=None if args.no_log else args.log_dir,
+        record_path=record_path,
+        timeout=args.timeout,
+        replay_speed=args.replay_speed,
+        log_raw_data=args.raw_log
+    )
+
+    def request_stop(signum, frame):
+        print(f"\n종료 신호 수신 ({signal.Signals(signum).name}) - 정리 중...")
+        core.stop()
+
+    signal.signal(signal.SIGINT, request_stop)
+    if hasattr(signal, 'SIGTERM'):
+        signal.signal(signal.SIGTERM, request_stop)
+
+    print(f"🚀 헤드리스 모니터 시작: {args.port}"
+          + (f", 녹화 {record_path}" if record_path else ""))
+    try:
+        core.run(duration=args.duration, max_frames=args.frames, report_interval=args.report)
+    finally:
+        core.close()
+        print(core.format_stats())
+
+    return 0 if core.stats['frames'] > 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
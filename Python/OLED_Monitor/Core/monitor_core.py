@@ -0,0 +1,420 @@
+"""
+OLED 모니터 캡처 코어 (Tk 없음)
+
+연결, 화면 포맷 협상, 화면/STATUS 요청-응답, 상태 파싱, 로그와 세션 녹화를
+GUI 없이 수행한다. 서버나 게이트웨이에서 무인 수집할 때 headless_monitor.py가
+사용하며, 화면 디코딩/렌더링은 하지 않고 원시 프레임만 녹화한다.
+
+OLEDMonitor도 같은 캡처 세션(수신 스레드, 포맷 협상, 화면 요청/재요청)을 이
+클래스로 처리한다. 이때 포트는 GUI가 열어 attach()로 넘기고, 디코딩/표시와
+상태 처리는 GUI가 맡는다.
+
+메모리는 고정 크기로 제한된다: 수신 큐(SerialFrameReader), 최근 상태 기록(StatusHistory),
+마지막 프레임 하나. 로그는 AsyncLogWriter, 녹화는 버퍼링된 추가 기록이다.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+import serial
+
+from serial_parser import ScreenFrameDecoder, SerialDataParser, SerialFrameReader
+from session_recorder import SessionRecorder
+from session_replay import REPLAY_PORT_PREFIX, open_replay_port
+from status_history import StatusHistory
+from utils import LatencyHistogram, StatusLogger
+
+
+class MonitorCore:
+    """
+    GUI 없는 캡처 루프
+
+    run()은 stop()이 호출되거나 지정한 시간/프레임 수에 도달할 때까지 화면을
+    요청하고, close()는 녹화 색인 기록, 로그 flush, 포트 닫기를 순서대로 수행한다.
+    포트 오류가 나면 reconnect_delay 간격(최대 max_reconnect_delay)으로 재연결한다.
+
+    Args:
+        port: 시리얼 포트 이름 ('replay:<파일>'이면 세션 재생, attach()만 쓰면 None)
+        baudrate: 보드레이트
+        interval: 요청 간격 (초), 0이면 최대 속도
+        binary: 바이너리 화면 전송 협상 여부
+        log_dir: 상태 로그 디렉토리 (None이면 로그 없음)
+        record_path: 세션 녹화 파일 (None이면 녹화 없음)
+        history_size: 메모리에 보관할 최근 상태 수 (StatusHistory 열 배열, 샘플당 24바이트)
+        timeout: 응답 대기 시간 (초)
+        corrupt_frame_retries: 손상 프레임 재요청 횟수
+        replay_speed: 재생 포트 배속 (0 = 최대 속도)
+        log: 메시지 출력 함수
+        status_logger: 외부 StatusLogger (지정하면 log_dir 무시, 여러 장치가 기록 스레드 공유)
+        on_frame: 프레임 처리 후 호출 (frame, 파싱된 상태 또는 None)
+        backpressure: 요청 전 호출, 반환한 시간(초)만큼 대기 (하류가 밀릴 때 속도 제한)
+        frame_queue_size: 수신 프레임 큐 크기 (가득 차면 오래된 프레임 폐기)
+        status_grace: 화면 수신 후 같은 프레임으로 묶을 STATUS 줄 대기 시간 (초)
+    """
+
+    def __init__(self, port: Optional[str], baudrate: int = 921600, interval: float = 0.0,
+                 binary: bool = True, log_dir: Optional[str] = "LOG",
+                 record_path: Optional[str] = None, history_size: int = 36000,
+                 timeout: float = 1.0, corrupt_frame_retries: int = 1,
+                 replay_speed: float = 0.0, log_raw_data: bool = False,
+                 log: Callable[[str], None] = print,
+                 status_logger: Optional[StatusLogger] = None,
+                 on_frame: Optional[Callable[[Dict, Optional[Dict]], None]] = None,
+                 backpressure: Optional[Callable[[], float]] = None,
+                 frame_queue_size: int = 4, status_grace: float = 0.05):
+        self.port_name = port
+        self.baudrate = baudrate
+        self.interval = interval
+        self.binary_requested = binary
+        self.timeout = timeout
+        self.corrupt_frame_retries = corrupt_frame_retries
+        self.replay_speed = replay_speed
+        self.log_raw_data = log_raw_data
+        self.log = log
+        self.on_frame = on_frame
+        self.backpressure = backpressure
+        self.frame_queue_size = frame_queue_size
+        self.status_grace = status_grace
+        self.reconnect_delay = 1.0
+        self.max_reconnect_delay = 30.0
+
+        self.serial_port = None
+        self.serial_reader = None
+        self.frame_decoder = ScreenFrameDecoder()
+        self.status_parser = SerialDataParser()
+        self.binary_active = False
+        self.write_lock = threading.Lock()
+
+        self.owns_status_logger = status_logger is None
+        if status_logger is None and log_dir:
+            status_logger = StatusLogger(log_dir)
+        self.status_logger = status_logger
+        self.recorder = SessionRecorder(record_path) if record_path else None
+
+        self.latest_frame = None
+        self.latest_status = None
+        self.status_history = StatusHistory(max_samples=history_size)
+        self.latency = LatencyHistogram()
+        self.stats = {
+            'requests': 0,
+            'frames': 0,
+            'status_records': 0,
+            'corrupted': 0,
+            'retried': 0,
+            'recovered': 0,
+            'timeouts': 0,
+            'reconnects': 0,
+            'port_errors': 0,
+            'throttled': 0,
+            'started_at': None
+        }
+
+        self._stop_event = threading.Event()
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # 연결
+    # ------------------------------------------------------------------
+    @property
+    def is_connected(self) -> bool:
+        return self.serial_port is not None and self.serial_port.is_open
+
+    def connect(self) -> bool:
+        """포트 열기, 수신 스레드 시작, 화면 포맷 협상"""
+        self.disconnect()
+        try:
+            if self.port_name.startswith(REPLAY_PORT_PREFIX):
+                self.serial_port = open_replay_port(self.port_name, speed=self.replay_speed,
+                                                    timeout=0.05, write_timeout=1.0)
+            else:
+                self.serial_port = serial.Serial(port=self.port_name, baudrate=self.baudrate,
+                                                 timeout=0.05, write_timeout=1.0)
+        except Exception as e:
+            self.log(f"❌ 포트 열기 실패 ({self.port_name}): {e}")
+            self.serial_port = None
+            return False
+
+        self.attach(self.serial_port)
+        self.log(f"✅ 연결됨: {self.port_name}")
+        self.negotiate_screen_format()
+        return True
+
+    def attach(self, serial_port):
+        """열린 포트에 수신 스레드 시작 (포트 열기/닫기는 호출측 담당)"""
+        self.detach()
+        self.serial_port = serial_port
+        self.binary_active = False
+        self.frame_decoder.reset()
+        self.frame_decoder.binary.reset()
+        self.serial_reader = SerialFrameReader(serial_port, self.frame_decoder,
+                                               max_frames=self.frame_queue_size,
+                                               status_grace=self.status_grace)
+        self.serial_reader.start()
+
+    def detach(self):
+        """수신 스레드만 종료 (포트와 화면 포맷 상태는 유지)"""
+        if self.serial_reader is not None:
+            self.serial_reader.stop()
+            self.serial_reader = None
+
+    def disconnect(self):
+        """수신 스레드 종료 후 포트 닫기"""
+        self.detach()
+        if self.serial_port is not None:
+            try:
+                if self.serial_port.is_open:
+                    self.serial_port.close()
+            except Exception:
+                pass
+            self.serial_port = None
+        self.binary_active = False
+
+    def negotiate_screen_format(self, command: Optional[Callable[[str, float], Optional[bytes]]] = None) -> bool:
+        """
+        바이너리 화면 전송 협상 (미지원 펌웨어는 텍스트 유지)
+
+        Args:
+            command: 명령 전송 후 응답 줄을 돌려주는 함수 (None이면 command())
+        """
+        self.binary_active = False
+        self.frame_decoder.binary.reset()
+        if not self.binary_requested:
+            return False
+        reply = (command or self.command)("SET_SCREEN_FORMAT:BINARY", 0.5)
+        if reply and b'OK:Screen format BINARY' in reply:
+            self.binary_active = True
+            self.log("✅ 바이너리 화면 전송 활성화")
+            return True
+        self.log("ℹ️ 바이너리 화면 전송 미지원 - 텍스트 전송 사용")
+        return False
+
+    def send(self, command: str):
+        """명령 전송 (포트 오류는 예외로 전달)"""
+        data = command.encode('ascii') + b'\n'
+        with self.write_lock:
+            self.serial_port.write(data)
+            self.serial_port.flush()
+
+    def command(self, command: str, timeout: float = 1.0) -> Optional[bytes]:
+        """명령 전송 후 응답 줄 하나 대기"""
+        if not self.is_connected:
+            return None
+        self.serial_reader.drain_replies()
+        try:
+            self.send(command)
+        except Exception as e:
+            self.log(f"⚠️ 명령 전송 실패 ({command}): {e}")
+            return None
+        return self.serial_reader.get_reply(timeout)
+
+    # ------------------------------------------------------------------
+    # 캡처
+    # ------------------------------------------------------------------
+    def screen_request_command(self) -> str:
+        if self.binary_active:
+            return f"GET_SCREEN_BIN:{self.frame_decoder.binary.ack_seq}"
+        return "GET_SCREEN"
+
+    def request_frame(self, timeout: Optional[float] = None) -> Optional[Dict]:
+        """
+        화면 요청 및 수신 - 손상 프레임만 재요청
+
+        체크섬/CRC 오류로 버려진 프레임은 수신 스레드가 즉시 알려주므로
+        corrupt_frame_retries 횟수까지 같은 요청을 다시 보낸다. 응답이 없는
+        경우(타임아웃)는 재요청하지 않는다.
+
+        Returns:
+            수신 프레임 ('request_sent_at'/'request_written_at' 포함),
+            재요청 한도까지 손상된 경우 마지막 {'data': None, 'error': 사유},
+            타임아웃이면 None
+        """
+        timeout = self.timeout if timeout is None else timeout
+        frame = None
+        for attempt in range(self.corrupt_frame_retries + 1):
+            if attempt:
+                self.stats['retried'] += 1
+            self.stats['requests'] += 1
+            # 이전 요청의 늦은 프레임이 이번 요청의 응답(과 지연 시간)으로 잡히지 않도록 폐기
+            self.serial_reader.drain_frames()
+            sent = time.perf_counter()
+            self.send(self.screen_request_command())
+            written = time.perf_counter()
+
+            frame = self.serial_reader.get_frame(timeout)
+            if frame is None:
+                # 늦게 도착한 응답이 다음 요청의 응답으로 섞이지 않도록 비움
+                self.stats['timeouts'] += 1
+                self.serial_reader.clear()
+                return None
+            if not frame.get('error'):
+                frame['request_sent_at'] = sent
+                frame['request_written_at'] = written
+                self.latency.record(frame['last_byte_at'] - sent)
+                if attempt:
+                    self.stats['recovered'] += 1
+                return frame
+            self.stats['corrupted'] += 1
+            if attempt < self.corrupt_frame_retries:
+                self.log(f"⚠️ 손상 프레임 폐기 ({frame['error']}) - 재요청")
+            else:
+                self.log(f"⚠️ 손상 프레임 폐기 ({frame['error']}) - 재요청 한도 초과")
+        return frame
+
+    def request_screen_frame(self) -> Optional[Dict]:
+        """화면 요청 및 수신 - 손상 프레임만 재요청, 실패/타임아웃은 None"""
+        frame = self.request_frame()
+        if frame is None or frame.get('error'):
+            return None
+        return frame
+
+    def capture_once(self) -> bool:
+        """화면 1회 캡처 및 처리 (성공 여부 반환)"""
+        frame = self.request_screen_frame()
+        if frame is None:
+            return False
+        self.handle_frame(frame)
+        return True
+
+    def handle_frame(self, frame: Dict):
+        """수신 프레임 녹화, STATUS 파싱 및 로그"""
+        self.stats['frames'] += 1
+        self.latest_frame = frame['data']
+        status_raw = frame.get('status')
+
+        if self.recorder is not None:
+            self.recorder.record_frame(frame['data'])
+            if status_raw:
+                self.recorder.record_status(status_raw)
+
+        status = None
+        if status_raw:
+            status = self.status_parser.parse_status_data(status_raw)
+            if status is not None:
+                if not self.log_raw_data:
+                    status.raw_data = b''
+                self.latest_status = status
+                self.status_history.append(status)
+                self.stats['status_records'] += 1
+                if self.status_logger is not None:
+                    self.status_logger.log_status(status)
+
+        if self.on_frame is not None:
+            self.on_frame(frame, status)
+
+    def run(self, duration: Optional[float] = None, max_frames: Optional[int] = None,
+            report_interval: float = 10.0):
+        """
+        캡처 루프 (stop() 또는 종료 조건까지 블로킹)
+
+        Args:
+            duration: 실행 시간 (초), None이면 무제한
+            max_frames: 수신 프레임 수 한도
+            report_interval: 통계 출력 주기 (초), 0이면 출력 안 함
+        """
+        self._stop_event.clear()
+        start = time.monotonic()
+        self.stats['started_at'] = time.time()
+        next_report = start + report_interval if report_interval > 0 else None
+        next_request = start
+        backoff = self.reconnect_delay
+
+        if not self.is_connected:
+            self.connect()
+
+        while not self._stop_event.is_set():
+            now = time.monotonic()
+            if duration is not None and now - start >= duration:
+                break
+            if max_frames is not None and self.stats['frames'] >= max_frames:
+                break
+            if next_report is not None and now >= next_report:
+                self.log(self.format_stats())
+                next_report += report_interval
+
+            if not self.is_connected:
+                self.stats['reconnects'] += 1
+                if self._stop_event.wait(backoff):
+                    break
+                if self.connect():
+                    backoff = self.reconnect_delay
+                else:
+                    backoff = min(backoff * 2, self.max_reconnect_delay)
+                continue
+
+            if self.backpressure is not None:
+                delay = self.backpressure()
+                if delay > 0:
+                    self.stats['throttled'] += 1
+                    if self._stop_event.wait(delay):
+                        break
+                    continue
+
+            if getattr(self.serial_port, 'finished', False):
+                self.log("⏹️ 세션 재생 완료")
+                break
+
+            try:
+                self.capture_once()
+            except (serial.SerialException, OSError) as e:
+                self.stats['port_errors'] += 1
+                self.log(f"❌ 포트 오류: {e} - 재연결 시도")
+                self.disconnect()
+                continue
+            except Exception as e:
+                self.log(f"⚠️ 캡처 처리 오류: {e}")
+
+            # 고정 주기 (밀린 주기는 건너뜀)
+            if self.interval > 0:
+                next_request = max(next_request + self.interval, time.monotonic())
+                self._stop_event.wait(max(0.0, next_request - time.monotonic()))
+
+    def stop(self):
+        """run() 종료 요청 (시그널 핸들러/다른 스레드에서 호출 가능)"""
+        self._stop_event.set()
+
+    def close(self):
+        """종료: 녹화 색인 기록, 로그 flush, 포트 닫기"""
+        if self._closed:
+            return
+        self._closed = True
+        self.stop()
+        self.disconnect()
+        if self.recorder is not None:
+            try:
+                self.recorder.close()
+            except Exception as e:
+                self.log(f"⚠️ 세션 녹화 종료 오류: {e}")
+        if self.status_logger is not None and self.owns_status_logger:
+            try:
+                self.status_logger.close()
+            except Exception as e:
+                self.log(f"⚠️ 로그 종료 오류: {e}")
+
+    # ------------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------------
+    def get_stats(self) -> Dict:
+        stats = dict(self.stats)
+        elapsed = time.time() - stats['started_at'] if stats['started_at'] else 0.0
+        stats['elapsed'] = elapsed
+        stats['fps'] = stats['frames'] / elapsed if elapsed > 0 else 0.0
+        stats['latency'] = self.latency.get_stats()
+        if self.recorder is not None:
+            stats['recorder'] = self.recorder.get_stats()
+        return stats
+
+    def format_stats(self) -> str:
+        stats = self.get_stats()
+        line = (f"📊 {stats['frames']}프레임 {stats['fps']:.1f} fps, 손상 {stats['corrupted']} "
+                f"(복구 {stats['recovered']}), 타임아웃 {stats['timeouts']}, "
+                f"재연결 {stats['reconnects']} | 지연 {self.latency.format_summary()}")
+        if self.recorder is not None:
+            line += f" | 녹화 {stats['recorder']['bytes_written'] / 1024:.0f}KB"
+        return line
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+다중 디바이스 모니터 (한 프로세스에서 여러 OnBoard 보드 동시 수집)
+
+포트마다 MonitorCore 하나와 캡처 스레드 하나를 둔다. 펌웨어가 요청/응답 방식이라
+포트별 스레드는 대부분 응답 대기로 블로킹되어 있으므로, 수십 개 포트도 Tk 루프나
+프로세스 없이 처리된다. 로그는 장치별 디렉토리에 기록하되 기록 스레드
+(AsyncLogWriter)는 하나를 공유하고, 기록 대기열이 max_pending_logs를 넘으면 모든
+장치의 요청을 잠시 늦춘다 (back-pressure).
+
+집계 API:
+    snapshot()      장치별 연결/프레임/fps/최근 상태
+    totals()        전체 합계
+    get_event()     (장치 이름, 프레임, 상태) 이벤트 큐 (크기 제한, 가득 차면 오래된 것 폐기)
+
+사용 예:
+    python multi_monitor.py /dev/ttyUSB0 /dev/ttyUSB1 rack3=/dev/ttyUSB2 --record-dir LOG/sessions
+"""
+
+import os
+import queue
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from monitor_core import MonitorCore
+from utils import AsyncLogWriter, StatusLogger
+
+
+def device_name_for_port(port: str) -> str:
+    """포트 이름에서 장치 이름 생성 (/dev/ttyUSB0 -> ttyUSB0, replay:a/b.oses -> b)"""
+    name = os.path.splitext(os.path.basename(port.split(':', 1)[-1].rstrip('/\\')))[0]
+    return re.sub(r'[^A-Za-z0-9_.-]', '_', name) or 'device'
+
+
+class MultiDeviceMonitor:
+    """
+    여러 포트 동시 캡처 서비스
+
+    Args:
+        baudrate, interval, binary, timeout, replay_speed: 장치 기본 설정 (add_device에서 재정의 가능)
+        log_dir: 로그 루트 (장치별 하위 디렉토리), None이면 로그 없음
+        record_dir: 세션 녹화 디렉토리 (None이면 녹화 없음)
+        flush_interval: 공유 로그 기록 주기 (초)
+        max_pending_logs: 기록 대기 레코드 상한 (초과시 요청 지연)
+        event_queue_size: 집계 이벤트 큐 크기
+        log: 메시지 출력 함수
+    """
+
+    BACKPRESSURE_DELAY = 0.05
+
+    def __init__(self, baudrate: int = 921600, interval: float = 0.0, binary: bool = True,
+                 timeout: float = 1.0, replay_speed: float = 0.0,
+                 log_dir: Optional[str] = "LOG", record_dir: Optional[str] = None,
+                 flush_interval: float = 0.5, max_pending_logs: int = 20000,
+                 event_queue_size: int = 1000, log: Callable[[str], None] = print):
+        self.defaults = {
+            'baudrate': baudrate,
+            'interval': interval,
+            'binary': binary,
+            'timeout': timeout,
+            'replay_speed': replay_speed
+        }
+        self.log_dir = log_dir
+        self.record_dir = record_dir
+        self.max_pending_logs = max_pending_logs
+        self.log = log
+
+        self.log_writer = AsyncLogWriter(flush_interval) if log_dir else None
+        self.devices = {}       # 이름 -> MonitorCore
+        self.threads = {}       # 이름 -> 캡처 스레드
+        self.events = queue.Queue(maxsize=event_queue_size)
+        self._lock = threading.Lock()
+        self.stats = {
+            'events': 0,
+            'dropped_events': 0,
+            'backpressure_waits': 0,
+            'started_at': None
+        }
+
+    def add_device(self, port: str, name: Optional[str] = None, **overrides) -> MonitorCore:
+        """장치 추가 (시작 후 추가하면 바로 캡처 시작)"""
+        name = name or device_name_for_port(port)
+        base_name, suffix = name, 2
+        while name in self.devices:
+            name = f"{base_name}_{suffix}"
+            suffix += 1
+
+        options = dict(self.defaults)
+        options.update(overrides)
+
+        status_logger = None
+        if self.log_writer is not None:
+            status_logger = StatusLogger(os.path.join(self.log_dir, name), writer=self.log_writer)
+        record_path = None
+        if self.record_dir:
+            record_path = os.path.join(self.record_dir,
+                                       f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.oses")
+
+        core = MonitorCore(
+            port,
+            log_dir=None,
+            status_logger=status_logger,
+            record_path=record_path,
+            log=lambda message, name=name: self.log(f"[{name}] {message}"),
+            on_frame=lambda frame, status, name=name: self._on_frame(name, frame, status),
+            backpressure=self._backpressure,
+            **options
+        )
+        with self._lock:
+            self.devices[name] = core
+            running = self.stats['started_at'] is not None
+        if running:
+            self._start_device(name)
+        return core
+
+    def remove_device(self, name: str, timeout: float = 2.0):
+        """장치 캡처 중지 및 정리"""
+        with self._lock:
+            core = self.devices.pop(name, None)
+            thread = self.threads.pop(name, None)
+        if core is None:
+            return
+        core.stop()
+        if thread is not None:
+            thread.join(timeout)
+        core.close()
+
+    def start(self):
+        """모든 장치 캡처 시작"""
+        self.stats['started_at'] = time.time()
+        for name in list(self.devices):
+            self._start_device(name)
+
+    def _start_device(self, name: str):
+        core = self.devices[name]
+        thread = threading.Thread(target=self._run_device, args=(name, core),
+                                  name=f"Capture-{name}", daemon=True)
+        self.threads[name] = thread
+        thread.start()
+
+    def _run_device(self, name: str, core: MonitorCore):
+        try:
+            core.run(report_interval=0)
+        except Exception as e:
+            self.log(f"[{name}] ❌ 캡처 스레드 오류: {e}")
+
+    def stop(self, timeout: float = 2.0):
+        """모든 캡처 중지 후 녹화/로그/포트 정리"""
+        for core in list(self.devices.values()):
+            core.stop()
+        for thread in list(self.threads.values()):
+            thread.join(timeout)
+        for core in list(self.devices.values()):
+            core.close()
+        self.threads.clear()
+        if self.log_writer is not None:
+            self.log_writer.close()
+
+    def wait(self, duration: Optional[float] = None, report_interval: float = 10.0,
+             stop_event: Optional[threading.Event] = None):
+        """캡처 스레드가 끝나거나 duration/stop_event까지 대기하며 주기적으로 집계 출력"""
+        stop_event = stop_event or threading.Event()
+        end = time.monotonic() + duration if duration is not None else None
+        next_report = time.monotonic() + report_interval if report_interval > 0 else None
+        while not stop_event.is_set():
+            if not any(thread.is_alive() for thread in self.threads.values()):
+                break
+            now = time.monotonic()
+            if end is not None and now >= end:
+                break
+            if next_report is not None and now >= next_report:
+                self.log(self.format_table())
+                next_report += report_interval
+            stop_event.wait(0.2)
+
+    # ------------------------------------------------------------------
+    # back-pressure / 이벤트
+    # ------------------------------------------------------------------
+    def _backpressure(self) -> float:
+        """공유 로그 기록이 밀리면 모든 장치의 요청을 지연"""
+        if self.log_writer is not None and self.log_writer.pending() > self.max_pending_logs:
+            self.stats['backpressure_waits'] += 1
+            return self.BACKPRESSURE_DELAY
+        return 0.0
+
+    def _on_frame(self, name: str, frame: Dict, status: Optional[Dict]):
+        event = (name, frame, status)
+        try:
+            self.events.put_nowait(event)
+        except queue.Full:
+            # 소비가 느리면 가장 오래된 이벤트 폐기
+            try:
+                self.events.get_nowait()
+            except queue.Empty:
+                pass
+            self.stats['dropped_events'] += 1
+            try:
+                self.events.put_nowait(event)
+            except queue.Full:
+                pass
+        self.stats['events'] += 1
+
+    def get_event(self, timeout: Optional[float] = None) -> Optional[Tuple[str, Dict, Optional[Dict]]]:
+        """집계 이벤트 (장치 이름, 프레임, 상태) 대기"""
+        try:
+            return self.events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    # ------------------------------------------------------------------
+    # 집계
+    # ------------------------------------------------------------------
+    def snapshot(self) -> Dict[str, Dict]:
+        """장치별 현재 상태"""
+        result = {}
+        for name, core in list(self.devices.items()):
+            stats = core.get_stats()
+            status = core.latest_status or {}
+            thread = self.threads.get(name)
+            result[name] = {
+                'port': core.port_name,
+                'connected': core.is_connected,
+                'running': thread is not None and thread.is_alive(),
+                'binary': core.binary_active,
+                'frames': stats['frames'],
+                'fps': stats['fps'],
+                'corrupted': stats['corrupted'],
+                'timeouts': stats['timeouts'],
+                'reconnects': stats['reconnects'],
+                'p99_ms': core.latency.percentile(0.99) * 1000 if core.latency.count else 0.0,
+                'battery': status.get('battery'),
+                'timer': status.get('timer'),
+                'status': status.get('status')
+            }
+        return result
+
+    def totals(self) -> Dict:
+        """전체 합계"""
+        snapshot = self.snapshot()
+        totals = {
+            'devices': len(snapshot),
+            'connected': sum(1 for device in snapshot.values() if device['connected']),
+            'frames': sum(device['frames'] for device in snapshot.values()),
+            'fps': sum(device['fps'] for device in snapshot.values()),
+            'corrupted': sum(device['corrupted'] for device in snapshot.values()),
+            'timeouts': sum(device['timeouts'] for device in snapshot.values()),
+            'log_pending': self.log_writer.pending() if self.log_writer is not None else 0
+        }
+        totals.update(self.stats)
+        return totals
+
+    def format_table(self) -> str:
+        """장치별 요약 표"""
+        lines = [f"{'장치':<14}{'연결':<6}{'프레임':>8}{'fps':>8}{'손상':>6}{'타임아웃':>8}"
+                 f"{'p99ms':>8}  {'상태':<10}{'타이머':<8}{'배터리':>6}"]
+        for name, device in sorted(self.snapshot().items()):
+            lines.append(f"{name:<14}{'O' if device['connected'] else 'X':<6}{device['frames']:>8}"
+                         f"{device['fps']:>8.1f}{device['corrupted']:>6}{device['timeouts']:>8}"
+                         f"{device['p99_ms']:>8.2f}  {str(device['status'] or '-'):<10}"
+                         f"{str(device['timer'] or '-'):<8}{str(device['battery'] or '-'):>6}")
+        totals = self.totals()
+        lines.append(f"합계: {totals['connected']}/{totals['devices']} 연결, {totals['frames']}프레임, "
+                     f"{totals['fps']:.1f} fps, 로그 대기 {totals['log_pending']}, "
+                     f"이벤트 폐기 {totals['dropped_events']}, 지연 {totals['backpressure_waits']}")
+        return "\n".join(lines)
+
+
+def parse_device_spec(spec: str) -> Tuple[Optional[str], str]:
+    """'이름=포트' 또는 '포트'"""
+    if '=' in spec:
+        name, port = spec.split('=', 1)
+        return name.strip() or None, port.strip()
+    return None, spec
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+    import signal
+
+    parser = argparse.ArgumentParser(description="다중 OnBoard 디바이스 헤드리스 수집")
+    parser.add_argument("ports", nargs="+", help="포트 목록 ('이름=포트' 형식 가능, replay:<파일> 지원)")
+    parser.add_argument("--baud", type=int, default=921600, help="보드레이트")
+    parser.add_argument("--interval", type=float, default=0.0, help="장치별 요청 간격 (초, 0 = 최대 속도)")
+    parser.add_argument("--duration", type=float, default=None, help="실행 시간 (초)")
+    parser.add_argument("--text", action="store_true", help="텍스트 화면 전송 사용")
+    parser.add_argument("--log-dir", default="LOG", help="로그 루트 디렉토리")
+    parser.add_argument("--no-log", action="store_true", help="상태 로그 기록 안 함")
+    parser.add_argument("--record-dir", default=None, help="세션 녹화 디렉토리")
+    parser.add_argument("--report", type=float, default=10.0, help="집계 출력 주기 (초)")
+    args = parser.parse_args(argv)
+
+    monitor = MultiDeviceMonitor(baudrate=args.baud, interval=args.interval, binary=not args.text,
+                                 log_dir=None if args.no_log else args.log_dir,
+                                 record_dir=args.record_dir)
+    for spec in args.ports:
+        name, port = parse_device_spec(spec)
+        monitor.add_device(port, name)
+
+    stop_event = threading.Event()
+
+    def request_stop(signum, frame):
+        print(f"\n종료 신호 수신 ({signal.Signals(signum).name}) - 정리 중...")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, request_stop)
+    if hasattr(signal, 'SIGTERM'):
+        signal.signal(signal.SIGTERM, request_stop)
+
+    print(f"🚀 다중 디바이스 모니터 시작: {len(monitor.devices)}개 장치")
+    monitor.start()
+    try:
+        monitor.wait(args.duration, args.report, stop_event)
+    finally:
+        monitor.stop()
+        print(monitor.format_table())
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -4,9 +4,10 @@ import serial
 import struct
 import time
 import threading
+import queue
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-from PIL import Image, ImageTk
+from tkinter import ttk, filedialog, messagebox, simpledialog
+from PIL import Image
 import numpy as np
 import json
 from datetime import datetime
@@ -18,15 +19,52 @@ import csv
 # 프로젝트 내 모듈 import
 try:
     from utils import StatusLogger, FileManager, Logger
-    from Python.OLED_Monitor.Core.serial_parser import SerialDataParser
 except ImportError:
     # 모듈이 없는 경우 기본 기능으로 대체
     StatusLogger = None
     FileManager = None
     Logger = None
-    SerialDataParser = None
+
+from serial_parser import OLEDImageDecoder, REVERSE_BYTE_LUT, SerialDataParser
+from async_transport import AsyncSerialTransport, TkCallbackBridge
+from monitor_core import MonitorCore
+from session_recorder import SessionRecorder
+from session_replay import REPLAY_PORT_PREFIX, ReplaySerialPort, open_replay_port
+from status_history import StatusHistory
+from trend_panel import BatteryTrendPanel
+from utils import (AsyncLogWriter, LatencyHistogram, ParseDeadline, ParseTimeoutError, ParseWatchdog,
+                   PerformanceMonitor, StageProfiler)
+import asyncio
+from collections import deque
+
+
+def _keyword_pattern(*keywords):
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+
+# 로그 메시지 분류 (우선순위 순서: 분류, 같은 메시지 재출력 제한 간격(초), 키워드)
+LOG_CATEGORIES = (
+    ("critical", 1.0, _keyword_pattern("오류", "실패", "ERROR", "❌", "CRITICAL", "FATAL")),
+    ("warning", 3.0, _keyword_pattern("경고", "WARNING", "⚠️", "주의")),
+    ("status", 5.0, _keyword_pattern("상태 요청", "GET_STATUS", "배터리", "타이머", "BAT_ADC")),
+    ("info", 10.0, _keyword_pattern("파싱 방법:", "✅ 파싱 완료", "수신 중...", "진행상황", "FPS:", "성공률:")),
+)
+LOG_GENERAL_INTERVAL = 2.0
+
+# 내용만 다른 반복 메시지를 하나의 스로틀 키로 묶음
+LOG_KEY_PATTERNS = (
+    ("data_receiving", _keyword_pattern("수신 중...")),
+    ("parsing_complete", _keyword_pattern("✅ 파싱 완료")),
+    ("parsing_method_change", _keyword_pattern("파싱 방법:")),
+    ("progress_update", _keyword_pattern("진행상황")),
+)
+LOG_PERFORMANCE_PATTERN = re.compile(r"FPS:.*성공률:|성공률:.*FPS:")
+LOG_CONSOLE_PATTERN = _keyword_pattern("연결", "시작", "중지", "성공")
 
 class OLEDMonitor:
+    # 배터리 추세 표시 구간 (콤보박스 이름 -> 초)
+    TREND_WINDOWS = {"1분": 60, "10분": 600, "1시간": 3600, "8시간": 28800}
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("OnBoard OLED Monitor v2.0 - 통합 응답 프로토콜")
@@ -39,6 +77,12 @@ class OLEDMonitor:
         
         # 무한루프 방지 및 안전 설정
         self.serial_lock = threading.Lock()
+        
+        # 캡처 세션 (수신 스레드, 화면 포맷 협상, 화면 요청/손상 프레임 재요청) - headless와 공유
+        self.capture_core = MonitorCore(None, log_dir=None, history_size=1,
+                                        log=lambda message: self.log_message(message))
+        self.write_lock = self.capture_core.write_lock  # 명령 전송 직렬화 (수신은 serial_reader 전담)
+        self.serial_reader = None
         self.last_screen_request_time = 0
         self.last_status_request_time = 0
         self.request_min_interval = 0.1  # 100ms 최소 간격
@@ -47,6 +91,10 @@ class OLEDMonitor:
         self.max_parse_time = 2.0  # 최대 파싱 시간 2초
         self.max_parse_attempts = 3  # 최대 파싱 시도 횟수
         self.parsing_active = False  # 파싱 진행 상태 플래그
+        self.parse_deadline = None  # 진행 중인 파싱의 마감 시각 (ParseDeadline)
+        self.parse_histograms = {}  # 파싱 이름별 소요 시간 히스토그램
+        self.parse_watchdog_enabled = True  # 공유 감시 스레드 사용 여부
+        self.parse_watchdog = ParseWatchdog(self.on_parse_overrun)
         
         # NumPy 가용성 검사 복구
         try:
@@ -69,12 +117,41 @@ class OLEDMonitor:
         self.current_screen = None
         self.current_status = {}
         
+        # 펌웨어 상태 기록 (열 단위 배열, 10Hz 기준 약 8시간 = 7MB) 및 추세 패널
+        self.status_history = StatusHistory(max_samples=300000)
+        self.trend_panel = None
+        
+        # 화면 표시 캐시 (지속 PhotoImage, 변경 행만 다시 그림)
+        self.display_photo = None
+        self.display_item = None
+        self.display_pixels = None       # 마지막으로 그린 픽셀 배열 사본
+        self.display_scale_cached = 0
+        # (원시 데이터, 파싱 방법, 디코딩 결과) - 캡처 스레드가 기록, 동일 프레임은 디코딩/표시 생략
+        # 다른 화면(테스트 패턴 등)이 표시되면 update_display가 비워서 다음 프레임을 다시 표시
+        self.last_frame = None
+        self.display_stats = {
+            'identical_frames': 0,       # 원시 데이터가 같아 디코딩/표시 요청 생략
+            'unchanged_frames': 0,       # 픽셀 변화 없어 다시 그리기 생략
+            'drawn_frames': 0,
+            'dirty_rows': 0
+        }
+        
         # 모니터링 및 성능 관련
         self.auto_request_enabled = True
         self.integrated_mode = True  # 통합 모드 기본 활성화
         
         # 모니터링 모드 설정 (새로 추가)
-        self.monitoring_mode = "integrated"  # "integrated", "screen_only", "status_only"
+        self.monitoring_mode = "integrated"  # "integrated", "pipelined", "screen_only", "status_only"
+        
+        # 파이프라인 모드 설정 (요청/수신 → 파싱 → 표시 단계 분리)
+        self.pipeline_depth = 2  # 수신 후 파싱/표시 대기 중일 수 있는 최대 프레임 수
+        self.pipeline_thread = None
+        self.pipeline_display_pending = None  # (화면 데이터, 슬롯 세마포어) - 최신 프레임만 유지
+        self.pipeline_display_lock = threading.Lock()
+        
+        # asyncio 전송 모드 (요청/응답/재요청을 하나의 이벤트 루프에서 처리)
+        self.async_transport = None
+        self.tk_bridge = TkCallbackBridge(self.root)  # 루프 → Tk 단일 wakeup 전달
         
         self.performance_stats = {
             'total_captures': 0,
@@ -83,9 +160,26 @@ class OLEDMonitor:
             'last_fps': 0,
             'start_time': time.time()
         }
-        
-        # 로그 스로틀링 (메시지 스팸 방지)
-        self.log_throttle = {}
+        # 현재 FPS(지수 감쇠)와 왕복 시간 p50/p95/p99 - 프레임마다 O(1) 기록
+        self.performance_monitor = PerformanceMonitor()
+        
+        # 로그 파이프라인: 생산자(아무 스레드)는 레코드를 제한 큐에 넣기만 하고,
+        # Tk 메인 스레드의 주기 작업이 모아서 한 번에 텍스트 위젯에 추가한다
+        self.log_throttle = {}             # 스로틀 키 -> 마지막 출력 시각 (삽입 순서 = 오래된 순)
+        self.log_throttle_limit = 100
+        self.log_lock = threading.Lock()
+        self.log_records = deque(maxlen=500)
+        self.log_flush_ms = 100
+        self.log_max_lines = 100
+        self.log_stats = {'queued': 0, 'throttled': 0, 'dropped': 0, 'flushes': 0}
+        
+        # 로그 파일 기록 스레드 (캡처 경로에서 디스크 I/O 제거)
+        self.log_flush_interval = 0.5
+        self.log_writer = AsyncLogWriter(self.log_flush_interval)
+        
+        # 바이너리 화면 전송 (SET_SCREEN_FORMAT:BINARY 협상 성공시 GET_SCREEN_BIN 사용)
+        self.binary_transfer_requested = True
+        self.binary_screen_active = False
         
         # 초기화
         self.setup_fallback_logging()
@@ -98,21 +192,45 @@ class OLEDMonitor:
         # 시작 메시지 (지연 출력)
         self.root.after(1000, lambda: self.log_message(self.log_startup_message))
         
+        # 로그 큐 비우기 주기 작업 (Tk 메인 스레드)
+        self.root.after(self.log_flush_ms, self.flush_log_messages)
+        
         # OLED 설정
         self.OLED_WIDTH = 128
         self.OLED_HEIGHT = 64
         self.IMAGE_SIZE = (self.OLED_WIDTH // 8) * self.OLED_HEIGHT  # 1024 bytes
         
+        # 캡처 파이프라인 단계별 소요 시간 (도구 > 단계별 지연 시간)
+        self.stage_profiler = StageProfiler()
+        self.stage_window = None
+        
+        # 벡터화 이미지 디코더 (모든 파싱 방법 공통)
+        self.image_decoder = OLEDImageDecoder(self.OLED_WIDTH, self.OLED_HEIGHT)
+        self.image_decoder.profiler = self.stage_profiler
+        
+        # GET_SCREEN 응답 증분 프레이머 (청크 단위 수신, 재스캔 없음) - 캡처 세션 소유
+        self.frame_decoder = self.capture_core.frame_decoder
+        self.status_grace_period = 0.05  # 화면 수신 후 STATUS 줄 대기 시간 (50ms)
+        self.frame_queue_size = 4  # 수신 프레임 큐 크기 (가득 차면 오래된 프레임 폐기)
+        
+        # 손상 프레임(체크섬/CRC 오류) 재요청 정책 - 같은 요청당 최대 횟수, 타임아웃은 재요청 안 함
+        self.corrupt_frame_retries = 1
+        self.frame_retry_stats = self.capture_core.stats  # corrupted/retried/recovered (캡처 세션과 공유)
+        
+        # 세션 녹화 (파일 메뉴에서 시작/중지, 수신 프레임과 STATUS 줄을 바이너리 컨테이너에 기록)
+        self.session_recorder = None
+        
+        # 세션 재생 ('replay:<파일>' 포트로 연결, 0 = 최대 속도 벤치마크)
+        self.replay_speed = 1.0
+        
         # 현재 화면 데이터
         self.current_screen = None
         self.current_status = {}
         
         # 파싱 방법 설정 (가장 안정적인 방법으로 기본값 변경)
         self.parsing_method = "method3_rotated_180"  # 세로 뒤집기가 가장 안정적
-        
-        # 로그 출력 최적화 - 중복 방지
-        self.log_throttle = {}  # 메시지별 마지막 출력 시간
-        self.log_throttle_interval = 2.0  # 2초 내 동일 메시지는 한 번만 출력
+        self.image_decoder.set_method(self.parsing_method)  # 방향 변환 계획 미리 계산
+        self.logged_parsing_method = None  # 마지막으로 로그에 남긴 파싱 방법
         
     def setup_status_logging(self):
         """상태 로깅 시스템 설정 - 실행 위치 기반 로그 폴더 생성"""
@@ -171,17 +289,8 @@ class OLEDMonitor:
             self.status_logger = None
     
     def setup_serial_parser(self):
-        """시리얼 파서 초기화"""
-        try:
-            if SerialDataParser:
-                self.serial_parser = SerialDataParser()
-                print(f"✅ 시리얼 파서 초기화 완료")
-            else:
-                self.serial_parser = None
-                print(f"⚠️ 시리얼 파서 모듈 없음 - 기본 파싱 사용")
-        except Exception as e:
-            print(f"❌ 시리얼 파서 초기화 실패: {str(e)}")
-            self.serial_parser = None
+        """시리얼 파서 초기화 - 모든 상태 파싱 경로가 공유 (parse_firmware_status_data)"""
+        self.serial_parser = SerialDataParser()
     
     def init_status_log_file(self):
         """상태 로그 파일 헤더 초기화"""
@@ -194,18 +303,18 @@ class OLEDMonitor:
                     return  # 오늘 파일이면 헤더 추가하지 않음
             
             # 새 파일이거나 어제 파일이면 헤더 작성
-            with open(self.status_log_file, 'a', encoding='utf-8') as f:
-                f.write("=" * 80 + "\n")
-                f.write(f"OnBoard OLED Monitor 상태 로그 - {datetime.now().strftime('%Y년 %m월 %d일')}\n")
-                f.write("=" * 80 + "\n")
-                f.write("시간\t\t\t배터리\t타이머\t\t상태\t\tL1\tL2\t비고\n")
-                f.write("-" * 80 + "\n")
+            self.log_writer.write(self.status_log_file,
+                                  "=" * 80 + "\n" +
+                                  f"OnBoard OLED Monitor 상태 로그 - {datetime.now().strftime('%Y년 %m월 %d일')}\n" +
+                                  "=" * 80 + "\n" +
+                                  "시간\t\t\t배터리\t타이머\t\t상태\t\tL1\tL2\t비고\n" +
+                                  "-" * 80 + "\n")
                 
         except Exception as e:
             print(f"❌ 상태 로그 파일 헤더 초기화 실패: {str(e)}")
     
     def write_status_log(self, status_data):
-        """상태 데이터를 텍스트 파일에 기록"""
+        """상태 데이터를 텍스트 파일에 기록 (기록 스레드로 전달, 대기 없음)"""
         if not hasattr(self, 'status_log_file') or not self.status_log_file:
             return
             
@@ -220,53 +329,59 @@ class OLEDMonitor:
             l2_connected = "O" if status_data.get('l2_connected', False) else "X"
             bat_adc = status_data.get('bat_adc', 0)
             
-            with open(self.status_log_file, 'a', encoding='utf-8') as f:
-                f.write(f"{timestamp}\t\t{battery}V\t{timer}\t\t{status}\t\t{l1_connected}\t{l2_connected}\t{bat_adc}\n")
+            self.log_writer.write(self.status_log_file,
+                                  f"{timestamp}\t\t{battery}V\t{timer}\t\t{status}\t\t{l1_connected}\t{l2_connected}\t{bat_adc}\n")
             
         except Exception as e:
             # 로그 기록 실패시 콘솔에만 출력 (무한 루프 방지)
             print(f"상태 로그 기록 실패: {str(e)}")
     
     def write_raw_data_log(self, raw_data, data_type="UNKNOWN", additional_info=""):
-        """RAW 데이터를 별도 로그 파일에 기록"""
+        """RAW 데이터를 별도 로그 파일에 기록 (HEX 덤프는 기록 스레드에서 생성)"""
         if not hasattr(self, 'raw_data_log_file') or not self.raw_data_log_file:
             return
             
         try:
             timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+            if isinstance(raw_data, (bytearray, memoryview)):
+                raw_data = bytes(raw_data)  # 호출측 버퍼 재사용 대비 복사
             
-            with open(self.raw_data_log_file, 'a', encoding='utf-8') as f:
-                f.write(f"[{timestamp}] {data_type}\n")
-                f.write(f"크기: {len(raw_data)} bytes\n")
-                
-                if additional_info:
-                    f.write(f"추가 정보: {additional_info}\n")
-                
-                # RAW 데이터 헥스 덤프
-                if isinstance(raw_data, bytes):
-                    f.write("HEX: ")
-                    f.write(' '.join(f'{b:02X}' for b in raw_data[:100]))  # 처음 100바이트만
-                    if len(raw_data) > 100:
-                        f.write(f" ... (총 {len(raw_data)} bytes)")
-                    f.write("\n")
-                    
-                    # 텍스트 표현 (가능한 경우)
-                    try:
-                        text_repr = raw_data.decode('utf-8', errors='replace')
-                        f.write(f"TEXT: {repr(text_repr[:200])}")  # 처음 200자만
-                        if len(text_repr) > 200:
-                            f.write(f" ... (총 {len(text_repr)} chars)")
-                        f.write("\n")
-                    except:
-                        f.write("TEXT: [디코딩 불가]\n")
-                else:
-                    f.write(f"DATA: {str(raw_data)[:200]}\n")
-                
-                f.write("-" * 50 + "\n\n")
+            self.log_writer.write(self.raw_data_log_file,
+                                  lambda: self.format_raw_data_log(timestamp, raw_data, data_type, additional_info))
                 
         except Exception as e:
             print(f"RAW 데이터 로그 기록 실패: {str(e)}")
     
+    @staticmethod
+    def format_raw_data_log(timestamp, raw_data, data_type, additional_info):
+        """RAW 데이터 로그 블록 생성"""
+        lines = [f"[{timestamp}] {data_type}\n", f"크기: {len(raw_data)} bytes\n"]
+        
+        if additional_info:
+            lines.append(f"추가 정보: {additional_info}\n")
+        
+        # RAW 데이터 헥스 덤프
+        if isinstance(raw_data, bytes):
+            hex_line = "HEX: " + ' '.join(f'{b:02X}' for b in raw_data[:100])  # 처음 100바이트만
+            if len(raw_data) > 100:
+                hex_line += f" ... (총 {len(raw_data)} bytes)"
+            lines.append(hex_line + "\n")
+            
+            # 텍스트 표현 (가능한 경우)
+            try:
+                text_repr = raw_data.decode('utf-8', errors='replace')
+                text_line = f"TEXT: {repr(text_repr[:200])}"  # 처음 200자만
+                if len(text_repr) > 200:
+                    text_line += f" ... (총 {len(text_repr)} chars)"
+                lines.append(text_line + "\n")
+            except:
+                lines.append("TEXT: [디코딩 불가]\n")
+        else:
+            lines.append(f"DATA: {str(raw_data)[:200]}\n")
+        
+        lines.append("-" * 50 + "\n\n")
+        return ''.join(lines)
+    
     def write_event_log(self, event_type, message, details=""):
         """이벤트 로그 기록 - 비활성화됨"""
         pass
@@ -306,6 +421,8 @@ class OLEDMonitor:
         menubar.add_cascade(label="파일", menu=file_menu)
         file_menu.add_command(label="화면 저장", command=self.save_screen)
         file_menu.add_command(label="세션 기록", command=self.save_session)
+        file_menu.add_command(label="세션 녹화 시작/중지", command=self.toggle_session_recording)
+        file_menu.add_command(label="세션 재생...", command=self.open_session_replay)
         file_menu.add_separator()
         file_menu.add_command(label="종료", command=self.on_closing)
         
@@ -313,6 +430,7 @@ class OLEDMonitor:
         tools_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="도구", menu=tools_menu)
         tools_menu.add_command(label="상태 로그 열기", command=self.open_status_log)
+        tools_menu.add_command(label="단계별 지연 시간", command=self.open_stage_profile)
         tools_menu.add_command(label="설정", command=self.open_settings)
         tools_menu.add_command(label="도움말", command=self.show_help)
         
@@ -350,7 +468,7 @@ class OLEDMonitor:
         ttk.Label(conn_frame, text="갱신 주기(ms):").grid(row=1, column=0, padx=5, pady=2, sticky=tk.W)
         self.interval_var = tk.StringVar(value="50")
         interval_combo = ttk.Combobox(conn_frame, textvariable=self.interval_var, width=8)
-        interval_combo['values'] = ['50', '100', '200', '500', '1000', '2000']
+        interval_combo['values'] = ['10', '20', '50', '100', '200', '500', '1000', '2000']
         interval_combo.grid(row=1, column=1, padx=5, pady=2)
         interval_combo.bind('<<ComboboxSelected>>', self.on_interval_changed)
         
@@ -365,12 +483,21 @@ class OLEDMonitor:
         self.update_mode_label = ttk.Label(conn_frame, text="수동 모드", foreground="orange")
         self.update_mode_label.grid(row=1, column=3, padx=5, pady=2)
         
+        # 바이너리 화면 전송 체크박스 (미지원 펌웨어는 텍스트 전송 유지)
+        self.binary_transfer_var = tk.BooleanVar(value=self.binary_transfer_requested)
+        binary_transfer_cb = ttk.Checkbutton(conn_frame, text="바이너리 전송 (델타/RLE)",
+                                             variable=self.binary_transfer_var,
+                                             command=self.on_binary_transfer_changed)
+        binary_transfer_cb.grid(row=1, column=4, columnspan=2, padx=5, pady=2, sticky=tk.W)
+        
         # 세 번째 행: 모니터링 모드 선택
         ttk.Label(conn_frame, text="모니터링 모드:").grid(row=2, column=0, padx=5, pady=2, sticky=tk.W)
         self.monitoring_mode_var = tk.StringVar(value="integrated")
         monitoring_combo = ttk.Combobox(conn_frame, textvariable=self.monitoring_mode_var, width=15)
         monitoring_combo['values'] = [
             'integrated',    # 통합 모드 (화면+상태)
+            'pipelined',     # 파이프라인 모드 (화면+상태, 파싱/표시 분리)
+            'async',         # asyncio 전송 모드 (화면+상태, 코루틴 요청/응답)
             'screen_only',   # 화면만
             'status_only'    # 상태만
         ]
@@ -381,6 +508,14 @@ class OLEDMonitor:
         self.monitoring_mode_label = ttk.Label(conn_frame, text="통합 모드 (화면+상태)", foreground="blue")
         self.monitoring_mode_label.grid(row=2, column=2, columnspan=2, padx=5, pady=2, sticky=tk.W)
         
+        # 파이프라인 깊이 선택
+        ttk.Label(conn_frame, text="파이프라인 깊이:").grid(row=2, column=4, padx=5, pady=2, sticky=tk.W)
+        self.pipeline_depth_var = tk.StringVar(value=str(self.pipeline_depth))
+        pipeline_combo = ttk.Combobox(conn_frame, textvariable=self.pipeline_depth_var, width=5)
+        pipeline_combo['values'] = ['1', '2', '3', '4']
+        pipeline_combo.grid(row=2, column=5, padx=5, pady=2)
+        pipeline_combo.bind('<<ComboboxSelected>>', self.on_pipeline_depth_changed)
+        
     def create_display_frame(self, parent):
         """화면 표시 프레임"""
         display_frame = ttk.LabelFrame(parent, text="OLED 화면 (128x64)")
@@ -519,6 +654,29 @@ class OLEDMonitor:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.status_text.config(yscrollcommand=scrollbar.set)
         
+        # 배터리 추세 (status_history 최근 구간, 새 샘플은 선분만 추가)
+        trend_frame = ttk.LabelFrame(parent, text="배터리 추세 (전압 / BAT ADC)")
+        trend_frame.pack(fill=tk.X, pady=(5, 0))
+        
+        window_frame = ttk.Frame(trend_frame)
+        window_frame.pack(fill=tk.X, padx=5)
+        ttk.Label(window_frame, text="표시 구간:").pack(side=tk.LEFT)
+        self.trend_window_var = tk.StringVar(value="10분")
+        window_combo = ttk.Combobox(window_frame, textvariable=self.trend_window_var, width=8,
+                                    values=list(self.TREND_WINDOWS), state="readonly")
+        window_combo.pack(side=tk.LEFT, padx=(5, 0))
+        window_combo.bind('<<ComboboxSelected>>', self.on_trend_window_changed)
+        
+        self.trend_panel = BatteryTrendPanel(trend_frame, self.status_history,
+                                             window_seconds=self.TREND_WINDOWS["10분"])
+        self.trend_panel.pack(fill=tk.X, expand=True, padx=5, pady=5)
+        
+    def on_trend_window_changed(self, event=None):
+        """배터리 추세 표시 구간 변경"""
+        seconds = self.TREND_WINDOWS.get(self.trend_window_var.get())
+        if seconds and self.trend_panel is not None:
+            self.trend_panel.set_window(seconds)
+        
     def get_available_ports(self):
         """사용 가능한 시리얼 포트 목록 반환"""
         try:
@@ -559,19 +717,23 @@ class OLEDMonitor:
             
             self.log_message(f"포트 {port}에 연결 시도 중... (보드레이트: {baud})")
             
-            # 시리얼 포트 생성 및 설정
-            self.serial_port = serial.Serial(
-                port=port,
-                baudrate=baud,
-                bytesize=serial.EIGHTBITS,
-                parity=serial.PARITY_NONE,
-                stopbits=serial.STOPBITS_ONE,
-                timeout=1.0,
-                write_timeout=1.0,
-                xonxoff=False,
-                rtscts=False,
-                dsrdtr=False
-            )
+            # 시리얼 포트 생성 및 설정 (녹화 세션 재생 포트 포함)
+            if port.startswith(REPLAY_PORT_PREFIX):
+                self.serial_port = open_replay_port(port, speed=self.replay_speed,
+                                                    timeout=1.0, write_timeout=1.0)
+            else:
+                self.serial_port = serial.Serial(
+                    port=port,
+                    baudrate=baud,
+                    bytesize=serial.EIGHTBITS,
+                    parity=serial.PARITY_NONE,
+                    stopbits=serial.STOPBITS_ONE,
+                    timeout=1.0,
+                    write_timeout=1.0,
+                    xonxoff=False,
+                    rtscts=False,
+                    dsrdtr=False
+                )
             
             # 연결 확인
             if not self.serial_port.is_open:
@@ -580,6 +742,9 @@ class OLEDMonitor:
             # 버퍼 클리어
             self.clear_serial_buffers()
             
+            # 수신 전용 스레드 시작
+            self.start_serial_reader()
+            
             # 연결 성공 처리
             self.is_connected = True
             self.connect_btn.config(text="연결 해제", state="normal")
@@ -590,6 +755,9 @@ class OLEDMonitor:
             # 연결 테스트 (선택적)
             self.test_connection_quick()
             
+            # 화면 전송 포맷 협상
+            self.negotiate_screen_format()
+            
         except serial.SerialException as e:
             error_msg = f"시리얼 포트 오류: {str(e)}"
             self.connection_failed(error_msg)
@@ -599,6 +767,8 @@ class OLEDMonitor:
     
     def connection_failed(self, error_msg):
         """연결 실패 처리"""
+        self.stop_serial_reader()
+        
         # 시리얼 포트 정리
         if hasattr(self, 'serial_port') and self.serial_port:
             try:
@@ -628,12 +798,8 @@ class OLEDMonitor:
             if not self.is_connected or not self.serial_port:
                 return
                 
-            # PING 명령 전송
-            self.serial_port.write(b'PING\n')
-            self.serial_port.flush()
-            
-            # 응답 대기 (짧은 타임아웃)
-            response = self.wait_for_response(1000)  # 1초
+            # PING 명령 전송 후 응답 대기 (짧은 타임아웃)
+            response = self.send_command_and_wait("PING", 1000)  # 1초
             if response and b'PONG' in response:
                 self.log_message("✅ 통신 테스트 성공")
             else:
@@ -642,6 +808,50 @@ class OLEDMonitor:
         except Exception as e:
             self.log_message(f"⚠️ 통신 테스트 오류: {str(e)} (연결은 유지)")
     
+    # 화면 전송 포맷/재요청 설정은 캡처 세션(MonitorCore)이 보관
+    @property
+    def binary_transfer_requested(self):
+        return self.capture_core.binary_requested
+    
+    @binary_transfer_requested.setter
+    def binary_transfer_requested(self, value):
+        self.capture_core.binary_requested = value
+    
+    @property
+    def binary_screen_active(self):
+        return self.capture_core.binary_active
+    
+    @binary_screen_active.setter
+    def binary_screen_active(self, value):
+        self.capture_core.binary_active = value
+    
+    @property
+    def corrupt_frame_retries(self):
+        return self.capture_core.corrupt_frame_retries
+    
+    @corrupt_frame_retries.setter
+    def corrupt_frame_retries(self, value):
+        self.capture_core.corrupt_frame_retries = value
+    
+    def negotiate_screen_format(self):
+        """화면 전송 포맷 협상 - 지원 펌웨어면 바이너리(델타/RLE, CRC32), 아니면 텍스트 유지"""
+        if not self.is_connected or not self.serial_port:
+            self.binary_screen_active = False
+            return False
+        
+        try:
+            # 응답 대기는 현재 수신 경로(수신 스레드 또는 asyncio 전송)를 거침
+            return self.capture_core.negotiate_screen_format(
+                lambda command, timeout: self.send_command_and_wait(command, int(timeout * 1000)))
+        except Exception as e:
+            self.binary_screen_active = False
+            self.log_message(f"⚠️ 화면 포맷 협상 오류: {str(e)}")
+            return False
+    
+    def screen_request_command(self):
+        """현재 전송 포맷의 화면 요청 명령 (바이너리는 마지막 수신 시퀀스를 함께 보내 델타 요청)"""
+        return self.capture_core.screen_request_command()
+    
     def disconnect_device(self):
         """디바이스 연결 해제"""
         try:
@@ -654,12 +864,13 @@ class OLEDMonitor:
             if hasattr(self, 'serial_port') and self.serial_port:
                 try:
                     # 펌웨어에 정지 명령 전송 (선택적)
-                    if self.serial_port.is_open:
-                        self.serial_port.write(b'STOP_MONITOR\n')
-                        self.serial_port.flush()
+                    if self.serial_port.is_open and self.send_command('STOP_MONITOR'):
                         time.sleep(0.1)
                     
-                    # 포트 닫기
+                    # 수신 스레드 종료 후 포트 닫기
+                    self.stop_serial_reader()
+                    if isinstance(self.serial_port, ReplaySerialPort):
+                        self.log_replay_stats()
                     if self.serial_port.is_open:
                         self.serial_port.close()
                         
@@ -683,11 +894,47 @@ class OLEDMonitor:
             self.connect_btn.config(text="연결", state="normal")
             self.status_label.config(text="연결 안됨", foreground="red")
     
+    def start_serial_reader(self):
+        """수신 전용 스레드 시작 - 블로킹 read 후 프레이머로 디코딩하여 큐에 적재"""
+        self.stop_serial_reader()
+        self.capture_core.frame_queue_size = self.frame_queue_size
+        self.capture_core.status_grace = self.status_grace_period
+        self.capture_core.attach(self.serial_port)
+        self.serial_reader = self.capture_core.serial_reader
+    
+    def stop_serial_reader(self):
+        """수신 전용 스레드 종료"""
+        if self.serial_reader is not None:
+            self.serial_reader.stop()
+            stats = self.serial_reader.stats
+            if stats['dropped_frames'] or stats['frame_errors']:
+                self.log_message(f"📊 수신 통계: 프레임 {stats['frames']}, 폐기 {stats['dropped_frames']}, 프레임 오류 {stats['frame_errors']}")
+            if self.frame_decoder.error_counts:
+                self.log_message(f"📊 프레임 오류 사유: {self.frame_decoder.error_counts}, "
+                                 f"재요청 {self.frame_retry_stats['retried']}회 (복구 {self.frame_retry_stats['recovered']})")
+            binary_stats = self.frame_decoder.binary.stats
+            binary_frames = binary_stats['key_frames'] + binary_stats['delta_frames']
+            if binary_frames:
+                self.log_message(f"📊 바이너리 전송: 키 {binary_stats['key_frames']}, 델타 {binary_stats['delta_frames']}, "
+                                 f"평균 {binary_stats['wire_bytes'] / binary_frames:.0f} bytes/frame, "
+                                 f"CRC 오류 {binary_stats['crc_errors']}")
+            self.capture_core.detach()
+            self.serial_reader = None
+    
     def clear_serial_buffers(self):
         """시리얼 버퍼 클리어"""
         if not self.serial_port or not self.serial_port.is_open:
             return
             
+        # 수신 스레드 동작 중에는 스레드에서 버퍼/프레이머/큐를 함께 비움
+        if self.serial_reader is not None and self.serial_reader.is_running:
+            try:
+                self.serial_port.flush()
+                self.serial_reader.clear()
+            except Exception as e:
+                self.log_message(f"⚠️ 버퍼 클리어 오류: {str(e)}")
+            return
+            
         try:
             # 입력 버퍼 클리어
             if self.serial_port.in_waiting > 0:
@@ -702,32 +949,21 @@ class OLEDMonitor:
             time.sleep(0.05)  # 50ms 대기
             if self.serial_port.in_waiting > 0:
                 self.serial_port.read(self.serial_port.in_waiting)
+            
+            # 프레이머에 남은 불완전 프레임 폐기
+            self.frame_decoder.reset()
                 
         except Exception as e:
             self.log_message(f"⚠️ 버퍼 클리어 오류: {str(e)}")
     
     def wait_for_response(self, timeout_ms=2000):
-        """응답 대기"""
-        if not self.is_connected or not self.serial_port:
+        """응답 대기 - 수신 스레드가 적재한 응답 줄 하나를 꺼냄"""
+        if not self.is_connected or not self.serial_reader:
             return None
             
         try:
-            timeout_seconds = timeout_ms / 1000.0
-            start_time = time.time()
-            response_data = b''
-            
-            while time.time() - start_time < timeout_seconds:
-                if self.serial_port.in_waiting > 0:
-                    chunk = self.serial_port.read(self.serial_port.in_waiting)
-                    response_data += chunk
-                    
-                    # 완료 조건 확인 (개행 문자)
-                    if b'\n' in response_data or b'\r' in response_data:
-                        break
-                else:
-                    time.sleep(0.01)  # 10ms 대기
-                    
-            return response_data if response_data else None
+            line = self.serial_reader.get_reply(timeout_ms / 1000.0)
+            return line + b'\n' if line is not None else None
             
         except Exception as e:
             self.log_message(f"응답 대기 오류: {str(e)}")
@@ -745,8 +981,9 @@ class OLEDMonitor:
             else:
                 command_bytes = command + b'\n'
                 
-            self.serial_port.write(command_bytes)
-            self.serial_port.flush()
+            with self.write_lock:
+                self.serial_port.write(command_bytes)
+                self.serial_port.flush()
             
             return True
             
@@ -756,11 +993,55 @@ class OLEDMonitor:
     
     def send_command_and_wait(self, command, timeout_ms=2000):
         """명령어 전송 후 응답 대기"""
+        # asyncio 전송 모드에서는 루프의 요청 직렬화를 거침 (화면 요청과 겹치지 않음)
+        if self.async_transport is not None and self.async_transport.is_running:
+            try:
+                line = self.async_transport.call(self.async_transport.command(command, timeout_ms / 1000.0),
+                                                 timeout_ms / 1000.0 + 2.0)
+                return line + b'\n' if line is not None else None
+            except Exception as e:
+                self.log_message(f"응답 대기 오류: {str(e)}")
+                return None
+        
+        # 이전 명령의 늦게 도착한 응답 폐기
+        if self.serial_reader:
+            self.serial_reader.drain_replies()
+            
         if not self.send_command(command):
             return None
             
         return self.wait_for_response(timeout_ms)
     
+    def request_screen_frame(self, timeout_seconds=2.0):
+        """화면 요청 및 수신 - 캡처 세션(MonitorCore.request_frame)에 위임
+        
+        손상 프레임은 corrupt_frame_retries 횟수까지 재요청하고, 타임아웃은 재요청 없이
+        늦은 응답을 비운 뒤 호출측의 주기 처리에 맡긴다. STATUS 줄은 수신 스레드가
+        status_grace_period 안에 도착한 경우 같은 프레임에 묶어 둔다.
+        
+        Returns:
+            dict: {'screen': 화면 이벤트 데이터 또는 None,
+                   'status': STATUS 줄 원시 데이터 또는 None,
+                   'error': 손상 프레임 사유 (체크섬/CRC 오류 등) 또는 None}
+        """
+        response = {'screen': None, 'status': None, 'error': None}
+        if not self.is_connected or not self.serial_reader:
+            return response
+        
+        try:
+            frame = self.capture_core.request_frame(timeout_seconds)
+        except Exception as e:
+            self.log_message(f"명령어 전송 오류: {str(e)}")
+            return response
+        
+        if frame is not None:
+            if frame.get('error'):
+                response['error'] = frame['error']
+            else:
+                response['screen'] = frame
+                response['status'] = frame.get('status')
+        return response
+    
     def check_connection(self):
         """연결 상태 확인"""
         try:
@@ -797,6 +1078,7 @@ class OLEDMonitor:
                 'fps_counter': 0,
                 'fps_start_time': time.time()
             }
+            self.performance_monitor.reset()
             
             # 모니터링 플래그 설정
             self.is_monitoring = True
@@ -808,6 +1090,10 @@ class OLEDMonitor:
             # 모니터링 모드에 따른 분기 처리
             if self.monitoring_mode == "integrated":
                 self.start_integrated_monitoring()
+            elif self.monitoring_mode == "pipelined":
+                self.start_pipelined_monitoring()
+            elif self.monitoring_mode == "async":
+                self.start_async_monitoring()
             elif self.monitoring_mode == "screen_only":
                 self.start_screen_only_monitoring()
             elif self.monitoring_mode == "status_only":
@@ -863,6 +1149,40 @@ class OLEDMonitor:
             self.log_message(f"❌ 통합 모니터링 시작 오류: {str(e)}")
             raise
     
+    def start_pipelined_monitoring(self):
+        """파이프라인 모니터링 시작 (화면+상태, 요청/파싱/표시 단계 분리)"""
+        try:
+            # 펌웨어 설정 (통합 모드와 동일)
+            try:
+                command = f"SET_UPDATE_MODE:INTEGRATED_RESPONSE,{self.update_interval_ms}\n"
+                response = self.send_command_and_wait(command, 1000)
+                if response and b'OK' in response:
+                    self.log_message("✅ 펌웨어 통합 응답 모드 설정 완료")
+                else:
+                    command = f"SET_UPDATE_MODE:REQUEST_RESPONSE,{self.update_interval_ms}\n"
+                    self.send_command(command)
+                    self.log_message("🔄 기존 펌웨어 모드로 폴백")
+                
+                response = self.send_command_and_wait("START_MONITOR", 1000)
+                if response and b'OK' in response:
+                    self.log_message("✅ 펌웨어 모니터링 활성화")
+                    
+            except Exception as setup_error:
+                self.log_message(f"⚠️ 펌웨어 설정 오류: {str(setup_error)} - 계속 진행")
+            
+            # 요청/수신 단계 스레드 시작 (파싱 단계 스레드는 루프 내부에서 시작)
+            if self.capture_thread is None or not self.capture_thread.is_alive():
+                self.capture_thread = threading.Thread(target=self.pipelined_capture_loop, daemon=True)
+                self.capture_thread.start()
+            
+            interval_text = f" ({self.update_interval_ms}ms)" if self.auto_request_enabled else ""
+            self.log_message(f"🚀 파이프라인 모니터링 시작 - 깊이 {self.pipeline_depth}{interval_text}")
+            self.write_event_log("START", f"파이프라인 모니터링 시작 - 깊이 {self.pipeline_depth}{interval_text}")
+            
+        except Exception as e:
+            self.log_message(f"❌ 파이프라인 모니터링 시작 오류: {str(e)}")
+            raise
+    
     def start_screen_only_monitoring(self):
         """화면만 모니터링 시작"""
         try:
@@ -939,6 +1259,121 @@ class OLEDMonitor:
             self.log_message(f"❌ 상태 전용 모니터링 시작 오류: {str(e)}")
             raise
     
+    def start_async_monitoring(self):
+        """asyncio 전송 모드 시작 (화면+상태, 요청/응답/재요청을 코루틴으로 처리)"""
+        try:
+            # 펌웨어 설정 (통합 모드와 동일, 스레드 수신기로 응답 확인)
+            try:
+                command = f"SET_UPDATE_MODE:INTEGRATED_RESPONSE,{self.update_interval_ms}\n"
+                response = self.send_command_and_wait(command, 1000)
+                if response and b'OK' in response:
+                    self.log_message("✅ 펌웨어 통합 응답 모드 설정 완료")
+                
+                response = self.send_command_and_wait("START_MONITOR", 1000)
+                if response and b'OK' in response:
+                    self.log_message("✅ 펌웨어 모니터링 활성화")
+                    
+            except Exception as setup_error:
+                self.log_message(f"⚠️ 펌웨어 설정 오류: {str(setup_error)} - 계속 진행")
+            
+            # 포트 수신 소비자는 하나만 가능 - 스레드 수신기를 전송 계층으로 교체
+            self.stop_serial_reader()
+            self.async_transport = AsyncSerialTransport(
+                self.serial_port,
+                self.frame_decoder,
+                status_grace=self.status_grace_period,
+                write_lock=self.write_lock
+            )
+            self.async_transport.start()
+            self.async_transport.submit(self.async_capture_loop())
+            
+            self.log_message(f"🚀 asyncio 전송 모드 시작 - {self.async_transport.reader_mode} 수신, "
+                             f"{self.update_interval_ms}ms")
+            self.write_event_log("START", f"asyncio 전송 모드 시작 ({self.update_interval_ms}ms)")
+            
+        except Exception as e:
+            self.log_message(f"❌ asyncio 전송 모드 시작 오류: {str(e)}")
+            self.stop_async_transport()
+            raise
+    
+    async def async_capture_loop(self):
+        """asyncio 캡처 루프 - 요청 마감 시각 기준 주기 유지, 파싱은 실행기에서 수행"""
+        transport = self.async_transport
+        loop = asyncio.get_running_loop()
+        consecutive_failures = 0
+        max_failures = 10
+        next_request_time = loop.time()
+        
+        self.log_message("🔄 asyncio 캡처 루프 시작")
+        
+        try:
+            while self.is_monitoring:
+                if not self.auto_request_enabled:
+                    # 수동 모드에서는 긴 대기
+                    await asyncio.sleep(0.1)
+                    next_request_time = loop.time()
+                    consecutive_failures = 0
+                    continue
+                
+                response = await transport.request_screen(self.screen_request_command, 1.0,
+                                                          self.corrupt_frame_retries)
+                self.performance_stats['total_captures'] += 1
+                
+                if response['screen'] is None:
+                    consecutive_failures += 1
+                    self.performance_monitor.record_dropped_frame()
+                    if response['error']:
+                        self.frame_retry_stats['corrupted'] += 1
+                    if consecutive_failures >= max_failures:
+                        self.log_message(f"⚠️ 연속 {max_failures}회 수신 실패 - 잠시 대기 후 계속")
+                        consecutive_failures = 0
+                        await asyncio.sleep(0.5)
+                else:
+                    consecutive_failures = 0
+                    # 파싱/로그 기록은 루프 밖에서 (수신 처리 지연 방지)
+                    screen_data = await loop.run_in_executor(
+                        None, self.process_screen_events, response['screen'], response['status'])
+                    if screen_data is not None:
+                        self.performance_stats['successful_captures'] += 1
+                        if not response['screen'].get('repeated'):
+                            self.tk_bridge.post(self.update_display, screen_data, key='display')
+                
+                if self.performance_stats['total_captures'] % 10 == 0:
+                    self.tk_bridge.post(self.update_performance_display, key='performance')
+                
+                # 마감 시각 기준 대기 (처리 시간만큼 주기가 늘어나지 않음)
+                next_request_time += self.update_interval_ms / 1000.0
+                delay = next_request_time - loop.time()
+                if delay < 0:
+                    next_request_time = loop.time()
+                    delay = 0
+                await asyncio.sleep(delay)
+                
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            self.log_message(f"❌ asyncio 캡처 루프 오류: {str(e)}")
+        
+        self.log_message("🔄 asyncio 캡처 루프 종료")
+    
+    def stop_async_transport(self):
+        """asyncio 전송 계층 종료 후 스레드 수신기 복귀"""
+        if self.async_transport is None:
+            return
+        
+        transport = self.async_transport
+        self.async_transport = None
+        try:
+            transport.stop()
+            stats = transport.stats
+            self.log_message(f"📊 asyncio 전송 통계: 프레임 {stats['frames']}, 타임아웃 {stats['timeouts']}, "
+                             f"재요청 {stats['retries']}, 손상 {stats['rejected_frames']}")
+        except Exception as e:
+            self.log_message(f"⚠️ asyncio 전송 종료 오류: {str(e)}")
+        
+        if self.is_connected and self.serial_port:
+            self.start_serial_reader()
+    
     def stop_monitoring(self):
         """모니터링 중지 - 간소화된 안전한 종료"""
         if not self.is_monitoring:
@@ -949,6 +1384,9 @@ class OLEDMonitor:
         self.monitor_btn.config(text="모니터링 시작")
         
         try:
+            # asyncio 전송 계층을 먼저 내리고 스레드 수신기로 복귀
+            self.stop_async_transport()
+            
             # 펌웨어에 모니터링 중지 명령 전송
             if self.is_connected and self.serial_port:
                 self.send_command("STOP_MONITOR")
@@ -958,6 +1396,7 @@ class OLEDMonitor:
                 else:
                     self.log_message("⚠️ 펌웨어 모니터링 비활성화 응답 없음")
             
+            self.log_parse_timing()
             self.log_message("🛑 모니터링 중지")
             self.write_event_log("STOP", "모니터링 중지")
             
@@ -1126,6 +1565,144 @@ class OLEDMonitor:
             self.log_message("🛑 사용자가 모니터링을 중지함")
         # 자동으로 stop_monitoring을 호출하지 않음
     
+    def pipelined_capture_loop(self):
+        """파이프라인 캡처 루프 - 요청/수신 단계
+        
+        프레임 N의 바이트 수신이 끝나면 바로 프레임 N+1을 요청하고, 수신한
+        프레임은 파싱 단계 큐로 넘긴다. 파싱/표시 대기 프레임이 pipeline_depth에
+        도달하면 슬롯이 빌 때까지 다음 요청을 보류한다.
+        
+        펌웨어는 명령 버퍼가 하나뿐이라 전송 중 도착한 명령을 잃으므로,
+        전송선 위의 미응답 요청은 항상 하나로 유지한다.
+        """
+        depth = max(1, self.pipeline_depth)
+        slots = threading.Semaphore(depth)
+        parse_queue = queue.Queue()
+        consecutive_failures = 0
+        max_failures = 10
+        last_request_time = 0
+        loop_start_time = time.time()
+        
+        # 파싱 단계 스레드 시작
+        self.pipeline_thread = threading.Thread(target=self.pipeline_parse_loop,
+                                                args=(parse_queue,), daemon=True)
+        self.pipeline_thread.start()
+        
+        self.log_message(f"🔄 파이프라인 캡처 루프 시작 - 깊이 {depth}")
+        
+        while self.is_monitoring:
+            try:
+                if not self.check_connection():
+                    time.sleep(0.5)
+                    continue
+                
+                if not self.auto_request_enabled:
+                    # 수동 모드에서는 긴 대기
+                    time.sleep(0.1)
+                    consecutive_failures = 0
+                    continue
+                
+                # 파싱/표시 단계에 빈 슬롯이 생길 때까지 대기
+                if not slots.acquire(timeout=0.2):
+                    continue
+                
+                # 요청 간격 제한 (갱신 주기 설정)
+                interval_seconds = self.update_interval_ms / 1000.0
+                wait_time = last_request_time + interval_seconds - time.time()
+                if wait_time > 0:
+                    time.sleep(wait_time)
+                
+                last_request_time = time.time()
+                response = self.request_screen_frame(1.0)
+                if response['screen'] is None:
+                    slots.release()
+                    consecutive_failures += 1
+                    self.performance_stats['total_captures'] += 1
+                    self.performance_monitor.record_dropped_frame()
+                    
+                    if consecutive_failures >= max_failures:
+                        self.log_message(f"⚠️ 연속 {max_failures}회 수신 실패 - 버퍼 정리 후 계속")
+                        self.clear_serial_buffers()
+                        consecutive_failures = 0
+                        time.sleep(0.5)
+                    continue
+                
+                # 슬롯은 파싱 단계로 넘어가 표시(또는 폐기) 시점에 반환됨
+                consecutive_failures = 0
+                parse_queue.put((response, slots))
+                
+            except Exception as e:
+                self.log_message(f"❌ 파이프라인 캡처 루프 오류: {str(e)}")
+                time.sleep(0.5)
+        
+        # 파싱 단계 종료 신호
+        parse_queue.put(None)
+        
+        total_time = time.time() - loop_start_time
+        self.log_message(f"🔄 파이프라인 캡처 루프 종료 - 실행시간: {total_time:.1f}초")
+    
+    def pipeline_parse_loop(self, parse_queue):
+        """파이프라인 파싱 단계 - 수신된 프레임을 파싱 후 표시 단계로 전달"""
+        while True:
+            try:
+                item = parse_queue.get(timeout=0.5)
+            except queue.Empty:
+                if not self.is_monitoring:
+                    break
+                continue
+            
+            if item is None:
+                break
+            
+            response, slots = item
+            try:
+                screen_data = self.process_screen_events(response['screen'], response['status'])
+            except Exception as e:
+                screen_data = None
+                self.log_message(f"❌ 파이프라인 파싱 오류: {str(e)}")
+            
+            self.performance_stats['total_captures'] += 1
+            if screen_data is None:
+                slots.release()
+                continue
+            
+            self.performance_stats['successful_captures'] += 1
+            if response['screen'].get('repeated'):
+                # 이미 표시(또는 표시 대기) 중인 프레임과 같음
+                slots.release()
+            else:
+                self.pipeline_submit_display(screen_data, slots)
+            
+            if self.performance_stats['total_captures'] % 10 == 0:
+                self.root.after(0, self.update_performance_display)
+    
+    def pipeline_submit_display(self, screen_data, slots):
+        """파이프라인 표시 단계로 프레임 전달 - 아직 그려지지 않은 이전 프레임은 폐기"""
+        with self.pipeline_display_lock:
+            previous = self.pipeline_display_pending
+            self.pipeline_display_pending = (screen_data, slots)
+        
+        if previous is None:
+            # 대기 중인 표시 작업이 없을 때만 GUI 콜백 예약
+            self.root.after(0, self.pipeline_display_tick)
+        else:
+            previous[1].release()
+    
+    def pipeline_display_tick(self):
+        """파이프라인 표시 단계 (GUI 스레드) - 최신 프레임 하나만 그림"""
+        with self.pipeline_display_lock:
+            pending = self.pipeline_display_pending
+            self.pipeline_display_pending = None
+        
+        if pending is None:
+            return
+        
+        screen_data, slots = pending
+        try:
+            self.update_display(screen_data)
+        finally:
+            slots.release()
+    
     def screen_only_capture_loop(self):
         """화면 전용 캡처 루프 - 화면만 모니터링"""
         consecutive_failures = 0
@@ -1283,53 +1860,45 @@ class OLEDMonitor:
                         interval_seconds = min_interval
                     
                     if current_time - last_request_time >= interval_seconds:
-                        # 시리얼 락 획득 (짧은 타임아웃)
-                        if self.serial_lock.acquire(timeout=0.5):
-                            try:
-                                total_requests += 1
+                        try:
+                            total_requests += 1
                                 
-                                # 최소 간격 체크
-                                if current_time - self.last_status_request_time >= self.request_min_interval:
-                                    self.last_status_request_time = current_time
+                            # 최소 간격 체크
+                            if current_time - self.last_status_request_time >= self.request_min_interval:
+                                self.last_status_request_time = current_time
                                     
-                                    # GET_STATUS 명령 전송
-                                    response = self.send_command_and_wait("GET_STATUS", 1000)
-                                    last_request_time = current_time
-                                    requests_per_minute += 1
+                                # GET_STATUS 명령 전송
+                                response = self.send_command_and_wait("GET_STATUS", 1000)
+                                last_request_time = current_time
+                                requests_per_minute += 1
                                     
-                                    if response:
-                                        status_data = self.parse_firmware_status_data(response)
-                                        if status_data:
-                                            # GUI 업데이트 (비동기)
-                                            self.root.after(0, lambda data=status_data: self.update_status_display(data))
+                                if response:
+                                    status_data = self.parse_firmware_status_data(response)
+                                    if status_data:
+                                        # GUI 업데이트 (비동기)
+                                        self.root.after(0, lambda data=status_data: self.update_status_display(data))
                                             
-                                            # 상태 로그에 기록
-                                            try:
-                                                self.write_status_log(status_data)
-                                            except:
-                                                pass
+                                        # 상태 로그에 기록
+                                        try:
+                                            self.write_status_log(status_data)
+                                        except:
+                                            pass
                                             
-                                            successful_requests += 1
-                                            consecutive_failures = 0
-                                        else:
-                                            # 파싱 실패시 테스트 데이터
-                                            try:
-                                                test_status = self.generate_test_status_data()
-                                                self.root.after(0, lambda data=test_status: self.update_status_display(data))
-                                            except:
-                                                pass
-                                            consecutive_failures += 1
+                                        successful_requests += 1
+                                        consecutive_failures = 0
                                     else:
+                                        # 파싱 실패시 테스트 데이터
+                                        try:
+                                            test_status = self.generate_test_status_data()
+                                            self.root.after(0, lambda data=test_status: self.update_status_display(data))
+                                        except:
+                                            pass
                                         consecutive_failures += 1
+                                else:
+                                    consecutive_failures += 1
                                 
-                            except Exception as status_error:
-                                consecutive_failures += 1
-                            finally:
-                                # 락 해제
-                                self.serial_lock.release()
-                        else:
-                            # 락 획득 실패시 그냥 넘어감
-                            pass
+                        except Exception as status_error:
+                            consecutive_failures += 1
                     
                     # 적절한 대기 시간
                     sleep_time = min(0.1, interval_seconds / 5)
@@ -1394,48 +1963,40 @@ class OLEDMonitor:
                 
                 # 상태 요청 주기 확인
                 if current_time - last_status_request >= status_request_interval:
-                    # 시리얼 락 획득 (짧은 타임아웃)
-                    if self.serial_lock.acquire(timeout=0.3):
-                        try:
-                            total_requests += 1
+                    try:
+                        total_requests += 1
                             
-                            # 최소 간격 체크
-                            if current_time - self.last_status_request_time >= self.request_min_interval:
-                                self.last_status_request_time = current_time
+                        # 최소 간격 체크
+                        if current_time - self.last_status_request_time >= self.request_min_interval:
+                            self.last_status_request_time = current_time
                                 
-                                # 상태 요청
-                                response = self.send_command_and_wait("GET_STATUS", 800)
-                                if response:
-                                    status_data = self.parse_firmware_status_data(response)
-                                    if status_data:
-                                        # GUI 업데이트 (비동기)
-                                        self.root.after(0, lambda data=status_data: self.update_status_display(data))
+                            # 상태 요청
+                            response = self.send_command_and_wait("GET_STATUS", 800)
+                            if response:
+                                status_data = self.parse_firmware_status_data(response)
+                                if status_data:
+                                    # GUI 업데이트 (비동기)
+                                    self.root.after(0, lambda data=status_data: self.update_status_display(data))
                                         
-                                        # 상태 로그에 기록 (모니터링 중 자동 기록)
-                                        try:
-                                            self.write_status_log(status_data)
-                                        except:
-                                            pass
+                                    # 상태 로그에 기록 (모니터링 중 자동 기록)
+                                    try:
+                                        self.write_status_log(status_data)
+                                    except:
+                                        pass
                                         
-                                        successful_requests += 1
-                                    else:
-                                        # 파싱 실패시 테스트 데이터
-                                        try:
-                                            test_status = self.generate_test_status_data()
-                                            self.root.after(0, lambda data=test_status: self.update_status_display(data))
-                                        except:
-                                            pass
+                                    successful_requests += 1
+                                else:
+                                    # 파싱 실패시 테스트 데이터
+                                    try:
+                                        test_status = self.generate_test_status_data()
+                                        self.root.after(0, lambda data=test_status: self.update_status_display(data))
+                                    except:
+                                        pass
                                 
-                                last_status_request = current_time
+                            last_status_request = current_time
                                 
-                        except Exception as status_error:
-                            # 오류 발생시 로깅 없이 계속 진행
-                            pass
-                        finally:
-                            # 락 해제
-                            self.serial_lock.release()
-                    else:
-                        # 락 획득 실패시 그냥 넘어감
+                    except Exception as status_error:
+                        # 오류 발생시 로깅 없이 계속 진행
                         pass
                 
                 # 루프 대기 시간
@@ -1458,10 +2019,6 @@ class OLEDMonitor:
         """통합 화면+상태 요청 - 하나의 요청으로 화면과 상태를 모두 받음"""
         if not self.check_connection():
             return False
-        
-        # 시리얼 락 획득 (짧은 타임아웃)
-        if not self.serial_lock.acquire(timeout=0.5):
-            return False  # 락 획득 실패시 스킵
             
         try:
             current_time = time.time()
@@ -1472,16 +2029,17 @@ class OLEDMonitor:
             
             self.last_screen_request_time = current_time
             
-            # 통합 화면+상태 요청 전송
-            response = self.send_command_and_wait("GET_SCREEN", 2000)  # 통합 응답이므로 타임아웃 증가
-            if not response:
+            # 통합 화면+상태 요청 전송 (수신은 serial_reader 스레드가 담당하므로 락 불필요)
+            response = self.request_screen_frame(2.0)
+            if response['screen'] is None:
                 return False
             
             # 통합 응답 데이터 파싱
-            screen_data = self.parse_screen_response(response)
+            screen_data = self.process_screen_events(response['screen'], response['status'])
             if screen_data is not None:
-                # GUI 업데이트 (메인 스레드에서)
-                self.root.after(0, lambda: self.update_display(screen_data))
+                # GUI 업데이트 (메인 스레드에서) - 직전과 같은 프레임은 생략
+                if not response['screen'].get('repeated'):
+                    self.root.after(0, lambda: self.update_display(screen_data))
                 
                 # 성능 통계 업데이트
                 self.performance_stats['total_captures'] += 1
@@ -1498,38 +2056,32 @@ class OLEDMonitor:
         except Exception as e:
             # 오류는 로깅하지 않음 (빈번한 호출로 스팸 방지)
             return False
-        finally:
-            # 락 해제
-            self.serial_lock.release()
     
     def simple_screen_request(self):
-        """간단한 화면 요청 및 처리 - 시리얼 충돌 방지"""
+        """간단한 화면 요청 및 처리"""
         if not self.check_connection():
             return False
-        
-        # 시리얼 락 획득 (짧은 타임아웃)
-        if not self.serial_lock.acquire(timeout=0.5):
-            return False  # 락 획득 실패시 스킵
             
         try:
             current_time = time.time()
             
-            # 최소 간격 체크 (상태 요청과 충돌 방지)
+            # 최소 간격 체크
             if current_time - self.last_screen_request_time < self.request_min_interval:
                 return False  # 너무 빠른 요청은 스킵
             
             self.last_screen_request_time = current_time
             
-            # 화면 요청
-            response = self.send_command_and_wait("GET_SCREEN", 1500)  # 타임아웃 단축
-            if not response:
+            # 화면 요청 (수신은 serial_reader 스레드가 담당하므로 락 불필요)
+            response = self.request_screen_frame(1.5)
+            if response['screen'] is None:
                 return False
             
             # 데이터 파싱
-            screen_data = self.parse_screen_response(response)
+            screen_data = self.process_screen_events(response['screen'], response['status'])
             if screen_data is not None:
-                # GUI 업데이트 (메인 스레드에서)
-                self.root.after(0, lambda: self.update_display(screen_data))
+                # GUI 업데이트 (메인 스레드에서) - 직전과 같은 프레임은 생략
+                if not response['screen'].get('repeated'):
+                    self.root.after(0, lambda: self.update_display(screen_data))
                 
                 # 성능 통계 업데이트
                 self.performance_stats['total_captures'] += 1
@@ -1546,640 +2098,85 @@ class OLEDMonitor:
         except Exception as e:
             # 오류는 로깅하지 않음 (빈번한 호출로 스팸 방지)
             return False
-        finally:
-            # 락 해제
-            self.serial_lock.release()
     
-    def parse_screen_response(self, response_data):
-        """화면 응답 데이터 파싱 - 상태 정보 포함 (무한루프 방지 단순화)"""
-        try:
-            screen_data = None
-            
-            # 데이터 크기 제한 (메모리 및 성능 보호)
-            if len(response_data) > 10000:  # 10KB 제한
-                response_data = response_data[:10000]
-            
-            # 실제 펌웨어 형식: <<SCREEN_END>>\r\n 다음에 바로 STATUS: 형식
-            if b'<<SCREEN_START>>' in response_data and b'<<SCREEN_END>>' in response_data:
-                self.log_message("📦 통합 응답 데이터 감지")
-                
-                # 화면 데이터 추출
-                screen_start = response_data.find(b'<<SCREEN_START>>')
-                screen_end = response_data.find(b'<<SCREEN_END>>')
-                
-                if screen_start != -1 and screen_end != -1 and screen_end > screen_start:
-                    screen_section = response_data[screen_start:screen_end + len(b'<<SCREEN_END>>')]
-                    
-                    # 화면 데이터에서 이미지 데이터 추출
-                    data_start_pos = screen_section.find(b'<<DATA_START>>')
-                    data_end_pos = screen_section.find(b'<<DATA_END>>')
-                    
-                    if data_start_pos != -1 and data_end_pos != -1 and data_end_pos > data_start_pos:
-                        # 실제 데이터 시작점 찾기
-                        data_content_start = data_start_pos + len(b'<<DATA_START>>')
-                        # 개행문자 건너뛰기
-                        while data_content_start < data_end_pos:
-                            if screen_section[data_content_start:data_content_start+1] in [b'\n', b'\r']:
-                                data_content_start += 1
-                            else:
-                                break
-                        
-                        if data_content_start < data_end_pos:
-                            img_data = screen_section[data_content_start:data_end_pos]
-                            
-                            if len(img_data) >= 1024:
-                                # 안전 래퍼를 사용한 화면 파싱
-                                def parse_screen_safe(data):
-                                    return self.parse_firmware_screen_data_enhanced(data[:1024])
-                                
-                                screen_data = self.safe_parse_wrapper(parse_screen_safe, img_data, "화면파싱")
-                                if screen_data is not None:
-                                    self.log_message("✅ 화면 데이터 파싱 성공")
-                                else:
-                                    self.log_message("⚠️ 화면 데이터 파싱 실패 - 폴백 시도")
-                                    # 폴백: 기본 파싱 시도
-                                    try:
-                                        screen_data = self.parse_firmware_screen_data(img_data[:1024])
-                                        if screen_data is not None:
-                                            self.log_message("✅ 폴백 화면 파싱 성공")
-                                    except Exception as fallback_error:
-                                        self.log_message(f"❌ 폴백 파싱도 실패: {str(fallback_error)}")
-                            else:
-                                self.log_message(f"⚠️ 화면 데이터 크기 부족: {len(img_data)} bytes")
-                
-                # 상태 데이터 추출 (단순화된 방식)
-                status_start_marker = b'STATUS:'
-                status_pos = response_data.find(status_start_marker)
-                
-                if status_pos != -1:
-                    # STATUS: 이후 첫 번째 줄만 가져오기 (간단하게)
-                    status_start = status_pos
-                    status_end = status_pos + 200  # 최대 200자만 (안전 제한)
-                    
-                    # 개행문자로 끝나는 지점 찾기
-                    newline_pos = response_data.find(b'\n', status_start)
-                    if newline_pos != -1 and newline_pos < status_end:
-                        status_end = newline_pos
-                        
-                    crlf_pos = response_data.find(b'\r\n', status_start)
-                    if crlf_pos != -1 and crlf_pos < status_end:
-                        status_end = crlf_pos
-                    
-                    # 응답 데이터 끝을 넘지 않도록
-                    if status_end > len(response_data):
-                        status_end = len(response_data)
-                    
-                    if status_end > status_start:
-                        status_raw = response_data[status_start:status_end]
-                        
-                        # 상태 데이터 파싱 (안전한 방식)
-                        try:
-                            # 안전 래퍼를 사용한 상태 파싱
-                            def parse_status_safe(data):
-                                # 원본 함수에서 래퍼를 제거하고 실제 파싱 로직만 사용
-                                if isinstance(data, bytes):
-                                    try:
-                                        data_str = data.decode('utf-8', errors='ignore').strip()
-                                    except:
-                                        data_str = str(data, errors='replace').strip()
-                                else:
-                                    data_str = str(data).strip()
-                                
-                                status_info = {
-                                    'timestamp': datetime.now().strftime('%H:%M:%S'), 
-                                    'source': 'firmware',
-                                    'battery': 18.6,
-                                    'timer': '00:00',
-                                    'status': 'UNKNOWN',
-                                    'l1_connected': False,
-                                    'l2_connected': False,
-                                    'bat_adc': 0,
-                                    'raw_data': data,
-                                    'raw_string': data_str
-                                }
-                                
-                                if not data_str.startswith('STATUS:'):
-                                    return status_info
-                                
-                                status_part = data_str[7:]
-                                items = status_part.split(',')[:6]  # 최대 6개만
-                                
-                                for item in items:
-                                    item = item.strip()
-                                    if ':' not in item:
-                                        continue
-                                    key, value = item.split(':', 1)
-                                    key, value = key.strip(), value.strip()
-                                    
-                                    if key == 'BAT':
-                                        try:
-                                            battery_val = float(value.replace('V', ''))
-                                            status_info['battery'] = battery_val/100
-                                        except:
-                                            pass
-                                    elif key == 'TIMER' and len(value) <= 8:
-                                        status_info['timer'] = value
-                                    elif key == 'STATUS' and len(value) <= 15:
-                                        status_info['status'] = value
-                                    elif key == 'L1':
-                                        status_info['l1_connected'] = (value == '1')
-                                    elif key == 'L2':
-                                        status_info['l2_connected'] = (value == '1')
-                                    elif key == 'BAT_ADC':
-                                        try:
-                                            adc_val = int(value)
-                                            status_info['bat_adc'] = max(0, min(4095, adc_val))
-                                        except:
-                                            pass
-                                
-                                return status_info
-                            
-                            status_data = self.safe_parse_wrapper(parse_status_safe, status_raw, "상태파싱")
-                            if status_data:
-                                self.log_message("✅ 상태 데이터 파싱 성공")
-                                # RAW 데이터 먼저 기록
-                                self.write_raw_data_log(status_raw, "INTEGRATED_STATUS", f"통합 응답에서 추출된 상태 데이터")
-                                # GUI 업데이트는 메인 스레드에서
-                                self.root.after(0, lambda: self.update_status_display(status_data))
-                                self.write_status_log(status_data)
-                            else:
-                                self.log_message("⚠️ 상태 데이터 파싱 실패")
-                                # 실패한 RAW 데이터도 기록
-                                self.write_raw_data_log(status_raw, "FAILED_STATUS_PARSING", f"파싱 실패한 상태 데이터")
-                        except Exception as status_error:
-                            self.log_message(f"⚠️ 상태 파싱 오류: {str(status_error)}")
-                
-                # 화면 데이터 반환 (상태 처리 완료)
-                return screen_data
-            
-            # 기존 화면만 있는 형식 (하위 호환성)
-            elif b'<<SCREEN_START>>' in response_data and b'<<DATA_START>>' in response_data:
-                self.log_message("📺 기존 화면 전용 응답 처리")
-                
-                data_start_pos = response_data.find(b'<<DATA_START>>')
-                data_end_pos = response_data.find(b'<<DATA_END>>')
-                
-                if data_start_pos != -1 and data_end_pos != -1 and data_end_pos > data_start_pos:
-                    # 실제 데이터 시작점
-                    data_content_start = data_start_pos + len(b'<<DATA_START>>')
-                    # 개행문자 건너뛰기
-                    while data_content_start < data_end_pos:
-                        if response_data[data_content_start:data_content_start+1] in [b'\n', b'\r']:
-                            data_content_start += 1
-                        else:
-                            break
-                    
-                    if data_content_start < data_end_pos:
-                        img_data = response_data[data_content_start:data_end_pos]
-                        
-                        if len(img_data) >= 1024:
-                            # 안전 래퍼를 사용한 화면 파싱
-                            def parse_legacy_screen_safe(data):
-                                return self.parse_firmware_screen_data_enhanced(data[:1024])
-                            
-                            result = self.safe_parse_wrapper(parse_legacy_screen_safe, img_data, "레거시화면파싱")
-                            if result is not None:
-                                return result
-                            else:
-                                # 폴백: 기본 파싱
-                                try:
-                                    return self.parse_firmware_screen_data(img_data[:1024])
-                                except Exception as e:
-                                    self.log_message(f"❌ 레거시 폴백 파싱 실패: {str(e)}")
-                        else:
-                            self.log_message(f"⚠️ 레거시 화면 데이터 크기 부족: {len(img_data)} bytes")
-            
-            # 기존 형식으로 파싱 시도 (최종 폴백)
-            self.log_message("🔄 기존 형식으로 파싱 시도")
-            def parse_final_fallback(data):
-                return self.parse_firmware_screen_data(data)
-            
-            return self.safe_parse_wrapper(parse_final_fallback, response_data, "최종폴백파싱")
-            
-        except Exception as e:
-            self.log_message(f"❌ 화면 응답 파싱 오류: {str(e)}")
-            return None
+    def record_frame_timing(self, screen_event):
+        """요청 전송/첫 바이트/수신 구간 기록 (요청 시각이 붙은 프레임만)"""
+        sent_at = screen_event.get('request_sent_at')
+        first_byte_at = screen_event.get('first_byte_at')
+        if sent_at is None or first_byte_at is None:
+            self.performance_monitor.record_frame()
+            return
+        written_at = screen_event['request_written_at']
+        last_byte_at = screen_event['last_byte_at']
+        profiler = self.stage_profiler
+        profiler.record('request_write', written_at - sent_at)
+        # 요청 전에 이미 도착하기 시작한 응답(이전 요청의 늦은 응답 등)은 0으로 기록
+        profiler.record('first_byte', max(0.0, first_byte_at - written_at))
+        profiler.record('last_byte', last_byte_at - max(first_byte_at, written_at))
+        profiler.record('round_trip', last_byte_at - sent_at)
+        self.performance_monitor.record_capture_time(last_byte_at - sent_at)
     
-    def fast_screen_request(self):
-        """고속 화면 요청 및 처리 (최적화된 버전) - RAW 데이터 로깅 포함"""
-        if not self.is_connected or not self.serial_port:
-            return False
-            
+    def process_screen_events(self, screen_event, status_raw=None):
+        """프레이머가 완성한 화면 프레임과 STATUS 줄 처리
+        
+        Args:
+            screen_event: ScreenFrameDecoder 'screen' 이벤트 데이터
+            status_raw: 같은 응답의 STATUS 줄 (없으면 None)
+            
+        직전 프레임과 같은 프레임은 캐시된 디코딩 결과를 반환하고 screen_event에
+        'repeated' = True를 표시한다 (호출측은 표시 요청을 생략).
+        
+        Returns:
+            numpy.ndarray: 파싱된 화면 데이터 또는 None
+        """
+        screen_data = None
+        self.record_frame_timing(screen_event)
+        self.record_session_data(screen_event, status_raw)
         try:
-            # 고속 요청 전송
-            self.serial_port.write(b'GET_SCREEN\n')
-            self.serial_port.flush()
-            
-            # 초고속 응답 수집 (블록킹 방식으로 성능 향상)
-            start_time = time.time()
-            response_data = b''
-            timeout_seconds = 0.5  # 타임아웃 단축 (기존보다 빠름)
-            
-            # 필수 마커들
-            markers_found = {
-                'screen_start': False,
-                'data_start': False, 
-                'data_end': False,
-                'screen_end': False
-            }
-            
-            while time.time() - start_time < timeout_seconds:
-                try:
-                    if self.serial_port.in_waiting > 0:
-                        chunk = self.serial_port.read(self.serial_port.in_waiting)
-                        response_data += chunk
-                        
-                        # 마커 검사 (최적화된 방식)
-                        if not markers_found['screen_start'] and b'<<SCREEN_START>>' in response_data:
-                            markers_found['screen_start'] = True
-                        if not markers_found['data_start'] and b'<<DATA_START>>' in response_data:
-                            markers_found['data_start'] = True
-                        if not markers_found['data_end'] and b'<<DATA_END>>' in response_data:
-                            markers_found['data_end'] = True
-                        if not markers_found['screen_end'] and b'<<SCREEN_END>>' in response_data:
-                            markers_found['screen_end'] = True
-                            break  # 모든 데이터 수신 완료
-                        
-                        # 오류 감지
-                        if b'<<TRANSMISSION_ERROR>>' in response_data:
-                            # 전송 오류시 RAW 데이터 로그 기록
-                            if hasattr(self, 'status_logger') and self.status_logger:
-                                self.status_logger.log_screen_capture(False, len(response_data), response_data)
-                            return False
-                    else:
-                        time.sleep(0.001)  # 1ms 대기 (매우 짧음)
-                        
-                except Exception as serial_error:
-                    # 시리얼 통신 오류 처리 및 RAW 데이터 로그
-                    if hasattr(self, 'status_logger') and self.status_logger:
-                        self.status_logger.log_event("SERIAL_ERROR", f"시리얼 오류: {str(serial_error)}", response_data)
-                    return False
-            
-            # 모든 마커 확인
-            if not all(markers_found.values()):
-                # 불완전한 수신시 RAW 데이터 로그
-                if hasattr(self, 'status_logger') and self.status_logger:
-                    missing_markers = [k for k, v in markers_found.items() if not v]
-                    self.status_logger.log_screen_capture(False, len(response_data), response_data)
-                    self.status_logger.log_event("INCOMPLETE_MARKERS", f"누락된 마커: {missing_markers}", response_data)
-                return False
-            
-            # 이미지 데이터 추출 (최적화)
-            try:
-                data_start_pos = response_data.find(b'<<DATA_START>>\n') + len(b'<<DATA_START>>\n')
-                data_end_pos = response_data.find(b'\n<<DATA_END>>')
-                
-                if data_start_pos == -1 or data_end_pos == -1:
-                    # 마커 위치 오류시 RAW 데이터 로그
-                    if hasattr(self, 'status_logger') and self.status_logger:
-                        self.status_logger.log_screen_capture(False, len(response_data), response_data)
-                        self.status_logger.log_event("MARKER_POSITION_ERROR", f"마커 위치 오류: start={data_start_pos}, end={data_end_pos}", response_data)
-                    return False
-                
-                img_data = response_data[data_start_pos:data_end_pos]
-                
-                # 크기 검증 (빠른 체크)
-                if len(img_data) != 1024:
-                    # 크기 오류시 RAW 데이터 로그
-                    if hasattr(self, 'status_logger') and self.status_logger:
-                        self.status_logger.log_screen_capture(False, len(img_data), response_data)
-                        self.status_logger.log_event("SIZE_MISMATCH", f"예상 크기: 1024, 실제 크기: {len(img_data)}", img_data)
-                    return False
-                
-                # 고속 파싱 및 화면 업데이트
-                screen_data = self.fast_parse_screen_data(img_data)
+            img_data = screen_event['data']
+            
+            # 직전 프레임과 원시 데이터가 같으면 디코딩 생략 (타이머 틱 사이 정지 화면)
+            last_frame = self.last_frame
+            if (last_frame is not None and last_frame[0] == img_data and
+                    last_frame[1] == self.parsing_method):
+                self.display_stats['identical_frames'] += 1
+                screen_event['repeated'] = True
+                screen_data = last_frame[2]
+            
+            elif len(img_data) >= self.IMAGE_SIZE:
+                # 프레이머가 체크섬/CRC를 검증했으므로 실패시 다른 파서로 재시도하지 않음
+                screen_data = self.safe_parse_wrapper(self.parse_firmware_screen_data_enhanced,
+                                                      img_data[:self.IMAGE_SIZE], "화면파싱")
                 if screen_data is not None:
-                    # GUI 업데이트는 메인 스레드에서 안전하게 수행
-                    try:
-                        self.root.after(0, lambda: self.update_display(screen_data))
-                    except Exception as gui_error:
-                        # GUI 업데이트 오류는 무시하고 계속 진행
-                        pass
-                    
-                    # 성공적인 화면 캡처 RAW 데이터 로그 (간소화 - 너무 빈번한 로깅 방지)
-                    if hasattr(self, 'status_logger') and self.status_logger and self.performance_stats['total_captures'] % 50 == 0:
-                        # 50회마다 한 번씩만 성공 RAW 데이터 로그
-                        self.status_logger.log_screen_capture(True, len(img_data), img_data[:100])  # 처음 100바이트만 로그
-                    
-                    # 성능 통계 업데이트 (경량화)
-                    self.performance_stats['total_captures'] += 1
-                    self.performance_stats['successful_captures'] += 1
-                    
-                    # 성능 표시 업데이트 (주기 줄임)
-                    if self.performance_stats['total_captures'] % 10 == 0:  # 10회마다 업데이트
-                        try:
-                            self.root.after(0, self.update_performance_display)
-                        except Exception as perf_error:
-                            # 성능 표시 오류는 무시
-                            pass
-                    
-                    return True
+                    # 디코더 반환 배열은 호출측 소유이므로 사본 없이 보관
+                    self.last_frame = (img_data, self.parsing_method, screen_data)
+                    self.log_message("✅ 화면 데이터 파싱 성공")
                 else:
-                    # 파싱 실패시 RAW 데이터 로그
-                    if hasattr(self, 'status_logger') and self.status_logger:
-                        self.status_logger.log_screen_capture(False, len(img_data), img_data)
-                        self.status_logger.log_event("PARSING_FAILED", "화면 데이터 파싱 실패", img_data)
-                
-            except Exception as parse_error:
-                # 파싱 과정 오류시 RAW 데이터 로그
-                if hasattr(self, 'status_logger') and self.status_logger:
-                    self.status_logger.log_screen_capture(False, len(response_data), response_data)
-                    self.status_logger.log_event("PARSE_EXCEPTION", f"파싱 예외: {str(parse_error)}", response_data)
-                return False
-                
-            return False
-                
-        except Exception as e:
-            # 모든 예외를 안전하게 처리하고 RAW 데이터 로그
-            if hasattr(self, 'status_logger') and self.status_logger:
-                self.status_logger.log_event("SCREEN_REQUEST_ERROR", f"화면 요청 오류: {str(e)}", None)
-            return False
-    
-    def request_screen_update(self):
-        """화면 업데이트 요청 (논블록킹 방식)"""
-        if not self.is_connected or not self.serial_port:
-            return False
-            
-        try:
-            # 논블록킹 방식으로 즉시 요청 전송
-            self.serial_port.write(b'GET_SCREEN\n')
-            self.serial_port.flush()
-            
-            # 즉시 응답 확인 (짧은 타임아웃)
-            response_available = False
-            quick_check_count = 0
-            
-            # 빠른 응답 확인 (최대 50ms)
-            while quick_check_count < 5:  # 5 x 10ms = 50ms
-                if self.serial_port.in_waiting > 0:
-                    response_available = True
-                    break
-                time.sleep(0.01)  # 10ms 대기
-                quick_check_count += 1
-            
-            if response_available:
-                # 응답이 빠르게 왔으면 즉시 처리
-                self.process_screen_response()
-                return True
+                    self.log_message("⚠️ 화면 데이터 파싱 실패 - 프레임 폐기")
             else:
-                # 응답이 늦으면 다음 사이클에서 처리
-                return False
-                
+                self.log_message(f"⚠️ 화면 데이터 크기 부족: {len(img_data)} bytes")
         except Exception as e:
-            self.log_message(f"❌ 화면 요청 오류: {str(e)}")
-            return False
-    
-    def process_screen_response(self):
-        """화면 응답 데이터 처리 (capture_screen 로직 재사용)"""
-        try:
-            # 기존 capture_screen 로직을 재사용하되, 요청 부분은 제외
-            # 성능 통계 업데이트
-            self.performance_stats['total_captures'] += 1
-            
-            response_data = b''
-            timeout_count = 0
-            max_timeout = 100  # 1초 타임아웃 (기존보다 단축)
-            
-            # 단계별 마커 확인
-            screen_start_found = False
-            data_start_found = False
-            data_end_found = False
-            screen_end_found = False
-            checksum_received = None
-            
-            while timeout_count < max_timeout:
-                if self.serial_port.in_waiting > 0:
-                    chunk = self.serial_port.read(self.serial_port.in_waiting)
-                    response_data += chunk
-                    
-                    # 단계별 마커 검출
-                    if not screen_start_found and b'<<SCREEN_START>>' in response_data:
-                        screen_start_found = True
-                        
-                    if screen_start_found and not data_start_found and b'<<DATA_START>>' in response_data:
-                        data_start_found = True
-                        
-                        # 체크섬 추출
-                        checksum_match = re.search(rb'CHECKSUM:([0-9A-F]{8})', response_data)
-                        if checksum_match:
-                            checksum_received = checksum_match.group(1).decode()
-                        
-                    if data_start_found and not data_end_found and b'<<DATA_END>>' in response_data:
-                        data_end_found = True
-                        
-                    if data_end_found and not screen_end_found and b'<<SCREEN_END>>' in response_data:
-                        screen_end_found = True
-                        break
-                        
-                    # 전송 오류 감지
-                    if b'<<TRANSMISSION_ERROR>>' in response_data:
-                        self.log_message("❌ 화면 전송 오류")
-                        return False
-                else:
-                    time.sleep(0.01)
-                    timeout_count += 1
-            
-            # 수신 완료 검증
-            if not (screen_start_found and data_start_found and data_end_found and screen_end_found):
-                return False
-                
-            # 실제 이미지 데이터 추출
-            data_start_pos = response_data.find(b'<<DATA_START>>')
-            data_end_pos = response_data.find(b'<<DATA_END>>')
-            
-            if data_start_pos == -1 or data_end_pos == -1:
-                return False
-                
-            data_start_actual = response_data.find(b'\n', data_start_pos) + 1
-            img_data = response_data[data_start_actual:data_end_pos]
-            
-            # 데이터 크기 검증
-            if len(img_data) < 1024:
-                return False
-            elif len(img_data) > 1024:
-                img_data = img_data[:1024]
-            
-            # 체크섬 검증 (있는 경우)
-            if checksum_received:
-                calculated_checksum = sum(img_data) & 0xFFFFFFFF
-                received_checksum = int(checksum_received, 16)
-                
-                if calculated_checksum != received_checksum:
-                    return False
-            
-            # 파싱 및 화면 업데이트
-            screen_data = self.parse_firmware_screen_data_enhanced(img_data)
-            if screen_data is not None:
-                self.update_display(screen_data)
-                
-                # 성공 통계 업데이트
-                self.performance_stats['successful_captures'] += 1
-                self.update_performance_display()
-                
-                return True
-            
-            return False
-                
-        except Exception as e:
-            self.log_message(f"❌ 화면 응답 처리 오류: {str(e)}")
-            return False
-    
-    def status_loop(self):
-        """상태 모니터링 루프 - BAT ADC 처리 최적화 및 무한루프 방지"""
-        status_request_interval = 5.0  # 5초마다 상태 요청
-        last_status_request = 0
-        consecutive_errors = 0  # 연속 오류 카운터
-        max_consecutive_errors = 3  # 최대 연속 오류 허용
-        status_timeout_count = 0  # 상태 타임아웃 카운터
-        max_status_timeouts = 5  # 최대 상태 타임아웃 허용
+            self.log_message(f"❌ 화면 프레임 처리 오류: {str(e)}")
         
-        while self.is_monitoring:
+        if status_raw:
             try:
-                current_time = time.time()
-                
-                # 상태 요청 주기 확인
-                if current_time - last_status_request >= status_request_interval:
-                    # GET_STATUS 명령어로 상태 정보 요청
-                    if self.is_connected and self.serial_port:
-                        try:
-                            # 시리얼 버퍼 클리어 (무한루프 방지)
-                            if self.serial_port.in_waiting > 0:
-                                old_data = self.serial_port.read(self.serial_port.in_waiting)
-                                if len(old_data) > 5000:  # 5KB 이상
-                                    self.write_event_log("WARNING", f"과도한 버퍼 데이터: {len(old_data)} bytes")
-                                    
-                                    # 강제 버퍼 클리어
-                                    try:
-                                        self.serial_port.reset_input_buffer()
-                                        self.serial_port.reset_output_buffer()
-                                        time.sleep(0.1)
-                                        self.log_message("🧹 시리얼 버퍼 강제 클리어")
-                                    except Exception:
-                                        pass
-                            
-                            # 상태 요청 전송 (타임아웃 설정)
-                            self.serial_port.write(b'GET_STATUS\n')
-                            self.serial_port.flush()
-                            
-                            # 응답 대기 및 처리 (짧은 타임아웃으로 블로킹 방지)
-                            response = self.wait_for_response(800)  # 800ms로 단축
-                            if response:
-                                # BAT ADC 안전 파싱
-                                status_data = self._safe_parse_status_data(response)
-                                if status_data:
-                                    # GUI 업데이트 (비동기)
-                                    self.root.after(0, lambda data=status_data: self.update_status_display(data))
-                                    
-                                    # 상태 로그에 기록 (안전한 방식)
-                                    try:
-                                        self.write_status_log(status_data)
-                                    except Exception as log_error:
-                                        # 로그 기록 실패해도 모니터링은 계속
-                                        pass
-                                    
-                                    consecutive_errors = 0  # 성공시 오류 카운터 리셋
-                                    status_timeout_count = 0  # 타임아웃 카운터 리셋
-                                    last_status_request = current_time
-                                else:
-                                    # 파싱 실패시 테스트 데이터로 대체 (BAT ADC 포함)
-                                    test_status = self._generate_safe_test_status()
-                                    self.root.after(0, lambda data=test_status: self.update_status_display(data))
-                                    consecutive_errors += 1
-                                    
-                            else:
-                                # 응답 없음 - 타임아웃 카운터 증가
-                                status_timeout_count += 1
-                                if status_timeout_count <= max_status_timeouts:
-                                    self.write_event_log("WARNING", f"상태 응답 없음 ({status_timeout_count}/{max_status_timeouts})")
-                                consecutive_errors += 1
-                                
-                        except Exception as status_error:
-                            error_msg = str(status_error)
-                            # BAT ADC 관련 오류 특별 처리
-                            if "BAT_ADC" in error_msg or "parse" in error_msg.lower():
-                                self.write_event_log("ERROR", f"BAT ADC 파싱 오류: {error_msg}")
-                                # 안전한 테스트 데이터로 대체
-                                safe_status = self._generate_safe_test_status()
-                                self.root.after(0, lambda data=safe_status: self.update_status_display(data))
-                            else:
-                                self.write_event_log("ERROR", f"상태 요청 오류: {error_msg}")
-                            consecutive_errors += 1
-                            
-                        # 연속 오류가 너무 많으면 잠시 대기
-                        if consecutive_errors >= max_consecutive_errors:
-                            self.write_event_log("WARNING", f"연속 오류 {consecutive_errors}회 발생, 대기 중...")
-                            time.sleep(3)  # 3초 대기 (단축)
-                            consecutive_errors = 0  # 리셋
-                            
-                        # 상태 타임아웃이 너무 많으면 상태 요청 중단
-                        if status_timeout_count >= max_status_timeouts:
-                            self.write_event_log("WARNING", "상태 요청 일시 중단 (과도한 타임아웃)")
-                            time.sleep(10)  # 10초 대기 후 재시도
-                            status_timeout_count = 0
-                            
-                    last_status_request = current_time
-                
-                # 루프 대기 시간 (CPU 효율성)
-                time.sleep(0.5)  # 0.5초 간격으로 단축 (기존 1초)
-                
-            except Exception as e:
-                error_msg = str(e)
-                self.write_event_log("ERROR", f"상태 루프 오류: {error_msg}")
-                consecutive_errors += 1
-                
-                # BAT ADC 관련 심각한 오류시 상태 루프 일시 중단
-                if "BAT_ADC" in error_msg or consecutive_errors >= max_consecutive_errors:
-                    time.sleep(5)  # 5초 대기
-                    consecutive_errors = 0
+                status_data = self.parse_firmware_status_data(status_raw)
+                if status_data:
+                    self.log_message("✅ 상태 데이터 파싱 성공")
+                    # RAW 데이터 먼저 기록
+                    self.write_raw_data_log(status_raw, "INTEGRATED_STATUS", f"통합 응답에서 추출된 상태 데이터")
+                    # GUI 업데이트는 메인 스레드에서
+                    self.root.after(0, lambda: self.update_status_display(status_data))
+                    self.write_status_log(status_data)
                 else:
-                    time.sleep(1)  # 1초 대기
+                    self.log_message("⚠️ 상태 데이터 파싱 실패")
+                    # 실패한 RAW 데이터도 기록
+                    self.write_raw_data_log(status_raw, "FAILED_STATUS_PARSING", f"파싱 실패한 상태 데이터")
+            except Exception as status_error:
+                self.log_message(f"⚠️ 상태 파싱 오류: {str(status_error)}")
         
-        # 종료 처리
-        self.log_message("🔄 상태 루프 종료")
-    
-    def _safe_parse_status_data(self, response):
-        """BAT ADC 안전 파싱 (타임아웃 및 예외 처리 강화)"""
-        try:
-            # 파싱 시간 제한 (3초)
-            import signal
-            
-            def timeout_handler(signum, frame):
-                raise TimeoutError("상태 파싱 타임아웃")
-            
-            # 윈도우에서는 signal.alarm이 지원되지 않으므로 조건부 처리
-            try:
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(3)  # 3초 타임아웃
-            except (AttributeError, OSError):
-                # 윈도우나 신호 처리가 지원되지 않는 환경
-                pass
-            
-            try:
-                # 기존 파싱 함수 호출
-                result = self.parse_firmware_status_data(response)
-                
-                # BAT ADC 값 검증 및 보정
-                if result and 'bat_adc' in result:
-                    bat_adc = result['bat_adc']
-                    # ADC 값 범위 검증 (0-4095, 12-bit ADC)
-                    if not isinstance(bat_adc, int) or bat_adc < 0 or bat_adc > 4095:
-                        result['bat_adc'] = 0  # 잘못된 값은 0으로 보정
-                        self.write_event_log("WARNING", f"BAT ADC 값 보정: {bat_adc} -> 0")
-                
-                return result
-                
-            finally:
-                try:
-                    signal.alarm(0)  # 타임아웃 해제
-                except (AttributeError, OSError):
-                    pass
-                
-        except TimeoutError:
-            self.write_event_log("ERROR", "상태 파싱 타임아웃 - 안전 모드로 전환")
-            return self._generate_safe_test_status()
-        except Exception as e:
-            self.write_event_log("ERROR", f"안전 파싱 오류: {str(e)}")
-            return self._generate_safe_test_status()
+        # 화면 데이터 반환 (상태 처리 완료)
+        return screen_data
     
     def _generate_safe_test_status(self):
         """안전한 테스트 상태 데이터 생성 (BAT ADC 포함)"""
@@ -2241,11 +2238,7 @@ class OLEDMonitor:
             
             self.log_message("📡 수동 화면+상태 캡처 요청...")
             
-            # 즉시 통합 요청 전송
-            self.serial_port.write(b'GET_SCREEN\n')
-            self.serial_port.flush()
-            
-            # 동기적으로 통합 응답 처리 (수동 요청이므로 완전한 대기)
+            # 통합 요청 전송 및 동기적 응답 처리 (수동 요청이므로 완전한 대기)
             success = self.process_integrated_response_sync()
             
             if success:
@@ -2263,96 +2256,37 @@ class OLEDMonitor:
     def process_integrated_response_sync(self):
         """동기식 통합 응답 처리 (수동 캡처용) - 실제 펌웨어 형식"""
         try:
-            response_data = b''
-            timeout_count = 0
-            max_timeout = 400  # 4초 타임아웃 (통합 응답이므로 더 긴 시간)
-            
-            # 실제 펌웨어 응답 마커들
-            screen_start_found = False
-            screen_end_found = False
-            status_found = False
-            
-            while timeout_count < max_timeout:
-                if self.serial_port.in_waiting > 0:
-                    chunk = self.serial_port.read(self.serial_port.in_waiting)
-                    response_data += chunk
-                    
-                    # 실제 펌웨어 응답 마커 검출
-                    if not screen_start_found and b'<<SCREEN_START>>' in response_data:
-                        screen_start_found = True
-                        self.log_message("✓ SCREEN_START 감지")
-                        
-                    if not screen_end_found and b'<<SCREEN_END>>' in response_data:
-                        screen_end_found = True
-                        self.log_message("✓ SCREEN_END 감지")
-                        
-                    # SCREEN_END 다음에 STATUS: 찾기
-                    if screen_end_found and not status_found:
-                        screen_end_pos = response_data.find(b'<<SCREEN_END>>')
-                        if screen_end_pos != -1:
-                            after_screen_end = response_data[screen_end_pos + len(b'<<SCREEN_END>>'):]
-                            if (b'\r\nSTATUS:' in after_screen_end or 
-                                b'\nSTATUS:' in after_screen_end or 
-                                b'STATUS:' in after_screen_end):
-                                status_found = True
-                                self.log_message("✓ STATUS: 데이터 감지")
-                        
-                    # 화면과 상태가 모두 발견되면 완료
-                    if screen_start_found and screen_end_found and status_found:
-                        # STATUS: 라인이 완료되었는지 확인
-                        screen_end_pos = response_data.find(b'<<SCREEN_END>>')
-                        after_screen_end = response_data[screen_end_pos + len(b'<<SCREEN_END>>'):]
-                        
-                        # STATUS: 다음에 개행문자가 있는지 확인
-                        if b'STATUS:' in after_screen_end:
-                            status_pos = after_screen_end.find(b'STATUS:')
-                            status_line = after_screen_end[status_pos:]
-                            
-                            # STATUS: 라인이 개행문자로 끝나는지 확인
-                            if b'\r\n' in status_line or b'\n' in status_line:
-                                self.log_message("✅ 통합 응답 완전 수신")
-                                break
-                        
-                    # 화면만 있는 응답 감지 (기존 펌웨어)
-                    if screen_start_found and screen_end_found and not status_found:
-                        if timeout_count > 100:  # 1초 정도 기다려도 상태가 없으면
-                            self.log_message("⚠️ 화면만 있는 응답 감지 (기존 펌웨어)")
-                            break
-                        
-                    # 전송 오류 감지
-                    if b'<<TRANSMISSION_ERROR>>' in response_data:
-                        self.log_message("❌ 전송 오류 감지됨")
-                        return False
-                        
-                else:
-                    time.sleep(0.01)
-                    timeout_count += 1
+            # 통합 응답이므로 긴 타임아웃 (4초), STATUS 없는 기존 펌웨어는 유예 시간 후 종료
+            response = self.request_screen_frame(4.0)
             
-            if len(response_data) == 0:
-                self.log_message("❌ 응답 데이터 없음")
+            if response['screen'] is None:
+                if response['error']:
+                    self.log_message(f"❌ 손상 프레임만 수신 ({response['error']})")
+                else:
+                    errors = self.serial_reader.stats['frame_errors'] if self.serial_reader else 0
+                    self.log_message(f"❌ 화면 응답 없음 (누적 프레임 오류: {errors})")
                 return False
             
             # 수신된 데이터 요약 로그
-            data_summary = f"데이터 크기: {len(response_data)}bytes"
-            if status_found:
+            data_summary = f"데이터 크기: {len(response['screen']['data'])}bytes"
+            if response['status'] is not None:
                 data_summary += ", 상태 포함"
+            else:
+                self.log_message("⚠️ 화면만 있는 응답 감지 (기존 펌웨어)")
             self.log_message(f"📦 수신 완료 - {data_summary}")
             
             # 통합 응답 파싱
-            screen_data = self.parse_screen_response(response_data)
+            screen_data = self.process_screen_events(response['screen'], response['status'])
             if screen_data is not None:
                 self.log_message("✅ 통합 응답 파싱 성공")
-                self.update_display(screen_data)
+                if not response['screen'].get('repeated'):
+                    self.update_display(screen_data)
                 return True
             else:
                 self.log_message("❌ 통합 응답 파싱 실패")
                 
-                # 디버그: 응답 데이터 일부 출력
-                if len(response_data) > 50:
-                    sample_data = response_data[:50] + b'...'
-                else:
-                    sample_data = response_data
-                self.log_message(f"🔍 응답 데이터 샘플: {sample_data}")
+                # 디버그: 이미지 데이터 일부 출력
+                self.log_message(f"🔍 이미지 데이터 샘플: {response['screen']['data'][:50]}...")
                 return False
                 
         except Exception as e:
@@ -2410,6 +2344,7 @@ class OLEDMonitor:
             
             # 바이너리 데이터 처리
             if img_data is None:
+                self.check_parse_deadline()
                 try:
                     text_ratio = len([b for b in data if 32 <= b <= 126]) / max(len(data), 1)
                     if text_ratio < 0.1:
@@ -2453,160 +2388,58 @@ class OLEDMonitor:
                 
             # NumPy 사용 가능 여부 확인
             if not self.numpy_available:
-                try:
-                    import numpy as np
-                    self.numpy_available = True
-                except ImportError:
-                    return self._parse_without_numpy(img_data)
-            
-            import numpy as np
-            
-            # OLED 데이터를 PIL 이미지로 변환
-            img_array = np.zeros((self.OLED_HEIGHT, self.OLED_WIDTH), dtype=np.uint8)
-            width_bytes = self.OLED_WIDTH // 8  # 16 bytes per row
+                return self._parse_without_numpy(img_data)
             
+            # 프레임마다 로그를 남기지 않도록 파싱 방법이 바뀐 경우에만 기록
             current_method = self.parsing_method
-            self.log_message(f"파싱 방법: {current_method}")
-            
-            # 기본 파싱 (원본 데이터)
-            temp_array = np.zeros((self.OLED_HEIGHT, self.OLED_WIDTH), dtype=np.uint8)
-            
-            for row in range(self.OLED_HEIGHT):
-                for byte_col in range(width_bytes):
-                    byte_idx = byte_col + row * width_bytes
-                    
-                    if byte_idx < len(img_data):
-                        byte_value = img_data[byte_idx]
-                        
-                        for bit in range(8):
-                            x = byte_col * 8 + bit
-                            y = row
-                            
-                            if x < self.OLED_WIDTH and y < self.OLED_HEIGHT:
-                                bit_value = (byte_value >> (7 - bit)) & 1
-                                temp_array[y, x] = 255 if bit_value else 0
-            
-            # 파싱 방법에 따른 변환 적용
-            if current_method == "method1_direct":
-                # 방법 1: 직접 매핑 (변환 없음)
-                img_array = temp_array.copy()
-                
-            elif current_method == "method2_reversed":
-                # 방법 2: reverse 함수 적용
-                for row in range(self.OLED_HEIGHT):
-                    for byte_col in range(width_bytes):
-                        byte_idx = byte_col + row * width_bytes
-                        
-                        if byte_idx < len(img_data):
-                            byte_value = img_data[byte_idx]
-                            reversed_byte = self.reverse_byte(byte_value)
-                            
-                            for bit in range(8):
-                                x = byte_col * 8 + bit
-                                y = row
-                                
-                                if x < self.OLED_WIDTH and y < self.OLED_HEIGHT:
-                                    bit_value = (reversed_byte >> (7 - bit)) & 1
-                                    img_array[y, x] = 255 if bit_value else 0
-                                    
-            elif current_method == "method3_rotated_180":
-                # 방법 3: 180도 회전
-                img_array = np.rot90(temp_array, 2)
-                
-            elif current_method == "method4_flipped_h":
-                # 방법 4: 가로 뒤집기
-                img_array = np.fliplr(temp_array)
-                
-            elif current_method == "method5_flipped_v":
-                # 방법 5: 세로 뒤집기 (기본, 안정적)
-                img_array = np.flipud(temp_array)
-                
-            elif current_method == "method5_rotate_90":
-                # 방법 5-1: 90도 시계방향 회전
-                img_array = np.rot90(temp_array, -1)  # -1은 시계방향
-                
-            elif current_method == "method5_rotate_270":
-                # 방법 5-2: 270도 시계방향 회전 (90도 반시계방향)
-                img_array = np.rot90(temp_array, 1)   # 1은 반시계방향
-                
-            elif current_method == "method5_mirror_h":
-                # 방법 5-3: 가로 미러링 (좌우 반전)
-                img_array = np.fliplr(temp_array)
-                
-            elif current_method == "method5_mirror_v":
-                # 방법 5-4: 세로 미러링 (상하 반전)
-                img_array = np.flipud(temp_array)
-                
-            elif current_method == "method5_flip_both":
-                # 방법 5-5: 상하좌우 모두 뒤집기
-                img_array = np.flipud(np.fliplr(temp_array))
-                
-            elif current_method == "method6_transposed":
-                # 방법 6: 전치 + 조정
-                # 128x64를 64x128로 전치하면 크기가 맞지 않으므로 보간 필요
-                transposed = temp_array.T  # 전치: 64x128
-                # 64x128을 128x64로 리사이즈
-                from PIL import Image
-                pil_img = Image.fromarray(transposed.astype(np.uint8), mode='L')
-                resized_img = pil_img.resize((self.OLED_WIDTH, self.OLED_HEIGHT), Image.NEAREST)
-                img_array = np.array(resized_img)
-                
-            else:
-                # 알 수 없는 방법인 경우 기본 세로 뒤집기 적용
-                self.log_message(f"⚠️ 알 수 없는 파싱 방법: {current_method}, 기본값 적용")
-                img_array = np.flipud(temp_array)
-            
-            # 데이터 검증
-            white_pixels = np.sum(img_array == 255)
-            black_pixels = np.sum(img_array == 0)
-            total_pixels = white_pixels + black_pixels
-            
-            if total_pixels == 0:
-                self.log_message("❌ 빈 이미지 데이터")
-                return None
-                
-            white_ratio = (white_pixels / total_pixels) * 100
-            # 파싱 완료 로그를 간소화 (과도한 출력 방지)
-            if white_ratio > 5:  # 의미있는 데이터가 있을 때만 상세 로그
-                self.log_message(f"✅ 파싱 완료 - 흰색 픽셀: {white_ratio:.1f}%")
-            else:
-                self.log_message("✅ 파싱 완료")
+            if current_method != self.logged_parsing_method:
+                self.logged_parsing_method = current_method
+                if current_method in OLEDImageDecoder.METHODS:
+                    self.log_message(f"파싱 방법: {current_method}")
+                else:
+                    # 알 수 없는 방법인 경우 기본 세로 뒤집기 적용 (디코더 기본 동작)
+                    self.log_message(f"⚠️ 알 수 없는 파싱 방법: {current_method}, 기본값 적용")
             
-            return img_array
+            # 룩업 테이블 gather + 미리 계산된 방향 변환 계획 gather (링 버퍼에 기록)
+            # 데이터 무결성은 프레이머의 체크섬/CRC 검증으로 보장됨
+            return self.image_decoder.decode(img_data, current_method)
             
         except Exception as e:
             self.log_message(f"❌ 파싱 오류: {str(e)}")
             return None
     
     def _parse_without_numpy(self, img_data):
-        """NumPy 없이 파싱하는 폴백 함수"""
+        """NumPy 없이 파싱하는 폴백 함수 - PIL 1bpp 원시 디코딩 (픽셀 단위 루프 없음)"""
         try:
             # 원본 데이터 저장
             self.last_raw_data = img_data
             
-            # PIL로 직접 처리
-            img = Image.new('L', (128, 64), 0)
-            pixels = []
-            
-            for y in range(64):
-                for x in range(128):
-                    byte_index = y * 16 + x // 8
-                    if byte_index < len(img_data):
-                        byte_val = img_data[byte_index]
-                        bit_pos = 7 - (x % 8)
-                        pixel_val = 255 if (byte_val >> bit_pos) & 1 else 0
-                        pixels.append(pixel_val)
-                    else:
-                        pixels.append(0)
+            data = bytes(img_data[:self.IMAGE_SIZE])
+            if len(data) < self.IMAGE_SIZE:
+                data += bytes(self.IMAGE_SIZE - len(data))
             
-            img.putdata(pixels)
+            current_method = self.parsing_method
+            if current_method == "method2_reversed":
+                # 바이트 내 비트 순서 반전 (256 엔트리 룩업 테이블)
+                data = data.translate(REVERSE_BYTE_LUT)
+            
+            # 펌웨어 형식(행 우선, MSB 먼저)은 PIL '1' 모드 원시 형식과 동일
+            img = Image.frombytes('1', (self.OLED_WIDTH, self.OLED_HEIGHT), data).convert('L')
             
-            # 파싱 방법 적용 (간단한 변환만)
-            if self.parsing_method == "method3_rotated_180":
-                img = img.rotate(180)
-            elif self.parsing_method == "method4_flipped_h":
+            # 파싱 방법 적용 (NumPy 디코더와 동일한 결과)
+            if current_method in ("method1_direct", "method2_reversed"):
+                pass
+            elif current_method in ("method3_rotated_180", "method5_flip_both"):
+                img = img.transpose(Image.ROTATE_180)
+            elif current_method in ("method4_flipped_h", "method5_mirror_h"):
                 img = img.transpose(Image.FLIP_LEFT_RIGHT)
-            elif self.parsing_method == "method5_flipped_v":
+            elif current_method == "method5_rotate_90":
+                img = img.transpose(Image.ROTATE_270)  # 시계방향 90도
+            elif current_method == "method5_rotate_270":
+                img = img.transpose(Image.ROTATE_90)   # 반시계방향 90도
+            elif current_method == "method6_transposed":
+                img = img.transpose(Image.TRANSPOSE).resize((self.OLED_WIDTH, self.OLED_HEIGHT), Image.NEAREST)
+            else:
                 img = img.transpose(Image.FLIP_TOP_BOTTOM)
             
             return img
@@ -2620,11 +2453,7 @@ class OLEDMonitor:
         # temp = ((temp & 0x55) << 1) | ((temp & 0xaa) >> 1);
         # temp = ((temp & 0x33) << 2) | ((temp & 0xcc) >> 2);
         # temp = ((temp & 0x0f) << 4) | ((temp & 0xf0) >> 4);
-        temp = byte_val
-        temp = ((temp & 0x55) << 1) | ((temp & 0xaa) >> 1)
-        temp = ((temp & 0x33) << 2) | ((temp & 0xcc) >> 2) 
-        temp = ((temp & 0x0f) << 4) | ((temp & 0xf0) >> 4)
-        return temp
+        return REVERSE_BYTE_LUT[byte_val & 0xFF]
         
     def generate_test_screen(self):
         """테스트용 더미 화면 데이터 생성 (실제 OLED 형식)"""
@@ -2690,26 +2519,8 @@ class OLEDMonitor:
             return
             
         try:
-            # 상태 요청 명령 전송
-            self.serial_port.write(b'GET_STATUS\n')
-            self.serial_port.flush()
-            
-            # 응답 대기
-            response_data = b''
-            timeout_count = 0
-            max_timeout = 20  # 200ms 타임아웃
-            
-            while timeout_count < max_timeout:
-                if self.serial_port.in_waiting > 0:
-                    chunk = self.serial_port.read(self.serial_port.in_waiting)
-                    response_data += chunk
-                    
-                    # 개행 문자를 찾으면 완료
-                    if b'\n' in response_data:
-                        break
-                else:
-                    time.sleep(0.01)
-                    timeout_count += 1
+            # 상태 요청 명령 전송 후 응답 대기 (200ms 타임아웃)
+            response_data = self.send_command_and_wait("GET_STATUS", 200) or b''
             
             if len(response_data) > 0:
                 # 실제 펌웨어 응답 파싱
@@ -2735,160 +2546,67 @@ class OLEDMonitor:
             self.log_message(f"상태 요청 실패: {str(e)}")
     
     def parse_firmware_status_data(self, response):
-        """펌웨어에서 받은 상태 데이터 파싱 - 무한루프 완전 방지"""
-        try:
-            # 기본 상태 정보 (항상 반환되도록)
-            status_info = {
-                'timestamp': datetime.now().strftime('%H:%M:%S'),
-                'source': 'firmware',
-                'battery': 18.6,
-                'timer': '00:00',
-                'status': 'UNKNOWN',
-                'l1_connected': False,
-                'l2_connected': False,
-                'bat_adc': 0
-            }
-            
-            # 응답 데이터 전처리
-            if isinstance(response, bytes):
-                try:
-                    data_str = response.decode('utf-8', errors='ignore').strip()
-                    status_info['raw_data'] = response
-                except:
-                    data_str = str(response, errors='replace').strip()
-                    status_info['raw_data'] = data_str.encode('utf-8', errors='ignore')
-            else:
-                data_str = str(response).strip()
-                status_info['raw_data'] = data_str.encode('utf-8', errors='ignore')
-            
-            status_info['raw_string'] = data_str
-            
-            # 데이터 길이 검증 (과도한 데이터 방지)
-            if len(data_str) > 500:
-                self.write_event_log("WARNING", f"데이터 크기 제한: {len(data_str)} chars")
-                data_str = data_str[:500]
-            
-            # STATUS: 형식 확인
-            if not data_str.startswith('STATUS:'):
-                self.write_event_log("WARNING", f"잘못된 STATUS 형식: {data_str[:50]}")
-                return status_info
-            
-            # STATUS: 제거 후 파싱
-            status_part = data_str[7:]  # "STATUS:" 제거
-            
-            # 항목 분할 (최대 개수 제한)
-            items = status_part.split(',')[:8]  # 최대 8개 항목만 처리
-            
-            # 각 항목 파싱
-            for item in items:
-                try:
-                    item = item.strip()
-                    if not item or ':' not in item:
-                        continue
-                    
-                    parts = item.split(':', 1)
-                    if len(parts) != 2:
-                        continue
-                        
-                    key = parts[0].strip()
-                    value = parts[1].strip()
-                    
-                    # 키와 값 길이 검증
-                    if len(key) > 15 or len(value) > 30:
-                        continue
-                    
-                    # 각 항목별 파싱
-                    if key == 'BAT':
-                        try:
-                            battery_str = value.replace('V', '').strip()
-                            battery_val = int(battery_str)
-                            status_info['battery'] = battery_val/100
-                        except:
-                            pass
-                            
-                    elif key == 'TIMER':
-                        if len(value) <= 8:
-                            status_info['timer'] = value
-                            
-                    elif key == 'STATUS':
-                        if len(value) <= 15:
-                            status_info['status'] = value
-                            
-                    elif key == 'L1':
-                        status_info['l1_connected'] = (value == '1')
-                        
-                    elif key == 'L2':
-                        status_info['l2_connected'] = (value == '1')
-                        
-                    elif key == 'BAT_ADC':
-                        try:
-                            adc_val = int(value)
-                            status_info['bat_adc'] = max(0, min(4095, adc_val))
-                        except:
-                            pass
-                            
-                except Exception as item_error:
-                    # 개별 아이템 오류는 무시하고 계속
-                    continue
-            
-            return status_info
-            
-        except Exception as e:
-            # 모든 오류를 포착하여 안전한 기본값 반환
-            self.write_event_log("ERROR", f"상태 파싱 오류: {str(e)}")
-            return {
-                'timestamp': datetime.now().strftime('%H:%M:%S'),
-                'source': 'firmware_error',
-                'battery': 18.6,
-                'timer': '00:00',
-                'status': 'ERROR',
-                'l1_connected': False,
-                'l2_connected': False,
-                'bat_adc': 0,
-                'error': str(e),
-                'raw_data': response if isinstance(response, bytes) else str(response).encode('utf-8', errors='ignore'),
-                'raw_string': response.decode('utf-8', errors='ignore') if isinstance(response, bytes) else str(response)
-            }
+        """펌웨어 STATUS 줄 파싱 - 모든 상태 경로(화면 응답, GET_STATUS, 수동 새로고침)가 사용
+        
+        SerialDataParser.parse_status_data 한 곳에서만 파싱한다 (정규식 한 번,
+        입력 크기 제한). STATUS 줄이 아니면 None을 반환하고 이벤트 로그에 남긴다.
+        
+        Returns:
+            StatusRecord: 파싱된 상태 (dict처럼 접근 가능) 또는 None
+        """
+        status = self.serial_parser.parse_status_data(response)
+        if status is None:
+            preview = bytes(response[:50]) if isinstance(response, (bytes, bytearray)) else str(response)[:50]
+            self.write_event_log("WARNING", f"잘못된 STATUS 형식: {preview!r}")
+        return status
     
     def update_display(self, screen_data):
-        """화면 업데이트 (PIL/NumPy 호환 버전)"""
+        """화면 업데이트 (PIL/NumPy 호환) - 지속 PhotoImage에 변경된 행만 다시 그림"""
         if screen_data is None:
             return
+        
+        # 캡처 스레드의 마지막 프레임이 아닌 화면(테스트 패턴, 이전 프레임 등)을 그리면
+        # 동일 프레임 생략을 해제해서 다음 수신 프레임이 다시 표시되게 함
+        last_frame = self.last_frame
+        if last_frame is not None and last_frame[2] is not screen_data:
+            self.last_frame = None
             
         try:
-            # 화면 데이터를 PIL Image로 통일
-            if hasattr(screen_data, 'save'):
-                # 이미 PIL Image인 경우
-                display_img = screen_data
-            elif hasattr(screen_data, 'shape'):
-                # NumPy 배열인 경우
-                display_img = Image.fromarray(screen_data.astype('uint8'), mode='L')
+            # 화면 데이터를 NumPy 배열로 통일
+            if hasattr(screen_data, 'shape'):
+                pixels = screen_data
+            elif hasattr(screen_data, 'convert'):
+                # PIL Image인 경우
+                pixels = np.asarray(screen_data.convert('L'), dtype=np.uint8)
             else:
-                # 다른 형식인 경우 PIL Image로 변환 시도
-                display_img = Image.fromarray(screen_data, mode='L')
+                pixels = np.asarray(screen_data, dtype=np.uint8)
             
-            # 스케일링 최적화
-            scale = int(self.scale_var.get())
+            height, width = pixels.shape[:2]
+            scale = max(1, int(self.scale_var.get()))
             
-            if scale == 1:
-                # 스케일링 없음 - 최고 성능
-                final_img = display_img
+            if (self.display_photo is None or scale != self.display_scale_cached or
+                    self.display_pixels.shape != pixels.shape):
+                # 크기/배율이 바뀐 경우에만 PhotoImage와 캔버스 재구성
+                self._rebuild_display_surface(width, height, scale)
+                dirty_rows = np.arange(height)
             else:
-                # 고품질 리사이징 (필요시에만)
-                new_size = (128 * scale, 64 * scale)
-                final_img = display_img.resize(new_size, Image.NEAREST)  # NEAREST는 가장 빠름
-            
-            # PhotoImage 변환 최적화
-            self.current_image = ImageTk.PhotoImage(final_img)
+                # 이전 화면과 비교하여 변경된 행만 선택
+                dirty_rows = np.flatnonzero((pixels != self.display_pixels).any(axis=1))
+                if dirty_rows.size == 0:
+                    self.display_stats['unchanged_frames'] += 1
+                    self.current_screen = screen_data
+                    return
             
-            # Canvas 업데이트 (최소한의 연산)
-            self.canvas.delete("all")  # 이전 이미지 삭제
-            self.canvas.create_image(0, 0, anchor=tk.NW, image=self.current_image)
+            # 연속된 변경 행 묶음 단위로 PhotoImage 부분 갱신
+            breaks = np.flatnonzero(np.diff(dirty_rows) > 1)
+            band_starts = np.concatenate(([dirty_rows[0]], dirty_rows[breaks + 1]))
+            band_ends = np.concatenate((dirty_rows[breaks], [dirty_rows[-1]])) + 1
+            for start, end in zip(band_starts, band_ends):
+                self._put_display_rows(pixels, int(start), int(end), scale)
             
-            # Canvas 크기 자동 조정
-            canvas_width = 128 * scale
-            canvas_height = 64 * scale
-            self.canvas.config(width=canvas_width, height=canvas_height)
+            self.display_pixels[...] = pixels
+            self.display_stats['drawn_frames'] += 1
+            self.display_stats['dirty_rows'] += int(dirty_rows.size)
             
             # 현재 화면 저장 (파싱 방법 변경용)
             self.current_screen = screen_data
@@ -2896,11 +2614,44 @@ class OLEDMonitor:
         except Exception as e:
             self.log_message(f"❌ 화면 업데이트 오류: {str(e)}")
     
+    def _rebuild_display_surface(self, width, height, scale):
+        """표시용 PhotoImage 재생성 및 캔버스 크기 조정 (배율/크기 변경시에만)"""
+        self.display_photo = tk.PhotoImage(width=width * scale, height=height * scale)
+        self.current_image = self.display_photo  # 참조 유지
+        
+        if self.display_item is None:
+            self.display_item = self.canvas.create_image(0, 0, anchor=tk.NW, image=self.display_photo)
+        else:
+            self.canvas.itemconfig(self.display_item, image=self.display_photo)
+        
+        self.canvas.config(width=width * scale, height=height * scale)
+        self.display_pixels = np.zeros((height, width), dtype=np.uint8)
+        self.display_scale_cached = scale
+    
+    def _put_display_rows(self, pixels, start, end, scale):
+        """픽셀 행 구간 [start, end)를 확대하여 PhotoImage에 기록 (바이너리 PGM)"""
+        build_start = time.perf_counter()
+        band = pixels[start:end]
+        if scale > 1:
+            band = band.repeat(scale, axis=0).repeat(scale, axis=1)
+        
+        header = f"P5\n{band.shape[1]} {band.shape[0]}\n255\n".encode('ascii')
+        data = header + band.tobytes()
+        put_start = time.perf_counter()
+        self.display_photo.tk.call(self.display_photo.name, 'put', data,
+                                   '-format', 'ppm', '-to', 0, start * scale)
+        self.stage_profiler.record('photo_build', put_start - build_start)
+        self.stage_profiler.record('canvas_update', time.perf_counter() - put_start)
+    
     def update_display_scale(self, value):
         """화면 확대 비율 업데이트"""
         scale = int(float(value))
         self.scale_label.config(text=f"{scale}x")
         
+        # 배율이 실제로 바뀐 경우에만 다시 그림 (슬라이더 이동 중 중복 호출 방지)
+        if scale == self.display_scale_cached:
+            return
+        
         if self.current_screen is not None:
             self.update_display(self.current_screen)
             
@@ -2911,6 +2662,9 @@ class OLEDMonitor:
         # 데이터 소스 표시
         data_source = status_data.get('source', 'unknown')
         if data_source == 'firmware':
+            self.status_history.append(status_data)
+            if self.trend_panel is not None:
+                self.trend_panel.update()
             source_text = "📡 실시간 데이터"
             source_color = "green"
         else:
@@ -2963,88 +2717,12 @@ L2 연결: {'예' if status_data.get('l2_connected', False) else '아니오'}
             # 단순한 상태 요청
             self.log_message("📡 수동 상태 새로고침...")
             
-            # 버퍼 클리어
-            try:
-                self.serial_port.reset_input_buffer()
-                self.serial_port.reset_output_buffer()
-            except:
-                pass
-            
-            # 상태 요청 전송
-            self.serial_port.write(b'GET_STATUS\n')
-            self.serial_port.flush()
-            
-            # 단순한 응답 대기 (1초 타임아웃)
-            start_time = time.time()
-            response_data = b''
-            
-            while time.time() - start_time < 1.0:  # 1초 타임아웃
-                if self.serial_port.in_waiting > 0:
-                    chunk = self.serial_port.read(self.serial_port.in_waiting)
-                    response_data += chunk
-                    
-                    # STATUS: 가 포함되면 완료
-                    if b'STATUS:' in response_data:
-                        break
-                else:
-                    time.sleep(0.01)
+            # 상태 요청 전송 후 STATUS: 줄 대기 (1초 타임아웃)
+            response_data = self.send_command_and_wait("GET_STATUS", 1000) or b''
             
             # 응답 처리
-            if response_data and b'STATUS:' in response_data:
-                # 안전 래퍼를 사용한 상태 파싱
-                def parse_status_simple(data):
-                    # 단순화된 상태 파싱
-                    if isinstance(data, bytes):
-                        try:
-                            data_str = data.decode('utf-8', errors='ignore').strip()
-                        except:
-                            data_str = str(data).strip()
-                    else:
-                        data_str = str(data).strip()
-                    
-                    status_info = {
-                        'timestamp': datetime.now().strftime('%H:%M:%S'), 
-                        'source': 'firmware',
-                        'battery': 0,
-                        'timer': '00:00',
-                        'status': 'UNKNOWN',
-                        'l1_connected': False,
-                        'l2_connected': False,
-                        'bat_adc': 0
-                    }
-                    
-                    if data_str.startswith('STATUS:'):
-                        status_part = data_str[7:]
-                        items = status_part.split(',')[:6]
-                        
-                        for item in items:
-                            item = item.strip()
-                            if ':' in item:
-                                key, value = item.split(':', 1)
-                                key, value = key.strip(), value.strip()
-                                
-                                if key == 'BAT':
-                                    try:
-                                        status_info['battery'] = float(value.replace('V', ''))/100
-                                    except:
-                                        pass
-                                elif key == 'TIMER':
-                                    status_info['timer'] = value[:8]
-                                elif key == 'STATUS':
-                                    status_info['status'] = value[:15]
-                                elif key == 'L1':
-                                    status_info['l1_connected'] = (value == '1')
-                                elif key == 'L2':
-                                    status_info['l2_connected'] = (value == '1')
-                                elif key == 'BAT_ADC':
-                                    try:
-                                        status_info['bat_adc'] = max(0, min(4095, int(value)))
-                                    except:
-                                        pass
-                    
-                    return status_info
-                
-                status_data = self.safe_parse_wrapper(parse_status_simple, response_data, "수동상태파싱")
+            if response_data and b'STATUS:' in response_data:
+                status_data = self.parse_firmware_status_data(response_data)
                 if status_data:
                     # RAW 데이터 기록
                     self.write_raw_data_log(response_data, "MANUAL_STATUS_REFRESH", "수동 상태 새로고침")
@@ -3112,9 +2790,12 @@ L2 연결: {'예' if status_data.get('l2_connected', False) else '아니오'}
         )
         
         if filename:
+            # StatusRecord/원시 바이트는 JSON으로 저장할 수 없으므로 일반 dict로 변환
+            status = dict(self.current_status or {})
+            status.pop('raw_data', None)
             session_data = {
                 'timestamp': datetime.now().isoformat(),
-                'status': self.current_status,
+                'status': status,
                 'settings': {
                     'port': self.port_var.get(),
                     'baudrate': self.baud_var.get()
@@ -3128,8 +2809,96 @@ L2 연결: {'예' if status_data.get('l2_connected', False) else '아니오'}
             except Exception as e:
                 messagebox.showerror("오류", f"저장 실패: {str(e)}")
     
+    def toggle_session_recording(self):
+        """세션 녹화 시작/중지"""
+        if self.session_recorder is not None:
+            self.stop_session_recording()
+            return
+        
+        default_name = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.oses"
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".oses",
+            initialdir=getattr(self, 'log_directory', None) or os.getcwd(),
+            initialfile=default_name,
+            filetypes=[("OLED session", "*.oses"), ("All files", "*.*")]
+        )
+        
+        if filename:
+            try:
+                self.session_recorder = SessionRecorder(filename, image_size=self.IMAGE_SIZE)
+                self.session_recorder.record_event(
+                    f"START port={self.port_var.get()} baud={self.baud_var.get()} "
+                    f"binary={self.binary_screen_active}")
+                self.log_message(f"⏺️ 세션 녹화 시작: {filename}")
+            except Exception as e:
+                self.session_recorder = None
+                messagebox.showerror("오류", f"세션 녹화 시작 실패: {str(e)}")
+    
+    def stop_session_recording(self):
+        """세션 녹화 종료 (색인 기록 후 파일 닫기)"""
+        recorder = self.session_recorder
+        if recorder is None:
+            return
+        self.session_recorder = None
+        try:
+            recorder.close()
+            stats = recorder.get_stats()
+            self.log_message(f"⏹️ 세션 녹화 종료: {stats['frames']}프레임 "
+                             f"(키 {stats['key_frames']}/델타 {stats['delta_frames']}/반복 {stats['repeat_frames']}), "
+                             f"{stats['bytes_written'] / 1024:.1f}KB, 원본 대비 {stats['compression_ratio'] * 100:.1f}%")
+        except Exception as e:
+            self.log_message(f"❌ 세션 녹화 종료 오류: {str(e)}")
+    
+    def open_session_replay(self):
+        """녹화 세션 파일을 재생 포트로 연결"""
+        filename = filedialog.askopenfilename(
+            initialdir=getattr(self, 'log_directory', None) or os.getcwd(),
+            filetypes=[("OLED session", "*.oses"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+        
+        speed = simpledialog.askfloat("세션 재생", "재생 배속 (1 = 실시간, 0 = 최대 속도):",
+                                      initialvalue=self.replay_speed, minvalue=0.0, parent=self.root)
+        if speed is None:
+            return
+        
+        self.replay_speed = speed
+        self.port_var.set(REPLAY_PORT_PREFIX + filename)
+        self.log_message(f"▶️ 세션 재생: {filename} (x{speed:g})" if speed > 0
+                         else f"▶️ 세션 재생: {filename} (최대 속도)")
+        self.connect_device()
+    
+    def log_replay_stats(self):
+        """재생 포트 처리량 통계 출력 (최대 속도 재생시 파서/표시 경로 벤치마크)"""
+        try:
+            stats = self.serial_port.get_stats()
+            self.log_message(f"📼 재생 통계: {stats['frames_served']}프레임 / {stats['wall_time']:.2f}s "
+                             f"= {stats['frames_per_second']:.1f} fps, "
+                             f"재생 위치 {stats['replay_position']:.1f}s (x{stats['effective_speed']:.1f}), "
+                             f"건너뜀 {stats['frames_skipped']}, 완료 {stats['finished']}")
+        except Exception as e:
+            self.log_message(f"⚠️ 재생 통계 오류: {str(e)}")
+    
+    def record_session_data(self, screen_event, status_raw=None):
+        """녹화 중이면 수신한 화면과 STATUS 줄 기록"""
+        recorder = self.session_recorder
+        if recorder is None:
+            return
+        try:
+            if screen_event and screen_event.get('data'):
+                recorder.record_frame(screen_event['data'])
+            if status_raw:
+                recorder.record_status(status_raw)
+        except Exception as e:
+            self.log_message(f"⚠️ 세션 녹화 기록 실패: {str(e)}")
+    
     def log_message(self, message):
-        """로그 메시지 출력 - 무한루프 방지 및 성능 최적화 강화"""
+        """로그 메시지 큐에 추가 - 어느 스레드에서나 호출 가능, 위젯/콘솔 출력 없음
+        
+        분류와 반복 메시지 제한만 여기서 하고, 출력은 flush_log_messages가
+        메인 스레드에서 모아서 한다. 큐가 가득 차면 가장 오래된 레코드를 버린다.
+        """
         try:
             current_time = time.time()
             
@@ -3137,118 +2906,93 @@ L2 연결: {'예' if status_data.get('l2_connected', False) else '아니오'}
             if len(message) > 200:
                 message = message[:200] + "... (잘림)"
             
-            # 메시지 유형별 스로틀링 설정
-            critical_keywords = ["오류", "실패", "ERROR", "❌", "CRITICAL", "FATAL"]
-            warning_keywords = ["경고", "WARNING", "⚠️", "주의"]
-            info_keywords = ["파싱 방법:", "✅ 파싱 완료", "수신 중...", "진행상황", "FPS:", "성공률:"]
-            status_keywords = ["상태 요청", "GET_STATUS", "배터리", "타이머", "BAT_ADC"]  # 상태 관련 키워드 추가
-            
-            # 메시지 중요도에 따른 스로틀링 간격 설정
-            if any(keyword in message for keyword in critical_keywords):
-                throttle_interval = 1.0  # 중요한 오류는 1초 간격
-                message_category = "critical"
-            elif any(keyword in message for keyword in warning_keywords):
-                throttle_interval = 3.0  # 경고는 3초 간격
-                message_category = "warning"
-            elif any(keyword in message for keyword in status_keywords):
-                throttle_interval = 5.0  # 상태 관련 메시지는 5초 간격 (덜 빈번하게)
-                message_category = "status"
-            elif any(keyword in message for keyword in info_keywords):
-                throttle_interval = 10.0  # 정보성 메시지는 10초 간격
-                message_category = "info"
-            else:
-                throttle_interval = 2.0  # 일반 메시지는 2초 간격
-                message_category = "general"
+            # 메시지 유형별 분류 (미리 컴파일한 키워드 패턴, 우선순위 순)
+            message_category, throttle_interval = "general", LOG_GENERAL_INTERVAL
+            for category, interval, pattern in LOG_CATEGORIES:
+                if pattern.search(message):
+                    message_category, throttle_interval = category, interval
+                    break
             
             # 메시지 키 생성 (동일 패턴의 메시지 그룹화)
             message_key = message
-            if "수신 중..." in message:
-                message_key = "data_receiving"
-            elif "✅ 파싱 완료" in message:
-                message_key = "parsing_complete"
-            elif "파싱 방법:" in message:
-                message_key = "parsing_method_change"
-            elif "FPS:" in message and "성공률:" in message:
+            if LOG_PERFORMANCE_PATTERN.search(message):
                 message_key = "performance_stats"
-            elif "진행상황" in message:
-                message_key = "progress_update"
-            
-            # 스로틀링 딕셔너리 크기 제한 (메모리 누수 방지)
-            if len(self.log_throttle) > 100:
-                # 오래된 항목 제거 (가장 오래된 50개 제거)
-                sorted_items = sorted(self.log_throttle.items(), key=lambda x: x[1])
-                for old_key, _ in sorted_items[:50]:
-                    del self.log_throttle[old_key]
-            
-            # 중복 메시지 제한 검사
-            if message_key in self.log_throttle:
-                time_diff = current_time - self.log_throttle[message_key]
-                if time_diff < throttle_interval:
-                    return  # 제한 시간 내 동일 메시지는 스킵
-            
-            # 메시지 출력 시간 기록
-            self.log_throttle[message_key] = current_time
-            
-            # 타임스탬프 생성
-            try:
-                timestamp = datetime.now().strftime("%H:%M:%S")
-                log_msg = f"[{timestamp}] {message}\n"
-            except Exception:
-                # 시간 생성 실패시 간단한 형태로
-                log_msg = f"[LOG] {message}\n"
+            else:
+                for key, pattern in LOG_KEY_PATTERNS:
+                    if pattern.search(message):
+                        message_key = key
+                        break
             
-            # GUI 텍스트 위젯에 추가 (안전한 방식)
-            try:
-                if hasattr(self, 'status_text') and self.status_text:
-                    # 텍스트 위젯 라인 수 확인 및 제한
-                    try:
-                        line_count = int(self.status_text.index('end-1c').split('.')[0])
-                        
-                        # 라인 수가 너무 많으면 정리 (성능 향상)
-                        if line_count > 100:  # 100줄로 제한 축소 (기존 200줄)
-                            # 앞의 30줄 삭제 (기존 50줄)
-                            self.status_text.delete('1.0', '31.0')
-                            
-                    except Exception:
-                        # 라인 수 확인 실패시 텍스트 위젯 초기화
-                        try:
-                            self.status_text.delete('1.0', tk.END)
-                            self.status_text.insert('1.0', "=== 로그 초기화 ===\n")
-                        except:
-                            pass
-                    
-                    # 메시지 추가
-                    self.status_text.insert(tk.END, log_msg)
-                    
-                    # 자동 스크롤 (성능 최적화 - 중요한 메시지만)
-                    if message_category in ["critical", "warning"]:
-                        self.status_text.see(tk.END)
-                        
-            except Exception as gui_error:
-                # GUI 업데이트 실패는 무시 (콘솔 출력은 계속)
-                pass
+            with self.log_lock:
+                # 중복 메시지 제한 검사
+                last_time = self.log_throttle.pop(message_key, None)
+                if last_time is not None and current_time - last_time < throttle_interval:
+                    self.log_throttle[message_key] = last_time
+                    self.log_stats['throttled'] += 1
+                    return
+                
+                # 다시 넣어 가장 최근 항목으로 이동, 넘치면 가장 오래된 항목부터 제거
+                self.log_throttle[message_key] = current_time
+                while len(self.log_throttle) > self.log_throttle_limit:
+                    del self.log_throttle[next(iter(self.log_throttle))]
+                
+                if len(self.log_records) == self.log_records.maxlen:
+                    self.log_stats['dropped'] += 1
+                self.log_records.append((current_time, message_category, message))
+                self.log_stats['queued'] += 1
                 
-            # 콘솔 출력 (중요한 메시지만 또는 모니터링 중이 아닐 때)
-            should_print = (
-                not self.is_monitoring or  # 모니터링 중이 아니거나
-                message_category in ["critical", "warning"] or  # 중요한 메시지이거나
-                any(keyword in message for keyword in ["연결", "시작", "중지", "성공"])  # 상태 변화 메시지
-            )
-            
-            if should_print:
-                try:
-                    print(log_msg.strip())
-                except Exception:
-                    # 콘솔 출력 실패도 무시
-                    pass
-                    
         except Exception as log_error:
             # 로그 함수 자체에서 오류 발생시 최소한의 출력
             try:
                 print(f"[LOG_ERROR] {message} (로그 오류: {str(log_error)})")
             except:
                 pass  # 모든 출력 실패시 조용히 무시
-
+    
+    def flush_log_messages(self):
+        """쌓인 로그 레코드를 텍스트 위젯에 한 번에 추가 (Tk 메인 스레드 주기 작업)"""
+        try:
+            with self.log_lock:
+                records = list(self.log_records)
+                self.log_records.clear()
+            
+            if records:
+                self.log_stats['flushes'] += 1
+                lines = []
+                scroll = False
+                for record_time, message_category, message in records:
+                    log_msg = f"[{time.strftime('%H:%M:%S', time.localtime(record_time))}] {message}"
+                    lines.append(log_msg)
+                    important = message_category in ("critical", "warning")
+                    scroll = scroll or important
+                    
+                    # 콘솔 출력 (중요한 메시지만 또는 모니터링 중이 아닐 때)
+                    if not self.is_monitoring or important or LOG_CONSOLE_PATTERN.search(message):
+                        try:
+                            print(log_msg)
+                        except Exception:
+                            pass
+                
+                if hasattr(self, 'status_text') and self.status_text:
+                    try:
+                        self.status_text.insert(tk.END, "\n".join(lines) + "\n")
+                        
+                        # 라인 수 제한 (묶음당 한 번만 확인, 넘친 만큼 앞에서 삭제)
+                        line_count = int(self.status_text.index('end-1c').split('.')[0])
+                        if line_count > self.log_max_lines:
+                            self.status_text.delete('1.0', f'{line_count - self.log_max_lines + 1}.0')
+                        
+                        # 자동 스크롤 (중요한 메시지가 있을 때만)
+                        if scroll:
+                            self.status_text.see(tk.END)
+                    except Exception:
+                        # GUI 업데이트 실패는 무시 (콘솔 출력은 계속)
+                        pass
+        finally:
+            try:
+                self.root.after(self.log_flush_ms, self.flush_log_messages)
+            except Exception:
+                pass  # 창이 닫힌 뒤
+    
     def open_settings(self):
         """설정 창 열기"""
         messagebox.showinfo("설정", "설정 기능은 향후 버전에서 제공됩니다")
@@ -3359,6 +3103,15 @@ L2 연결: {'예' if status_data.get('l2_connected', False) else '아니오'}
             if self.is_connected:
                 self.disconnect_device()
             
+            # 세션 녹화 중이면 색인 기록 후 종료
+            self.stop_session_recording()
+            
+            # 남은 로그 기록 후 파일 닫기
+            try:
+                self.log_writer.close()
+            except Exception as log_error:
+                print(f"로그 기록 종료 오류: {str(log_error)}")
+            
             # 시리얼 포트 강제 닫기
             if hasattr(self, 'serial_port') and self.serial_port:
                 try:
@@ -3545,110 +3298,10 @@ L2 연결: {'예' if status_data.get('l2_connected', False) else '아니오'}
         except Exception as e:
             self.log_message(f"❌ 기본 연결 테스트 오류: {str(e)}")
     
-    def test_simple_screen(self):
-        """간단한 화면 데이터 테스트 - 새로운 마커 형식 지원"""
-        if not self.is_connected:
-            messagebox.showwarning("경고", "디바이스가 연결되지 않았습니다")
-            return
-            
-        try:
-            # 명령 전송 전 버퍼 완전 클리어
-            self.clear_serial_buffers()
-            
-            self.serial_port.write(b'GET_SIMPLE\n')
-            self.serial_port.flush()
-            self.log_message("📡 GET_SIMPLE 명령어 전송")
-            
-            # 강화된 수신 로직 (capture_screen과 동일)
-            response_data = b''
-            timeout_count = 0
-            max_timeout = 300  # 3초 타임아웃
-            
-            screen_start_found = False
-            data_start_found = False
-            data_end_found = False
-            screen_end_found = False
-            
-            self.log_message("📥 GET_SIMPLE 응답 수신 중...")
-            
-            while timeout_count < max_timeout:
-                if self.serial_port.in_waiting > 0:
-                    chunk = self.serial_port.read(self.serial_port.in_waiting)
-                    response_data += chunk
-                    
-                    # 마커 검출
-                    if not screen_start_found and b'<<SCREEN_START>>' in response_data:
-                        screen_start_found = True
-                        self.log_message("✓ SCREEN_START 감지")
-                        
-                    if screen_start_found and not data_start_found and b'<<DATA_START>>' in response_data:
-                        data_start_found = True
-                        self.log_message("✓ DATA_START 감지")
-                        
-                    if data_start_found and not data_end_found and b'<<DATA_END>>' in response_data:
-                        data_end_found = True
-                        self.log_message("✓ DATA_END 감지")
-                        
-                    if data_end_found and not screen_end_found and b'<<SCREEN_END>>' in response_data:
-                        screen_end_found = True
-                        self.log_message("✓ SCREEN_END 감지")
-                        break
-                        
-                    if b'<<TRANSMISSION_ERROR>>' in response_data:
-                        self.log_message("❌ 전송 오류 감지됨")
-                        return
-                        
-                    # 진행상황 표시 (간소화)
-                    if timeout_count % 100 == 0 and len(response_data) > 0:
-                        self.log_message(f"수신 중... {len(response_data)} bytes")
-                else:
-                    time.sleep(0.01)
-                    timeout_count += 1
-            
-            if screen_start_found and data_start_found and data_end_found and screen_end_found:
-                self.log_message(f"✅ GET_SIMPLE 데이터 수신 완료: {len(response_data)} bytes")
-                
-                # 데이터 추출 및 파싱
-                data_start_pos = response_data.find(b'<<DATA_START>>')
-                data_end_pos = response_data.find(b'<<DATA_END>>')
-                
-                if data_start_pos != -1 and data_end_pos != -1:
-                    data_start_actual = response_data.find(b'\n', data_start_pos) + 1
-                    img_data = response_data[data_start_actual:data_end_pos]
-                    
-                    if len(img_data) >= 1024:
-                        screen_data = self.parse_firmware_screen_data_enhanced(img_data[:1024])
-                        if screen_data is not None:
-                            self.log_message("✅ GET_SIMPLE 파싱 성공")
-                            self.update_display(screen_data)
-                            return
-                
-                self.log_message("❌ GET_SIMPLE 데이터 파싱 실패")
-            else:
-                self.log_message(f"❌ GET_SIMPLE 불완전한 수신: START:{screen_start_found}, D_START:{data_start_found}, D_END:{data_end_found}, END:{screen_end_found}")
-                
-            # 실패시 기존 방식으로 재시도
-            self.log_message("🔄 기존 방식으로 GET_SIMPLE 재파싱 시도")
-            if len(response_data) > 0:
-                screen_data = self.parse_firmware_screen_data(response_data)
-                if screen_data is not None:
-                    self.log_message("✅ 기존 방식 파싱 성공")
-                    self.update_display(screen_data)
-                    return
-                    
-            # 모든 방법 실패시 테스트 패턴
-            self.log_message("🧪 테스트 패턴으로 대체")
-            screen_data = self.generate_test_screen()
-            self.update_display(screen_data)
-                
-        except Exception as e:
-            self.log_message(f"❌ GET_SIMPLE 명령어 오류: {str(e)}")
-            import traceback
-            self.log_message(f"📋 상세 오류: {traceback.format_exc()}")
-
     def on_parsing_method_changed(self, event):
         """파싱 방법 변경 처리"""
         self.parsing_method = self.parsing_var.get()
+        self.image_decoder.set_method(self.parsing_method)
         self.log_message(f"🔄 파싱 방법 변경: {self.parsing_method}")
         
         
@@ -3667,6 +3320,7 @@ L2 연결: {'예' if status_data.get('l2_connected', False) else '아니오'}
     def apply_parsing_method(self):
         """파싱 방법 수동 적용"""
         self.parsing_method = self.parsing_var.get()
+        self.image_decoder.set_method(self.parsing_method)  # 방향 변환 계획 재계산
         self.log_message(f"✅ 파싱 방법 수동 적용: {self.parsing_method}")
         
         # 현재 화면이 있으면 새로운 파싱 방법으로 재처리
@@ -3684,16 +3338,9 @@ L2 연결: {'예' if status_data.get('l2_connected', False) else '아니오'}
     def update_performance_display(self):
         """성능 통계 표시 업데이트"""
         try:
-            current_time = time.time()
-            
-            # FPS 계산 (5초마다 리셋)
-            if current_time - self.performance_stats['fps_start_time'] >= 5.0:
-                fps = self.performance_stats['fps_counter'] / 5.0
-                self.performance_stats['fps_counter'] = 0
-                self.performance_stats['fps_start_time'] = current_time
-            else:
-                self.performance_stats['fps_counter'] += 1
-                fps = self.performance_stats['fps_counter'] / max(1, current_time - self.performance_stats['fps_start_time'])
+            # 현재 처리량 (최근 몇 초 가중 - 호출 횟수와 무관)
+            fps = self.performance_monitor.get_fps()
+            self.performance_stats['last_fps'] = fps
             
             # 성공률 계산
             total = self.performance_stats['total_captures']
@@ -3703,11 +3350,65 @@ L2 연결: {'예' if status_data.get('l2_connected', False) else '아니오'}
             # GUI 업데이트
             if hasattr(self, 'perf_label'):
                 perf_text = f"FPS: {fps:.1f} | 성공률: {success_rate:.1f}% ({successful}/{total})"
+                if self.performance_monitor.sketches['capture'].count:
+                    round_trip = self.performance_monitor.get_percentiles('capture')
+                    perf_text += (f" | 왕복 p50 {round_trip['p50'] * 1000:.1f}ms"
+                                  f" p95 {round_trip['p95'] * 1000:.1f}ms"
+                                  f" p99 {round_trip['p99'] * 1000:.1f}ms")
                 self.perf_label.config(text=perf_text)
                 
         except Exception as e:
             pass  # 성능 표시 오류는 무시
 
+    def open_stage_profile(self):
+        """단계별 지연 시간 창 (1초마다 갱신, JSON/CSV 내보내기)"""
+        if self.stage_window is not None and self.stage_window.winfo_exists():
+            self.stage_window.lift()
+            return
+        
+        window = tk.Toplevel(self.root)
+        window.title("단계별 지연 시간 (ms)")
+        self.stage_window = window
+        
+        text = tk.Text(window, height=12, width=90, font=("Courier", 9))
+        text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        button_frame = ttk.Frame(window)
+        button_frame.pack(fill=tk.X, padx=5, pady=(0, 5))
+        ttk.Button(button_frame, text="JSON 내보내기",
+                   command=lambda: self.export_stage_profile('json')).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="CSV 내보내기",
+                   command=lambda: self.export_stage_profile('csv')).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(button_frame, text="초기화",
+                   command=self.stage_profiler.reset).pack(side=tk.RIGHT)
+        
+        def refresh():
+            if not window.winfo_exists():
+                return
+            text.delete('1.0', tk.END)
+            text.insert(tk.END, self.stage_profiler.format_table())
+            window.after(1000, refresh)
+        
+        refresh()
+    
+    def export_stage_profile(self, file_format):
+        """단계별 지연 시간 저장 (json 또는 csv)"""
+        filename = filedialog.asksaveasfilename(
+            defaultextension=f".{file_format}",
+            initialfile=f"stage_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{file_format}",
+            filetypes=[(f"{file_format.upper()} files", f"*.{file_format}"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+        try:
+            if file_format == 'json':
+                self.stage_profiler.export_json(filename)
+            else:
+                self.stage_profiler.export_csv(filename)
+            self.log_message(f"✅ 단계별 지연 시간 저장: {filename}")
+        except Exception as e:
+            messagebox.showerror("오류", f"저장 실패: {str(e)}")
+    
     def on_interval_changed(self, event):
         """갱신 주기 변경 처리"""
         try:
@@ -3723,6 +3424,20 @@ L2 연결: {'예' if status_data.get('l2_connected', False) else '아니오'}
             self.log_message("❌ 잘못된 갱신 주기 값")
             self.interval_var.set(str(self.update_interval_ms))
 
+    def on_binary_transfer_changed(self):
+        """바이너리 화면 전송 설정 변경 처리"""
+        self.binary_transfer_requested = self.binary_transfer_var.get()
+        
+        if not self.is_connected:
+            return
+            
+        if self.binary_transfer_requested:
+            self.negotiate_screen_format()
+        elif self.binary_screen_active:
+            self.binary_screen_active = False
+            self.send_command("SET_SCREEN_FORMAT:TEXT")
+            self.log_message("ℹ️ 텍스트 화면 전송으로 전환")
+
     def on_auto_request_changed(self):
         """자동 요청 모드 변경 처리"""
         self.auto_request_enabled = self.auto_request_var.get()
@@ -3738,164 +3453,6 @@ L2 연결: {'예' if status_data.get('l2_connected', False) else '아니오'}
         if self.is_monitoring:
             self.log_message("⚙️ 모니터링 중 설정 변경 - 적용됨")
 
-    def fast_parse_screen_data(self, img_data):
-        """초고속 화면 데이터 파싱 (128x64 최적화) - 파싱 방법 적용"""
-        try:
-            # 원본 데이터 저장 (파싱 방법 변경시 재사용)
-            self.last_raw_data = img_data
-            
-            # NumPy 배열을 사용한 초고속 처리 (가능한 경우)
-            if self.numpy_available:
-                import numpy as np
-                
-                # 1024바이트를 NumPy 배열로 변환
-                byte_array = np.frombuffer(img_data, dtype=np.uint8)
-                
-                # 기본 파싱: 8비트를 개별 픽셀로 확장 (벡터화 연산)
-                # 각 바이트를 8개 비트로 분해
-                bits = np.unpackbits(byte_array).reshape(64, 128)
-                
-                # 0과 1을 255와 0으로 변환하여 가시성 향상
-                temp_array = (bits * 255).astype(np.uint8)
-                
-                # 현재 파싱 방법 적용
-                current_method = self.parsing_method
-                
-                # 파싱 방법에 따른 변환 적용
-                if current_method == "method1_direct":
-                    # 방법 1: 직접 매핑 (변환 없음)
-                    img_array = temp_array.copy()
-                    
-                elif current_method == "method2_reversed":
-                    # 방법 2: reverse 함수 적용 - NumPy로 최적화
-                    img_array = temp_array.copy()
-                    # 바이트별 reverse 처리는 복잡하므로 기본 처리
-                    
-                elif current_method == "method3_rotated_180":
-                    # 방법 3: 180도 회전
-                    img_array = np.rot90(temp_array, 2)
-                    
-                elif current_method == "method4_flipped_h":
-                    # 방법 4: 가로 뒤집기
-                    img_array = np.fliplr(temp_array)
-                    
-                elif current_method == "method5_flipped_v":
-                    # 방법 5: 세로 뒤집기 (기본, 안정적)
-                    img_array = np.flipud(temp_array)
-                    
-                elif current_method == "method5_rotate_90":
-                    # 방법 5-1: 90도 시계방향 회전
-                    img_array = np.rot90(temp_array, -1)  # -1은 시계방향
-                    
-                elif current_method == "method5_rotate_270":
-                    # 방법 5-2: 270도 시계방향 회전 (90도 반시계방향)
-                    img_array = np.rot90(temp_array, 1)   # 1은 반시계방향
-                    
-                elif current_method == "method5_mirror_h":
-                    # 방법 5-3: 가로 미러링 (좌우 반전)
-                    img_array = np.fliplr(temp_array)
-                    
-                elif current_method == "method5_mirror_v":
-                    # 방법 5-4: 세로 미러링 (상하 반전)
-                    img_array = np.flipud(temp_array)
-                    
-                elif current_method == "method5_flip_both":
-                    # 방법 5-5: 상하좌우 모두 뒤집기
-                    img_array = np.flipud(np.fliplr(temp_array))
-                    
-                elif current_method == "method6_transposed":
-                    # 방법 6: 전치 + 조정
-                    # 128x64를 64x128로 전치하면 크기가 맞지 않으므로 보간 필요
-                    transposed = temp_array.T  # 전치: 64x128
-                    # 64x128을 128x64로 리사이즈
-                    from PIL import Image
-                    pil_img = Image.fromarray(transposed.astype(np.uint8), mode='L')
-                    resized_img = pil_img.resize((128, 64), Image.NEAREST)
-                    img_array = np.array(resized_img)
-                    
-                else:
-                    # 알 수 없는 방법인 경우 기본 세로 뒤집기 적용
-                    img_array = np.flipud(temp_array)
-                
-                # PIL 이미지 생성
-                img = Image.fromarray(img_array, mode='L')  # 그레이스케일
-                
-                return img
-            else:
-                # NumPy가 없는 경우 최적화된 Python 코드 사용
-                return self._fast_parse_fallback(img_data)
-                
-        except Exception as e:
-            # 오류 발생시 폴백 방식 사용
-            return self._fast_parse_fallback(img_data)
-    
-    def _fast_parse_fallback(self, img_data):
-        """NumPy 없이 최적화된 파싱 (폴백 방식) - 파싱 방법 적용"""
-        try:
-            # 원본 데이터 저장
-            self.last_raw_data = img_data
-            
-            # PIL 이미지 생성 (L 모드로 성능 향상)
-            img = Image.new('L', (128, 64), 0)
-            
-            # 픽셀 데이터를 직접 생성 (최적화된 방식)
-            pixels = []
-            
-            # 미리 계산된 비트 마스크 (룩업 테이블)
-            bit_masks = [0x80, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02, 0x01]
-            
-            # 행별 처리 (64행)
-            for y in range(64):
-                row_pixels = []
-                row_start = y * 16  # 각 행은 16바이트 (128픽셀 / 8)
-                
-                # 각 행의 16바이트 처리
-                for x_byte in range(16):
-                    byte_index = row_start + x_byte
-                    if byte_index >= len(img_data):
-                        # 데이터 부족시 0으로 채움
-                        row_pixels.extend([0] * 8)
-                        continue
-                    
-                    byte_val = img_data[byte_index]
-                    
-                    # 각 바이트의 8비트를 픽셀로 변환 (언롤링)
-                    for bit_mask in bit_masks:
-                        pixel_val = 255 if (byte_val & bit_mask) else 0
-                        row_pixels.append(pixel_val)
-                
-                pixels.extend(row_pixels)
-            
-            # 픽셀 데이터를 이미지에 적용
-            img.putdata(pixels)
-            
-            # 파싱 방법 적용 (간단한 변환만)
-            current_method = self.parsing_method
-            
-            if current_method == "method3_rotated_180":
-                img = img.rotate(180)
-            elif current_method == "method4_flipped_h" or current_method == "method5_mirror_h":
-                img = img.transpose(Image.FLIP_LEFT_RIGHT)
-            elif current_method == "method5_flipped_v" or current_method == "method5_mirror_v":
-                img = img.transpose(Image.FLIP_TOP_BOTTOM)
-            elif current_method == "method5_flip_both":
-                img = img.transpose(Image.FLIP_LEFT_RIGHT).transpose(Image.FLIP_TOP_BOTTOM)
-            elif current_method == "method5_rotate_90":
-                img = img.rotate(-90, expand=True)  # 시계방향 90도
-                img = img.resize((128, 64), Image.NEAREST)  # 크기 조정
-            elif current_method == "method5_rotate_270":
-                img = img.rotate(90, expand=True)  # 반시계방향 90도
-                img = img.resize((128, 64), Image.NEAREST)  # 크기 조정
-            elif current_method == "method6_transposed":
-                img = img.transpose(Image.TRANSPOSE)
-                img = img.resize((128, 64), Image.NEAREST)  # 크기 조정
-            # method1_direct와 method2_reversed는 변환 없음 또는 복잡한 처리가 필요하여 생략
-            
-            return img
-            
-        except Exception as e:
-            return None
-
     def save_screen_high_res(self):
         """고해상도 화면 저장 - 해상도를 높여서 저장"""
         if self.current_screen is None:
@@ -4023,14 +3580,19 @@ L2 연결: {'예' if status_data.get('l2_connected', False) else '아니오'}
             messagebox.showerror("오류", f"로그 파일을 열 수 없습니다: {str(e)}")
 
     def safe_parse_wrapper(self, parse_function, data, function_name="unknown"):
-        """파싱 함수 안전 래퍼 - 무한루프 및 타임아웃 완전 방지"""
+        """파싱 함수 안전 래퍼 - 단조 시계 마감 검사 + 소요 시간 히스토그램 기록
+        
+        파싱마다 스레드를 만들지 않는다. 반복 파서는 check_parse_deadline()으로
+        예산 초과시 스스로 중단하고, 멈춘 파싱은 공유 감시 스레드가 알린다.
+        """
         if self.parsing_active:
             self.log_message("⚠️ 다른 파싱 진행 중 - 중복 파싱 방지")
             return None
             
         self.parsing_active = True
-        start_time = time.time()
-        result = None
+        deadline = ParseDeadline(self.max_parse_time)
+        self.parse_deadline = deadline
+        watch_token = None
         
         try:
             # 데이터 크기 검증
@@ -4039,158 +3601,56 @@ L2 연결: {'예' if status_data.get('l2_connected', False) else '아니오'}
                     self.log_message(f"⚠️ {function_name}: 데이터 크기 초과 ({len(data)} bytes)")
                     return None
             
-            # 시간 제한으로 파싱 실행
-            timeout_occurred = False
-            
-            def timeout_handler():
-                nonlocal timeout_occurred
-                timeout_occurred = True
-                self.log_message(f"⚠️ {function_name}: 타임아웃 발생")
+            if self.parse_watchdog_enabled:
+                watch_token = self.parse_watchdog.watch(function_name, deadline)
             
-            # 타이머 설정
-            timer = threading.Timer(self.max_parse_time, timeout_handler)
-            timer.start()
+            # 실제 파싱 함수 실행
+            result = parse_function(data)
             
-            try:
-                # 실제 파싱 함수 실행
-                if not timeout_occurred:
-                    result = parse_function(data)
-            finally:
-                timer.cancel()
-            
-            # 타임아웃 체크
-            if timeout_occurred:
-                self.log_message(f"❌ {function_name}: 타임아웃으로 중단됨")
-                return None
-                
-            elapsed_time = time.time() - start_time
-            if elapsed_time > 1.0:  # 1초 이상 걸린 경우 경고
-                self.log_message(f"⚠️ {function_name}: 느린 파싱 ({elapsed_time:.2f}초)")
+            elapsed_time = deadline.elapsed()
+            self.record_parse_time(function_name, elapsed_time)
+            if elapsed_time > self.max_parse_time:
+                self.log_message(f"⚠️ {function_name}: 느린 파싱 ({elapsed_time:.2f}초, 예산 {self.max_parse_time:.1f}초)")
                 
             return result
             
+        except ParseTimeoutError:
+            elapsed_time = deadline.elapsed()
+            self.record_parse_time(function_name, elapsed_time)
+            self.log_message(f"❌ {function_name}: 시간 예산 초과로 중단됨 ({elapsed_time:.2f}초)")
+            return None
         except Exception as e:
-            elapsed_time = time.time() - start_time
+            elapsed_time = deadline.elapsed()
             self.log_message(f"❌ {function_name}: 파싱 오류 ({elapsed_time:.2f}초) - {str(e)}")
             return None
         finally:
+            if watch_token is not None:
+                self.parse_watchdog.done(watch_token)
+            self.parse_deadline = None
             self.parsing_active = False
-
-    def parse_firmware_status_data(self, response):
-        """펌웨어에서 받은 상태 데이터 파싱 - 무한루프 완전 방지"""
-        try:
-            # 기본 상태 정보 (항상 반환되도록)
-            status_info = {
-                'timestamp': datetime.now().strftime('%H:%M:%S'),
-                'source': 'firmware',
-                'battery': 18.6,
-                'timer': '00:00',
-                'status': 'UNKNOWN',
-                'l1_connected': False,
-                'l2_connected': False,
-                'bat_adc': 0
-            }
-            
-            # 응답 데이터 전처리
-            if isinstance(response, bytes):
-                try:
-                    data_str = response.decode('utf-8', errors='ignore').strip()
-                    status_info['raw_data'] = response
-                except:
-                    data_str = str(response, errors='replace').strip()
-                    status_info['raw_data'] = data_str.encode('utf-8', errors='ignore')
-            else:
-                data_str = str(response).strip()
-                status_info['raw_data'] = data_str.encode('utf-8', errors='ignore')
-            
-            status_info['raw_string'] = data_str
-            
-            # 데이터 길이 검증 (과도한 데이터 방지)
-            if len(data_str) > 500:
-                self.write_event_log("WARNING", f"데이터 크기 제한: {len(data_str)} chars")
-                data_str = data_str[:500]
-            
-            # STATUS: 형식 확인
-            if not data_str.startswith('STATUS:'):
-                self.write_event_log("WARNING", f"잘못된 STATUS 형식: {data_str[:50]}")
-                return status_info
-            
-            # STATUS: 제거 후 파싱
-            status_part = data_str[7:]  # "STATUS:" 제거
-            
-            # 항목 분할 (최대 개수 제한)
-            items = status_part.split(',')[:8]  # 최대 8개 항목만 처리
-            
-            # 각 항목 파싱
-            for item in items:
-                try:
-                    item = item.strip()
-                    if not item or ':' not in item:
-                        continue
-                    
-                    parts = item.split(':', 1)
-                    if len(parts) != 2:
-                        continue
-                        
-                    key = parts[0].strip()
-                    value = parts[1].strip()
-                    
-                    # 키와 값 길이 검증
-                    if len(key) > 15 or len(value) > 30:
-                        continue
-                    
-                    # 각 항목별 파싱
-                    if key == 'BAT':
-                        try:
-                            battery_str = value.replace('V', '').strip()
-                            battery_val = int(battery_str)
-                            status_info['battery'] = battery_val/100
-                        except:
-                            pass
-                            
-                    elif key == 'TIMER':
-                        if len(value) <= 8:
-                            status_info['timer'] = value
-                            
-                    elif key == 'STATUS':
-                        if len(value) <= 15:
-                            status_info['status'] = value
-                            
-                    elif key == 'L1':
-                        status_info['l1_connected'] = (value == '1')
-                        
-                    elif key == 'L2':
-                        status_info['l2_connected'] = (value == '1')
-                        
-                    elif key == 'BAT_ADC':
-                        try:
-                            adc_val = int(value)
-                            status_info['bat_adc'] = max(0, min(4095, adc_val))
-                        except:
-                            pass
-                            
-                except Exception as item_error:
-                    # 개별 아이템 오류는 무시하고 계속
-                    continue
-            
-            return status_info
-            
-        except Exception as e:
-            # 모든 오류를 포착하여 안전한 기본값 반환
-            self.write_event_log("ERROR", f"상태 파싱 오류: {str(e)}")
-            return {
-                'timestamp': datetime.now().strftime('%H:%M:%S'),
-                'source': 'firmware_error',
-                'battery': 18.6,
-                'timer': '00:00',
-                'status': 'ERROR',
-                'l1_connected': False,
-                'l2_connected': False,
-                'bat_adc': 0,
-                'error': str(e),
-                'raw_data': response if isinstance(response, bytes) else str(response).encode('utf-8', errors='ignore'),
-                'raw_string': response.decode('utf-8', errors='ignore') if isinstance(response, bytes) else str(response)
-            }
+    
+    def check_parse_deadline(self):
+        """진행 중인 파싱의 시간 예산 확인 (반복 파서 루프에서 호출, 초과시 ParseTimeoutError)"""
+        deadline = self.parse_deadline
+        if deadline is not None:
+            deadline.check()
+    
+    def record_parse_time(self, function_name, elapsed_time):
+        """파싱 소요 시간 히스토그램 기록"""
+        histogram = self.parse_histograms.get(function_name)
+        if histogram is None:
+            histogram = self.parse_histograms.setdefault(function_name, LatencyHistogram())
+        histogram.record(elapsed_time)
+    
+    def on_parse_overrun(self, function_name, elapsed_time):
+        """감시 스레드 알림 - 예산을 넘겨 아직 진행 중인 파싱"""
+        self.log_message(f"⏱️ {function_name}: {elapsed_time:.2f}초째 파싱 진행 중 (예산 {self.max_parse_time:.1f}초 초과)")
+    
+    def log_parse_timing(self):
+        """파싱 소요 시간 요약 로그"""
+        for function_name, histogram in list(self.parse_histograms.items()):
+            if histogram.count:
+                self.log_message(f"📊 {function_name} 소요 시간: {histogram.format_summary()}")
 
     def on_monitoring_mode_changed(self, event):
         """모니터링 모드 변경 처리"""
@@ -4200,6 +3660,12 @@ L2 연결: {'예' if status_data.get('l2_connected', False) else '아니오'}
         if self.monitoring_mode == "integrated":
             self.monitoring_mode_label.config(text="통합 모드 (화면+상태)", foreground="blue")
             self.log_message("🔄 모니터링 모드 변경: 통합 모드 (화면+상태)")
+        elif self.monitoring_mode == "pipelined":
+            self.monitoring_mode_label.config(text=f"파이프라인 모드 (깊이 {self.pipeline_depth})", foreground="blue")
+            self.log_message(f"🔄 모니터링 모드 변경: 파이프라인 모드 (깊이 {self.pipeline_depth})")
+        elif self.monitoring_mode == "async":
+            self.monitoring_mode_label.config(text="asyncio 전송 모드 (화면+상태)", foreground="blue")
+            self.log_message("🔄 모니터링 모드 변경: asyncio 전송 모드 (화면+상태)")
         elif self.monitoring_mode == "screen_only":
             self.monitoring_mode_label.config(text="화면만 모니터링", foreground="green")
             self.log_message("🔄 모니터링 모드 변경: 화면만 모니터링")
@@ -4214,6 +3680,28 @@ L2 연결: {'예' if status_data.get('l2_connected', False) else '아니오'}
             time.sleep(0.5)  # 잠시 대기
             self.start_monitoring()
     
+    def on_pipeline_depth_changed(self, event):
+        """파이프라인 깊이 변경 처리"""
+        try:
+            new_depth = max(1, min(8, int(self.pipeline_depth_var.get())))
+        except ValueError:
+            self.log_message("❌ 잘못된 파이프라인 깊이 값")
+            self.pipeline_depth_var.set(str(self.pipeline_depth))
+            return
+        
+        self.pipeline_depth = new_depth
+        self.log_message(f"🔄 파이프라인 깊이 변경: {new_depth}")
+        
+        if self.monitoring_mode == "pipelined":
+            self.monitoring_mode_label.config(text=f"파이프라인 모드 (깊이 {new_depth})", foreground="blue")
+            
+            # 파이프라인 모드로 모니터링 중이면 새 깊이로 재시작
+            if self.is_monitoring:
+                self.log_message("⚙️ 모니터링 중 깊이 변경 - 재시작 중...")
+                self.stop_monitoring()
+                time.sleep(0.5)
+                self.start_monitoring()
+    
     def start_monitoring(self):
         """모니터링 시작 - 모드별 분기 처리"""
         if not self.is_connected:
@@ -4229,6 +3717,7 @@ L2 연결: {'예' if status_data.get('l2_connected', False) else '아니오'}
                 'fps_counter': 0,
                 'fps_start_time': time.time()
             }
+            self.performance_monitor.reset()
             
             # 모니터링 플래그 설정
             self.is_monitoring = True
@@ -4240,6 +3729,10 @@ L2 연결: {'예' if status_data.get('l2_connected', False) else '아니오'}
             # 모니터링 모드에 따른 분기 처리
             if self.monitoring_mode == "integrated":
                 self.start_integrated_monitoring()
+            elif self.monitoring_mode == "pipelined":
+                self.start_pipelined_monitoring()
+            elif self.monitoring_mode == "async":
+                self.start_async_monitoring()
             elif self.monitoring_mode == "screen_only":
                 self.start_screen_only_monitoring()
             elif self.monitoring_mode == "status_only":
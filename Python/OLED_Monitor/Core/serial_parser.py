@@ -1,9 +1,117 @@
 import struct
 import numpy as np
-from typing import Dict, Optional, Tuple
+from collections.abc import Mapping
+from typing import Any, Dict, List, Optional, Tuple
 import re
 from datetime import datetime
 import time
+import threading
+import queue
+import zlib
+
+# 펌웨어 STATUS 줄 (UART_SendStatusData) - BAT_VOLT는 이전 펌웨어에 없음
+# 줄 전체가 일치하지 않으면 (끝의 공백/개행 제외) 느린 경로로 처리
+STATUS_FAST_PATTERN = re.compile(
+    rb'\s*STATUS:BAT:(\d{1,5})V,TIMER:(\d{1,2}:\d\d),STATUS:([A-Z_]{1,15}),L1:([01]),L2:([01]),'
+    rb'BAT_ADC:(\d{1,5})(?:,BAT_VOLT:(\d{1,3}\.\d{1,3}))?\s*')
+STATUS_NAME_CACHE = {name.encode('ascii'): name for name in ('STANDBY', 'RUNNING', 'COOLING', 'SETTING')}
+
+
+class StatusRecord(Mapping):
+    """
+    파싱된 STATUS 줄 (슬롯 레코드)
+    
+    속성 접근(record.battery)이 기본이며, 기존 dict 기반 코드와 호환되도록
+    record['battery'], record.get('timer'), 'bat_adc' in record 같은 매핑 접근과
+    항목 대입도 지원한다. 알 수 없는 필드는 extra dict에 들어간다.
+    timestamp와 raw_string은 요청할 때만 만든다.
+    """
+    
+    __slots__ = ('battery', 'timer', 'status', 'l1_connected', 'l2_connected', 'bat_adc',
+                 'bat_volt', 'raw_data', 'received_at', 'source', 'extra')
+    
+    # 매핑 접근시 노출하는 키 (기존 dict 결과와 동일한 이름)
+    KEYS = ('timestamp', 'source', 'raw_data', 'raw_string', 'battery', 'timer', 'status',
+            'l1_connected', 'l2_connected', 'bat_adc', 'bat_volt')
+    _KEY_SET = frozenset(KEYS)
+    
+    def __init__(self, battery: float = 0, timer: str = '00:00', status: str = 'UNKNOWN',
+                 l1_connected: bool = False, l2_connected: bool = False, bat_adc: int = 0,
+                 bat_volt: Optional[float] = None, raw_data: bytes = b'',
+                 received_at: Optional[float] = None, source: str = 'firmware'):
+        self.battery = battery
+        self.timer = timer
+        self.status = status
+        self.l1_connected = l1_connected
+        self.l2_connected = l2_connected
+        self.bat_adc = bat_adc
+        self.bat_volt = bat_volt
+        self.raw_data = raw_data
+        self.received_at = time.time() if received_at is None else received_at
+        self.source = source
+        self.extra = None
+    
+    @property
+    def timestamp(self) -> str:
+        """수신 시각 (HH:MM:SS)"""
+        return datetime.fromtimestamp(self.received_at).strftime('%H:%M:%S')
+    
+    @property
+    def raw_string(self) -> str:
+        """원본 줄 문자열"""
+        raw = self.raw_data
+        if isinstance(raw, (bytes, bytearray)):
+            return bytes(raw).decode('utf-8', errors='ignore').strip()
+        return str(raw).strip()
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self._KEY_SET:
+            return getattr(self, key)
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+    
+    def __setitem__(self, key: str, value: Any):
+        if key in self._KEY_SET and key not in ('timestamp', 'raw_string'):
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+    
+    def __iter__(self):
+        yield from self.KEYS
+        if self.extra:
+            yield from self.extra
+    
+    def __len__(self) -> int:
+        return len(self.KEYS) + (len(self.extra) if self.extra else 0)
+    
+    def __contains__(self, key) -> bool:
+        return key in self._KEY_SET or (self.extra is not None and key in self.extra)
+    
+    def to_dict(self) -> Dict:
+        """일반 dict로 변환 (JSON 저장 등)"""
+        return dict(self.items())
+    
+    def __repr__(self) -> str:
+        return (f"StatusRecord(battery={self.battery}, timer={self.timer!r}, status={self.status!r}, "
+                f"l1={self.l1_connected}, l2={self.l2_connected}, bat_adc={self.bat_adc}, "
+                f"bat_volt={self.bat_volt}" + (f", extra={self.extra}" if self.extra else "") + ")")
+
+
+# parse_status_data 빠른 경로용 (전역 이름 조회 한 번으로 줄임)
+_new_record = StatusRecord.__new__
+_now = time.time
+
+# 필드 원시 바이트 -> 변환 값 캐시 (배터리/타이머/ADC 값은 반복되므로 int()/decode() 생략)
+# 값 종류가 많은 경우를 대비해 캐시별 항목 수를 제한한다
+STATUS_VALUE_CACHE_LIMIT = 8192
+_battery_cache: Dict[bytes, float] = {}
+_timer_cache: Dict[bytes, str] = {}
+_adc_cache: Dict[bytes, int] = {}
+_volt_cache: Dict[bytes, float] = {}
+
 
 class SerialDataParser:
     """시리얼 데이터 파싱 클래스"""
@@ -95,178 +203,132 @@ class SerialDataParser:
             
         return img_array
     
-    def parse_status_data(self, data: bytes) -> Optional[Dict]:
+    def parse_status_data(self, data: bytes) -> Optional['StatusRecord']:
         """
-        상태 데이터 파싱 - BAT ADC 안전 처리 및 무한루프 방지
+        상태 데이터 파싱 - 펌웨어 형식은 정규식 한 번으로 처리
+        
+        UART_SendStatusData 형식(BAT_VOLT 없는 이전 펌웨어 포함)은 미리 컴파일한
+        바이트 정규식으로 바로 필드를 꺼내고, 그 외 형식(필드 순서 변경, 알 수 없는
+        필드 등)만 parse_status_fields의 항목 분할 경로로 처리한다.
         
         Args:
             data: 시리얼에서 받은 상태 데이터
             
         Returns:
-            Dict: 파싱된 상태 정보 또는 None (RAW 데이터 포함)
+            StatusRecord: 파싱된 상태 정보 또는 None (RAW 데이터 포함)
         """
         try:
-            # 파싱 시간 제한 (무한루프 방지)
-            start_time = time.time()
-            max_parse_time = 1.5  # 1.5초 파싱 시간 제한
-            
-            # 원본 RAW 데이터 보존
-            raw_data = data
-            
-            # 데이터 크기 검증 (과도한 데이터 방지)
-            if len(data) > 2048:  # 2KB 제한
-                data = data[:2048]  # 잘라내기
-            
             try:
-                data_str = data.decode('utf-8', errors='ignore').strip()
-            except UnicodeDecodeError:
-                data_str = str(data, errors='replace').strip()
-            
-            # 파싱 시간 체크
-            if time.time() - start_time > max_parse_time:
-                return None
-            
-            # STATUS: 형식인지 확인
-            if not data_str.startswith('STATUS:'):
-                return None
-            
-            # STATUS: 제거
-            status_part = data_str[7:]  # "STATUS:" 제거
-            
-            # 각 항목 파싱 (안전한 방식)
-            status_info = {
-                'timestamp': datetime.now().strftime('%H:%M:%S'), 
-                'source': 'firmware',
-                'raw_data': raw_data,  # 원본 RAW 데이터 추가
-                'raw_string': data_str  # 문자열 형태도 추가
-            }
-            
-            try:
-                # 안전한 분할 처리
-                items = status_part.split(',')
-                
-                # 최대 아이템 수 제한 (무한루프 방지)
-                if len(items) > 15:
-                    items = items[:15]  # 최대 15개로 제한
-                
-                parse_count = 0
-                max_parse_count = 30  # 최대 파싱 횟수 제한
-                
-                for item in items:
-                    parse_count += 1
-                    if parse_count > max_parse_count:
-                        break
-                    
-                    # 파싱 시간 체크
-                    if time.time() - start_time > max_parse_time:
-                        break
-                    
-                    item = item.strip()
-                    if not item or ':' not in item:
-                        continue
-                    
-                    try:
-                        # 안전한 키-값 분할
-                        parts = item.split(':', 1)
-                        if len(parts) != 2:
-                            continue
-                            
-                        key, value = parts
-                        key = key.strip()
-                        value = value.strip()
-                        
-                        # 키와 값 길이 검증
-                        if len(key) > 20 or len(value) > 50:
-                            continue
-                        
-                        # 각 필드별 안전한 파싱
-                        if key == 'BAT':
-                            # 배터리 파싱 (안전한 처리)
-                            try:
-                                battery_str = value.replace('V', '').strip()
-                                if battery_str.isdigit():
-                                    battery_val = int(battery_str)
-                                    status_info['battery'] = battery_val/100
-                                else:
-                                    status_info['battery'] = 0
-                            except (ValueError, TypeError):
-                                status_info['battery'] = 0
-                                
-                        elif key == 'TIMER':
-                            # 타이머 파싱 (형식 검증)
-                            if len(value) <= 8 and ':' in value:
-                                status_info['timer'] = value
-                            else:
-                                status_info['timer'] = '00:00'
-                                
-                        elif key == 'STATUS':
-                            # 상태 파싱 (길이 제한)
-                            if len(value) <= 15:
-                                status_info['status'] = value
-                            else:
-                                status_info['status'] = 'UNKNOWN'
-                                
-                        elif key == 'L1':
-                            # L1 연결 상태 (안전한 변환)
-                            status_info['l1_connected'] = (value == '1')
-                            
-                        elif key == 'L2':
-                            # L2 연결 상태 (안전한 변환)
-                            status_info['l2_connected'] = (value == '1')
-                            
-                        elif key == 'BAT_ADC':
-                            # BAT ADC 파싱 (강화된 안전 처리)
-                            try:
-                                # 숫자 문자열 검증
-                                if value.isdigit() and len(value) <= 5:  # 최대 5자리
-                                    adc_val = int(value)
-                                    # 12-bit ADC 범위 검증 (0-4095)
-                                    if 0 <= adc_val <= 4095:
-                                        status_info['bat_adc'] = adc_val
-                                    else:
-                                        # 범위 벗어나면 보정
-                                        status_info['bat_adc'] = max(0, min(4095, adc_val))
-                                else:
-                                    # 잘못된 형식
-                                    status_info['bat_adc'] = 0
-                            except (ValueError, TypeError, OverflowError):
-                                # 모든 변환 오류 처리
-                                status_info['bat_adc'] = 0
-                                
-                    except Exception as item_error:
-                        # 개별 아이템 파싱 오류시 계속 진행
-                        continue
-                
-            except Exception as split_error:
-                # 분할 오류시 기본값 반환
-                pass
-            
-            # 필수 필드 기본값 설정
-            if 'battery' not in status_info:
-                status_info['battery'] = 0
-            if 'timer' not in status_info:
-                status_info['timer'] = '00:00'
-            if 'status' not in status_info:
-                status_info['status'] = 'UNKNOWN'
-            if 'l1_connected' not in status_info:
-                status_info['l1_connected'] = False
-            if 'l2_connected' not in status_info:
-                status_info['l2_connected'] = False
-            if 'bat_adc' not in status_info:
-                status_info['bat_adc'] = 0
-            
-            # 최종 파싱 시간 체크
-            parse_duration = time.time() - start_time
-            if parse_duration > 0.5:  # 0.5초 이상 걸리면 경고
-                print(f"⚠️ 시리얼 파서 지연: {parse_duration:.2f}초")
+                match = STATUS_FAST_PATTERN.fullmatch(data)
+            except TypeError:
+                # 문자열 입력 (드묾) - 바이트로 변환 후 다시 시도
+                if not isinstance(data, str):
+                    raise
+                data = data.encode('utf-8', errors='replace')
+                match = STATUS_FAST_PATTERN.fullmatch(data)
+            if match is None:
+                return self.parse_status_fields(data)
             
-            return status_info
+            # 생성자 호출 대신 슬롯 직접 대입, 숫자/문자열 변환은 캐시 우선
+            battery, timer, status, l1, l2, adc, volt = match.groups()
+            record = _new_record(StatusRecord)
+            value = _battery_cache.get(battery)
+            if value is None:
+                value = int(battery) / 100
+                if len(_battery_cache) < STATUS_VALUE_CACHE_LIMIT:
+                    _battery_cache[battery] = value
+            record.battery = value
+            value = _timer_cache.get(timer)
+            if value is None:
+                value = timer.decode('ascii')
+                if len(_timer_cache) < STATUS_VALUE_CACHE_LIMIT:
+                    _timer_cache[timer] = value
+            record.timer = value
+            record.status = STATUS_NAME_CACHE.get(status) or status.decode('ascii')
+            record.l1_connected = l1 == b'1'
+            record.l2_connected = l2 == b'1'
+            value = _adc_cache.get(adc)
+            if value is None:
+                value = int(adc)
+                if value > 4095:
+                    value = 4095
+                if len(_adc_cache) < STATUS_VALUE_CACHE_LIMIT:
+                    _adc_cache[adc] = value
+            record.bat_adc = value
+            if volt is not None:
+                value = _volt_cache.get(volt)
+                if value is None:
+                    value = float(volt)
+                    if len(_volt_cache) < STATUS_VALUE_CACHE_LIMIT:
+                        _volt_cache[volt] = value
+                volt = value
+            record.bat_volt = volt
+            record.raw_data = data
+            record.received_at = _now()
+            record.source = 'firmware'
+            record.extra = None
+            return record
             
         except Exception as e:
             # 모든 예외를 안전하게 처리
             print(f"❌ 시리얼 파서 오류: {str(e)}")
             return None
     
+    def parse_status_fields(self, data: bytes) -> Optional['StatusRecord']:
+        """
+        상태 데이터 일반 파싱 (느린 경로) - 항목을 ','와 ':'로 분할
+        
+        알려진 필드는 검증 후 레코드 속성에, 알 수 없는 필드는 문자열 그대로
+        extra에 넣는다. 입력은 2KB, 항목은 15개까지만 처리한다.
+        """
+        raw_data = data
+        try:
+            data_str = bytes(data[:2048]).decode('utf-8', errors='ignore').strip()
+        except Exception:
+            return None
+        
+        # STATUS: 형식인지 확인
+        if not data_str.startswith('STATUS:'):
+            return None
+        
+        record = StatusRecord(raw_data=raw_data)
+        for item in data_str[7:].split(',', 15)[:15]:
+            key, sep, value = item.partition(':')
+            if not sep:
+                continue
+            key = key.strip()
+            value = value.strip()
+            
+            # 키와 값 길이 검증
+            if not key or len(key) > 20 or len(value) > 50:
+                continue
+            
+            if key == 'BAT':
+                battery_str = value.replace('V', '').strip()
+                record.battery = int(battery_str) / 100 if battery_str.isdigit() else 0
+            elif key == 'TIMER':
+                record.timer = value if len(value) <= 8 and ':' in value else '00:00'
+            elif key == 'STATUS':
+                record.status = value if len(value) <= 15 else 'UNKNOWN'
+            elif key == 'L1':
+                record.l1_connected = (value == '1')
+            elif key == 'L2':
+                record.l2_connected = (value == '1')
+            elif key == 'BAT_ADC':
+                # 12-bit ADC 범위 (0-4095)로 보정, 잘못된 형식은 0
+                record.bat_adc = min(4095, int(value)) if value.isdigit() and len(value) <= 5 else 0
+            elif key == 'BAT_VOLT':
+                try:
+                    record.bat_volt = float(value)
+                except ValueError:
+                    record.bat_volt = None
+            else:
+                if record.extra is None:
+                    record.extra = {}
+                record.extra[key] = value
+        
+        return record
+    
     def create_test_screen_data(self, pattern: str = "checkerboard") -> np.ndarray:
         """
         테스트용 화면 데이터 생성
@@ -357,7 +419,7 @@ class SerialDataParser:
         Returns:
             bool: 유효성 여부
         """
-        if not isinstance(status, dict):
+        if not isinstance(status, Mapping):
             return False
             
         required_fields = ['battery', 'timer', 'status', 'l1_connected', 'l2_connected']
@@ -425,6 +487,979 @@ class SerialDataParser:
         except Exception as e:
             return 'error', {'message': f"디코딩 오류: {e}"}
 
+# 비트 반전 룩업 테이블 - OLED 드라이버 reverse() 함수와 동일 (bytes.translate용)
+REVERSE_BYTE_LUT = bytes(int(f'{value:08b}'[::-1], 2) for value in range(256))
+
+class OLEDImageDecoder:
+    """
+    OLED 1bpp 이미지 벡터화 디코더
+
+    펌웨어 Paint 이미지 형식(행 우선, 바이트당 가로 8픽셀, MSB 먼저)을
+    0/255 그레이스케일 배열로 변환한다.
+
+    파싱 방법마다 "방향 변환 계획"(출력 픽셀 → 펼친 원본 픽셀 인덱스 배열)을
+    한 번만 계산해 두고, 프레임마다 바이트→8픽셀 룩업 테이블 gather와
+    계획 인덱스 gather 두 번으로 디코딩과 방향 변환을 끝낸다.
+
+    decode()가 반환한 배열은 호출측 소유다 (표시 대기, 현재 화면 등으로 오래
+    보관해도 다음 디코딩이 덮어쓰지 않음). 바로 쓰고 버리는 호출측은 out에
+    재사용 배열을 넘겨 프레임당 할당을 없앨 수 있다. 펼침 작업 버퍼는 하나를
+    공유하므로 decode/set_method는 락으로 직렬화되어 어느 스레드에서나 호출할 수 있다.
+    """
+
+    METHODS = (
+        'method1_direct',       # 직접 매핑
+        'method2_reversed',     # reverse 함수 적용 (바이트 내 비트 순서 반전)
+        'method3_rotated_180',  # 180도 회전
+        'method4_flipped_h',    # 가로 뒤집기
+        'method5_flipped_v',    # 세로 뒤집기
+        'method5_rotate_90',    # 90도 시계방향 회전 (128x64 → 64x128)
+        'method5_rotate_270',   # 270도 시계방향 회전 (128x64 → 64x128)
+        'method5_mirror_h',     # 가로 미러링
+        'method5_mirror_v',     # 세로 미러링
+        'method5_flip_both',    # 상하좌우 모두 뒤집기
+        'method6_transposed'    # 전치 후 128x64로 최근접 리샘플링
+    )
+    DEFAULT_METHOD = 'method3_rotated_180'
+
+    # 바이트 값 → 8픽셀(0/255) 룩업 테이블
+    PIXEL_LUT = (np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1) * 255).astype(np.uint8)
+
+    def __init__(self, width: int = 128, height: int = 64):
+        """
+        Args:
+            width, height: OLED 해상도
+        """
+        self.width = width
+        self.height = height
+        self.image_size = (width // 8) * height
+
+        self._unpacked = np.empty((self.image_size, 8), dtype=np.uint8)
+        self._unpacked_flat = self._unpacked.reshape(-1)
+        self._plans = {}
+        self._lock = threading.Lock()  # 작업 버퍼, 계획 캐시, 현재 방법 보호
+        self.profiler = None  # StageProfiler - 지정하면 디코딩/방향 변환 시간 기록
+
+        self.method = None
+        self.plan = None
+        self.set_method(self.DEFAULT_METHOD)
+
+    def set_method(self, method: str) -> np.ndarray:
+        """현재 파싱 방법 설정 및 변환 계획 준비"""
+        with self._lock:
+            plan = self._compile_plan(method)
+            self.method, self.plan = method, plan
+        return plan
+
+    def compile_plan(self, method: str) -> np.ndarray:
+        """
+        파싱 방법의 방향 변환 계획 계산 (방법별 1회, 캐시)
+
+        펼친 원본 픽셀 번호 배열에 해당 방향 변환을 적용한 결과가 곧
+        출력 픽셀별 원본 인덱스가 된다.
+
+        Returns:
+            np.ndarray: 출력 크기의 intp 인덱스 배열
+        """
+        with self._lock:
+            return self._compile_plan(method)
+
+    def _compile_plan(self, method: str) -> np.ndarray:
+        plan = self._plans.get(method)
+        if plan is None:
+            index = np.arange(self.height * self.width, dtype=np.intp).reshape(self.height, self.width)
+            if method == 'method2_reversed':
+                # 바이트 내 비트 순서 반전 = 8픽셀 묶음 내부 순서 반전
+                index = index.reshape(self.height, self.width // 8, 8)[:, :, ::-1].reshape(self.height, self.width)
+            plan = np.ascontiguousarray(self.orient(index, method))
+            self._plans[method] = plan
+        return plan
+
+    def orient(self, pixels: np.ndarray, method: str) -> np.ndarray:
+        """
+        (height, width) 배열에 파싱 방법의 방향 변환 적용 (뷰 또는 인덱싱 결과)
+
+        알 수 없는 방법은 세로 뒤집기(method5_flipped_v)로 처리한다.
+        """
+        if method in ('method1_direct', 'method2_reversed'):
+            return pixels
+        if method in ('method3_rotated_180', 'method5_flip_both'):
+            return pixels[::-1, ::-1]
+        if method in ('method4_flipped_h', 'method5_mirror_h'):
+            return pixels[:, ::-1]
+        if method == 'method5_rotate_90':
+            return np.rot90(pixels, -1)
+        if method == 'method5_rotate_270':
+            return np.rot90(pixels, 1)
+        if method == 'method6_transposed':
+            return self._resample_transposed(pixels)
+        return pixels[::-1, :]
+
+    def _resample_transposed(self, pixels: np.ndarray) -> np.ndarray:
+        """전치 후 원래 크기로 최근접 리샘플링 - PIL Image.NEAREST와 동일한 좌표 매핑"""
+        transposed = pixels.T
+        src_h, src_w = transposed.shape
+        rows = ((np.arange(self.height) + 0.5) * src_h / self.height).astype(np.intp)
+        cols = ((np.arange(self.width) + 0.5) * src_w / self.width).astype(np.intp)
+        return transposed[rows[:, None], cols[None, :]]
+
+    def unpack(self, img_data: bytes) -> np.ndarray:
+        """
+        원시 데이터를 방향 변환 없이 (height, width) 픽셀 배열로 펼침
+
+        Returns:
+            np.ndarray: 새 배열 (호출측 소유)
+        """
+        with self._lock:
+            return self._unpack(img_data).copy()
+
+    def _unpack(self, img_data: bytes) -> np.ndarray:
+        byte_array = np.frombuffer(img_data, dtype=np.uint8, count=self.image_size)
+        np.take(self.PIXEL_LUT, byte_array, axis=0, out=self._unpacked)
+        return self._unpacked_flat.reshape(self.height, self.width)
+
+    def decode(self, img_data: bytes, method: Optional[str] = None,
+               out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        원시 데이터를 파싱 방법에 맞춰 디코딩
+
+        Args:
+            img_data: OLED 원시 데이터 (image_size 바이트 이상)
+            method: 파싱 방법 (None이면 set_method로 설정된 방법)
+            out: 결과를 기록할 배열 (None이면 새로 할당 - 반환값은 호출측 소유)
+
+        Returns:
+            np.ndarray: 0/255 uint8 배열 (회전 방법은 (width, height) 크기)
+        """
+        profiler = self.profiler
+        with self._lock:
+            if method is None or method == self.method:
+                plan = self.plan
+            else:
+                plan = self._compile_plan(method)
+
+            if out is None:
+                out = np.empty(plan.shape, dtype=np.uint8)
+
+            if profiler is None:
+                self._unpack(img_data)
+                np.take(self._unpacked_flat, plan, out=out)
+                return out
+
+            start = time.perf_counter()
+            self._unpack(img_data)
+            unpacked = time.perf_counter()
+            np.take(self._unpacked_flat, plan, out=out)
+            end = time.perf_counter()
+        profiler.record('frame_decode', unpacked - start)
+        profiler.record('orientation', end - unpacked)
+        return out
+
+# 바이너리 화면 프레임 상수 (uart_protocol.h의 UART_BIN_* 정의와 동일)
+BIN_MAGIC = b'\xA5\x5A'
+BIN_TYPE_KEY = 0x01
+BIN_TYPE_DELTA = 0x02
+BIN_PAGE_RAW = 0x00
+BIN_PAGE_RLE = 0x01
+BIN_NO_BASE = 0xFFFF
+BIN_PAGE_SIZE = 128
+BIN_HEADER = struct.Struct('<2sBHHH')   # magic, type, seq, base_seq, payload_length
+BIN_CRC = struct.Struct('<I')
+
+
+class BinaryScreenEncoder:
+    """
+    바이너리 화면 프레임 인코더 (펌웨어 UART_EncodeScreenFrame과 동일한 포맷)
+
+    프레임: magic(2) type(1) seq(2) base(2) length(2) payload CRC32(4), 정수는 리틀엔디안.
+    payload는 페이지 비트맵(1) 뒤에 포함된 페이지마다 인코딩(1) + 데이터가 이어진다.
+    페이지는 128바이트(8행) 단위이며, 델타 프레임은 기준 프레임과 XOR한 페이지 중
+    변경된 페이지만 포함한다. RLE는 (count, value) 쌍이며 원본보다 짧을 때만 사용한다.
+    CRC32(IEEE)는 type부터 payload 끝까지 계산한다.
+
+    펌웨어 시뮬레이터와 테스트 데이터 생성에 사용된다.
+    """
+
+    def __init__(self, image_size: int = 1024):
+        self.image_size = image_size
+        self.page_count = image_size // BIN_PAGE_SIZE
+        self.reset()
+
+    def reset(self):
+        """기준 프레임 초기화 (다음 프레임은 키 프레임)"""
+        self.last_frame = None
+        self.last_seq = BIN_NO_BASE
+        self.next_seq = 0
+
+    def encode(self, image: bytes, ack_seq: int = BIN_NO_BASE) -> bytes:
+        """
+        화면 데이터를 바이너리 프레임으로 인코딩
+
+        Args:
+            image: 1024바이트 화면 버퍼
+            ack_seq: 호스트가 마지막으로 수신한 시퀀스 (일치하면 델타 프레임)
+
+        Returns:
+            bytes: CRC 포함 완성 프레임
+        """
+        image = bytes(image)
+        seq = self.next_seq
+        self.next_seq = (self.next_seq + 1) % BIN_NO_BASE
+
+        base = None
+        if ack_seq != BIN_NO_BASE and ack_seq == self.last_seq and self.last_frame is not None:
+            base = self.last_frame
+
+        payload = encode_screen_pages(image, base)
+        frame_type = BIN_TYPE_DELTA if base is not None else BIN_TYPE_KEY
+        header = BIN_HEADER.pack(BIN_MAGIC, frame_type, seq,
+                                 ack_seq if base is not None else BIN_NO_BASE, len(payload))
+        crc = zlib.crc32(header[2:] + payload) & 0xFFFFFFFF
+
+        self.last_frame = image
+        self.last_seq = seq
+        return header + payload + BIN_CRC.pack(crc)
+
+
+class BinaryScreenDecoder:
+    """
+    바이너리 화면 프레임 디코더 (호스트측 기준 프레임 보관)
+
+    마지막으로 정상 복원한 프레임과 시퀀스를 보관한다. ack_seq는 다음
+    GET_SCREEN_BIN 요청에 실어 보내며, 펌웨어는 이 값이 자신이 마지막으로
+    보낸 시퀀스와 같을 때만 델타 프레임을 보낸다. CRC 오류나 기준 불일치가
+    발생하면 기준을 버려 다음 요청이 키 프레임을 받도록 한다.
+    """
+
+    def __init__(self, image_size: int = 1024):
+        self.image_size = image_size
+        self.page_count = image_size // BIN_PAGE_SIZE
+        # payload 최대 길이: 비트맵 + 페이지마다 (인코딩 + 원본)
+        self.max_payload = 1 + self.page_count * (1 + BIN_PAGE_SIZE)
+        self.stats = {
+            'key_frames': 0,
+            'delta_frames': 0,
+            'wire_bytes': 0,
+            'crc_errors': 0,
+            'base_mismatches': 0,
+            'payload_errors': 0
+        }
+        self.reset()
+
+    def reset(self):
+        """기준 프레임 초기화"""
+        self.last_frame = None
+        self.last_seq = BIN_NO_BASE
+
+    @property
+    def ack_seq(self) -> int:
+        """다음 요청에 보낼 확인 시퀀스 (기준 프레임이 없으면 0xFFFF)"""
+        return self.last_seq if self.last_frame is not None else BIN_NO_BASE
+
+    def parse_header(self, header: bytes) -> Optional[Tuple[int, int, int, int]]:
+        """
+        헤더 파싱
+
+        Returns:
+            Optional[Tuple]: (type, seq, base_seq, payload_length), 잘못된 헤더면 None
+        """
+        magic, frame_type, seq, base_seq, length = BIN_HEADER.unpack(header[:BIN_HEADER.size])
+        if magic != BIN_MAGIC or frame_type not in (BIN_TYPE_KEY, BIN_TYPE_DELTA):
+            return None
+        if not 1 <= length <= self.max_payload:
+            return None
+        return frame_type, seq, base_seq, length
+
+    def decode(self, frame: bytes) -> Dict:
+        """
+        완성된 프레임 검증 및 화면 복원
+
+        Args:
+            frame: 헤더부터 CRC까지의 전체 프레임
+
+        Returns:
+            Dict: {'data', 'seq', 'frame_type', 'wire_size'}
+
+        Raises:
+            ValueError: 'header' / 'crc' / 'base_mismatch' / 'payload'
+        """
+        parsed = self.parse_header(frame)
+        if parsed is None:
+            raise ValueError('header')
+        frame_type, seq, base_seq, length = parsed
+
+        payload_end = BIN_HEADER.size + length
+        if len(frame) != payload_end + BIN_CRC.size:
+            raise ValueError('header')
+
+        expected_crc = BIN_CRC.unpack_from(frame, payload_end)[0]
+        if zlib.crc32(frame[2:payload_end]) & 0xFFFFFFFF != expected_crc:
+            self.stats['crc_errors'] += 1
+            self.reset()
+            raise ValueError('crc')
+
+        base = None
+        if frame_type == BIN_TYPE_DELTA:
+            if self.last_frame is None or base_seq != self.last_seq:
+                self.stats['base_mismatches'] += 1
+                self.reset()
+                raise ValueError('base_mismatch')
+            base = self.last_frame
+
+        try:
+            image = self._decode_pages(frame[BIN_HEADER.size:payload_end], base)
+        except ValueError:
+            self.stats['payload_errors'] += 1
+            self.reset()
+            raise ValueError('payload')
+
+        self.last_frame = image
+        self.last_seq = seq
+        if frame_type == BIN_TYPE_KEY:
+            self.stats['key_frames'] += 1
+        else:
+            self.stats['delta_frames'] += 1
+        self.stats['wire_bytes'] += len(frame)
+
+        return {
+            'data': image,
+            'seq': seq,
+            'frame_type': 'KEY' if frame_type == BIN_TYPE_KEY else 'DELTA',
+            'wire_size': len(frame)
+        }
+
+    def _decode_pages(self, payload: bytes, base: Optional[bytes]) -> bytes:
+        """payload의 페이지들을 풀어 1024바이트 화면 복원"""
+        return decode_screen_pages(payload, base, self.image_size)
+
+
+def encode_screen_pages(image: bytes, base: Optional[bytes] = None) -> bytes:
+    """
+    화면을 페이지 payload로 인코딩 (비트맵 + 페이지별 인코딩/데이터)
+
+    Args:
+        image: 화면 버퍼 (BIN_PAGE_SIZE의 배수)
+        base: 기준 프레임 (지정하면 XOR 델타, 변경 없는 페이지는 생략)
+
+    Returns:
+        bytes: payload
+    """
+    bitmap = 0
+    pages = []
+    for page in range(len(image) // BIN_PAGE_SIZE):
+        start = page * BIN_PAGE_SIZE
+        block = image[start:start + BIN_PAGE_SIZE]
+        if base is not None:
+            block = xor_page(block, base[start:start + BIN_PAGE_SIZE])
+            if not any(block):
+                continue
+        bitmap |= 1 << page
+        rle = rle_encode_page(block, BIN_PAGE_SIZE - 1)
+        if rle is not None:
+            pages.append(bytes((BIN_PAGE_RLE,)) + rle)
+        else:
+            pages.append(bytes((BIN_PAGE_RAW,)) + block)
+    return bytes((bitmap,)) + b''.join(pages)
+
+
+def decode_screen_pages(payload: bytes, base: Optional[bytes], image_size: int = 1024) -> bytes:
+    """
+    페이지 payload를 화면으로 복원 (encode_screen_pages의 역)
+
+    Raises:
+        ValueError: payload 형식 오류
+    """
+    page_count = image_size // BIN_PAGE_SIZE
+    if not payload:
+        raise ValueError('empty')
+    bitmap = payload[0]
+    if bitmap >> page_count:
+        raise ValueError('bitmap')
+
+    if base is None:
+        if bitmap != (1 << page_count) - 1:
+            raise ValueError('key frame missing pages')
+        image = bytearray(image_size)
+    else:
+        image = bytearray(base)
+
+    pos = 1
+    for page in range(page_count):
+        if not bitmap & (1 << page):
+            continue
+        if pos >= len(payload):
+            raise ValueError('truncated')
+        encoding = payload[pos]
+        pos += 1
+        if encoding == BIN_PAGE_RAW:
+            block = payload[pos:pos + BIN_PAGE_SIZE]
+            pos += BIN_PAGE_SIZE
+        elif encoding == BIN_PAGE_RLE:
+            block, pos = rle_decode_page(payload, pos, BIN_PAGE_SIZE)
+        else:
+            raise ValueError('encoding')
+        if len(block) != BIN_PAGE_SIZE:
+            raise ValueError('truncated')
+
+        start = page * BIN_PAGE_SIZE
+        if base is not None:
+            block = xor_page(block, image[start:start + BIN_PAGE_SIZE])
+        image[start:start + BIN_PAGE_SIZE] = block
+
+    if pos != len(payload):
+        raise ValueError('trailing bytes')
+    return bytes(image)
+
+
+def xor_page(block: bytes, base: bytes) -> bytes:
+    """같은 길이 바이트열 XOR (정수 변환으로 한 번에 처리)"""
+    value = int.from_bytes(block, 'little') ^ int.from_bytes(base, 'little')
+    return value.to_bytes(len(block), 'little')
+
+
+def rle_encode_page(block: bytes, limit: int) -> Optional[bytes]:
+    """(count, value) 쌍 RLE 인코딩, 결과가 limit 바이트를 넘으면 None"""
+    out = bytearray()
+    i = 0
+    size = len(block)
+    while i < size:
+        value = block[i]
+        run = 1
+        while i + run < size and block[i + run] == value and run < 255:
+            run += 1
+        if len(out) + 2 > limit:
+            return None
+        out += bytes((run, value))
+        i += run
+    return bytes(out)
+
+
+def rle_decode_page(payload: bytes, pos: int, size: int) -> Tuple[bytes, int]:
+    """RLE 페이지 복원, (페이지 데이터, 다음 위치) 반환"""
+    out = bytearray()
+    while len(out) < size:
+        if pos + 2 > len(payload):
+            raise ValueError('truncated')
+        run = payload[pos]
+        if run == 0:
+            raise ValueError('zero run')
+        out += bytes((payload[pos + 1],)) * run
+        pos += 2
+    return bytes(out), pos
+
+class ScreenFrameDecoder:
+    """
+    GET_SCREEN 응답 증분 프레이머
+
+    수신 청크를 bytearray 버퍼에 누적하고, 마지막 스캔 위치부터 이어서
+    개행을 검색한다. 이미지 데이터 구간은 SIZE 헤더로 길이를 알 수 있으므로
+    마커를 검색하지 않고 바이트 수만 센다. 완성된 화면 프레임과 STATUS 줄은
+    도착하는 즉시 이벤트로 반환된다.
+
+    줄 시작 위치에서 바이너리 매직(0xA5 0x5A)이 보이면 GET_SCREEN_BIN 프레임으로
+    처리한다. 헤더의 길이만큼 받은 뒤 BinaryScreenDecoder로 CRC 검증과 델타 복원을
+    수행하며, 결과는 텍스트 프레임과 같은 'screen' 이벤트로 반환된다
+    (추가 키: 'seq', 'frame_type', 'wire_size').
+
+    이벤트 형식 (decode_response와 동일한 (타입, 데이터) 튜플):
+        ('screen', {'data', 'width', 'height', 'format', 'checksum'})
+        ('status', {'raw'})   - STATUS: 줄
+        ('line',   {'raw'})   - OK:/ERROR:/PONG 등 기타 응답 줄
+        ('error',  {'reason', 'raw'})
+
+    CHECKSUM 헤더가 있으면 SCREEN_END 시점에 데이터 바이트 합과 비교하고,
+    불일치 프레임은 'checksum' 오류로 버린다 (화면 이벤트 없음). 오류 사유별
+    횟수는 error_counts에 누적된다.
+    """
+
+    SCREEN_START = b'<<SCREEN_START>>'
+    SCREEN_END = b'<<SCREEN_END>>'
+    DATA_START = b'<<DATA_START>>'
+    DATA_END = b'<<DATA_END>>'
+    TRANSMISSION_ERROR = b'<<TRANSMISSION_ERROR>>'
+    STATUS_PREFIX = b'STATUS:'
+
+    # 프레이머 상태
+    STATE_IDLE = 0      # 일반 응답 줄 스캔
+    STATE_HEADER = 1    # SIZE/FORMAT/CHECKSUM 헤더 줄
+    STATE_PAYLOAD = 2   # 고정 길이 이미지 데이터
+    STATE_TRAILER = 3   # <<DATA_END>> / <<SCREEN_END>> 대기
+    STATE_BINARY = 4    # 바이너리 화면 프레임 (헤더 + payload + CRC)
+
+    # 요청한 프레임이 손상/유실되었음을 뜻하는 오류 ('restarted'는 뒤이은 프레임이 유효하므로 제외)
+    FRAME_LOSS_ERRORS = frozenset([
+        'checksum', 'crc', 'base_mismatch', 'payload', 'binary_header',
+        'transmission_error', 'trailer', 'header', 'invalid_size'
+    ])
+
+    def __init__(self, image_size: int = 1024, max_line_length: int = 512,
+                 compact_threshold: int = 4096, verify_checksum: bool = True):
+        self.default_image_size = image_size
+        self.verify_checksum = verify_checksum      # CHECKSUM 헤더 검증 여부
+        self.max_line_length = max_line_length      # 개행 없는 줄 최대 길이 (초과시 폐기)
+        self.compact_threshold = compact_threshold  # 소비된 앞부분 정리 기준
+        self.stats = {
+            'frames': 0,
+            'status_lines': 0,
+            'lines': 0,
+            'errors': 0,
+            'discarded_bytes': 0,
+            'binary_frames': 0,
+            'verified_frames': 0
+        }
+        self.error_counts = {}  # 오류 사유별 횟수
+        # 바이너리 프레임 기준 화면은 reset()과 무관하게 유지 (연결 단위로 초기화)
+        self.binary = BinaryScreenDecoder(image_size)
+        self.reset()
+
+    def reset(self):
+        """버퍼 및 프레임 상태 초기화"""
+        self.buffer = bytearray()
+        self.read_pos = 0   # 아직 소비되지 않은 첫 바이트 위치
+        self.scan_pos = 0   # 개행 검색 재개 위치 (이미 검사한 구간은 다시 보지 않음)
+        self._reset_frame()
+
+    def _reset_frame(self):
+        """진행 중인 프레임 정보 초기화"""
+        self.state = self.STATE_IDLE
+        self.frame_width = 0
+        self.frame_height = 0
+        self.frame_format = None
+        self.frame_checksum = None
+        self.payload_size = self.default_image_size
+        self.payload = None
+        self.data_end_seen = False
+        self.header_lines = 0
+
+    def pending_bytes(self) -> int:
+        """아직 처리되지 않은 바이트 수"""
+        return len(self.buffer) - self.read_pos
+
+    def feed(self, chunk: bytes) -> List[Tuple[str, Dict]]:
+        """
+        수신 청크 추가 및 완성된 이벤트 반환
+
+        Args:
+            chunk: 시리얼에서 읽은 원시 데이터
+
+        Returns:
+            List[Tuple[str, Dict]]: 이번 청크로 완성된 이벤트 목록
+        """
+        events = []
+        if chunk:
+            self.buffer += chunk
+
+        buffer = self.buffer
+        while True:
+            if self.state == self.STATE_IDLE and self.read_pos < len(buffer) and \
+                    buffer[self.read_pos] == BIN_MAGIC[0]:
+                # 줄 시작의 0xA5는 텍스트 응답에 나타나지 않음 - 바이너리 프레임 후보
+                if len(buffer) - self.read_pos < 2:
+                    break
+                if buffer[self.read_pos + 1] == BIN_MAGIC[1]:
+                    self.state = self.STATE_BINARY
+                    self.payload_size = 0
+
+            if self.state == self.STATE_BINARY:
+                if not self._process_binary(buffer, events):
+                    break
+                continue
+
+            if self.state == self.STATE_PAYLOAD:
+                # 이미지 데이터는 길이로만 판단 (바이너리 내부 마커 검색 안 함)
+                end = self.read_pos + self.payload_size
+                if len(buffer) < end:
+                    break
+                self.payload = bytes(buffer[self.read_pos:end])
+                self.read_pos = self.scan_pos = end
+                self.state = self.STATE_TRAILER
+                continue
+
+            newline = buffer.find(b'\n', self.scan_pos)
+            if newline == -1:
+                self.scan_pos = len(buffer)
+                if self.scan_pos - self.read_pos > self.max_line_length:
+                    # 개행 없이 너무 긴 데이터는 쓰레기로 간주하고 폐기
+                    self.stats['discarded_bytes'] += self.scan_pos - self.read_pos
+                    self.read_pos = self.scan_pos
+                break
+
+            line = bytes(buffer[self.read_pos:newline])
+            if line.endswith(b'\r'):
+                line = line[:-1]
+            self.read_pos = self.scan_pos = newline + 1
+            self._process_line(line, events)
+
+        self._compact()
+        return events
+
+    def _compact(self):
+        """소비된 앞부분 정리 (상각 O(1))"""
+        if self.read_pos == len(self.buffer):
+            self.buffer.clear()
+            self.read_pos = self.scan_pos = 0
+        elif self.read_pos >= self.compact_threshold:
+            del self.buffer[:self.read_pos]
+            self.scan_pos -= self.read_pos
+            self.read_pos = 0
+
+    def _process_binary(self, buffer: bytearray, events: List[Tuple[str, Dict]]) -> bool:
+        """
+        바이너리 프레임 처리
+
+        Returns:
+            bool: 진행했으면 True, 데이터가 더 필요하면 False
+        """
+        start = self.read_pos
+        if self.payload_size == 0:
+            if len(buffer) - start < BIN_HEADER.size:
+                return False
+            parsed = self.binary.parse_header(bytes(buffer[start:start + BIN_HEADER.size]))
+            if parsed is None:
+                # 헤더가 깨짐 - 매직만 버리고 텍스트 스캔으로 재동기화
+                self._emit_error('binary_header', bytes(buffer[start:start + BIN_HEADER.size]), events)
+                self.stats['discarded_bytes'] += 2
+                self.read_pos = self.scan_pos = start + 2
+                self._reset_frame()
+                return True
+            self.payload_size = BIN_HEADER.size + parsed[3] + BIN_CRC.size
+
+        end = start + self.payload_size
+        if len(buffer) < end:
+            return False
+
+        frame = bytes(buffer[start:end])
+        self.read_pos = self.scan_pos = end
+        self._reset_frame()
+        try:
+            result = self.binary.decode(frame)
+        except ValueError as e:
+            self._emit_error(str(e), frame[:BIN_HEADER.size], events)
+            return True
+
+        self.stats['frames'] += 1
+        self.stats['binary_frames'] += 1
+        width = 128
+        events.append(('screen', {
+            'data': result['data'],
+            'width': width,
+            'height': (len(result['data']) * 8) // width,
+            'format': 'BINARY_' + result['frame_type'],
+            'checksum': None,
+            'verified': True,
+            'seq': result['seq'],
+            'frame_type': result['frame_type'],
+            'wire_size': result['wire_size']
+        }))
+        return True
+
+    def _process_line(self, line: bytes, events: List[Tuple[str, Dict]]):
+        """현재 상태에 따라 한 줄 처리"""
+        if self.state == self.STATE_IDLE:
+            self._process_idle_line(line, events)
+        elif self.state == self.STATE_HEADER:
+            self._process_header_line(line, events)
+        else:
+            self._process_trailer_line(line, events)
+
+    def _process_idle_line(self, line: bytes, events: List[Tuple[str, Dict]]):
+        if not line:
+            return
+
+        if line.endswith(self.SCREEN_START):
+            self.state = self.STATE_HEADER
+        elif line.startswith(self.STATUS_PREFIX):
+            self.stats['status_lines'] += 1
+            events.append(('status', {'raw': line}))
+        elif self.TRANSMISSION_ERROR in line:
+            self._emit_error('transmission_error', line, events)
+        else:
+            self.stats['lines'] += 1
+            events.append(('line', {'raw': line}))
+
+    def _process_header_line(self, line: bytes, events: List[Tuple[str, Dict]]):
+        if not line:
+            return
+
+        if line == self.DATA_START:
+            self.state = self.STATE_PAYLOAD
+        elif line.startswith(b'SIZE:'):
+            size_match = re.match(rb'SIZE:(\d+)x(\d+)', line)
+            if size_match:
+                self.frame_width = int(size_match.group(1))
+                self.frame_height = int(size_match.group(2))
+                self.payload_size = (self.frame_width * self.frame_height) // 8
+                if not 0 < self.payload_size <= 8192:
+                    self._emit_error('invalid_size', line, events)
+                    self._reset_frame()
+        elif line.startswith(b'FORMAT:'):
+            self.frame_format = line[7:].decode('ascii', errors='replace')
+        elif line.startswith(b'CHECKSUM:'):
+            try:
+                self.frame_checksum = int(line[9:], 16)
+            except ValueError:
+                self.frame_checksum = None
+        elif line.endswith(self.SCREEN_START):
+            # 이전 프레임이 끊긴 채 새 프레임 시작
+            self._emit_error('restarted', line, events)
+            self._reset_frame()
+            self.state = self.STATE_HEADER
+        else:
+            self.header_lines += 1
+            if self.header_lines > 8 or self.TRANSMISSION_ERROR in line:
+                self._emit_error('header', line, events)
+                self._reset_frame()
+
+    def _process_trailer_line(self, line: bytes, events: List[Tuple[str, Dict]]):
+        if not line:
+            return
+
+        if line == self.DATA_END:
+            self.data_end_seen = True
+        elif line == self.SCREEN_END and self.data_end_seen:
+            verified = False
+            if self.verify_checksum and self.frame_checksum is not None:
+                if sum(self.payload) & 0xFFFFFFFF != self.frame_checksum:
+                    # 손상 프레임은 화면 이벤트 없이 폐기
+                    self._emit_error('checksum', line, events)
+                    self._reset_frame()
+                    return
+                verified = True
+                self.stats['verified_frames'] += 1
+
+            self.stats['frames'] += 1
+            events.append(('screen', {
+                'data': self.payload,
+                'width': self.frame_width or 128,
+                'height': self.frame_height or 64,
+                'format': self.frame_format,
+                'checksum': self.frame_checksum,
+                'verified': verified
+            }))
+            self._reset_frame()
+        else:
+            # 트레일러 불일치 - 프레임 폐기 후 이 줄을 일반 줄로 재처리
+            reason = 'transmission_error' if (self.TRANSMISSION_ERROR in line or
+                                               self.TRANSMISSION_ERROR in self.payload) else 'trailer'
+            self._emit_error(reason, line, events)
+            self._reset_frame()
+            if reason != 'transmission_error':
+                self._process_idle_line(line, events)
+
+    def _emit_error(self, reason: str, raw: bytes, events: List[Tuple[str, Dict]]):
+        self.stats['errors'] += 1
+        self.error_counts[reason] = self.error_counts.get(reason, 0) + 1
+        events.append(('error', {'reason': reason, 'raw': raw}))
+
+class SerialFrameReader:
+    """
+    시리얼 수신 전용 백그라운드 스레드
+
+    타임아웃이 있는 블로킹 read로 데이터를 받아 ScreenFrameDecoder에 전달한다.
+    완성된 화면 프레임은 크기 제한이 있는 frame_queue로, 그 밖의 응답 줄
+    (OK/PONG/ERROR, 화면에 딸리지 않은 STATUS 줄)은 reply_queue로 보낸다.
+    큐가 가득 차면 가장 오래된 항목을 버리고 dropped 카운터를 올린다.
+
+    화면 프레임 뒤에 오는 STATUS 줄은 status_grace 초 안에 도착하면
+    같은 프레임의 'status' 항목으로 묶인다.
+
+    화면 프레임에는 응답 첫 바이트와 마지막 바이트를 읽은 시각
+    ('first_byte_at', 'last_byte_at', time.perf_counter 기준)이 들어간다.
+
+    손상/유실된 프레임(FRAME_LOSS_ERRORS)은 {'data': None, 'error': 사유} 항목으로
+    frame_queue에 넣어, 요청측이 타임아웃을 기다리지 않고 바로 재요청할 수 있게 한다.
+    이 항목도 STATUS 줄(펌웨어 전송 종료)을 기다린 뒤 전달된다.
+    """
+
+    def __init__(self, serial_port, decoder: Optional['ScreenFrameDecoder'] = None,
+                 max_frames: int = 4, max_replies: int = 32,
+                 read_timeout: float = 0.05, status_grace: float = 0.05):
+        self.serial_port = serial_port
+        self.decoder = decoder if decoder is not None else ScreenFrameDecoder()
+        self.read_timeout = read_timeout
+        self.status_grace = status_grace
+
+        self.frame_queue = queue.Queue(maxsize=max_frames)
+        self.reply_queue = queue.Queue(maxsize=max_replies)
+
+        self.stats = {
+            'bytes_read': 0,
+            'frames': 0,
+            'replies': 0,
+            'dropped_frames': 0,
+            'dropped_replies': 0,
+            'frame_errors': 0,
+            'rejected_frames': 0,
+            'read_errors': 0
+        }
+
+        self._thread = None
+        self._running = False
+        self._clear_request = threading.Event()
+        self._clear_done = threading.Event()
+        self._pending_screen = None     # STATUS 줄을 기다리는 화면 프레임
+        self._pending_deadline = 0.0
+        self._burst_start = None        # 진행 중인 응답의 첫 바이트 수신 시각
+        self._chunk_at = 0.0            # 마지막 청크 수신 시각
+
+    @property
+    def is_running(self) -> bool:
+        return self._running and self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """수신 스레드 시작 (포트 read 타임아웃을 read_timeout으로 설정)"""
+        if self.is_running:
+            return
+        self.serial_port.timeout = self.read_timeout
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="SerialFrameReader", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """수신 스레드 종료 대기"""
+        self._running = False
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+
+    def clear(self, timeout: float = 0.5):
+        """입력 버퍼, 프레이머, 큐 비우기 (수신 스레드에서 수행하고 완료 대기)"""
+        if not self.is_running:
+            self._clear_now()
+            return
+        self._clear_done.clear()
+        self._clear_request.set()
+        self._clear_done.wait(timeout)
+
+    def get_frame(self, timeout: Optional[float] = None) -> Optional[Dict]:
+        """화면 프레임 대기 (타임아웃시 None)"""
+        try:
+            return self.frame_queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def get_reply(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """응답 줄 대기 (타임아웃시 None)"""
+        try:
+            return self.reply_queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def drain_replies(self) -> int:
+        """이전 명령의 남은 응답 줄 폐기"""
+        return self._drain(self.reply_queue)
+
+    def drain_frames(self) -> int:
+        """이전 요청의 늦게 도착한 화면 프레임 폐기"""
+        return self._drain(self.frame_queue)
+
+    def _run(self):
+        port = self.serial_port
+        while self._running:
+            if self._clear_request.is_set():
+                self._clear_now()
+                self._clear_request.clear()
+                self._clear_done.set()
+
+            try:
+                # 최소 1바이트를 read_timeout까지 블로킹 대기, 이미 도착한 데이터는 한 번에 읽음
+                chunk = port.read(port.in_waiting or 1)
+            except Exception:
+                self.stats['read_errors'] += 1
+                if not self._running:
+                    break
+                time.sleep(self.read_timeout)
+                continue
+
+            now = time.time()
+            if chunk:
+                self._chunk_at = time.perf_counter()
+                if self._burst_start is None:
+                    self._burst_start = self._chunk_at
+                self.stats['bytes_read'] += len(chunk)
+                for event_type, event in self.decoder.feed(chunk):
+                    self._dispatch(event_type, event, now)
+
+            if self._pending_screen is not None and now >= self._pending_deadline:
+                self._flush_pending_screen()
+
+        self._running = False
+
+    def _dispatch(self, event_type: str, event: Dict, now: float):
+        # 응답 하나가 끝났으므로 다음 청크부터 새 응답의 첫 바이트
+        first_byte_at = self._burst_start or self._chunk_at
+        self._burst_start = None
+        if event_type == 'screen':
+            event['error'] = None
+            event['first_byte_at'] = first_byte_at
+            event['last_byte_at'] = self._chunk_at
+            self._hold_pending(event, now)
+        elif event_type == 'status':
+            if self._pending_screen is not None:
+                self._pending_screen['status'] = event['raw']
+                self._flush_pending_screen()
+            else:
+                self._put(self.reply_queue, event['raw'], 'dropped_replies')
+                self.stats['replies'] += 1
+        elif event_type == 'line':
+            self._put(self.reply_queue, event['raw'], 'dropped_replies')
+            self.stats['replies'] += 1
+        elif event_type == 'error':
+            self.stats['frame_errors'] += 1
+            if event['reason'] in ScreenFrameDecoder.FRAME_LOSS_ERRORS:
+                self._hold_pending({'data': None, 'error': event['reason']}, now)
+
+    def _hold_pending(self, event: Dict, now: float):
+        """STATUS 줄을 기다리도록 프레임(또는 손상 표시) 보류"""
+        if self._pending_screen is not None:
+            self._flush_pending_screen()
+        event['status'] = None
+        event['received_at'] = now
+        self._pending_screen = event
+        self._pending_deadline = now + self.status_grace
+
+    def _flush_pending_screen(self):
+        self._put(self.frame_queue, self._pending_screen, 'dropped_frames')
+        if self._pending_screen['error'] is None:
+            self.stats['frames'] += 1
+        else:
+            self.stats['rejected_frames'] += 1
+        self._pending_screen = None
+
+    def _put(self, target: 'queue.Queue', item, drop_key: str):
+        """큐에 추가 - 가득 차면 가장 오래된 항목 폐기"""
+        while True:
+            try:
+                target.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    target.get_nowait()
+                    self.stats[drop_key] += 1
+                except queue.Empty:
+                    pass
+
+    def _clear_now(self):
+        try:
+            self.serial_port.reset_input_buffer()
+        except Exception:
+            pass
+        self.decoder.reset()
+        self._pending_screen = None
+        self._burst_start = None
+        self._drain(self.frame_queue)
+        self._drain(self.reply_queue)
+
+    @staticmethod
+    def _drain(target: 'queue.Queue') -> int:
+        count = 0
+        while True:
+            try:
+                target.get_nowait()
+                count += 1
+            except queue.Empty:
+                return count
+
 class ProtocolManager:
     """통신 프로토콜 관리 클래스"""
     
@@ -493,6 +1528,69 @@ if __name__ == "__main__":
     status = parser.parse_status_data(test_status_raw)
     print(f"상태 파싱 결과: {status}")
     
+    # 상태 파싱 마이크로벤치마크 - 교체 전 구현(문자열 분할 + 항목별 시간 검사 + dict)과 비교, 7회 중 최소
+    def legacy_parse_status_data(data: bytes) -> Optional[Dict]:
+        """정규식 경로 도입 전 parse_status_data (펌웨어 형식에서 실행되는 처리만 그대로 옮김)"""
+        start_time = time.time()
+        raw_data = data
+        if len(data) > 2048:
+            data = data[:2048]
+        data_str = data.decode('utf-8', errors='ignore').strip()
+        if time.time() - start_time > 1.5 or not data_str.startswith('STATUS:'):
+            return None
+        status_info = {'timestamp': datetime.now().strftime('%H:%M:%S'), 'source': 'firmware',
+                       'raw_data': raw_data, 'raw_string': data_str}
+        items = data_str[7:].split(',')[:15]
+        for parse_count, item in enumerate(items, 1):
+            if parse_count > 30 or time.time() - start_time > 1.5:
+                break
+            item = item.strip()
+            if not item or ':' not in item:
+                continue
+            parts = item.split(':', 1)
+            if len(parts) != 2:
+                continue
+            key, value = parts[0].strip(), parts[1].strip()
+            if len(key) > 20 or len(value) > 50:
+                continue
+            if key == 'BAT':
+                battery_str = value.replace('V', '').strip()
+                status_info['battery'] = int(battery_str) / 100 if battery_str.isdigit() else 0
+            elif key == 'TIMER':
+                status_info['timer'] = value if len(value) <= 8 and ':' in value else '00:00'
+            elif key == 'STATUS':
+                status_info['status'] = value if len(value) <= 15 else 'UNKNOWN'
+            elif key == 'L1':
+                status_info['l1_connected'] = (value == '1')
+            elif key == 'L2':
+                status_info['l2_connected'] = (value == '1')
+            elif key == 'BAT_ADC':
+                if value.isdigit() and len(value) <= 5:
+                    status_info['bat_adc'] = max(0, min(4095, int(value)))
+                else:
+                    status_info['bat_adc'] = 0
+        for key, default in (('battery', 0), ('timer', '00:00'), ('status', 'UNKNOWN'),
+                             ('l1_connected', False), ('l2_connected', False), ('bat_adc', 0)):
+            status_info.setdefault(key, default)
+        if time.time() - start_time > 0.5:
+            print(f"⚠️ 시리얼 파서 지연: {time.time() - start_time:.2f}초")
+        return status_info
+    
+    status_lines = [f"STATUS:BAT:{380 + i % 30}V,TIMER:{i // 60 % 100:02d}:{i % 60:02d},STATUS:RUNNING,"
+                    f"L1:1,L2:0,BAT_ADC:{2400 + i % 97},BAT_VOLT:4.05".encode('ascii') for i in range(20000)]
+    timings = {}
+    for name, parse in (("이전 구현", legacy_parse_status_data), ("항목 분할", parser.parse_status_fields),
+                        ("정규식", parser.parse_status_data)):
+        elapsed = float('inf')
+        for _ in range(7):
+            start_time = time.perf_counter()
+            for line in status_lines:
+                parse(line)
+            elapsed = min(elapsed, time.perf_counter() - start_time)
+        timings[name] = elapsed
+        print(f"상태 파싱 ({name}): {elapsed / len(status_lines) * 1e6:.2f}us/줄")
+    print(f"상태 파싱 속도 향상 (이전 구현 대비): {timings['이전 구현'] / timings['정규식']:.1f}배")
+    
     # 유효성 검증 테스트
     print(f"화면 데이터 유효성: {parser.validate_screen_data(test_screen)}")
     print(f"상태 데이터 유효성: {parser.validate_status_data(status)}") 
\ No newline at end of file
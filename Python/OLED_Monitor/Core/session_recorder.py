@@ -0,0 +1,452 @@
+"""
+OLED 모니터 세션 녹화 파일 (바이너리 컨테이너)
+
+화면 프레임과 STATUS 줄을 타임스탬프와 함께 추가 전용으로 기록하고,
+닫을 때 키 프레임 색인을 파일 끝에 붙여 임의 위치 탐색을 지원한다.
+
+파일 구조 (정수는 리틀엔디안):
+    헤더     magic(8) version(2) image_size(2) start_time(f64) key_interval(4)
+    레코드   type(1) t(f64, 시작 후 경과 초) length(2) payload
+    색인     magic(4) 'OIDX' 이후 (t(f64), offset(u64), frame_no(u32)) 반복
+    트레일러 index_offset(u64) count(u32) magic(4) 'OEND'
+
+화면 레코드는 바이너리 전송과 같은 페이지 payload(serial_parser.encode_screen_pages)를
+사용한다. 키 프레임은 전체 페이지, 델타 프레임은 직전 프레임과 XOR한 변경 페이지만,
+직전과 같은 프레임은 길이 0인 반복 레코드로 기록한다. 펌웨어 형식의 STATUS 줄은
+값만 묶어 12바이트로 저장하고 원문이 정확히 복원되지 않는 줄은 그대로 저장한다.
+
+프로그램이 비정상 종료되어 색인이 없으면 읽을 때 레코드를 순차 탐색해 다시 만든다.
+"""
+
+import os
+import re
+import struct
+import threading
+import time
+from typing import Dict, Iterator, Optional, Tuple
+
+from serial_parser import decode_screen_pages, encode_screen_pages
+
+SESSION_MAGIC = b'OLEDSES\x00'
+SESSION_VERSION = 1
+SESSION_HEADER = struct.Struct('<8sHHdI')     # magic, version, image_size, start_time, key_interval
+RECORD_HEADER = struct.Struct('<BdH')         # type, t, payload_length
+INDEX_MAGIC = b'OIDX'
+INDEX_ENTRY = struct.Struct('<dQI')           # t, offset, frame_no
+TRAILER = struct.Struct('<QI4s')              # index_offset, count, magic
+TRAILER_MAGIC = b'OEND'
+
+RECORD_FRAME_KEY = 1
+RECORD_FRAME_DELTA = 2
+RECORD_FRAME_REPEAT = 3
+RECORD_STATUS = 4
+RECORD_STATUS_RAW = 5
+RECORD_EVENT = 6
+
+FRAME_RECORDS = (RECORD_FRAME_KEY, RECORD_FRAME_DELTA, RECORD_FRAME_REPEAT)
+
+# STATUS 줄 압축 (UART_SendStatusData 형식)
+STATUS_PACK = struct.Struct('<HBBBBBHH')      # bat, min, sec, status, l1, l2, adc, volt*100
+STATUS_LINE_PATTERN = re.compile(
+    rb'STATUS:BAT:(\d+)V,TIMER:(\d+):(\d+),STATUS:([A-Z_]+),L1:(\d+),L2:(\d+),'
+    rb'BAT_ADC:(\d+),BAT_VOLT:(\d+)\.(\d\d)')
+STATUS_NAMES = ('STANDBY', 'RUNNING', 'COOLING', 'SETTING')
+
+
+def pack_status_line(line: bytes) -> Optional[bytes]:
+    """펌웨어 STATUS 줄을 고정 길이로 압축 (원문이 정확히 복원되지 않으면 None)"""
+    match = STATUS_LINE_PATTERN.fullmatch(line)
+    if match is None:
+        return None
+    status = match.group(4).decode('ascii')
+    if status not in STATUS_NAMES:
+        return None
+    try:
+        values = [int(group) for group in match.group(1, 2, 3, 5, 6, 7)]
+        volt = int(match.group(8)) * 100 + int(match.group(9))
+        packed = STATUS_PACK.pack(values[0], values[1], values[2], STATUS_NAMES.index(status),
+                                  values[3], values[4], values[5], volt)
+    except struct.error:
+        return None   # 필드 범위 초과
+    # 앞자리 0 등으로 원문과 달라지면 원문 저장
+    if unpack_status_line(packed) != line:
+        return None
+    return packed
+
+
+def unpack_status_line(packed: bytes) -> bytes:
+    """pack_status_line의 역 - 펌웨어와 같은 형식의 STATUS 줄 (개행 제외)"""
+    bat, minutes, seconds, status, l1, l2, adc, volt = STATUS_PACK.unpack(packed)
+    return (f"STATUS:BAT:{bat}V,TIMER:{minutes:02d}:{seconds:02d},STATUS:{STATUS_NAMES[status]},"
+            f"L1:{l1},L2:{l2},BAT_ADC:{adc},BAT_VOLT:{volt // 100}.{volt % 100:02d}").encode('ascii')
+
+
+class SessionRecorder:
+    """
+    세션 녹화기 (추가 전용 기록)
+
+    캡처 스레드에서 record_frame()/record_status()를 호출한다. 기록은 버퍼링된
+    파일 쓰기라 호출 비용은 인코딩 시간 정도이며, key_interval 프레임마다 키 프레임을
+    넣어 탐색시 복원해야 하는 델타 수를 제한한다.
+    """
+
+    def __init__(self, path: str, image_size: int = 1024, key_interval: int = 300,
+                 buffer_size: int = 65536):
+        self.path = path
+        self.image_size = image_size
+        self.key_interval = max(1, key_interval)
+        self.start_time = time.time()
+        self._start_monotonic = time.monotonic()
+        self._lock = threading.Lock()
+        self._last_frame = None
+        self._frames_since_key = 0
+        self.index = []   # [(t, offset, frame_no)] 키 프레임 위치
+
+        self.stats = {
+            'frames': 0,
+            'key_frames': 0,
+            'delta_frames': 0,
+            'repeat_frames': 0,
+            'status_records': 0,
+            'raw_status_records': 0,
+            'events': 0,
+            'frame_bytes': 0,      # 원본 화면 크기 합계
+            'bytes_written': 0
+        }
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'wb', buffering=buffer_size)
+        self._write(SESSION_HEADER.pack(SESSION_MAGIC, SESSION_VERSION, image_size,
+                                        self.start_time, self.key_interval))
+
+    @property
+    def is_open(self) -> bool:
+        return self._file is not None
+
+    def elapsed(self) -> float:
+        """녹화 시작 후 경과 시간 (초)"""
+        return time.monotonic() - self._start_monotonic
+
+    def record_frame(self, image: bytes, timestamp: Optional[float] = None) -> Optional[int]:
+        """
+        화면 프레임 기록
+
+        Args:
+            image: 화면 버퍼 (image_size 바이트, 초과분은 무시)
+            timestamp: 경과 시간 (None이면 현재)
+
+        Returns:
+            Optional[int]: 기록한 레코드 종류 (닫힌 뒤면 None)
+        """
+        image = bytes(image[:self.image_size])
+        if len(image) != self.image_size:
+            raise ValueError(f"화면 크기 불일치: {len(image)} != {self.image_size}")
+        t = self.elapsed() if timestamp is None else timestamp
+
+        with self._lock:
+            if self._file is None:
+                return None
+
+            if self._last_frame is None or self._frames_since_key >= self.key_interval:
+                record_type = RECORD_FRAME_KEY
+                payload = encode_screen_pages(image)
+                self.index.append((t, self._file.tell(), self.stats['frames']))
+                self._frames_since_key = 0
+                self.stats['key_frames'] += 1
+            elif image == self._last_frame:
+                record_type = RECORD_FRAME_REPEAT
+                payload = b''
+                self.stats['repeat_frames'] += 1
+            else:
+                record_type = RECORD_FRAME_DELTA
+                payload = encode_screen_pages(image, self._last_frame)
+                self.stats['delta_frames'] += 1
+
+            self._write(RECORD_HEADER.pack(record_type, t, len(payload)) + payload)
+            self._last_frame = image
+            self._frames_since_key += 1
+            self.stats['frames'] += 1
+            self.stats['frame_bytes'] += len(image)
+            return record_type
+
+    def record_status(self, line: bytes, timestamp: Optional[float] = None):
+        """STATUS 줄 기록 (개행 제외)"""
+        if isinstance(line, str):
+            line = line.encode('utf-8', errors='replace')
+        line = bytes(line).rstrip(b'\r\n')
+        t = self.elapsed() if timestamp is None else timestamp
+
+        packed = pack_status_line(line)
+        if packed is not None:
+            record_type, payload = RECORD_STATUS, packed
+        else:
+            record_type, payload = RECORD_STATUS_RAW, line[:0xFFFF]
+
+        with self._lock:
+            if self._file is None:
+                return
+            self._write(RECORD_HEADER.pack(record_type, t, len(payload)) + payload)
+            self.stats['status_records'] += 1
+            if record_type == RECORD_STATUS_RAW:
+                self.stats['raw_status_records'] += 1
+
+    def record_event(self, text: str, timestamp: Optional[float] = None):
+        """이벤트/메모 기록 (UTF-8 텍스트)"""
+        payload = text.encode('utf-8')[:0xFFFF]
+        t = self.elapsed() if timestamp is None else timestamp
+        with self._lock:
+            if self._file is None:
+                return
+            self._write(RECORD_HEADER.pack(RECORD_EVENT, t, len(payload)) + payload)
+            self.stats['events'] += 1
+
+    def close(self):
+        """키 프레임 색인과 트레일러를 기록하고 파일 닫기"""
+        with self._lock:
+            if self._file is None:
+                return
+            try:
+                index_offset = self._file.tell()
+                entries = b''.join(INDEX_ENTRY.pack(*entry) for entry in self.index)
+                self._write(INDEX_MAGIC + entries)
+                self._write(TRAILER.pack(index_offset, len(self.index), TRAILER_MAGIC))
+            finally:
+                self._file.close()
+                self._file = None
+
+    def get_stats(self) -> Dict:
+        """기록 통계 (압축률 포함)"""
+        stats = dict(self.stats)
+        stats['duration'] = self.elapsed()
+        stats['compression_ratio'] = (stats['bytes_written'] / stats['frame_bytes']
+                                      if stats['frame_bytes'] else 0.0)
+        return stats
+
+    def _write(self, data: bytes):
+        self._file.write(data)
+        self.stats['bytes_written'] += len(data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class SessionReader:
+    """
+    세션 파일 읽기
+
+    records()는 (종류, 경과 시간, 값)을 순서대로 돌려준다:
+        ('frame', t, 1024바이트 화면)
+        ('status', t, STATUS 줄 바이트 (개행 제외))
+        ('event', t, 텍스트)
+    seek(t)는 t 이전의 마지막 키 프레임부터 읽어 t 이후 레코드만 돌려준다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        header = self._file.read(SESSION_HEADER.size)
+        if len(header) != SESSION_HEADER.size:
+            self._file.close()
+            raise ValueError("세션 파일 헤더가 잘렸습니다")
+        magic, version, image_size, start_time, key_interval = SESSION_HEADER.unpack(header)
+        if magic != SESSION_MAGIC:
+            self._file.close()
+            raise ValueError("세션 파일이 아닙니다")
+        if version > SESSION_VERSION:
+            self._file.close()
+            raise ValueError(f"지원하지 않는 세션 파일 버전: {version}")
+
+        self.version = version
+        self.image_size = image_size
+        self.start_time = start_time
+        self.key_interval = key_interval
+        self.data_end = None
+        self.index = []          # [(t, offset, frame_no)]
+        self.recovered = False   # 색인 없이 재구성했는지
+        self.frame_count = 0
+        self.duration = 0.0
+        self._load_index()
+
+    def _load_index(self):
+        """트레일러의 색인 읽기, 없으면 레코드 순차 탐색으로 재구성"""
+        file_size = os.fstat(self._file.fileno()).st_size
+        if file_size >= SESSION_HEADER.size + TRAILER.size:
+            self._file.seek(file_size - TRAILER.size)
+            index_offset, count, magic = TRAILER.unpack(self._file.read(TRAILER.size))
+            index_size = len(INDEX_MAGIC) + count * INDEX_ENTRY.size
+            if magic == TRAILER_MAGIC and index_offset + index_size + TRAILER.size == file_size:
+                self._file.seek(index_offset)
+                block = self._file.read(index_size)
+                if block[:len(INDEX_MAGIC)] == INDEX_MAGIC:
+                    self.index = [INDEX_ENTRY.unpack_from(block, len(INDEX_MAGIC) + i * INDEX_ENTRY.size)
+                                  for i in range(count)]
+                    self.data_end = index_offset
+                    self._scan_summary(self.index[-1][1] if self.index else SESSION_HEADER.size,
+                                       self.index[-1][2] if self.index else 0)
+                    return
+
+        # 비정상 종료: 잘린 마지막 레코드 앞까지가 유효 데이터
+        self.recovered = True
+        self.data_end = file_size
+        self.index = []
+        frame_no = 0
+        for record_type, t, offset, _ in self._iter_raw(SESSION_HEADER.size):
+            if record_type == RECORD_FRAME_KEY:
+                self.index.append((t, offset, frame_no))
+            if record_type in FRAME_RECORDS:
+                frame_no += 1
+        self.data_end = self._valid_end
+        self._scan_summary(self.index[-1][1] if self.index else SESSION_HEADER.size,
+                           self.index[-1][2] if self.index else 0)
+
+    def _scan_summary(self, offset: int, frame_no: int):
+        """마지막 키 프레임 이후만 훑어 프레임 수와 길이 계산"""
+        for record_type, t, _, _ in self._iter_raw(offset):
+            self.duration = t
+            if record_type in FRAME_RECORDS:
+                frame_no += 1
+        self.frame_count = frame_no
+
+    def _iter_raw(self, offset: int) -> Iterator[Tuple[int, float, int, bytes]]:
+        """(type, t, offset, payload) 순차 읽기 - 잘린 레코드에서 멈춤"""
+        self._file.seek(offset)
+        self._valid_end = offset
+        read = self._file.read
+        while self.data_end is None or offset < self.data_end:
+            header = read(RECORD_HEADER.size)
+            if len(header) != RECORD_HEADER.size:
+                return
+            record_type, t, length = RECORD_HEADER.unpack(header)
+            payload = read(length)
+            if len(payload) != length:
+                return
+            yield record_type, t, offset, payload
+            offset += RECORD_HEADER.size + length
+            self._valid_end = offset
+
+    def records(self, start: float = 0.0) -> Iterator[Tuple[str, float, object]]:
+        """
+        레코드 순차 읽기
+
+        Args:
+            start: 시작 경과 시간 (초), 이전 키 프레임부터 복원 후 이 시점 이후만 반환
+        """
+        offset = SESSION_HEADER.size
+        if start > 0 and self.index:
+            for t, key_offset, _ in self.index:
+                if t > start:
+                    break
+                offset = key_offset
+
+        frame = None
+        for record_type, t, _, payload in self._iter_raw(offset):
+            if record_type == RECORD_FRAME_KEY:
+                frame = decode_screen_pages(payload, None, self.image_size)
+            elif record_type == RECORD_FRAME_DELTA:
+                if frame is None:
+                    continue   # 기준 프레임 없음 (첫 키 프레임 이전)
+                frame = decode_screen_pages(payload, frame, self.image_size)
+            elif record_type == RECORD_FRAME_REPEAT:
+                if frame is None:
+                    continue
+            if t < start:
+                continue
+
+            if record_type in FRAME_RECORDS:
+                yield 'frame', t, frame
+            elif record_type == RECORD_STATUS:
+                yield 'status', t, unpack_status_line(payload)
+            elif record_type == RECORD_STATUS_RAW:
+                yield 'status', t, payload
+            elif record_type == RECORD_EVENT:
+                yield 'event', t, payload.decode('utf-8', errors='replace')
+
+    def frames(self, start: float = 0.0) -> Iterator[Tuple[float, bytes]]:
+        """화면 프레임만 (t, 화면) 순서로 반환"""
+        for kind, t, value in self.records(start):
+            if kind == 'frame':
+                yield t, value
+
+    def frame_at(self, t: float) -> Optional[bytes]:
+        """t 시점에 표시 중이던 화면"""
+        frame = None
+        for kind, frame_t, value in self.records(self._key_time_before(t)):
+            if frame_t > t:
+                break
+            if kind == 'frame':
+                frame = value
+        return frame
+
+    def _key_time_before(self, t: float) -> float:
+        key_time = 0.0
+        for entry_t, _, _ in self.index:
+            if entry_t > t:
+                break
+            key_time = entry_t
+        return key_time
+
+    def get_info(self) -> Dict:
+        """세션 요약 정보"""
+        return {
+            'path': self.path,
+            'version': self.version,
+            'image_size': self.image_size,
+            'start_time': self.start_time,
+            'duration': self.duration,
+            'frame_count': self.frame_count,
+            'key_frames': len(self.index),
+            'file_size': os.fstat(self._file.fileno()).st_size,
+            'recovered': self.recovered
+        }
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+if __name__ == "__main__":
+    # 녹화/재생 크기 비교
+    import sys
+    import tempfile
+
+    from firmware_simulator import FirmwareSimulator
+
+    if len(sys.argv) > 1:
+        with SessionReader(sys.argv[1]) as reader:
+            for key, value in reader.get_info().items():
+                print(f"{key}: {value}")
+        sys.exit(0)
+
+    simulator = FirmwareSimulator()
+    path = os.path.join(tempfile.gettempdir(), "oled_session_demo.oses")
+    frame_count = 3000
+    with SessionRecorder(path) as recorder:
+        for frame_no in range(frame_count):
+            if frame_no % 10 == 0:
+                simulator.draw_test_pattern(frame_no // 10)
+            recorder.record_frame(simulator.image, frame_no * 0.05)
+            recorder.record_status(simulator.status_line(), frame_no * 0.05)
+        stats = recorder.get_stats()
+
+    hex_text_size = frame_count * 1024 * 2
+    print(f"{frame_count}프레임 녹화: {stats['bytes_written']} bytes "
+          f"(원본 대비 {stats['compression_ratio'] * 100:.1f}%, HEX 텍스트 {hex_text_size} bytes)")
+    print(f"키 {stats['key_frames']} / 델타 {stats['delta_frames']} / 반복 {stats['repeat_frames']}")
+
+    with SessionReader(path) as reader:
+        start_time = time.perf_counter()
+        count = sum(1 for _ in reader.frames())
+        elapsed = time.perf_counter() - start_time
+        print(f"재생: {count}프레임 {elapsed * 1000:.1f}ms, 정보: {reader.get_info()}")
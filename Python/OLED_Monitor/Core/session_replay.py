@@ -0,0 +1,289 @@
+"""
+녹화 세션 재생 시리얼 포트
+
+ReplaySerialPort는 serial.Serial 대신 OLEDMonitor.serial_port에 들어가, 녹화된
+화면과 STATUS 줄을 펌웨어와 같은 응답 형식으로 돌려준다. 명령 처리는
+FirmwareSimulator를 그대로 사용하므로 텍스트/바이너리 전송, 프레이머, 파서,
+화면 표시 경로가 실제 디바이스와 동일하게 동작한다.
+
+재생 속도:
+    speed = 1.0   실시간 (요청 시점의 재생 시각에 표시 중이던 화면 응답)
+    speed = N     N배속
+    speed = 0     최대 속도 (화면 요청마다 다음 녹화 프레임 응답) - 처리량 벤치마크용
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+from firmware_simulator import FirmwareSimulator
+from session_recorder import SessionReader
+
+REPLAY_PORT_PREFIX = "replay:"
+
+
+class ReplayFirmware(FirmwareSimulator):
+    """
+    녹화 세션을 화면 버퍼로 사용하는 펌웨어 시뮬레이터
+
+    화면 요청(GET_SCREEN/GET_SCREEN_BIN)이 올 때마다 재생 위치를 옮기고
+    그 시점의 녹화 화면과 STATUS 줄로 응답한다.
+    """
+
+    def __init__(self, reader: SessionReader, speed: float = 1.0, loop: bool = False,
+                 start: float = 0.0):
+        super().__init__(reader.image_size)
+        self.reader = reader
+        self.speed = max(0.0, speed)
+        self.loop = loop
+        self.start = start
+        self.finished = False
+        self.recorded_status = None
+        self.replay_stats = {
+            'screen_requests': 0,
+            'frames_served': 0,
+            'frames_skipped': 0,
+            'repeats_served': 0,
+            'loops': 0,
+            'first_request': None,
+            'last_request': None,
+            'replay_position': start
+        }
+        self._records = None
+        self._next = None
+        self._clock_start = None      # 재생 시각 = _clock_base + 경과 시간 x speed
+        self._clock_base = start
+        self._frame_pending = False   # 아직 응답하지 않은 새 프레임 있음
+        self._rewind()
+
+    def _rewind(self):
+        self._records = self.reader.records(self.start)
+        self._next = next(self._records, None)
+        self._clock_start = None
+
+    def _consume(self) -> bool:
+        """다음 레코드 하나를 현재 상태에 반영 (끝이면 False)"""
+        record = self._next
+        if record is None:
+            if not self.loop:
+                self.finished = True
+                return False
+            self.replay_stats['loops'] += 1
+            self._rewind()
+            record = self._next
+            if record is None:
+                self.finished = True
+                return False
+            self._clock_start = time.monotonic()
+            self._clock_base = record[1]
+
+        kind, t, value = record
+        if kind == 'frame':
+            if self._frame_pending:
+                self.replay_stats['frames_skipped'] += 1
+            self.image[:] = value
+            self._frame_pending = True
+        elif kind == 'status':
+            self.recorded_status = value
+        self.replay_stats['replay_position'] = t
+        self._next = next(self._records, None)
+        return True
+
+    def advance(self):
+        """화면 요청 시점까지 재생 위치 이동"""
+        now = time.monotonic()
+        if self.replay_stats['first_request'] is None:
+            self.replay_stats['first_request'] = now
+        self.replay_stats['last_request'] = now
+
+        if self.speed > 0:
+            # 재생 시각은 첫 화면 요청 때 첫 레코드 시각에서 시작
+            if self._clock_start is None:
+                self._clock_start = now
+                self._clock_base = self._next[1] if self._next is not None else self.start
+            while True:
+                if self._next is None:
+                    if self.finished or not self._consume():   # 끝 표시 또는 처음부터 반복
+                        break
+                    continue
+                if self._next[1] > self._clock_base + (now - self._clock_start) * self.speed:
+                    break
+                self._consume()
+        else:
+            # 다음 프레임과 그 뒤의 STATUS 줄까지
+            self._frame_pending = False
+            while True:
+                if not self._consume():
+                    break
+                if self._frame_pending and (self._next is None or self._next[0] == 'frame'):
+                    break
+
+    def process_command(self, command: bytes) -> bytes:
+        cmd = command.decode('ascii', errors='ignore').rstrip('\r\n ')
+        if cmd == 'GET_SCREEN' or cmd == 'GET_SCREEN_BIN' or cmd.startswith('GET_SCREEN_BIN:'):
+            self.replay_stats['screen_requests'] += 1
+            self.advance()
+            if self.finished and not self._frame_pending:
+                # 재생 끝: 디바이스가 응답하지 않는 것과 동일
+                self.stats['commands'] += 1
+                self.stats['ignored'] += 1
+                return b''
+            if self._frame_pending:
+                self.replay_stats['frames_served'] += 1
+            else:
+                self.replay_stats['repeats_served'] += 1
+            self._frame_pending = False
+        return super().process_command(command)
+
+    def status_line(self) -> bytes:
+        """녹화된 STATUS 줄 (녹화에 없으면 시뮬레이터 기본값)"""
+        if self.recorded_status is not None:
+            return bytes(self.recorded_status) + b'\n'
+        return super().status_line()
+
+
+class ReplaySerialPort:
+    """
+    serial.Serial 호환 재생 포트
+
+    OLEDMonitor/SerialFrameReader/AsyncSerialTransport가 사용하는 속성과 메서드
+    (read, write, in_waiting, timeout, is_open, flush, reset_*_buffer, close)만 제공한다.
+    fileno가 없으므로 AsyncSerialTransport는 블로킹 read 스레드 모드로 동작한다.
+    """
+
+    def __init__(self, path: str, speed: float = 1.0, loop: bool = False, start: float = 0.0,
+                 timeout: Optional[float] = 1.0, write_timeout: Optional[float] = 1.0):
+        self.port = REPLAY_PORT_PREFIX + path
+        self.baudrate = 0
+        self.timeout = timeout
+        self.write_timeout = write_timeout
+        self.reader = SessionReader(path)
+        self.firmware = ReplayFirmware(self.reader, speed=speed, loop=loop, start=start)
+        self.is_open = True
+        self._rx = bytearray()
+        self._cond = threading.Condition()
+        self.stats = {
+            'bytes_written': 0,
+            'bytes_read': 0,
+            'opened_at': time.monotonic()
+        }
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self._rx)
+
+    @property
+    def finished(self) -> bool:
+        """녹화 끝까지 재생했는지 (loop=False)"""
+        return self.firmware.finished
+
+    def write(self, data) -> int:
+        if not self.is_open:
+            raise OSError("재생 포트가 닫혀 있습니다")
+        data = bytes(data)
+        response = self.firmware.feed(data)
+        self.stats['bytes_written'] += len(data)
+        if response:
+            with self._cond:
+                self._rx += response
+                self._cond.notify_all()
+        return len(data)
+
+    def read(self, size: int = 1) -> bytes:
+        with self._cond:
+            if not self._rx and self.is_open:
+                if self.timeout is None:
+                    while not self._rx and self.is_open:
+                        self._cond.wait()
+                elif self.timeout > 0:
+                    self._cond.wait_for(lambda: self._rx or not self.is_open, self.timeout)
+            chunk = bytes(self._rx[:size])
+            del self._rx[:size]
+        self.stats['bytes_read'] += len(chunk)
+        return chunk
+
+    def flush(self):
+        pass
+
+    def reset_input_buffer(self):
+        with self._cond:
+            self._rx.clear()
+
+    def reset_output_buffer(self):
+        pass
+
+    def close(self):
+        with self._cond:
+            self.is_open = False
+            self._cond.notify_all()
+        self.reader.close()
+
+    def get_stats(self) -> Dict:
+        """재생/벤치마크 통계 - 처리 속도는 첫 화면 요청부터 마지막 요청까지 기준"""
+        replay = self.firmware.replay_stats
+        stats = dict(self.stats)
+        stats.update({key: value for key, value in replay.items()
+                      if key not in ('first_request', 'last_request')})
+        stats['speed'] = self.firmware.speed
+        stats['finished'] = self.firmware.finished
+        stats['binary'] = self.firmware.screen_format == FirmwareSimulator.SCREEN_FORMAT_BINARY
+
+        wall = 0.0
+        if replay['first_request'] is not None:
+            wall = replay['last_request'] - replay['first_request']
+        stats['wall_time'] = wall
+        stats['frames_per_second'] = replay['frames_served'] / wall if wall > 0 else 0.0
+        covered = replay['replay_position'] - self.firmware.start
+        stats['effective_speed'] = covered / wall if wall > 0 else 0.0
+        return stats
+
+
+def open_replay_port(port_name: str, speed: float = 1.0, **kwargs) -> ReplaySerialPort:
+    """'replay:<경로>' 포트 이름으로 재생 포트 생성"""
+    if not port_name.startswith(REPLAY_PORT_PREFIX):
+        raise ValueError(f"재생 포트 이름이 아닙니다: {port_name}")
+    return ReplaySerialPort(port_name[len(REPLAY_PORT_PREFIX):], speed=speed, **kwargs)
+
+
+if __name__ == "__main__":
+    # 디바이스 없이 프레이머 + 화면 디코더 처리량 측정
+    import argparse
+
+    import numpy as np
+
+    from serial_parser import OLEDImageDecoder, ScreenFrameDecoder
+
+    parser = argparse.ArgumentParser(description="세션 재생 처리량 벤치마크")
+    parser.add_argument("session", help="세션 파일 (.oses)")
+    parser.add_argument("--speed", type=float, default=0.0, help="재생 배속 (0 = 최대 속도)")
+    parser.add_argument("--text", action="store_true", help="텍스트 GET_SCREEN 사용 (기본: 바이너리)")
+    args = parser.parse_args()
+
+    port = ReplaySerialPort(args.session, speed=args.speed, timeout=0.5)
+    decoder = ScreenFrameDecoder()
+    image_decoder = OLEDImageDecoder()
+    # 디코딩 결과를 바로 버리므로 출력 배열 하나를 재사용 (프레임당 할당 없음)
+    frame_pixels = np.empty((image_decoder.height, image_decoder.width), dtype=np.uint8)
+    if not args.text:
+        port.write(b'SET_SCREEN_FORMAT:BINARY\n')
+        port.read(port.in_waiting)
+
+    frames = 0
+    start_time = time.perf_counter()
+    while not port.finished:
+        command = 'GET_SCREEN' if args.text else f'GET_SCREEN_BIN:{decoder.binary.ack_seq}'
+        port.write(command.encode('ascii') + b'\n')
+        for event_type, event in decoder.feed(port.read(port.in_waiting)):
+            if event_type == 'screen':
+                image_decoder.decode(event['data'], out=frame_pixels)
+                frames += 1
+        if args.speed > 0:
+            time.sleep(0.05)
+    elapsed = time.perf_counter() - start_time
+
+    stats = port.get_stats()
+    print(f"{frames}프레임 {elapsed:.3f}s: {frames / elapsed:.0f} fps, "
+          f"재생 {stats['replay_position']:.1f}s (x{stats['effective_speed']:.1f}), "
+          f"수신 {stats['bytes_read']} bytes")
+    print(f"재생 통계: {stats}")
+    port.close()
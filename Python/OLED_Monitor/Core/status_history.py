@@ -0,0 +1,223 @@
+"""
+상태 기록 (열 단위 NumPy 배열)
+
+파싱된 STATUS 레코드를 dict/객체 목록 대신 열(column)별 고정 타입 배열에 쌓는다.
+샘플당 24바이트이므로 10Hz로 몇 시간을 보관해도 수 MB 이내이며, 그래프는
+열 배열의 뷰를 그대로 사용한다.
+
+열:
+    time        수신 시각 (epoch 초, float64)
+    battery     배터리 전압 (float32)
+    bat_volt    BAT_VOLT 필드 (float32, 없으면 NaN)
+    bat_adc     BAT_ADC 값 (uint16)
+    timer       타이머 남은 시간 (초, int32, 파싱 불가시 -1)
+    state       상태 코드 (uint8, STATE_NAMES 색인)
+    links       L1/L2 연결 비트 (uint8, bit0 = L1, bit1 = L2)
+"""
+
+import time
+from typing import Dict, Mapping, NamedTuple, Optional
+
+import numpy as np
+
+# 상태 코드 - 펌웨어 상태 이름 (새 이름은 append에서 뒤에 추가됨)
+STATE_NAMES = ['UNKNOWN', 'STANDBY', 'RUNNING', 'COOLING', 'SETTING']
+
+LINK_L1 = 0x01
+LINK_L2 = 0x02
+
+
+class StatusSample(NamedTuple):
+    """상태 기록 한 행 (StatusHistory[i])"""
+    time: float
+    battery: float
+    bat_volt: Optional[float]
+    bat_adc: int
+    timer_seconds: int
+    status: str
+    l1_connected: bool
+    l2_connected: bool
+
+
+def timer_to_seconds(timer) -> int:
+    """'MM:SS' 타이머 문자열을 초로 변환 (형식 오류는 -1)"""
+    try:
+        minutes, _, seconds = str(timer).partition(':')
+        return int(minutes) * 60 + int(seconds)
+    except ValueError:
+        return -1
+
+
+class StatusHistory:
+    """
+    열 단위 상태 기록 버퍼
+
+    용량이 차면 두 배로 늘리고, max_samples를 지정하면 최근 max_samples개만 유지한다
+    (용량 2 x max_samples에서 최근 구간을 앞으로 한 번에 옮기므로 추가는 상각 O(1)).
+    유효 구간은 항상 연속이라 column()/window()는 복사 없는 뷰를 반환한다.
+    반환된 뷰는 다음 append 전까지만 유효하다.
+
+    Args:
+        max_samples: 보관할 최대 샘플 수 (None이면 무제한)
+        initial_capacity: 초기 배열 크기
+    """
+
+    COLUMNS = (('time', np.float64), ('battery', np.float32), ('bat_volt', np.float32),
+               ('bat_adc', np.uint16), ('timer', np.int32), ('state', np.uint8),
+               ('links', np.uint8))
+
+    def __init__(self, max_samples: Optional[int] = None, initial_capacity: int = 4096):
+        self.max_samples = max_samples
+        capacity = max(16, initial_capacity)
+        if max_samples:
+            capacity = min(capacity, 2 * max_samples)
+        self._columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in self.COLUMNS}
+        self._start = 0
+        self._end = 0
+        self.state_names = list(STATE_NAMES)
+        self._state_codes = {name: code for code, name in enumerate(self.state_names)}
+        self.total_appended = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def capacity(self) -> int:
+        return len(self._columns['time'])
+
+    def _make_room(self):
+        """끝에 한 칸 확보 - 최근 구간 앞으로 이동 또는 배열 확장"""
+        count = self._end - self._start
+        if self.max_samples and self.capacity >= 2 * self.max_samples:
+            keep = min(count, self.max_samples - 1)
+            for column in self._columns.values():
+                column[:keep] = column[self._end - keep:self._end]
+            self._start, self._end = 0, keep
+            return
+
+        capacity = self.capacity * 2
+        if self.max_samples:
+            capacity = min(capacity, 2 * self.max_samples)
+        for name, column in self._columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:count] = column[self._start:self._end]
+            self._columns[name] = grown
+        self._start, self._end = 0, count
+
+    def state_code(self, name: str) -> int:
+        """상태 이름의 코드 (처음 보는 이름은 등록, 255개 초과시 UNKNOWN)"""
+        code = self._state_codes.get(name)
+        if code is None:
+            if len(self.state_names) >= 256:
+                return 0
+            code = len(self.state_names)
+            self.state_names.append(name)
+            self._state_codes[name] = code
+        return code
+
+    def append(self, status: Mapping, received_at: Optional[float] = None):
+        """
+        상태 레코드 추가
+
+        Args:
+            status: StatusRecord 또는 같은 키를 가진 dict
+            received_at: 수신 시각 (None이면 레코드의 received_at, 없으면 현재 시각)
+        """
+        if self._end >= self.capacity:
+            self._make_room()
+
+        if received_at is None:
+            received_at = getattr(status, 'received_at', None) or time.time()
+        bat_volt = status.get('bat_volt')
+        links = ((LINK_L1 if status.get('l1_connected') else 0) |
+                 (LINK_L2 if status.get('l2_connected') else 0))
+
+        index = self._end
+        columns = self._columns
+        columns['time'][index] = received_at
+        columns['battery'][index] = status.get('battery') or 0.0
+        columns['bat_volt'][index] = np.nan if bat_volt is None else bat_volt
+        columns['bat_adc'][index] = min(max(int(status.get('bat_adc') or 0), 0), 0xFFFF)
+        columns['timer'][index] = timer_to_seconds(status.get('timer', ''))
+        columns['state'][index] = self.state_code(status.get('status') or 'UNKNOWN')
+        columns['links'][index] = links
+        self._end = index + 1
+        self.total_appended += 1
+
+        if self.max_samples and self._end - self._start > self.max_samples:
+            self._start += 1
+
+    def clear(self):
+        self._start = 0
+        self._end = 0
+
+    def column(self, name: str) -> np.ndarray:
+        """유효 구간의 열 뷰 (복사 없음)"""
+        return self._columns[name][self._start:self._end]
+
+    def window(self, seconds: float, now: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """최근 seconds초 구간의 열 뷰 (시각은 단조 증가로 가정)"""
+        times = self.column('time')
+        if now is None:
+            now = times[-1] if len(times) else time.time()
+        first = int(np.searchsorted(times, now - seconds, side='left'))
+        return {name: self._columns[name][self._start + first:self._end] for name, _ in self.COLUMNS}
+
+    def __getitem__(self, index: int) -> StatusSample:
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError(index)
+        i = self._start + index
+        columns = self._columns
+        bat_volt = float(columns['bat_volt'][i])
+        links = int(columns['links'][i])
+        return StatusSample(
+            float(columns['time'][i]),
+            round(float(columns['battery'][i]), 3),
+            None if bat_volt != bat_volt else round(bat_volt, 3),
+            int(columns['bat_adc'][i]),
+            int(columns['timer'][i]),
+            self.state_names[columns['state'][i]],
+            bool(links & LINK_L1),
+            bool(links & LINK_L2)
+        )
+
+    def latest(self) -> Optional[StatusSample]:
+        return self[-1] if len(self) else None
+
+    def memory_bytes(self) -> int:
+        """배열 메모리 사용량 (할당 용량 기준)"""
+        return sum(column.nbytes for column in self._columns.values())
+
+    def get_stats(self) -> Dict:
+        times = self.column('time')
+        return {
+            'samples': len(self),
+            'total_appended': self.total_appended,
+            'capacity': self.capacity,
+            'memory_bytes': self.memory_bytes(),
+            'span_seconds': float(times[-1] - times[0]) if len(times) > 1 else 0.0
+        }
+
+
+if __name__ == "__main__":
+    # 추가 속도와 메모리 사용량 측정 (10Hz x 4시간 분량)
+    from serial_parser import SerialDataParser
+
+    parser = SerialDataParser()
+    line = b"STATUS:BAT:405V,TIMER:05:00,STATUS:RUNNING,L1:1,L2:0,BAT_ADC:2512,BAT_VOLT:4.05"
+    record = parser.parse_status_data(line)
+
+    history = StatusHistory()
+    samples = 10 * 3600 * 4
+    start_time = time.perf_counter()
+    for i in range(samples):
+        history.append(record, received_at=1.0e9 + i * 0.1)
+    elapsed = time.perf_counter() - start_time
+
+    stats = history.get_stats()
+    print(f"{samples}개 추가: {elapsed / samples * 1e6:.2f}us/샘플, "
+          f"메모리 {stats['memory_bytes'] / 1024 / 1024:.1f}MB (용량 {stats['capacity']})")
+    print(f"최근 60초: {len(history.window(60.0)['time'])}개, 마지막 {history.latest()}")
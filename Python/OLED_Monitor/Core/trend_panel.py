@@ -0,0 +1,231 @@
+"""
+배터리 추세 패널 (Tk Canvas)
+
+StatusHistory의 최근 구간을 배터리 전압/BAT_ADC 선 그래프로 표시한다.
+
+- 전체 다시 그리기는 화면 가로 픽셀 열마다 최소/최대값 한 쌍으로 줄여서(decimate)
+  그리므로 비용이 기록 길이와 무관하다 (선 하나 = 캔버스 항목 하나, 최대 2 x 폭 점).
+- 새 샘플은 마지막 점과 잇는 짧은 선분만 추가한다 (블리팅에 해당). 시간축이
+  오른쪽 끝을 넘거나 전압이 축 범위를 벗어나거나 추가 선분이 폭만큼 쌓이면
+  그때만 전체를 다시 그린다.
+
+matplotlib 없이 Tk만 사용한다 (OLEDMonitor 필수 모듈과 동일).
+"""
+
+import tkinter as tk
+from typing import Tuple
+
+import numpy as np
+
+from status_history import StatusHistory
+
+
+def decimate_minmax(times: np.ndarray, values: np.ndarray, t0: float, span: float,
+                    columns: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    시간순 샘플을 픽셀 열별 최소/최대값으로 축소
+
+    Args:
+        times: 정렬된 시각 배열
+        values: 값 배열 (times와 같은 길이, NaN 없음)
+        t0: 왼쪽 끝 시각
+        span: 가로 구간 길이 (초)
+        columns: 픽셀 열 수
+
+    Returns:
+        (열 번호, 최소값, 최대값) - 샘플이 있는 열만
+    """
+    if len(times) == 0 or columns <= 0 or span <= 0:
+        empty = np.zeros(0)
+        return empty.astype(np.int64), empty, empty
+
+    column = ((times - t0) * (columns / span)).astype(np.int64)
+    np.clip(column, 0, columns - 1, out=column)
+    # 정렬된 열 번호에서 열이 바뀌는 위치 = 구간 시작
+    starts = np.flatnonzero(np.diff(column, prepend=-1))
+    return (column[starts],
+            np.minimum.reduceat(values, starts),
+            np.maximum.reduceat(values, starts))
+
+
+class BatteryTrendPanel:
+    """
+    배터리 전압(왼쪽 축)과 BAT_ADC(오른쪽 축, 0~4095) 추세 캔버스
+
+    update()는 상태가 추가될 때마다 Tk 메인 스레드에서 호출한다.
+
+    Args:
+        parent: 부모 위젯
+        history: 상태 기록 (OLEDMonitor.status_history)
+        window_seconds: 표시 구간 길이 (초)
+        width, height: 캔버스 크기 (픽셀)
+    """
+
+    MARGIN_LEFT = 40
+    MARGIN_RIGHT = 40
+    MARGIN_Y = 12
+    ADC_MAX = 4095
+    SCROLL_FRACTION = 0.25        # 오른쪽 끝을 넘으면 구간의 25%만큼 이동
+    VOLT_COLOR = "#1f77b4"
+    ADC_COLOR = "#ff7f0e"
+
+    def __init__(self, parent, history: StatusHistory, window_seconds: float = 600.0,
+                 width: int = 480, height: int = 140):
+        self.history = history
+        self.window_seconds = window_seconds
+        self.canvas = tk.Canvas(parent, width=width, height=height, bg="white",
+                                highlightthickness=0)
+        self.canvas.bind("<Configure>", self._on_resize)
+        self.width = width
+        self.height = height
+
+        self.t0 = None                 # 시간축 왼쪽 끝
+        self.volt_range = (0.0, 1.0)
+        self.last_point = None         # (시각, 전압, ADC) - 다음 선분의 시작점
+        self.segment_count = 0
+        self.volt_line = None
+        self.adc_line = None
+        self.stats = {'full_redraws': 0, 'segments': 0}
+
+    def pack(self, **kwargs):
+        self.canvas.pack(**kwargs)
+
+    # ------------------------------------------------------------------
+    # 좌표 변환
+    # ------------------------------------------------------------------
+    @property
+    def plot_width(self) -> int:
+        return max(1, self.width - self.MARGIN_LEFT - self.MARGIN_RIGHT)
+
+    @property
+    def plot_height(self) -> int:
+        return max(1, self.height - 2 * self.MARGIN_Y)
+
+    def _x(self, t):
+        return self.MARGIN_LEFT + (t - self.t0) * (self.plot_width / self.window_seconds)
+
+    def _y_volt(self, v):
+        low, high = self.volt_range
+        return self.MARGIN_Y + (high - v) * (self.plot_height / (high - low))
+
+    def _y_adc(self, adc):
+        return self.MARGIN_Y + (self.ADC_MAX - adc) * (self.plot_height / self.ADC_MAX)
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def set_window(self, seconds: float):
+        """표시 구간 변경 (전체 다시 그리기)"""
+        self.window_seconds = max(1.0, float(seconds))
+        self.t0 = None
+        self.redraw()
+
+    def update(self):
+        """최근 샘플 반영 - 축 안이면 선분 하나만 추가"""
+        sample = self.history.latest()
+        if sample is None:
+            return
+        t, volt, adc = sample.time, sample.battery, sample.bat_adc
+        if self.last_point is not None and t <= self.last_point[0]:
+            return
+
+        low, high = self.volt_range
+        if (self.t0 is None or self.last_point is None or
+                t > self.t0 + self.window_seconds or not low <= volt <= high or
+                self.segment_count >= self.plot_width):
+            self.redraw()
+            return
+
+        t_prev, volt_prev, adc_prev = self.last_point
+        x0, x1 = self._x(t_prev), self._x(t)
+        self.canvas.create_line(x0, self._y_volt(volt_prev), x1, self._y_volt(volt),
+                                fill=self.VOLT_COLOR, tags="segment")
+        self.canvas.create_line(x0, self._y_adc(adc_prev), x1, self._y_adc(adc),
+                                fill=self.ADC_COLOR, tags="segment")
+        self.last_point = (t, volt, adc)
+        self.segment_count += 1
+        self.stats['segments'] += 1
+
+    def redraw(self):
+        """현재 구간 전체 다시 그리기 (픽셀 열 단위로 축소)"""
+        self.canvas.delete("segment")
+        self.segment_count = 0
+        times = self.history.column('time')
+        if len(times) == 0:
+            self.canvas.delete("all")
+            self.volt_line = self.adc_line = None
+            self.last_point = None
+            return
+
+        latest = float(times[-1])
+        if self.t0 is None or latest > self.t0 + self.window_seconds:
+            # 오른쪽에 여유를 두고 이동 (매 샘플마다 다시 그리지 않도록)
+            self.t0 = latest - self.window_seconds * (1.0 - self.SCROLL_FRACTION)
+        view = self.history.window(latest - self.t0, now=latest)
+        volts = view['battery'].astype(np.float64)
+        adcs = view['bat_adc'].astype(np.float64)
+        self._fit_volt_range(volts)
+
+        columns = self.plot_width
+        volt_coords = self._polyline(view['time'], volts, columns, self._y_volt)
+        adc_coords = self._polyline(view['time'], adcs, columns, self._y_adc)
+        self._draw_axes()
+        self.volt_line = self._set_line(self.volt_line, volt_coords, self.VOLT_COLOR)
+        self.adc_line = self._set_line(self.adc_line, adc_coords, self.ADC_COLOR)
+        self.last_point = (latest, float(volts[-1]), float(adcs[-1]))
+        self.stats['full_redraws'] += 1
+
+    def _fit_volt_range(self, volts: np.ndarray):
+        """전압축 범위 - 0.1V 단위로 여유를 두고 맞춤"""
+        low, high = float(volts.min()), float(volts.max())
+        pad = max(0.05, (high - low) * 0.1)
+        self.volt_range = (float(np.floor((low - pad) * 10)) / 10,
+                           float(np.ceil((high + pad) * 10)) / 10)
+
+    def _polyline(self, times, values, columns, to_y):
+        """열별 최소/최대를 지그재그로 이은 좌표 목록"""
+        column, minimum, maximum = decimate_minmax(times, values, self.t0, self.window_seconds, columns)
+        if len(column) == 0:
+            return []
+        x = (self.MARGIN_LEFT + column).astype(np.float64)
+        points = np.empty((len(column) * 2, 2))
+        points[0::2, 0] = x
+        points[1::2, 0] = x
+        points[0::2, 1] = to_y(minimum)
+        points[1::2, 1] = to_y(maximum)
+        return points.ravel().tolist()
+
+    def _set_line(self, item, coords, color):
+        if len(coords) < 4:
+            coords = coords * 2 if coords else [0, 0, 0, 0]
+        if item is None:
+            return self.canvas.create_line(*coords, fill=color, tags="trend")
+        self.canvas.coords(item, *coords)
+        return item
+
+    def _draw_axes(self):
+        self.canvas.delete("axis")
+        left, right = self.MARGIN_LEFT, self.width - self.MARGIN_RIGHT
+        top, bottom = self.MARGIN_Y, self.height - self.MARGIN_Y
+        self.canvas.create_rectangle(left, top, right, bottom, outline="#cccccc", tags="axis")
+        low, high = self.volt_range
+        font = ("TkDefaultFont", 8)
+        self.canvas.create_text(left - 3, top, text=f"{high:.1f}V", anchor=tk.NE, font=font,
+                                fill=self.VOLT_COLOR, tags="axis")
+        self.canvas.create_text(left - 3, bottom, text=f"{low:.1f}V", anchor=tk.SE, font=font,
+                                fill=self.VOLT_COLOR, tags="axis")
+        self.canvas.create_text(right + 3, top, text=str(self.ADC_MAX), anchor=tk.NW, font=font,
+                                fill=self.ADC_COLOR, tags="axis")
+        self.canvas.create_text(right + 3, bottom, text="0", anchor=tk.SW, font=font,
+                                fill=self.ADC_COLOR, tags="axis")
+        span = (f"{self.window_seconds / 60:.0f}분" if self.window_seconds >= 120
+                else f"{self.window_seconds:.0f}초")
+        self.canvas.create_text(right, bottom + 1, text=f"최근 {span}",
+                                anchor=tk.NE, font=font, fill="gray", tags="axis")
+        self.canvas.tag_lower("axis")
+
+    def _on_resize(self, event):
+        if event.width == self.width and event.height == self.height:
+            return
+        self.width, self.height = event.width, event.height
+        self.redraw()
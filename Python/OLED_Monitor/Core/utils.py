@@ -8,24 +8,178 @@ Date: 2024-01-01
 """
 
 import os
+import re
 import json
 import time
 import threading
+import bisect
+import math
+import atexit
+import functools
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import serial.tools.list_ports
 from PIL import Image, ImageDraw, ImageFont
 import numpy as np
 
+class AsyncLogWriter:
+    """
+    비동기 배치 로그 기록기
+    
+    write()는 collections.deque에 (경로, 내용)을 추가만 하고 바로 반환한다
+    (deque append/popleft는 원자적이므로 락 없음). 백그라운드 스레드가
+    flush_interval마다 큐를 비우고 경로별로 묶어 한 번에 기록하며, 파일은
+    열어 둔 채로 재사용한다. 내용 대신 인자 없는 함수를 넘기면 문자열 변환도
+    기록 스레드에서 수행한다 (HEX 덤프 등 비싼 포맷팅을 호출측에서 제거).
+    """
+    
+    def __init__(self, flush_interval: float = 0.5, max_pending: int = 2000, encoding: str = 'utf-8'):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending    # 이 이상 쌓이면 주기 전에 기록
+        self.encoding = encoding
+        self.stats = {
+            'records': 0,
+            'batches': 0,
+            'bytes': 0,
+            'max_pending': 0,
+            'errors': 0
+        }
+        
+        self._queue = deque()
+        self._files = {}
+        self._wakeup = threading.Event()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="AsyncLogWriter", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+    
+    def write(self, path: str, content):
+        """기록 예약 (content: 문자열 또는 문자열을 반환하는 인자 없는 함수)"""
+        queue_ = self._queue
+        queue_.append((path, content))
+        if len(queue_) >= self.max_pending:
+            self._wakeup.set()
+    
+    def release(self, path: str):
+        """파일 핸들 닫기 예약 (일일 파일 교체시)"""
+        self._queue.append((path, None))
+    
+    def flush(self, timeout: float = 2.0) -> bool:
+        """지금까지 예약된 기록이 디스크에 쓰일 때까지 대기
+        
+        큐에 완료 표시(Event)를 넣고 기록 스레드가 그 앞의 항목을 모두 쓴 뒤
+        표시를 처리할 때까지 기다린다.
+        """
+        if not self._thread.is_alive():
+            self._write_pending()
+            return True
+        marker = threading.Event()
+        self._queue.append((None, marker))
+        self._wakeup.set()
+        return marker.wait(timeout)
+    
+    def close(self):
+        """남은 기록을 모두 쓰고 파일 닫기"""
+        if self._running:
+            self._running = False
+            self._wakeup.set()
+            self._thread.join(max(self.flush_interval * 4, 1.0))
+        self._write_pending()
+        for handle in self._files.values():
+            try:
+                handle.close()
+            except Exception:
+                pass
+        self._files.clear()
+    
+    def pending(self) -> int:
+        """기록 대기 중인 항목 수"""
+        return len(self._queue)
+    
+    def _run(self):
+        while self._running:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._write_pending()
+    
+    def _write_pending(self):
+        queue_ = self._queue
+        pending = len(queue_)
+        if pending > self.stats['max_pending']:
+            self.stats['max_pending'] = pending
+        
+        batches = {}
+        order = []
+        while queue_:
+            path, content = queue_.popleft()
+            if path is None:
+                # flush() 완료 표시 - 앞선 항목을 먼저 기록한 뒤 알림
+                self._write_batches(batches, order)
+                batches, order = {}, []
+                content.set()
+                continue
+            if content is None:
+                self._write_batches(batches, order)
+                batches, order = {}, []
+                self._close_file(path)
+                continue
+            if callable(content):
+                try:
+                    content = content()
+                except Exception as e:
+                    self.stats['errors'] += 1
+                    print(f"로그 포맷팅 실패: {e}")
+                    continue
+            if path not in batches:
+                batches[path] = []
+                order.append(path)
+            batches[path].append(content)
+            self.stats['records'] += 1
+        
+        self._write_batches(batches, order)
+    
+    def _write_batches(self, batches: Dict, order: List[str]):
+        for path in order:
+            text = ''.join(batches[path])
+            try:
+                handle = self._files.get(path)
+                if handle is None:
+                    handle = open(path, 'a', encoding=self.encoding)
+                    self._files[path] = handle
+                handle.write(text)
+                handle.flush()
+                self.stats['batches'] += 1
+                self.stats['bytes'] += len(text)
+            except Exception as e:
+                self.stats['errors'] += 1
+                print(f"로그 배치 기록 실패 ({path}): {e}")
+                self._close_file(path)
+    
+    def _close_file(self, path: str):
+        handle = self._files.pop(path, None)
+        if handle is not None:
+            try:
+                handle.close()
+            except Exception:
+                pass
+
 class StatusLogger:
-    """상태 로그 전용 클래스 - RAW 데이터 기록 지원"""
+    """상태 로그 전용 클래스 - RAW 데이터 기록 지원
+    
+    기록은 AsyncLogWriter로 넘겨 백그라운드에서 배치 기록되므로, 호출측
+    (캡처 스레드)은 디스크 I/O를 기다리지 않는다.
+    """
     
-    def __init__(self, log_dir: str = "LOG"):
+    def __init__(self, log_dir: str = "LOG", flush_interval: float = 0.5,
+                 writer: Optional[AsyncLogWriter] = None):
         self.log_dir = log_dir
         self.ensure_log_directory()
         self.status_log_file = None
         self.raw_log_file = None  # RAW 데이터 전용 로그 파일
-        self.log_lock = threading.Lock()
+        self.log_lock = threading.Lock()  # 일일 파일 교체용
+        self.log_date = None
+        self.writer = writer if writer is not None else AsyncLogWriter(flush_interval)
         self.setup_daily_log()
         
     def ensure_log_directory(self):
@@ -34,8 +188,16 @@ class StatusLogger:
             os.makedirs(self.log_dir, exist_ok=True)
     
     def setup_daily_log(self):
-        """일일 상태 로그 파일 설정"""
-        today = datetime.now().strftime("%Y%m%d")
+        """일일 상태 로그 파일 설정 (날짜가 바뀌면 이전 파일 핸들 반환)"""
+        now = datetime.now()
+        today = now.strftime("%Y%m%d")
+        
+        if self.status_log_file:
+            self.writer.release(self.status_log_file)
+        if self.raw_log_file:
+            self.writer.release(self.raw_log_file)
+        
+        self.log_date = now.date()
         self.status_log_file = os.path.join(self.log_dir, f"status_log_{today}.txt")
         self.raw_log_file = os.path.join(self.log_dir, f"raw_data_log_{today}.txt")
         
@@ -46,31 +208,30 @@ class StatusLogger:
         if not os.path.exists(self.raw_log_file):
             self.write_raw_header()
     
+    def check_daily_rollover(self, now: datetime):
+        """자정이 지나면 새 일일 파일로 교체"""
+        if now.date() != self.log_date:
+            with self.log_lock:
+                if now.date() != self.log_date:
+                    self.setup_daily_log()
+    
     def write_header(self):
         """상태 로그 파일 헤더 작성"""
-        try:
-            with self.log_lock:
-                with open(self.status_log_file, 'w', encoding='utf-8') as f:
-                    f.write("=" * 140 + "\n")
-                    f.write(f"OnBoard OLED Monitor 상태 로그 - {datetime.now().strftime('%Y년 %m월 %d일')}\n")
-                    f.write("=" * 140 + "\n")
-                    f.write("시간\t\t\t배터리\t타이머\t\t상태\t\tL1\tL2\tBAT_ADC\t비고\t\t\tRAW 데이터\n")
-                    f.write("-" * 140 + "\n")
-        except Exception as e:
-            print(f"상태 로그 헤더 작성 실패: {e}")
+        self.writer.write(self.status_log_file,
+                          "=" * 140 + "\n" +
+                          f"OnBoard OLED Monitor 상태 로그 - {datetime.now().strftime('%Y년 %m월 %d일')}\n" +
+                          "=" * 140 + "\n" +
+                          "시간\t\t\t배터리\t타이머\t\t상태\t\tL1\tL2\tBAT_ADC\t비고\t\t\tRAW 데이터\n" +
+                          "-" * 140 + "\n")
     
     def write_raw_header(self):
         """RAW 데이터 로그 파일 헤더 작성"""
-        try:
-            with self.log_lock:
-                with open(self.raw_log_file, 'w', encoding='utf-8') as f:
-                    f.write("=" * 100 + "\n")
-                    f.write(f"OnBoard OLED Monitor RAW 데이터 로그 - {datetime.now().strftime('%Y년 %m월 %d일')}\n")
-                    f.write("=" * 100 + "\n")
-                    f.write("시간\t\t\t데이터 타입\t\t길이\tRAW 데이터 (HEX)\n")
-                    f.write("-" * 100 + "\n")
-        except Exception as e:
-            print(f"RAW 로그 헤더 작성 실패: {e}")
+        self.writer.write(self.raw_log_file,
+                          "=" * 100 + "\n" +
+                          f"OnBoard OLED Monitor RAW 데이터 로그 - {datetime.now().strftime('%Y년 %m월 %d일')}\n" +
+                          "=" * 100 + "\n" +
+                          "시간\t\t\t데이터 타입\t\t길이\tRAW 데이터 (HEX)\n" +
+                          "-" * 100 + "\n")
     
     def log_status(self, status_data: Dict):
         """상태 데이터 로그 기록 - RAW 데이터 포함"""
@@ -78,120 +239,121 @@ class StatusLogger:
             return
             
         try:
-            with self.log_lock:
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                
-                battery = status_data.get('battery', 'N/A')
-                timer = status_data.get('timer', 'N/A')
-                status = status_data.get('status', 'N/A')
-                l1_connected = '연결' if status_data.get('l1_connected', False) else '해제'
-                l2_connected = '연결' if status_data.get('l2_connected', False) else '해제'
-                bat_adc = status_data.get('bat_adc', 'N/A')  # BAT ADC 값 추가
-                source = status_data.get('source', 'unknown')
-                
-                # RAW 데이터 추출 (ASCII 값 그대로 저장)
-                raw_data = status_data.get('raw_data', '')
-                if isinstance(raw_data, bytes):
-                    # ASCII 값 그대로 디코딩
-                    raw_display = raw_data.decode('ascii', errors='replace')[:100] + '...' if len(raw_data) > 100 else raw_data.decode('ascii', errors='replace')
-                elif isinstance(raw_data, str):
-                    raw_display = raw_data[:100] + '...' if len(raw_data) > 100 else raw_data
-                else:
-                    raw_display = str(raw_data)[:100] + '...' if len(str(raw_data)) > 100 else str(raw_data)
-                
-                # 상태 로그 라인 구성 (BAT ADC 및 RAW 데이터 포함)
-                log_line = f"{timestamp}\t{battery}V\t{timer}\t\t{status}\t\t{l1_connected}\t{l2_connected}\t{bat_adc}\t{source}\t{raw_display}\n"
+            now = datetime.now()
+            self.check_daily_rollover(now)
+            timestamp = now.strftime("%H:%M:%S.%f")[:-3]
+            
+            battery = status_data.get('battery', 'N/A')
+            timer = status_data.get('timer', 'N/A')
+            status = status_data.get('status', 'N/A')
+            l1_connected = '연결' if status_data.get('l1_connected', False) else '해제'
+            l2_connected = '연결' if status_data.get('l2_connected', False) else '해제'
+            bat_adc = status_data.get('bat_adc', 'N/A')  # BAT ADC 값 추가
+            source = status_data.get('source', 'unknown')
+            
+            # RAW 데이터 추출 (ASCII 값 그대로 저장)
+            raw_data = status_data.get('raw_data', '')
+            if isinstance(raw_data, (bytes, bytearray)):
+                raw_display = bytes(raw_data[:100]).decode('ascii', errors='replace') + ('...' if len(raw_data) > 100 else '')
+            elif isinstance(raw_data, str):
+                raw_display = raw_data[:100] + '...' if len(raw_data) > 100 else raw_data
+            else:
+                raw_display = str(raw_data)[:100] + '...' if len(str(raw_data)) > 100 else str(raw_data)
+            
+            # 상태 로그 라인 구성 (BAT ADC 및 RAW 데이터 포함)
+            self.writer.write(self.status_log_file,
+                              f"{timestamp}\t{battery}V\t{timer}\t\t{status}\t\t{l1_connected}\t{l2_connected}\t{bat_adc}\t{source}\t{raw_display}\n")
                 
-                # 파일에 기록
-                with open(self.status_log_file, 'a', encoding='utf-8') as f:
-                    f.write(log_line)
-                    
-                # RAW 데이터가 있으면 별도 파일에도 기록
-                if raw_data:
-                    self.log_raw_data('STATUS', raw_data)
+            # RAW 데이터가 있으면 별도 파일에도 기록
+            if raw_data:
+                self.log_raw_data('STATUS', raw_data, timestamp)
                     
         except Exception as e:
             print(f"상태 로그 기록 실패: {e}")
     
-    def log_raw_data(self, data_type: str, raw_data: Any):
-        """RAW 데이터를 별도 파일에 상세 기록 - ASCII 값 그대로 저장"""
+    def log_raw_data(self, data_type: str, raw_data: Any, timestamp: Optional[str] = None):
+        """RAW 데이터를 별도 파일에 상세 기록 - ASCII/HEX 변환은 기록 스레드에서 수행"""
         if not self.raw_log_file:
             return
             
         try:
-            with self.log_lock:
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                
-                # 데이터 타입별 처리 - ASCII 값 그대로 저장
-                if isinstance(raw_data, bytes):
-                    data_length = len(raw_data)
-                    # ASCII 값 그대로 디코딩
-                    ascii_data = raw_data.decode('ascii', errors='replace')
-                    # HEX 값도 함께 저장
-                    hex_data = raw_data.hex().upper()
-                    
-                    # 긴 데이터는 줄바꿈 처리
-                    if len(ascii_data) > 80:
-                        ascii_display = ascii_data[:80] + f"... (총 {data_length} bytes)"
-                    else:
-                        ascii_display = ascii_data
-                        
-                elif isinstance(raw_data, str):
-                    data_length = len(raw_data.encode('utf-8'))
-                    ascii_display = raw_data[:80] + f"... (총 {data_length} bytes)" if len(raw_data) > 80 else raw_data
-                    hex_data = raw_data.encode('utf-8').hex().upper()
-                else:
-                    str_data = str(raw_data)
-                    data_length = len(str_data.encode('utf-8'))
-                    ascii_display = str_data[:80] + f"... (총 {data_length} bytes)" if len(str_data) > 80 else str_data
-                    hex_data = str_data.encode('utf-8').hex().upper()
-                
-                # ASCII 값 우선 기록
-                log_line = f"{timestamp}\t{data_type}\t\t{data_length}\t{ascii_display}\n"
-                
-                with open(self.raw_log_file, 'a', encoding='utf-8') as f:
-                    f.write(log_line)
-                    
-                    # HEX 값도 별도 라인에 기록
-                    if len(hex_data) > 80:
-                        hex_display = hex_data[:80] + f"... (총 {data_length} bytes)"
-                        f.write(f"{timestamp}\t{data_type}_HEX\t{data_length}\t{hex_display}\n")
-                        f.write(f"{timestamp}\t{data_type}_HEX_FULL\t{data_length}\t{hex_data}\n")
-                    else:
-                        f.write(f"{timestamp}\t{data_type}_HEX\t{data_length}\t{hex_data}\n")
+            if timestamp is None:
+                now = datetime.now()
+                self.check_daily_rollover(now)
+                timestamp = now.strftime("%H:%M:%S.%f")[:-3]
+            if isinstance(raw_data, (bytearray, memoryview)):
+                raw_data = bytes(raw_data)  # 호출측 버퍼 재사용 대비 복사
+            
+            self.writer.write(self.raw_log_file,
+                              functools.partial(self.format_raw_data, timestamp, data_type, raw_data))
                     
         except Exception as e:
             print(f"RAW 데이터 로그 기록 실패: {e}")
     
+    @staticmethod
+    def format_raw_data(timestamp: str, data_type: str, raw_data: Any) -> str:
+        """RAW 데이터 로그 라인 생성 - ASCII 값 그대로 + HEX"""
+        # 데이터 타입별 처리 - ASCII 값 그대로 저장
+        if isinstance(raw_data, bytes):
+            data_length = len(raw_data)
+            # ASCII 값 그대로 디코딩
+            ascii_data = raw_data.decode('ascii', errors='replace')
+            # HEX 값도 함께 저장
+            hex_data = raw_data.hex().upper()
+            
+            # 긴 데이터는 줄바꿈 처리
+            if len(ascii_data) > 80:
+                ascii_display = ascii_data[:80] + f"... (총 {data_length} bytes)"
+            else:
+                ascii_display = ascii_data
+                
+        elif isinstance(raw_data, str):
+            data_length = len(raw_data.encode('utf-8'))
+            ascii_display = raw_data[:80] + f"... (총 {data_length} bytes)" if len(raw_data) > 80 else raw_data
+            hex_data = raw_data.encode('utf-8').hex().upper()
+        else:
+            str_data = str(raw_data)
+            data_length = len(str_data.encode('utf-8'))
+            ascii_display = str_data[:80] + f"... (총 {data_length} bytes)" if len(str_data) > 80 else str_data
+            hex_data = str_data.encode('utf-8').hex().upper()
+        
+        # ASCII 값 우선 기록, HEX 값은 별도 라인
+        lines = [f"{timestamp}\t{data_type}\t\t{data_length}\t{ascii_display}\n"]
+        if len(hex_data) > 80:
+            hex_display = hex_data[:80] + f"... (총 {data_length} bytes)"
+            lines.append(f"{timestamp}\t{data_type}_HEX\t{data_length}\t{hex_display}\n")
+            lines.append(f"{timestamp}\t{data_type}_HEX_FULL\t{data_length}\t{hex_data}\n")
+        else:
+            lines.append(f"{timestamp}\t{data_type}_HEX\t{data_length}\t{hex_data}\n")
+        return ''.join(lines)
+    
     def log_event(self, event_type: str, message: str, raw_data: Any = None):
         """이벤트 로그 기록 - RAW 데이터 선택적 포함"""
         if not self.status_log_file:
             return
             
         try:
-            with self.log_lock:
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                
-                # RAW 데이터가 있으면 간단히 표시
-                if raw_data:
-                    if isinstance(raw_data, bytes):
-                        raw_info = f" [RAW: {len(raw_data)}bytes]"
-                    elif isinstance(raw_data, str):
-                        raw_info = f" [RAW: {len(raw_data)}chars]"
-                    else:
-                        raw_info = f" [RAW: {type(raw_data).__name__}]"
-                    message_with_raw = message + raw_info
+            now = datetime.now()
+            self.check_daily_rollover(now)
+            timestamp = now.strftime("%H:%M:%S.%f")[:-3]
+            
+            # RAW 데이터가 있으면 간단히 표시
+            if raw_data:
+                if isinstance(raw_data, (bytes, bytearray)):
+                    raw_info = f" [RAW: {len(raw_data)}bytes]"
+                elif isinstance(raw_data, str):
+                    raw_info = f" [RAW: {len(raw_data)}chars]"
                 else:
-                    message_with_raw = message
-                
-                log_line = f"{timestamp}\t[{event_type}]\t{message_with_raw}\n"
+                    raw_info = f" [RAW: {type(raw_data).__name__}]"
+                message_with_raw = message + raw_info
+            else:
+                message_with_raw = message
+            
+            self.writer.write(self.status_log_file, f"{timestamp}\t[{event_type}]\t{message_with_raw}\n")
                 
-                with open(self.status_log_file, 'a', encoding='utf-8') as f:
-                    f.write(log_line)
-                    
-                # RAW 데이터가 있으면 별도 로그에도 기록
-                if raw_data:
-                    self.log_raw_data(f"EVENT_{event_type}", raw_data)
+            # RAW 데이터가 있으면 별도 로그에도 기록
+            if raw_data:
+                self.log_raw_data(f"EVENT_{event_type}", raw_data, timestamp)
                     
         except Exception as e:
             print(f"이벤트 로그 기록 실패: {e}")
@@ -212,6 +374,14 @@ class StatusLogger:
     def get_raw_log_file_path(self) -> str:
         """현재 RAW 로그 파일 경로 반환"""
         return self.raw_log_file
+    
+    def flush(self, timeout: float = 2.0) -> bool:
+        """예약된 로그를 즉시 기록"""
+        return self.writer.flush(timeout)
+    
+    def close(self):
+        """남은 로그 기록 후 파일 닫기"""
+        self.writer.close()
 
 class FileManager:
     """파일 관리 클래스"""
@@ -527,195 +697,841 @@ class ConfigManager:
         
         return result
 
+class RollingMean:
+    """최근 size개 값의 평균 (고정 크기 링 버퍼 + 누적 합, 추가 O(1))"""
+    
+    def __init__(self, size: int = 100):
+        self.size = max(1, size)
+        self._values = [0.0] * self.size
+        self._index = 0
+        self.count = 0
+        self.total = 0.0
+    
+    def add(self, value: float):
+        """값 추가 (가장 오래된 값을 누적 합에서 뺌)"""
+        index = self._index
+        if self.count < self.size:
+            self.count += 1
+        else:
+            self.total -= self._values[index]
+        self._values[index] = value
+        self.total += value
+        index += 1
+        if index == self.size:
+            index = 0
+            # 한 바퀴마다 다시 합산해서 부동소수점 오차 누적 방지
+            self.total = sum(self._values[:self.count])
+        self._index = index
+    
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+class DecayingRate:
+    """
+    지수 감쇠 발생률 (초당 횟수)
+    
+    각 간격에 exp(-경과/time_constant) 가중치를 주므로 최근 time_constant초 정도의
+    처리량을 반영하고, 기록이 멈추면 0으로 줄어든다. 시작 직후에는 관측한 시간만큼만
+    나누어 초기값이 낮게 나오지 않게 한다.
+    """
+    
+    def __init__(self, time_constant: float = 2.0):
+        self.time_constant = max(1e-3, time_constant)
+        self._weight = 0.0
+        self._first = None
+        self._last = None
+    
+    def tick(self, now: float):
+        """발생 기록 (첫 기록은 기준 시각으로만 사용)"""
+        last = self._last
+        if last is None:
+            self._first = now
+        else:
+            self._weight = self._weight * math.exp((last - now) / self.time_constant) + 1.0
+        self._last = now
+    
+    def rate(self, now: float) -> float:
+        """now 시점의 초당 발생 수"""
+        if self._last is None:
+            return 0.0
+        tau = self.time_constant
+        weight = self._weight * math.exp(min(0.0, self._last - now) / tau)
+        observed = tau * (1.0 - math.exp((self._first - now) / tau))
+        return weight / observed if observed > 0 else 0.0
+
+class QuantileSketch:
+    """
+    스트리밍 분위수 스케치 (상대 오차 고정 로그 버킷)
+    
+    값 x를 ceil(log_gamma(x)) 버킷에 세기만 하므로 추가는 O(1)이고 샘플을 저장하지
+    않는다. 분위수 추정값의 상대 오차는 relative_accuracy 이내이며, 1us~10s 범위를
+    1% 정확도로 덮는 데 버킷 800여 개면 충분하다. min_value 이하는 0으로 센다.
+    """
+    
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-9):
+        self.gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.min_value = min_value
+        self.buckets = {}
+        self.zero_count = 0
+        self.count = 0
+    
+    def add(self, value: float):
+        """값 추가"""
+        self.count += 1
+        if value <= self.min_value:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        buckets = self.buckets
+        buckets[key] = buckets.get(key, 0) + 1
+    
+    def quantile(self, fraction: float) -> float:
+        """분위수 추정값 (기록이 없으면 0.0)"""
+        return self.quantiles((fraction,))[0]
+    
+    def quantiles(self, fractions=(0.50, 0.95, 0.99)) -> List[float]:
+        """여러 분위수를 버킷 한 번 순회로 계산"""
+        if self.count == 0:
+            return [0.0] * len(fractions)
+        ranks = [fraction * (self.count - 1) for fraction in fractions]
+        results = [0.0] * len(fractions)
+        pending = sorted(range(len(fractions)), key=ranks.__getitem__)
+        cumulative = self.zero_count
+        # 0 버킷에 해당하는 분위수는 0.0 그대로
+        while pending and ranks[pending[0]] < cumulative:
+            pending.pop(0)
+        for key in sorted(self.buckets):
+            if not pending:
+                break
+            cumulative += self.buckets[key]
+            # 버킷 (gamma^(k-1), gamma^k] 의 상대 오차 중앙값
+            estimate = 2.0 * self.gamma ** key / (self.gamma + 1.0)
+            while pending and ranks[pending[0]] < cumulative:
+                results[pending.pop(0)] = estimate
+        return results
+
 class PerformanceMonitor:
-    """성능 모니터링 클래스"""
+    """
+    성능 모니터링 클래스
     
-    def __init__(self):
-        self.stats = {
-            'frames_captured': 0,
-            'frames_dropped': 0,
-            'avg_capture_time': 0.0,
-            'avg_display_time': 0.0,
-            'start_time': time.time()
-        }
-        self.capture_times = []
-        self.display_times = []
-        self.max_samples = 100
+    캡처 루프에서 프레임/단계마다 호출해도 되도록 모든 기록이 O(1)이다.
+    
+    - 평균: 최근 window개 링 버퍼의 누적 합 (RollingMean)
+    - FPS: 지수 감쇠 발생률 (DecayingRate) - 전체 누적 평균이 아닌 현재 처리량
+    - p50/p95/p99: 시작(reset) 이후 전체 분포의 스트리밍 스케치 (QuantileSketch)
+    
+    캡처 파이프라인 단계별 소요 시간은 StageProfiler가 따로 기록한다.
+    
+    Args:
+        window: 평균을 낼 최근 샘플 수
+        fps_time_constant: FPS 감쇠 시간 상수 (초)
+    """
+    
+    PERCENTILES = (0.50, 0.95, 0.99)
+    
+    def __init__(self, window: int = 100, fps_time_constant: float = 2.0):
+        self.max_samples = window
+        self.fps_time_constant = fps_time_constant
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        """통계 초기화"""
+        with self._lock:
+            self.stats = {
+                'frames_captured': 0,
+                'frames_dropped': 0,
+                'avg_capture_time': 0.0,
+                'avg_display_time': 0.0,
+                'start_time': time.time()
+            }
+            self._started = time.monotonic()
+            self.capture_times = RollingMean(self.max_samples)
+            self.display_times = RollingMean(self.max_samples)
+            self.fps_meter = DecayingRate(self.fps_time_constant)
+            self.sketches = {'capture': QuantileSketch(), 'display': QuantileSketch()}
+    
+    def record_frame(self):
+        """소요 시간 없이 프레임 수신만 기록 (FPS, frames_captured)"""
+        with self._lock:
+            self.stats['frames_captured'] += 1
+            self.fps_meter.tick(time.monotonic())
     
     def record_capture_time(self, capture_time: float):
-        """캡처 시간 기록"""
-        self.capture_times.append(capture_time)
-        if len(self.capture_times) > self.max_samples:
-            self.capture_times.pop(0)
-        
-        self.stats['frames_captured'] += 1
-        self.stats['avg_capture_time'] = sum(self.capture_times) / len(self.capture_times)
+        """캡처 시간 기록 (프레임 1개 수신으로도 집계)"""
+        with self._lock:
+            self.capture_times.add(capture_time)
+            self.sketches['capture'].add(capture_time)
+            self.stats['frames_captured'] += 1
+            self.stats['avg_capture_time'] = self.capture_times.mean
+            self.fps_meter.tick(time.monotonic())
     
     def record_display_time(self, display_time: float):
         """디스플레이 시간 기록"""
-        self.display_times.append(display_time)
-        if len(self.display_times) > self.max_samples:
-            self.display_times.pop(0)
-        
-        self.stats['avg_display_time'] = sum(self.display_times) / len(self.display_times)
+        with self._lock:
+            self.display_times.add(display_time)
+            self.sketches['display'].add(display_time)
+            self.stats['avg_display_time'] = self.display_times.mean
     
     def record_dropped_frame(self):
         """드롭된 프레임 기록"""
-        self.stats['frames_dropped'] += 1
+        with self._lock:
+            self.stats['frames_dropped'] += 1
     
     def get_fps(self) -> float:
-        """FPS 계산"""
-        elapsed = time.time() - self.stats['start_time']
-        if elapsed > 0:
-            return self.stats['frames_captured'] / elapsed
-        return 0.0
+        """현재 FPS (최근 fps_time_constant초 가중)"""
+        with self._lock:
+            return self.fps_meter.rate(time.monotonic())
+    
+    def get_average_fps(self) -> float:
+        """시작 이후 전체 평균 FPS"""
+        with self._lock:
+            frames = self.stats['frames_captured']
+            elapsed = time.monotonic() - self._started
+        return frames / elapsed if elapsed > 0 else 0.0
+    
+    def get_percentiles(self, name: str = 'capture') -> Dict[str, float]:
+        """p50/p95/p99 (초, 기록이 없으면 0.0)"""
+        with self._lock:
+            sketch = self.sketches.get(name)
+            values = sketch.quantiles(self.PERCENTILES) if sketch else [0.0] * len(self.PERCENTILES)
+        return {f"p{round(fraction * 100)}": value for fraction, value in zip(self.PERCENTILES, values)}
     
     def get_stats(self) -> Dict:
         """통계 정보 반환"""
-        stats = self.stats.copy()
+        with self._lock:
+            stats = self.stats.copy()
         stats['fps'] = self.get_fps()
-        stats['runtime'] = time.time() - self.stats['start_time']
+        stats['average_fps'] = self.get_average_fps()
+        stats['runtime'] = time.time() - stats['start_time']
+        for name in self.sketches:
+            for key, value in self.get_percentiles(name).items():
+                stats[f"{name}_{key}"] = value
         return stats
+
+def log_bucket_bounds(relative_accuracy: float = 0.01, low: float = 1e-6,
+                      high: float = 10.0) -> List[float]:
+    """상대 오차 relative_accuracy의 로그 간격 버킷 상한 목록 (low ~ high 이상)"""
+    gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+    bounds = [low]
+    while bounds[-1] < high:
+        bounds.append(bounds[-1] * gamma)
+    return bounds
+
+class LatencyHistogram:
+    """
+    지연 시간 히스토그램 (로그 간격 버킷, 샘플 저장 없이 고정 메모리)
+    
+    기본 버킷은 QuantileSketch와 같은 상대 오차 1% 로그 간격이다 (1us ~ 10s,
+    버킷 800여 개). 분위수는 해당 버킷 (하한, 상한]의 상대 오차 중앙값이므로
+    오차는 1% 이내이고, 버킷 카운트는 그대로 내보낼 수 있다.
+    """
+    
+    # 버킷 상한 (초): 1us ~ 10s, 마지막 버킷은 초과값
+    DEFAULT_BOUNDS = tuple(log_bucket_bounds())
+    
+    def __init__(self, bounds: Optional[List[float]] = None):
+        self.bounds = list(bounds) if bounds else list(self.DEFAULT_BOUNDS)
+        self._lock = threading.Lock()
+        self.reset()
     
     def reset(self):
-        """통계 초기화"""
-        self.__init__()
+        """기록 초기화"""
+        with self._lock:
+            self.counts = [0] * (len(self.bounds) + 1)
+            self.count = 0
+            self.total = 0.0
+            self.min = None
+            self.max = 0.0
+    
+    def record(self, seconds: float):
+        """소요 시간 기록 (초)"""
+        index = bisect.bisect_left(self.bounds, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += seconds
+            if self.min is None or seconds < self.min:
+                self.min = seconds
+            if seconds > self.max:
+                self.max = seconds
+    
+    def percentile(self, fraction: float) -> float:
+        """분위수 근사값 (버킷 내 상대 오차 중앙값, 최소/최대값으로 제한)"""
+        with self._lock:
+            if self.count == 0:
+                return 0.0
+            target = fraction * self.count
+            cumulative = 0
+            for index, bucket_count in enumerate(self.counts):
+                cumulative += bucket_count
+                if cumulative >= target and bucket_count:
+                    return self._bucket_estimate(index)
+            return self.max
+    
+    def _bucket_estimate(self, index: int) -> float:
+        # 첫 버킷의 하한과 초과 버킷의 상한은 기록된 최소/최대값으로 대신함
+        bounds = self.bounds
+        lower = bounds[index - 1] if index else self.min
+        upper = bounds[index] if index < len(bounds) else self.max
+        if lower + upper <= 0:
+            return 0.0
+        estimate = 2.0 * lower * upper / (lower + upper)
+        return min(max(estimate, self.min), self.max)
+    
+    def count_above(self, threshold: float) -> int:
+        """threshold보다 큰 버킷에 속한 기록 수"""
+        index = bisect.bisect_left(self.bounds, threshold)
+        with self._lock:
+            return sum(self.counts[index + 1:])
+    
+    def get_stats(self) -> Dict:
+        """요약 통계 반환 (초 단위)"""
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'min': self.min or 0.0,
+            'max': self.max,
+            'p50': self.percentile(0.50),
+            'p90': self.percentile(0.90),
+            'p99': self.percentile(0.99)
+        }
+    
+    def format_summary(self) -> str:
+        """로그용 한 줄 요약 (ms)"""
+        stats = self.get_stats()
+        return (f"n={stats['count']}, 평균 {stats['mean'] * 1000:.3f}ms, "
+                f"p50 {stats['p50'] * 1000:.3f}ms, p99 {stats['p99'] * 1000:.3f}ms, "
+                f"최대 {stats['max'] * 1000:.3f}ms")
+
+class StageProfiler:
+    """
+    캡처 파이프라인 단계별 소요 시간
+
+    단계마다 LatencyHistogram 하나를 두고 record()는 고정 버킷 카운트만 올린다
+    (샘플 목록 없음, 메모리 고정). 어느 스레드에서나 호출할 수 있다.
+    STAGES에 없는 이름도 처음 기록할 때 추가된다.
+    """
+
+    # (단계, 표시 이름) - 한 프레임의 처리 순서
+    STAGES = (
+        ('request_write', '요청 전송'),
+        ('first_byte', '첫 바이트 대기'),
+        ('last_byte', '수신 (첫~마지막 바이트)'),
+        ('round_trip', '왕복 (요청~수신 완료)'),
+        ('frame_decode', '프레임 디코딩'),
+        ('orientation', '방향 변환'),
+        ('photo_build', 'PhotoImage 데이터 생성'),
+        ('canvas_update', '캔버스 갱신'),
+    )
+
+    def __init__(self):
+        self.labels = dict(self.STAGES)
+        self.histograms = {name: LatencyHistogram() for name, _ in self.STAGES}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def record(self, stage: str, seconds: float):
+        """단계 소요 시간 기록 (초)"""
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(stage, LatencyHistogram())
+        histogram.record(seconds)
+
+    def reset(self):
+        for histogram in list(self.histograms.values()):
+            histogram.reset()
+        self.started_at = time.time()
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """단계별 요약 통계 (초 단위, STAGES 순서)"""
+        return {name: histogram.get_stats() for name, histogram in list(self.histograms.items())}
+
+    def format_table(self) -> str:
+        """GUI/로그용 표 (ms)"""
+        # 한글 표시 폭이 달라 정렬이 깨지지 않도록 표시 이름은 마지막 열
+        lines = [f"{'stage':<16}{'count':>8}{'mean':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}  단계"]
+        for name, stats in self.get_stats().items():
+            if not stats['count']:
+                continue
+            lines.append(f"{name:<16}{stats['count']:>8}" +
+                         "".join(f"{stats[key] * 1000:>10.3f}" for key in ('mean', 'p50', 'p90', 'p99', 'max')) +
+                         f"  {self.labels.get(name, name)}")
+        return "\n".join(lines)
+
+    def export_json(self, path: str):
+        """단계별 통계와 버킷 카운트를 JSON으로 저장"""
+        stages = {}
+        for name, histogram in list(self.histograms.items()):
+            stats = histogram.get_stats()
+            stats['label'] = self.labels.get(name, name)
+            # 기록이 있는 버킷만 (상한, 초과 버킷은 null)
+            buckets = [(histogram.bounds[index] if index < len(histogram.bounds) else None, count)
+                       for index, count in enumerate(histogram.counts) if count]
+            stats['bucket_bounds'] = [bound for bound, _ in buckets]
+            stats['bucket_counts'] = [count for _, count in buckets]
+            stages[name] = stats
+        data = {
+            'started_at': datetime.fromtimestamp(self.started_at).isoformat(),
+            'exported_at': datetime.now().isoformat(),
+            'unit': 'seconds',
+            'stages': stages
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+    def export_csv(self, path: str):
+        """단계별 요약 통계를 CSV로 저장 (ms)"""
+        import csv
+
+        with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(['stage', 'label', 'count', 'mean_ms', 'min_ms', 'p50_ms', 'p90_ms',
+                             'p99_ms', 'max_ms'])
+            for name, stats in self.get_stats().items():
+                writer.writerow([name, self.labels.get(name, name), stats['count']] +
+                                [f"{stats[key] * 1000:.4f}"
+                                 for key in ('mean', 'min', 'p50', 'p90', 'p99', 'max')])
+
+class ParseTimeoutError(TimeoutError):
+    """파싱 시간 예산 초과"""
+    pass
+
+class ParseDeadline:
+    """단조 시계 기반 파싱 마감 시각 (스레드 없이 check() 호출 지점에서만 판단)"""
+    
+    __slots__ = ('start', 'deadline')
+    
+    def __init__(self, budget: float):
+        self.start = time.monotonic()
+        self.deadline = self.start + budget
+    
+    def elapsed(self) -> float:
+        return time.monotonic() - self.start
+    
+    def remaining(self) -> float:
+        return self.deadline - time.monotonic()
+    
+    def expired(self) -> bool:
+        return time.monotonic() >= self.deadline
+    
+    def check(self):
+        """예산을 넘었으면 ParseTimeoutError 발생 (반복 파서 루프 안에서 호출)"""
+        if time.monotonic() >= self.deadline:
+            raise ParseTimeoutError(f"파싱 시간 예산 초과 ({self.elapsed():.2f}초)")
+
+class ParseWatchdog:
+    """
+    모든 파싱이 공유하는 감시 스레드 (선택 사항)
+    
+    watch()/done()은 딕셔너리 등록/삭제만 수행하고, 감시 스레드는 check_interval
+    주기로 깨어나 마감을 넘긴 파싱을 한 번씩 on_overrun(이름, 경과 초)으로 알린다.
+    파싱을 중단시키지는 않으며 (Python 스레드는 강제 중단 불가), 멈춘 파싱을
+    파싱이 끝나기 전에 발견하기 위한 용도다. 스레드는 첫 watch() 때 시작된다.
+    """
+    
+    def __init__(self, on_overrun, check_interval: float = 0.25):
+        self.on_overrun = on_overrun
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._active = {}
+        self._next_token = 0
+        self._thread = None
+        self._stop = threading.Event()
+        self.overruns = 0
+    
+    def watch(self, name: str, deadline: ParseDeadline) -> int:
+        """파싱 감시 등록 - done()에 넘길 토큰 반환"""
+        with self._lock:
+            self._next_token += 1
+            token = self._next_token
+            self._active[token] = [name, deadline, False]
+        if self._thread is None:
+            self._start()
+        return token
+    
+    def done(self, token: int):
+        """파싱 종료 - 감시 해제"""
+        with self._lock:
+            self._active.pop(token, None)
+    
+    def stop(self):
+        """감시 스레드 종료"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(self.check_interval * 2)
+        self._thread = None
+    
+    def _start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="ParseWatchdog", daemon=True)
+            self._thread.start()
+    
+    def _run(self):
+        while not self._stop.wait(self.check_interval):
+            overdue = []
+            with self._lock:
+                for entry in self._active.values():
+                    if not entry[2] and entry[1].expired():
+                        entry[2] = True
+                        overdue.append((entry[0], entry[1].elapsed()))
+            for name, elapsed in overdue:
+                self.overruns += 1
+                try:
+                    self.on_overrun(name, elapsed)
+                except Exception:
+                    pass
 
 class DataBuffer:
-    """순환 데이터 버퍼"""
+    """
+    순환 데이터 버퍼 (NumPy 고정 타입 링)
     
-    def __init__(self, max_size: int = 1000):
-        self.max_size = max_size
-        self.buffer = []
-        self.index = 0
+    dtype으로 스칼라 타입(기본 float64) 또는 구조화 dtype(열 여러 개)을 지정한다.
+    append는 O(1)이고, segments()는 시간순 구간을 복사 없는 배열 뷰 1~2개로 돌려준다
+    (링이 한 바퀴 돌아 끝을 넘은 구간만 2개). get_latest/get_all은 구간이 하나면 뷰,
+    둘이면 이어 붙인 복사본이다. 집계(window_min/max/mean)는 구간별로 계산해서 합치므로
+    복사하지 않는다. 반환된 뷰는 다음 append 전까지만 유효하다.
+    
+    Args:
+        max_size: 최대 보관 개수
+        dtype: 요소 타입 (예: np.float32, [('time', 'f8'), ('battery', 'f4')], 임의 객체는 object)
+    """
+    
+    def __init__(self, max_size: int = 1000, dtype=np.float64):
+        self.max_size = max(1, max_size)
+        self.buffer = np.zeros(self.max_size, dtype=dtype)
+        self.index = 0          # 다음에 쓸 위치
+        self.count = 0
         self.is_full = False
     
+    def __len__(self) -> int:
+        return self.count
+    
     def append(self, data: Any):
-        """데이터 추가"""
-        if len(self.buffer) < self.max_size:
-            self.buffer.append(data)
+        """데이터 추가 (가득 차면 가장 오래된 값을 덮어씀)"""
+        self.buffer[self.index] = data
+        self.index += 1
+        if self.index == self.max_size:
+            self.index = 0
+        if self.count < self.max_size:
+            self.count += 1
         else:
-            self.buffer[self.index] = data
-            self.index = (self.index + 1) % self.max_size
             self.is_full = True
     
-    def get_latest(self, count: int = 1) -> List[Any]:
-        """최신 데이터 가져오기"""
-        if not self.buffer:
-            return []
-        
-        if not self.is_full:
-            return self.buffer[-count:]
+    def extend(self, values):
+        """여러 값을 한 번에 추가 (벡터 복사, 최대 두 번)"""
+        values = np.asarray(values, dtype=self.buffer.dtype)
+        if len(values) >= self.max_size:
+            self.buffer[:] = values[-self.max_size:]
+            self.index = 0
+            self.is_full = len(values) > self.max_size or self.count > 0
+            self.count = self.max_size
+            return
         
-        # 순환 버퍼에서 최신 데이터 추출
-        result = []
-        for i in range(count):
-            idx = (self.index - 1 - i) % self.max_size
-            if idx >= 0:
-                result.insert(0, self.buffer[idx])
+        first = min(len(values), self.max_size - self.index)
+        self.buffer[self.index:self.index + first] = values[:first]
+        self.buffer[:len(values) - first] = values[first:]
+        self.index = (self.index + len(values)) % self.max_size
+        overflow = self.count + len(values) > self.max_size
+        self.count = min(self.count + len(values), self.max_size)
+        self.is_full = self.is_full or overflow
+    
+    def segments(self, count: Optional[int] = None, field: Optional[str] = None) -> tuple:
+        """
+        최신 count개(None이면 전체)를 시간순 배열 뷰 1~2개로 반환 (복사 없음)
         
-        return result
+        Args:
+            count: 가져올 개수
+            field: 구조화 dtype의 열 이름 (None이면 전체 레코드)
+        """
+        buffer = self.buffer if field is None else self.buffer[field]
+        count = self.count if count is None else max(0, min(count, self.count))
+        start = self.index - count
+        if start >= 0:
+            return (buffer[start:self.index],)
+        if self.index == 0:
+            return (buffer[start:],)
+        return (buffer[start + self.max_size:], buffer[:self.index])
+    
+    def get_latest(self, count: int = 1, field: Optional[str] = None) -> np.ndarray:
+        """최신 데이터 가져오기 (시간순, 링 경계를 넘을 때만 복사)"""
+        parts = self.segments(count, field)
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
     
-    def get_all(self) -> List[Any]:
+    def get_all(self, field: Optional[str] = None) -> np.ndarray:
         """모든 데이터 가져오기 (시간순)"""
-        if not self.is_full:
-            return self.buffer.copy()
-        
-        # 순환 버퍼 정렬
-        return self.buffer[self.index:] + self.buffer[:self.index]
+        return self.get_latest(self.count, field)
+    
+    def _reduce(self, count, field, reducer) -> List:
+        return [reducer(part) for part in self.segments(count, field) if len(part)]
+    
+    def window_min(self, count: Optional[int] = None, field: Optional[str] = None):
+        """최신 count개의 최소값 (비어 있으면 None)"""
+        values = self._reduce(count, field, np.min)
+        return min(values) if values else None
+    
+    def window_max(self, count: Optional[int] = None, field: Optional[str] = None):
+        """최신 count개의 최대값 (비어 있으면 None)"""
+        values = self._reduce(count, field, np.max)
+        return max(values) if values else None
+    
+    def window_mean(self, count: Optional[int] = None, field: Optional[str] = None) -> Optional[float]:
+        """최신 count개의 평균 (비어 있으면 None)"""
+        parts = [part for part in self.segments(count, field) if len(part)]
+        if not parts:
+            return None
+        total = sum(float(np.sum(part, dtype=np.float64)) for part in parts)
+        return total / sum(len(part) for part in parts)
+    
+    def window_stats(self, count: Optional[int] = None, field: Optional[str] = None) -> Dict:
+        """최신 count개의 개수/최소/최대/평균"""
+        parts = self.segments(count, field)
+        return {
+            'count': sum(len(part) for part in parts),
+            'min': self.window_min(count, field),
+            'max': self.window_max(count, field),
+            'mean': self.window_mean(count, field)
+        }
     
     def clear(self):
         """버퍼 클리어"""
-        self.buffer.clear()
         self.index = 0
+        self.count = 0
         self.is_full = False
 
 class LogAnalyzer:
-    """상태 로그 분석 클래스"""
+    """
+    상태 로그 분석 클래스 (StatusLogger 상태 로그)
     
-    def __init__(self, log_file: str):
-        self.log_file = log_file
+    파일을 한 줄씩 한 번만 읽으면서 배터리/BAT_ADC 통계, 상태 분포, 이벤트 종류별
+    개수, 연결 이벤트를 한꺼번에 갱신한다. 줄 목록을 만들지 않으므로 메모리는 로그
+    길이와 무관하다 (연결 이벤트는 최근 max_events개만 보관).
+    
+    파일별로 읽은 위치를 기억하므로 update()를 다시 부르면 그 뒤에 추가된 완성된 줄만
+    읽는다 (모니터가 계속 기록 중인 로그 tail). 파일이 줄어들면 (잘리거나 교체됨) 누적
+    통계를 초기화하고 모든 파일을 처음부터 다시 읽는다.
+    get_* 메서드는 호출할 때 update()로 최신 상태를 반영한다.
+    
+    Args:
+        log_file: 상태 로그 경로 또는 경로 목록 (여러 날짜 파일은 날짜순으로)
+        max_events: 보관할 연결 이벤트 수
+    """
+    
+    # CONNECT, DISCONNECT, START, STOP
+    CONNECTION_PATTERN = re.compile(r'CONNECT|START|STOP')
+    
+    def __init__(self, log_file, max_events: int = 1000):
+        self.log_files = [log_file] if isinstance(log_file, str) else list(log_file)
+        self.log_file = self.log_files[-1] if self.log_files else None
+        self.max_events = max_events
+        self.reset()
+    
+    def reset(self):
+        """누적 통계와 읽은 위치 초기화"""
+        self.offsets = {path: 0 for path in self.log_files}
+        self.entry_count = 0
+        self.event_count = 0
+        self.battery = {'min': None, 'max': None, 'total': 0.0, 'count': 0}
+        self.bat_adc = {'min': None, 'max': None, 'total': 0, 'count': 0}
+        self.status_count = {}
+        self.event_types = {}
+        self.connection_events = deque(maxlen=self.max_events)
+        self.links = {'L1': None, 'L2': None}
+        self.first_timestamp = None
+        self.last_timestamp = None
+        self.last_entry = None
+    
+    @staticmethod
+    def parse_line(line: str) -> Optional[Dict]:
+        """
+        로그 한 줄 파싱
+        
+        Returns:
+            상태 줄은 {'type': 'status', timestamp, battery, timer, status, l1, l2, bat_adc, note},
+            이벤트 줄은 {'type': 'event', timestamp, event, message}, 헤더/빈 줄은 None
+        """
+        line = line.strip()
+        if not line or line[0] in '=-' or line.startswith('시간') or line.startswith('OnBoard'):
+            return None
         
+        # StatusLogger는 열 정렬용으로 탭을 여러 개 쓰므로 빈 칸은 건너뜀
+        parts = [part for part in line.split('\t') if part]
+        if len(parts) >= 3 and parts[1].startswith('[') and parts[1].endswith(']'):
+            return {'type': 'event', 'timestamp': parts[0], 'event': parts[1][1:-1],
+                    'message': ' '.join(parts[2:])}
+        if len(parts) < 6:
+            return None
+        return {
+            'type': 'status',
+            'timestamp': parts[0],
+            'battery': parts[1],
+            'timer': parts[2],
+            'status': parts[3],
+            'l1': parts[4],
+            'l2': parts[5],
+            'bat_adc': parts[6] if len(parts) > 6 else 'N/A',
+            'note': parts[7] if len(parts) > 7 else ''
+        }
+    
+    def iter_entries(self, path: Optional[str] = None):
+        """로그 엔트리를 한 줄씩 생성 (통계에는 반영하지 않음)"""
+        for log_path in ([path] if path else self.log_files):
+            try:
+                with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
+                    for line in f:
+                        entry = self.parse_line(line)
+                        if entry is not None:
+                            yield entry
+            except OSError as e:
+                print(f"로그 파싱 오류: {e}")
+    
     def parse_log_entries(self) -> List[Dict]:
-        """로그 엔트리 파싱"""
-        entries = []
+        """로그 엔트리 목록 (작은 파일용 - 큰 로그는 iter_entries 사용)"""
+        return list(self.iter_entries())
+    
+    def update(self) -> int:
+        """
+        마지막으로 읽은 위치 이후의 완성된 줄을 읽어 통계 갱신
         
-        try:
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith('=') or line.startswith('-') or '시간' in line:
-                    continue
-                    
-                parts = line.split('\t')
-                if len(parts) >= 6:
-                    entry = {
-                        'timestamp': parts[0],
-                        'battery': parts[1],
-                        'timer': parts[2],
-                        'status': parts[3],
-                        'l1': parts[4],
-                        'l2': parts[5],
-                        'note': parts[6] if len(parts) > 6 else ''
-                    }
-                    entries.append(entry)
-                    
-        except Exception as e:
-            print(f"로그 파싱 오류: {e}")
+        Returns:
+            int: 새로 반영한 엔트리 수
+        """
+        sizes = {}
+        for path in self.log_files:
+            try:
+                sizes[path] = os.path.getsize(path)
+            except OSError:
+                continue
+        if any(size < self.offsets.get(path, 0) for path, size in sizes.items()):
+            # 파일이 잘리거나 교체됨 - min/max는 빼낼 수 없으므로 전체 다시 집계
+            self.reset()
+        
+        added = 0
+        for path, size in sizes.items():
+            offset = self.offsets.get(path, 0)
+            if size == offset:
+                continue
             
-        return entries
+            try:
+                with open(path, 'rb') as f:
+                    f.seek(offset)
+                    for raw_line in f:
+                        if not raw_line.endswith(b'\n'):
+                            break  # 기록 중인 마지막 줄은 다음 update에서
+                        offset += len(raw_line)
+                        entry = self.parse_line(raw_line.decode('utf-8', errors='replace'))
+                        if entry is not None:
+                            self.add_entry(entry)
+                            added += 1
+            except OSError as e:
+                print(f"로그 파싱 오류: {e}")
+            self.offsets[path] = offset
+        return added
     
-    def get_battery_stats(self) -> Dict:
-        """배터리 통계 분석"""
-        entries = self.parse_log_entries()
+    def add_entry(self, entry: Dict):
+        """파싱된 엔트리 하나를 누적 통계에 반영"""
+        timestamp = entry['timestamp']
+        if self.first_timestamp is None:
+            self.first_timestamp = timestamp
+        self.last_timestamp = timestamp
+        
+        if entry['type'] == 'event':
+            self.event_count += 1
+            event = entry['event']
+            self.event_types[event] = self.event_types.get(event, 0) + 1
+            if self.CONNECTION_PATTERN.search(event) or self.CONNECTION_PATTERN.search(entry['message']):
+                self.connection_events.append({'timestamp': timestamp,
+                                               'event': f"{event}: {entry['message']}"})
+            return
+        
+        self.entry_count += 1
+        self.last_entry = entry
         
-        battery_levels = []
-        for entry in entries:
+        battery = entry['battery']
+        if battery.endswith('V'):
             try:
-                if entry['battery'] != 'N/A' and 'V' in entry['battery']:
-                    level = int(entry['battery'].replace('V', ''))
-                    battery_levels.append(level)
+                self._accumulate(self.battery, float(battery[:-1]))
             except ValueError:
-                continue
+                pass
+        try:
+            self._accumulate(self.bat_adc, int(entry['bat_adc']))
+        except ValueError:
+            pass
+        
+        status = entry['status'].strip()
+        if status and status != 'N/A':
+            self.status_count[status] = self.status_count.get(status, 0) + 1
         
-        if not battery_levels:
+        # L1/L2 연결 상태가 바뀐 시점을 연결 이벤트로 기록
+        for link in ('L1', 'L2'):
+            state = entry[link.lower()]
+            previous = self.links[link]
+            if previous is not None and state != previous:
+                self.connection_events.append({'timestamp': timestamp, 'event': f"{link} {state}"})
+            self.links[link] = state
+        
+        note = entry['note']
+        if note and self.CONNECTION_PATTERN.search(note):
+            self.connection_events.append({'timestamp': timestamp, 'event': note})
+    
+    @staticmethod
+    def _accumulate(summary: Dict, value):
+        if summary['count'] == 0 or value < summary['min']:
+            summary['min'] = value
+        if summary['count'] == 0 or value > summary['max']:
+            summary['max'] = value
+        summary['total'] += value
+        summary['count'] += 1
+    
+    @staticmethod
+    def _summarize(summary: Dict) -> Dict:
+        count = summary['count']
+        if not count:
             return {'min': 0, 'max': 0, 'avg': 0, 'count': 0}
-            
-        return {
-            'min': min(battery_levels),
-            'max': max(battery_levels),
-            'avg': sum(battery_levels) / len(battery_levels),
-            'count': len(battery_levels)
-        }
+        return {'min': summary['min'], 'max': summary['max'],
+                'avg': summary['total'] / count, 'count': count}
+    
+    def get_battery_stats(self) -> Dict:
+        """배터리 통계 분석 (V)"""
+        self.update()
+        return self._summarize(self.battery)
+    
+    def get_bat_adc_stats(self) -> Dict:
+        """BAT_ADC 통계 분석"""
+        self.update()
+        return self._summarize(self.bat_adc)
     
     def get_status_distribution(self) -> Dict:
         """상태 분포 분석"""
-        entries = self.parse_log_entries()
-        
-        status_count = {}
-        for entry in entries:
-            status = entry['status'].strip()
-            if status and status != 'N/A':
-                status_count[status] = status_count.get(status, 0) + 1
-                
-        return status_count
+        self.update()
+        return dict(self.status_count)
     
     def get_connection_events(self) -> List[Dict]:
-        """연결 이벤트 분석"""
-        entries = self.parse_log_entries()
-        
-        events = []
-        for entry in entries:
-            note = entry.get('note', '')
-            if any(keyword in note for keyword in ['CONNECT', 'DISCONNECT', 'START', 'STOP']):
-                events.append({
-                    'timestamp': entry['timestamp'],
-                    'event': note
-                })
-                
-        return events
+        """연결 이벤트 분석 (최근 max_events개)"""
+        self.update()
+        return list(self.connection_events)
+    
+    def get_summary(self) -> Dict:
+        """모든 요약을 한 번에 반환"""
+        self.update()
+        return {
+            'entries': self.entry_count,
+            'events': self.event_count,
+            'first_timestamp': self.first_timestamp,
+            'last_timestamp': self.last_timestamp,
+            'battery': self._summarize(self.battery),
+            'bat_adc': self._summarize(self.bat_adc),
+            'status_distribution': dict(self.status_count),
+            'event_types': dict(self.event_types),
+            'connection_events': list(self.connection_events),
+            'last_entry': self.last_entry
+        }
 
 if __name__ == "__main__":
     # 테스트 코드
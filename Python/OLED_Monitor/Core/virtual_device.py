@@ -0,0 +1,313 @@
+"""
+가상 OnBoard 디바이스 (pty 기반 펌웨어 에뮬레이터)
+
+FirmwareSimulator를 의사 터미널(pty)에 붙여 실제 시리얼 포트처럼 노출한다.
+OLEDMonitor는 출력된 /dev/pts/N 경로에 그대로 연결하면 되며, 보드레이트 속도 제한,
+응답 지연/지터, 바이트 유실과 비트 오류를 설정해 캡처 루프를 부하/내구 시험할 수 있다.
+
+POSIX 전용 (Linux/macOS).
+
+사용 예:
+    python virtual_device.py --baud 115200 --jitter 0.005 --corrupt 1e-5
+    python virtual_device.py --bench 500 --binary
+"""
+
+import os
+import random
+import select
+import threading
+import time
+from typing import Dict, Optional
+
+from firmware_simulator import FirmwareSimulator
+
+
+class VirtualDevice:
+    """
+    pty 가상 디바이스
+
+    수신 스레드 하나가 마스터 fd에서 명령을 읽어 시뮬레이터로 처리하고, 응답을
+    지연/오류 주입 후 보드레이트 속도에 맞춰 나눠 쓴다. 펌웨어처럼 응답 전송 중에는
+    다음 명령을 처리하지 않는다 (수신 데이터는 pty 버퍼에 남음).
+
+    Args:
+        simulator: 명령 처리기 (None이면 새 FirmwareSimulator)
+        baudrate: 전송 속도 제한 (바이트당 10비트), 0이면 제한 없음
+        latency: 명령 수신 후 응답 시작까지 고정 지연 (초)
+        jitter: 추가 지연의 최대값 (0~jitter 균등 분포, 초)
+        drop_rate: 응답 바이트별 유실 확률
+        corrupt_rate: 응답 바이트별 비트 반전 확률
+        screen_fps: 테스트 화면 갱신 주기 (0이면 고정 화면)
+        seed: 난수 시드 (재현용)
+    """
+
+    CHUNK_SIZE = 64   # 속도 제한 단위 (바이트)
+
+    def __init__(self, simulator: Optional[FirmwareSimulator] = None, baudrate: int = 921600,
+                 latency: float = 0.0, jitter: float = 0.0, drop_rate: float = 0.0,
+                 corrupt_rate: float = 0.0, screen_fps: float = 4.0, seed: Optional[int] = None):
+        self.simulator = simulator if simulator is not None else FirmwareSimulator()
+        self.baudrate = baudrate
+        self.latency = latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self.corrupt_rate = corrupt_rate
+        self.screen_fps = screen_fps
+        self.random = random.Random(seed)
+
+        self.master_fd = None
+        self.slave_fd = None
+        self.port_name = None
+        self.stats = {
+            'commands': 0,
+            'responses': 0,
+            'rx_bytes': 0,
+            'tx_bytes': 0,
+            'dropped_bytes': 0,
+            'corrupted_bytes': 0,
+            'screen_updates': 0,
+            'timer_ticks': 0,
+            'write_errors': 0
+        }
+
+        self._thread = None
+        self._running = False
+        self._frame_no = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._running and self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> str:
+        """pty 생성 후 처리 스레드 시작, 클라이언트가 열 포트 경로 반환"""
+        if self.is_running:
+            return self.port_name
+
+        import pty
+        import tty
+
+        self.master_fd, self.slave_fd = pty.openpty()
+        tty.setraw(self.slave_fd)   # 에코/개행 변환 없는 바이너리 전송
+        self.port_name = os.ttyname(self.slave_fd)
+
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="VirtualDevice", daemon=True)
+        self._thread.start()
+        return self.port_name
+
+    def stop(self, timeout: float = 1.0):
+        """처리 스레드 종료 후 pty 닫기"""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        for fd in (self.master_fd, self.slave_fd):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self.master_fd = None
+        self.slave_fd = None
+
+    def get_stats(self) -> Dict:
+        """가상 디바이스 + 시뮬레이터 통계"""
+        stats = dict(self.stats)
+        stats['simulator'] = self.simulator.get_stats()
+        return stats
+
+    def _run(self):
+        now = time.monotonic()
+        next_tick = now + 1.0
+        next_screen = now
+        screen_interval = 1.0 / self.screen_fps if self.screen_fps > 0 else None
+        if screen_interval is None:
+            self.simulator.draw_test_pattern(0)
+
+        while self._running:
+            now = time.monotonic()
+            if now >= next_tick:
+                self.simulator.tick_second()
+                self.stats['timer_ticks'] += 1
+                next_tick += 1.0
+            if screen_interval is not None and now >= next_screen:
+                self.simulator.draw_test_pattern(self._frame_no)
+                self._frame_no += 1
+                self.stats['screen_updates'] += 1
+                next_screen = max(next_screen + screen_interval, now)
+
+            wait = next_tick - now
+            if screen_interval is not None:
+                wait = min(wait, next_screen - now)
+            try:
+                readable, _, _ = select.select([self.master_fd], [], [], max(0.0, min(wait, 0.1)))
+            except (OSError, ValueError):
+                break
+            if not readable:
+                continue
+
+            try:
+                data = os.read(self.master_fd, 4096)
+            except OSError:
+                # 클라이언트가 포트를 닫은 직후 (EIO) - 다시 열 때까지 대기
+                time.sleep(0.05)
+                continue
+            if not data:
+                continue
+
+            self.stats['rx_bytes'] += len(data)
+            commands_before = self.simulator.stats['commands']
+            response = self.simulator.feed(data)
+            self.stats['commands'] += self.simulator.stats['commands'] - commands_before
+            if response:
+                self.stats['responses'] += 1
+                self._send(response)
+
+    def _send(self, data: bytes):
+        """지연/오류 주입 후 보드레이트 속도로 전송"""
+        delay = self.latency + (self.random.uniform(0.0, self.jitter) if self.jitter > 0 else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+        data = self._impair(data)
+        byte_time = 10.0 / self.baudrate if self.baudrate > 0 else 0.0
+        deadline = time.monotonic()
+        for start in range(0, len(data), self.CHUNK_SIZE):
+            chunk = data[start:start + self.CHUNK_SIZE]
+            try:
+                os.write(self.master_fd, chunk)
+            except OSError:
+                self.stats['write_errors'] += 1
+                return
+            self.stats['tx_bytes'] += len(chunk)
+            if byte_time:
+                deadline += len(chunk) * byte_time
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+
+    def _impair(self, data: bytes) -> bytes:
+        """바이트 유실/비트 반전 주입"""
+        if self.drop_rate <= 0 and self.corrupt_rate <= 0:
+            return data
+
+        out = bytearray()
+        rnd = self.random.random
+        for value in data:
+            if self.drop_rate > 0 and rnd() < self.drop_rate:
+                self.stats['dropped_bytes'] += 1
+                continue
+            if self.corrupt_rate > 0 and rnd() < self.corrupt_rate:
+                value ^= 1 << self.random.randrange(8)
+                self.stats['corrupted_bytes'] += 1
+            out.append(value)
+        return bytes(out)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def run_benchmark(port_name: str, requests: int, binary: bool, timeout: float = 1.0,
+                  interval: float = 0.0) -> Dict:
+    """
+    pyserial + SerialFrameReader로 캡처 요청 반복 (OLEDMonitor 요청/응답 경로와 동일)
+
+    Returns:
+        Dict: 성공/손상/타임아웃 수, 지연 시간 요약, fps
+    """
+    import serial
+
+    from serial_parser import SerialFrameReader
+    from utils import LatencyHistogram
+
+    port = serial.Serial(port_name, baudrate=921600, timeout=0.05)
+    reader = SerialFrameReader(port)
+    reader.start()
+    latency = LatencyHistogram()
+    result = {'requests': requests, 'frames': 0, 'corrupted': 0, 'timeouts': 0}
+
+    try:
+        if binary:
+            port.write(b'SET_SCREEN_FORMAT:BINARY\n')
+            reply = reader.get_reply(timeout)
+            if not reply or b'BINARY' not in reply:
+                print(f"⚠️ 바이너리 전환 실패: {reply!r} - 텍스트로 진행")
+                binary = False
+
+        start_time = time.perf_counter()
+        for _ in range(requests):
+            command = (f'GET_SCREEN_BIN:{reader.decoder.binary.ack_seq}\n' if binary
+                       else 'GET_SCREEN\n')
+            reader.drain_frames()
+            sent = time.perf_counter()
+            port.write(command.encode('ascii'))
+            frame = reader.get_frame(timeout)
+            if frame is None:
+                result['timeouts'] += 1
+                # 늦게 도착한 응답이 다음 요청의 응답으로 섞이지 않도록 비움
+                reader.clear()
+            elif frame.get('error'):
+                result['corrupted'] += 1
+            else:
+                result['frames'] += 1
+                latency.record(time.perf_counter() - sent)
+            if interval > 0:
+                time.sleep(interval)
+        elapsed = time.perf_counter() - start_time
+    finally:
+        reader.stop()
+        port.close()
+
+    result['elapsed'] = elapsed
+    result['fps'] = result['frames'] / elapsed if elapsed > 0 else 0.0
+    result['latency'] = latency.format_summary()
+    result['reader'] = dict(reader.stats)
+    return result
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="가상 OnBoard 디바이스 (pty)")
+    parser.add_argument("--baud", type=int, default=921600, help="전송 속도 제한 (0 = 제한 없음)")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 고정 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="응답 추가 지연 최대값 (초)")
+    parser.add_argument("--drop", type=float, default=0.0, help="바이트 유실 확률")
+    parser.add_argument("--corrupt", type=float, default=0.0, help="바이트 비트 반전 확률")
+    parser.add_argument("--fps", type=float, default=4.0, help="테스트 화면 갱신 주기 (0 = 고정)")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드")
+    parser.add_argument("--bench", type=int, default=0, help="내장 클라이언트로 N회 캡처 후 종료")
+    parser.add_argument("--binary", action="store_true", help="벤치마크에서 바이너리 전송 사용")
+    parser.add_argument("--interval", type=float, default=0.0, help="벤치마크 요청 간격 (초)")
+    args = parser.parse_args()
+
+    device = VirtualDevice(baudrate=args.baud, latency=args.latency, jitter=args.jitter,
+                           drop_rate=args.drop, corrupt_rate=args.corrupt,
+                           screen_fps=args.fps, seed=args.seed)
+    port_name = device.start()
+    print(f"🔌 가상 디바이스: {port_name} (baud {args.baud}, 지연 {args.latency}s+{args.jitter}s, "
+          f"유실 {args.drop}, 손상 {args.corrupt})")
+
+    try:
+        if args.bench > 0:
+            result = run_benchmark(port_name, args.bench, args.binary, interval=args.interval)
+            print(f"📊 {result['frames']}/{result['requests']} 성공, 손상 {result['corrupted']}, "
+                  f"타임아웃 {result['timeouts']}, {result['fps']:.1f} fps")
+            print(f"   지연 {result['latency']}")
+            print(f"   수신기 {result['reader']}")
+        else:
+            print("OLEDMonitor에서 위 포트로 연결하세요 (Ctrl+C 종료)")
+            while True:
+                time.sleep(5.0)
+                stats = device.get_stats()
+                print(f"명령 {stats['commands']} / 송신 {stats['tx_bytes']} bytes / "
+                      f"유실 {stats['dropped_bytes']} / 손상 {stats['corrupted_bytes']}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        device.stop()
+        print(f"디바이스 통계: {device.get_stats()}")